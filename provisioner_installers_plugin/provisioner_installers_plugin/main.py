@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 import pathlib
+import sys
+import time
+from typing import Optional
 
 import click
 
 from provisioner_installers_plugin.src.cli.cli import register_cli_commands
 from provisioner_installers_plugin.src.config.domain.config import PLUGIN_NAME, InstallersConfig
+from provisioner_installers_plugin.src.daemon.cli import register_daemon_commands
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import TRACE_TO_STDOUT, get_tracer
+from provisioner_installers_plugin.src.installer.tracing.timing_history import record_command_history
 from provisioner_installers_plugin.src.k3s.cli import register_k3s_commands
+from provisioner_installers_plugin.src.stats.cli import register_stats_commands
 from provisioner_installers_plugin.src.system.cli import register_system_commands
 from provisioner_shared.components.remote.cli_remote_opts import cli_remote_opts
 from provisioner_shared.components.remote.domain.config import RemoteConfig
@@ -31,11 +38,28 @@ def append_to_cli(root_menu: click.Group):
     @root_menu.group(invoke_without_command=True, no_args_is_help=True, cls=CustomGroup)
     @cli_remote_opts(remote_config=installers_cfg.remote if installers_cfg is not None else RemoteConfig())
     @cli_modifiers
+    @click.option(
+        "--trace",
+        "trace_path",
+        type=click.Path(dir_okay=False),
+        help="Write a Chrome trace of every install step to this file ('-' prints it to stdout)",
+        envvar="PROV_TRACE_FILE",
+    )
+    @click.option(
+        "--history/--no-history",
+        "record_history",
+        default=True,
+        show_default=True,
+        help="Record the command and step durations shown by 'provisioner stats'",
+        envvar="PROV_HISTORY",
+    )
     @click.pass_context
-    def install(ctx):
+    def install(ctx, trace_path: str, record_history: bool):
         """Install anything anywhere on any OS/Arch either on a local or remote machine"""
         if ctx.invoked_subcommand is None:
             click.echo(ctx.get_help())
+        else:
+            _trace_command(ctx, trace_path, record_history)
 
     append_version_cmd_to_cli(
         root_menu=install, root_package=INSTALLERS_PLUGINS_ROOT_PATH, description="Print installer plugin version"
@@ -46,3 +70,28 @@ def append_to_cli(root_menu: click.Group):
     register_k3s_commands(cli_group=install)
 
     register_system_commands(cli_group=install)
+
+    register_stats_commands(cli_group=root_menu)
+
+    register_daemon_commands(cli_group=root_menu)
+
+
+def _trace_command(ctx: click.Context, trace_path: Optional[str], record_history: bool) -> None:
+    # A remote run prints its trace for the provisioner which started it, that one records the history
+    record_history = record_history and trace_path != TRACE_TO_STDOUT
+    if not trace_path and not record_history:
+        return
+    tracer = get_tracer().enable()
+    command = f"{ctx.info_name} {ctx.invoked_subcommand}"
+    started_at = time.time()
+
+    def on_close() -> None:
+        # Runs once the sub command completes or fails, a failure is still being raised at this point
+        if trace_path:
+            tracer.export(trace_path)
+        if record_history:
+            error = sys.exc_info()[1]
+            failed = error is not None and not (isinstance(error, click.exceptions.Exit) and error.exit_code == 0)
+            record_command_history(tracer, command, started_at, failed=failed)
+
+    ctx.call_on_close(on_close)
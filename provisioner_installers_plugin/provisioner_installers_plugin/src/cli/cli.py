@@ -3,13 +3,17 @@
 from typing import List
 
 import click
+from provisioner_installers_plugin.src.installer.cmd.apply_cmd import ToolsetApplyCmd, ToolsetApplyCmdArgs
 from provisioner_installers_plugin.src.installer.cmd.installer_cmd import UtilityInstallerCmd, UtilityInstallerCmdArgs
 from provisioner_installers_plugin.src.installer.cmd.list_cmd import UtilityListCmd
+from provisioner_installers_plugin.src.installer.cmd.lock_cmd import ToolsetLockCmd, ToolsetLockCmdArgs
 from provisioner_installers_plugin.src.installer.domain.command import InstallerSubCommandName
 from provisioner_installers_plugin.src.installer.domain.version import (
     NameVersionArgsTuple,
     try_extract_name_version_tuple,
 )
+from provisioner_installers_plugin.src.installer.runner.async_evaluator import DEFAULT_MAX_CONCURRENT_DOWNLOADS
+from provisioner_installers_plugin.src.installer.runner.toolset_runner import DEFAULT_TOOLSET_MAX_WORKERS
 
 from provisioner_shared.components.remote.remote_opts import RemoteOpts
 from provisioner_shared.components.runtime.cli.cli_modifiers import cli_modifiers
@@ -25,10 +29,22 @@ def register_cli_commands(cli_group: click.Group):
     @click.argument("args", nargs=-1)
     @click.option("--force", is_flag=True, help="Force installation even if utility is already installed")
     @click.option("--uninstall", is_flag=True, help="Uninstall the utility instead of installing it")
+    @click.option(
+        "--search", "query", help="List only utilities matching a name prefix, description text or close name"
+    )
+    @click.option(
+        "--concurrent-downloads",
+        "max_concurrent_downloads",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+        show_default=True,
+        help="Number of GitHub released utilities to download at once, download progress bars are shown only for 1",
+        envvar="PROV_INSTALL_CONCURRENT_DOWNLOADS",
+    )
     @click.pass_context
-    def cli(ctx: click.Context, args: str, force: bool, uninstall: bool):
+    def cli(ctx: click.Context, args: str, force: bool, uninstall: bool, query: str, max_concurrent_downloads: int):
         """Select a CLI utility to install on any OS/Architecture"""
-        if args:
+        if args and not query:
             to_install: List[NameVersionArgsTuple] = []
             for name in args:
                 name_ver = try_extract_name_version_tuple(name)
@@ -39,9 +55,100 @@ def register_cli_commands(cli_group: click.Group):
                 remote_opts=RemoteOpts.from_click_ctx(ctx),
                 force=force,
                 uninstall=uninstall,
+                max_concurrent_downloads=max_concurrent_downloads,
             )
         else:
-            list_utilities(modifiers=CliModifiers.from_click_ctx(ctx))
+            list_utilities(modifiers=CliModifiers.from_click_ctx(ctx), query=query)
+
+    @cli_group.command()
+    @cli_modifiers
+    @click.option(
+        "-f",
+        "--file",
+        "manifest_path",
+        type=click.Path(exists=True, dir_okay=False),
+        required=True,
+        help="Toolset manifest listing the utilities and versions to have installed",
+        envvar="PROV_TOOLSET_MANIFEST",
+    )
+    @click.option(
+        "--lockfile",
+        "lockfile_path",
+        type=click.Path(exists=True, dir_okay=False),
+        help="Lockfile to install from, defaults to the manifest's .lock file when present",
+        envvar="PROV_TOOLSET_LOCKFILE",
+    )
+    @click.option("--prune", is_flag=True, help="Uninstall utilities installed by provisioner that are not listed")
+    @click.option(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_TOOLSET_MAX_WORKERS,
+        show_default=True,
+        help="Number of utilities to install in parallel",
+        envvar="PROV_TOOLSET_MAX_WORKERS",
+    )
+    @click.pass_context
+    def apply(ctx: click.Context, manifest_path: str, lockfile_path: str, prune: bool, max_workers: int):
+        """Install, upgrade or remove CLI utilities to match a toolset manifest"""
+        apply_toolset(
+            manifest_path=manifest_path,
+            lockfile_path=lockfile_path,
+            modifiers=CliModifiers.from_click_ctx(ctx),
+            prune=prune,
+            max_workers=max_workers,
+        )
+
+    @cli_group.command()
+    @cli_modifiers
+    @click.option(
+        "-f",
+        "--file",
+        "manifest_path",
+        type=click.Path(exists=True, dir_okay=False),
+        required=True,
+        help="Toolset manifest to resolve",
+        envvar="PROV_TOOLSET_MANIFEST",
+    )
+    @click.option(
+        "-o",
+        "--output",
+        "lockfile_path",
+        type=click.Path(dir_okay=False),
+        help="Lockfile to write, defaults to the manifest path with a .lock extension",
+    )
+    @click.option(
+        "--os-arch",
+        "os_arch_pairs",
+        multiple=True,
+        help="Lock only these OS/Arch release assets (e.g. linux_arm64), defaults to all supported",
+    )
+    @click.option("--upgrade", is_flag=True, help="Re-resolve versions already locked instead of keeping them")
+    @click.option(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_TOOLSET_MAX_WORKERS,
+        show_default=True,
+        help="Number of utilities to resolve in parallel",
+        envvar="PROV_TOOLSET_MAX_WORKERS",
+    )
+    @click.pass_context
+    def lock(
+        ctx: click.Context,
+        manifest_path: str,
+        lockfile_path: str,
+        os_arch_pairs: List[str],
+        upgrade: bool,
+        max_workers: int,
+    ):
+        """Resolve a toolset manifest into a lockfile of exact versions, release assets and digests"""
+        lock_toolset(
+            manifest_path=manifest_path,
+            lockfile_path=lockfile_path,
+            os_arch_pairs=list(os_arch_pairs),
+            upgrade=upgrade,
+            max_workers=max_workers,
+            modifiers=CliModifiers.from_click_ctx(ctx),
+        )
 
 
 def install_utilities(
@@ -50,6 +157,7 @@ def install_utilities(
     remote_opts: RemoteOpts,
     force: bool,
     uninstall: bool = False,
+    max_concurrent_downloads: int = 1,
 ) -> None:
     cli_ctx = CliContextManager.create(modifiers)
     Evaluator.eval_installer_cli_entrypoint_pyfn_step(
@@ -62,16 +170,58 @@ def install_utilities(
                 remote_opts=remote_opts,
                 force=force,
                 uninstall=uninstall,
+                max_concurrent_downloads=max_concurrent_downloads,
+            ),
+        ),
+        verbose=cli_ctx.is_verbose(),
+    )
+
+
+def apply_toolset(
+    manifest_path: str, lockfile_path: str, modifiers: CliModifiers, prune: bool, max_workers: int
+) -> None:
+    cli_ctx = CliContextManager.create(modifiers)
+    Evaluator.eval_installer_cli_entrypoint_pyfn_step(
+        name="Apply Toolset Command",
+        call=lambda: ToolsetApplyCmd().run(
+            ctx=cli_ctx,
+            args=ToolsetApplyCmdArgs(
+                manifest_path=manifest_path, lockfile_path=lockfile_path, prune=prune, max_workers=max_workers
+            ),
+        ),
+        verbose=cli_ctx.is_verbose(),
+    )
+
+
+def lock_toolset(
+    manifest_path: str,
+    lockfile_path: str,
+    os_arch_pairs: List[str],
+    upgrade: bool,
+    max_workers: int,
+    modifiers: CliModifiers,
+) -> None:
+    cli_ctx = CliContextManager.create(modifiers)
+    Evaluator.eval_installer_cli_entrypoint_pyfn_step(
+        name="Lock Toolset Command",
+        call=lambda: ToolsetLockCmd().run(
+            ctx=cli_ctx,
+            args=ToolsetLockCmdArgs(
+                manifest_path=manifest_path,
+                lockfile_path=lockfile_path,
+                os_arch_pairs=os_arch_pairs,
+                upgrade=upgrade,
+                max_workers=max_workers,
             ),
         ),
         verbose=cli_ctx.is_verbose(),
     )
 
 
-def list_utilities(modifiers: CliModifiers) -> None:
+def list_utilities(modifiers: CliModifiers, query: str = None) -> None:
     cli_ctx = CliContextManager.create(modifiers)
     Evaluator.eval_installer_cli_entrypoint_pyfn_step(
         name="list_utilities",
-        call=lambda: UtilityListCmd().run(ctx=cli_ctx),
+        call=lambda: UtilityListCmd().run(ctx=cli_ctx, query=query),
         verbose=cli_ctx.is_verbose(),
     )
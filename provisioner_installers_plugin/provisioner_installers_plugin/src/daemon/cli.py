@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import os
+
+import click
+from provisioner_installers_plugin.src.daemon.client import (
+    REQUEST_STATUS,
+    REQUEST_STOP,
+    daemon_socket_path,
+    request_control,
+)
+from provisioner_installers_plugin.src.daemon.server import (
+    DEFAULT_IDLE_TIMEOUT_MINUTES,
+    WarmDaemon,
+    daemonize,
+    wait_for_daemon,
+)
+from provisioner_installers_plugin.src.utilities.utilities_cli import SupportedToolingsCli
+from provisioner_installers_plugin.src.utilities.utilities_k8s import SupportedToolingsK8s
+from provisioner_installers_plugin.src.utilities.utilities_system import SupportedToolingsSystem
+
+from provisioner_shared.components.runtime.cli.menu_format import CustomGroup
+
+ProvisionerDaemonLogPath = os.path.expanduser("~/.cache/provisioner/daemon.log")
+DAEMON_START_TIMEOUT_SEC = 10
+
+
+def register_daemon_commands(cli_group: click.Group):
+
+    @cli_group.group(invoke_without_command=True, no_args_is_help=True, cls=CustomGroup)
+    @click.pass_context
+    def daemon(ctx: click.Context):
+        """
+        Keep provisioner loaded in the background so repeated commands start instantly
+
+        \b
+        Run commands through the daemon with the thin client, it runs them regularly when no daemon is up:
+          python -m provisioner_installers_plugin.src.daemon.client install cli helm
+        """
+        if ctx.invoked_subcommand is None:
+            click.echo(ctx.get_help())
+
+    @daemon.command()
+    @click.option(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT_MINUTES,
+        show_default=True,
+        help="Minutes without commands before the daemon exits, 0 keeps it running",
+        envvar="PROV_DAEMON_IDLE_TIMEOUT",
+    )
+    @click.option("--foreground", is_flag=True, help="Serve from this process instead of a background one")
+    def start(idle_timeout: float, foreground: bool):
+        """
+        Start the daemon, restart it after upgrading plugins or editing their config
+        """
+        socket_path = daemon_socket_path()
+        status = request_control(REQUEST_STATUS, socket_path)
+        if status is not None:
+            click.echo(f"Provisioner daemon is already running. pid: {status['pid']}")
+            return
+        warm_daemon = WarmDaemon(
+            # Every plugin is registered on the root menu by the time a command runs
+            root_menu=click.get_current_context().find_root().command,
+            socket_path=socket_path,
+            idle_timeout_minutes=idle_timeout,
+            warm_up_fns=[
+                lambda: len(SupportedToolingsCli),
+                lambda: len(SupportedToolingsK8s),
+                lambda: len(SupportedToolingsSystem),
+            ],
+        )
+        if foreground:
+            click.echo(f"Provisioner daemon listening on {socket_path}")
+            warm_daemon.serve_forever()
+            return
+        if daemonize(ProvisionerDaemonLogPath):
+            try:
+                warm_daemon.serve_forever()
+            finally:
+                os._exit(0)
+        if not wait_for_daemon(socket_path, DAEMON_START_TIMEOUT_SEC):
+            raise click.ClickException(f"Provisioner daemon did not start, see {ProvisionerDaemonLogPath}")
+        click.echo(f"Provisioner daemon started. socket: {socket_path}")
+
+    @daemon.command()
+    def stop():
+        """
+        Stop the daemon once running commands complete
+        """
+        response = request_control(REQUEST_STOP)
+        click.echo("Provisioner daemon is not running" if response is None else "Provisioner daemon stopped")
+
+    @daemon.command()
+    def status():
+        """
+        Print the daemon process, uptime and number of commands served
+        """
+        response = request_control(REQUEST_STATUS)
+        if response is None:
+            click.echo("Provisioner daemon is not running")
+            return
+        click.echo(
+            f"Provisioner daemon is running. pid: {response['pid']}, uptime: {response['uptime_sec']}s, "
+            + f"served: {response['served']}, running: {response['running']}, socket: {response['socket']}"
+        )
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+# Thin client of the warm daemon, only the standard library is imported to keep its own startup minimal.
+# To run a provisioner command through the daemon:
+#   python -m provisioner_installers_plugin.src.daemon.client install cli helm
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+from typing import Any, Dict, List, Optional
+
+PROVISIONER_EXECUTABLE = "provisioner"
+DAEMON_SOCKET_ENV_VAR = "PROV_DAEMON_SOCKET"
+# Requests carry the client stdin, stdout and stderr so commands read and write the client terminal directly
+FORWARDED_FDS = [0, 1, 2]
+HEADER_FORMAT = "!I"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+REQUEST_RUN = "run"
+REQUEST_STATUS = "status"
+REQUEST_STOP = "stop"
+
+
+def daemon_socket_path() -> str:
+    if os.getenv(DAEMON_SOCKET_ENV_VAR):
+        return os.environ[DAEMON_SOCKET_ENV_VAR]
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR") or os.path.expanduser("~/.cache/provisioner")
+    return os.path.join(runtime_dir, "provisioner-daemon.sock")
+
+
+def connect(socket_path: str) -> Optional[socket.socket]:
+    """Connected socket of a running daemon, None when no daemon listens on the path"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        return sock
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+
+
+def send_request(sock: socket.socket, request: Dict[str, Any], fds: Optional[List[int]] = None) -> None:
+    payload = json.dumps(request).encode("utf-8")
+    header = struct.pack(HEADER_FORMAT, len(payload))
+    if fds:
+        socket.send_fds(sock, [header], fds)
+    else:
+        sock.sendall(header)
+    sock.sendall(payload)
+
+
+def read_responses(sock: socket.socket):
+    """Newline delimited JSON responses until the daemon closes the connection"""
+    with sock.makefile("r", encoding="utf-8") as responses:
+        for line in responses:
+            if line.strip():
+                yield json.loads(line)
+
+
+def request_control(request_type: str, socket_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Status or stop request, None when no daemon is running"""
+    sock = connect(socket_path or daemon_socket_path())
+    if sock is None:
+        return None
+    try:
+        send_request(sock, {"type": request_type})
+        return next(read_responses(sock), None)
+    finally:
+        sock.close()
+
+
+def run_on_daemon(argv: List[str], socket_path: Optional[str] = None, fds: Optional[List[int]] = None) -> Optional[int]:
+    """
+    Run a provisioner command on the warm daemon and return its exit code, the command reads and writes
+    the given stdin, stdout and stderr file descriptors, this process ones by default.
+    Returns None when no daemon is running, the caller runs the command on a new interpreter instead.
+    """
+    sock = connect(socket_path or daemon_socket_path())
+    if sock is None:
+        return None
+    worker_pid = None
+
+    def forward_signal(signum, _frame) -> None:
+        # The terminal signals this process, the command runs on a daemon worker
+        if worker_pid:
+            os.kill(worker_pid, signum)
+
+    previous_handlers = {sig: signal.signal(sig, forward_signal) for sig in [signal.SIGINT, signal.SIGTERM]}
+    try:
+        send_request(
+            sock,
+            {"type": REQUEST_RUN, "argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)},
+            fds=fds if fds else FORWARDED_FDS,
+        )
+        for response in read_responses(sock):
+            if "pid" in response:
+                worker_pid = response["pid"]
+            if "exit_code" in response:
+                return response["exit_code"]
+        print("Provisioner daemon closed the connection before the command completed", file=sys.stderr)
+        return 1
+    finally:
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+        sock.close()
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    exit_code = run_on_daemon(argv)
+    if exit_code is None:
+        # No daemon is running, fall back to a regular invocation
+        os.execvp(PROVISIONER_EXECUTABLE, [PROVISIONER_EXECUTABLE] + argv)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
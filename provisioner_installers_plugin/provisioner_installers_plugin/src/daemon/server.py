@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import select
+import socket
+import struct
+import sys
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import click
+from loguru import logger
+from provisioner_installers_plugin.src.daemon.client import (
+    FORWARDED_FDS,
+    HEADER_FORMAT,
+    HEADER_SIZE,
+    REQUEST_RUN,
+    REQUEST_STATUS,
+    REQUEST_STOP,
+    connect,
+)
+
+DEFAULT_IDLE_TIMEOUT_MINUTES = 30
+PROG_NAME = "provisioner"
+# Seconds between checks for finished workers and the idle timeout
+POLL_INTERVAL_SEC = 1.0
+LISTEN_BACKLOG = 16
+
+
+class WarmDaemon:
+    """
+    Keeps a fully loaded provisioner (plugins, parsed configs and the click command tree) in memory
+    and serves commands over a Unix socket. Every command runs on a worker forked from the warm process,
+    workers skip the interpreter and plugin startup while each command still gets a process of its own:
+    the client stdin/stdout/stderr, working directory and environment, and no state leaking to the next one.
+    """
+
+    _root_menu: click.Group
+    _socket_path: str
+    _idle_timeout_sec: Optional[float]
+    _warm_up_fns: List[Callable[[], Any]]
+
+    def __init__(
+        self,
+        root_menu: click.Group,
+        socket_path: str,
+        idle_timeout_minutes: Optional[float] = DEFAULT_IDLE_TIMEOUT_MINUTES,
+        warm_up_fns: Optional[List[Callable[[], Any]]] = None,
+    ) -> None:
+        self._root_menu = root_menu
+        self._socket_path = socket_path
+        self._idle_timeout_sec = idle_timeout_minutes * 60 if idle_timeout_minutes else None
+        self._warm_up_fns = warm_up_fns if warm_up_fns else []
+        self._workers: Set[int] = set()
+        self._served = 0
+        self._started_at = time.time()
+        self._last_activity = time.monotonic()
+        self._stopping = False
+
+    def serve_forever(self) -> None:
+        for warm_up_fn in self._warm_up_fns:
+            warm_up_fn()
+        listener = self._bind()
+        logger.debug(f"Provisioner daemon listening. socket: {self._socket_path}, pid: {os.getpid()}")
+        try:
+            while not self._stopping:
+                readable, _, _ = select.select([listener], [], [], POLL_INTERVAL_SEC)
+                self._reap_workers()
+                if readable:
+                    conn, _ = listener.accept()
+                    self._last_activity = time.monotonic()
+                    self._handle_connection(listener, conn)
+                elif self._is_idle():
+                    logger.debug(f"Provisioner daemon idle, exiting. served: {self._served}")
+                    break
+        finally:
+            listener.close()
+            if os.path.exists(self._socket_path):
+                os.remove(self._socket_path)
+            self._wait_for_workers()
+
+    def _bind(self) -> socket.socket:
+        socket_dir = os.path.dirname(os.path.abspath(self._socket_path))
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        if os.path.exists(self._socket_path):
+            existing = connect(self._socket_path)
+            if existing is not None:
+                existing.close()
+                raise click.ClickException(f"Provisioner daemon is already running. socket: {self._socket_path}")
+            # Left behind by a daemon which did not exit cleanly
+            os.remove(self._socket_path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Requests run commands as this user, only this user may connect
+        previous_umask = os.umask(0o177)
+        try:
+            listener.bind(self._socket_path)
+        finally:
+            os.umask(previous_umask)
+        listener.listen(LISTEN_BACKLOG)
+        return listener
+
+    def _is_idle(self) -> bool:
+        if self._idle_timeout_sec is None or self._workers:
+            return False
+        return time.monotonic() - self._last_activity > self._idle_timeout_sec
+
+    def _reap_workers(self) -> None:
+        for pid in list(self._workers):
+            finished_pid, _ = os.waitpid(pid, os.WNOHANG)
+            if finished_pid:
+                self._workers.discard(pid)
+                self._last_activity = time.monotonic()
+
+    def _wait_for_workers(self) -> None:
+        # New commands can no longer reach the daemon, the running ones complete before it exits
+        if self._workers:
+            logger.debug(f"Provisioner daemon waiting for running commands. running: {len(self._workers)}")
+        for pid in list(self._workers):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+            self._workers.discard(pid)
+
+    def _handle_connection(self, listener: socket.socket, conn: socket.socket) -> None:
+        fds: List[int] = []
+        try:
+            if not self._is_same_user(conn):
+                logger.warning("Rejected a provisioner daemon connection of another user")
+                return
+            request, fds = self._read_request(conn)
+            request_type = request.get("type")
+            if request_type == REQUEST_RUN and len(fds) == len(FORWARDED_FDS):
+                self._fork_worker(listener, conn, request, fds)
+            elif request_type == REQUEST_STATUS:
+                self._respond(conn, self.status())
+            elif request_type == REQUEST_STOP:
+                self._stopping = True
+                self._respond(conn, {"stopping": True, "pid": os.getpid()})
+            else:
+                self._respond(conn, {"error": f"Unsupported request. type: {request_type}"})
+        except (OSError, ValueError) as ex:
+            logger.warning(f"Failed to handle a provisioner daemon request. error: {ex}")
+        finally:
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "socket": self._socket_path,
+            "uptime_sec": round(time.time() - self._started_at),
+            "served": self._served,
+            "running": len(self._workers),
+        }
+
+    def _is_same_user(self, conn: socket.socket) -> bool:
+        if not hasattr(socket, "SO_PEERCRED"):
+            # The socket file is accessible to its owner only
+            return True
+        credentials = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", credentials)
+        return uid == os.getuid()
+
+    def _read_request(self, conn: socket.socket):
+        header, fds, _, _ = socket.recv_fds(conn, HEADER_SIZE, len(FORWARDED_FDS))
+        if len(header) != HEADER_SIZE:
+            raise ValueError("Truncated request header")
+        (payload_size,) = struct.unpack(HEADER_FORMAT, header)
+        payload = b""
+        while len(payload) < payload_size:
+            chunk = conn.recv(payload_size - len(payload))
+            if not chunk:
+                raise ValueError("Truncated request payload")
+            payload += chunk
+        return json.loads(payload), fds
+
+    def _respond(self, conn: socket.socket, response: Dict[str, Any]) -> None:
+        conn.sendall((json.dumps(response) + "\n").encode("utf-8"))
+
+    def _fork_worker(
+        self, listener: socket.socket, conn: socket.socket, request: Dict[str, Any], fds: List[int]
+    ) -> None:
+        pid = os.fork()
+        if pid:
+            self._workers.add(pid)
+            self._served += 1
+            return
+        # Worker, never returns to the serving loop
+        exit_code = 1
+        try:
+            listener.close()
+            self._respond(conn, {"pid": os.getpid()})
+            self._attach_client(request, fds)
+            exit_code = self._invoke(request.get("argv", []))
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                self._respond(conn, {"exit_code": exit_code})
+            finally:
+                os._exit(exit_code)
+
+    def _attach_client(self, request: Dict[str, Any], fds: List[int]) -> None:
+        for target_fd, client_fd in zip(FORWARDED_FDS, fds):
+            os.dup2(client_fd, target_fd)
+            os.close(client_fd)
+        fds.clear()
+        # Streams are re-created so buffering and TTY detection follow the client terminal
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", buffering=1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+        os.chdir(request.get("cwd", os.getcwd()))
+        os.environ.clear()
+        os.environ.update(request.get("env", {}))
+
+    def _invoke(self, argv: List[str]) -> int:
+        try:
+            self._root_menu.main(args=argv, prog_name=PROG_NAME, standalone_mode=True)
+        except SystemExit as ex:
+            if ex.code is None:
+                return 0
+            return ex.code if isinstance(ex.code, int) else 1
+        return 0
+
+
+def wait_for_daemon(socket_path: str, timeout_sec: float) -> bool:
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
+        sock = connect(socket_path)
+        if sock is not None:
+            sock.close()
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def daemonize(log_path: str) -> bool:
+    """Detach into a background process, returns True in the background process and False in the caller"""
+    pid = os.fork()
+    if pid:
+        # The intermediate process exits as soon as the background one is forked
+        os.waitpid(pid, 0)
+        return False
+    os.setsid()
+    if os.fork():
+        os._exit(0)
+    os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+    with open(os.devnull, "r") as devnull:
+        os.dup2(devnull.fileno(), 0)
+    with open(log_path, "a") as log_file:
+        os.dup2(log_file.fileno(), 1)
+        os.dup2(log_file.fileno(), 2)
+    return True
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import click
+from provisioner_installers_plugin.src.daemon.client import (
+    REQUEST_STATUS,
+    REQUEST_STOP,
+    request_control,
+    run_on_daemon,
+)
+from provisioner_installers_plugin.src.daemon.server import WarmDaemon, wait_for_daemon
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/daemon/server_test.py
+#
+
+DAEMON_START_TIMEOUT_SEC = 5
+
+
+def create_fake_root_menu(warm_state: dict) -> click.Group:
+    @click.group()
+    def root_menu():
+        pass
+
+    @root_menu.command()
+    @click.argument("name")
+    def greet(name: str):
+        click.echo(f"Hello {name} from {os.getcwd()} as {os.environ.get('PROV_TEST_USER')}")
+        click.echo(f"warm: {warm_state.get('loaded')}")
+
+    @root_menu.command()
+    def fail():
+        sys.exit(3)
+
+    @root_menu.command()
+    @click.argument("marker_path")
+    def slow(marker_path: str):
+        time.sleep(0.5)
+        with open(marker_path, "w") as marker:
+            marker.write("done")
+
+    return root_menu
+
+
+class WarmDaemonTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-daemon-test")
+        self.socket_path = os.path.join(self.work_dir, "daemon.sock")
+        warm_state = {}
+        self.daemon = WarmDaemon(
+            root_menu=create_fake_root_menu(warm_state),
+            socket_path=self.socket_path,
+            idle_timeout_minutes=None,
+            warm_up_fns=[lambda: warm_state.update(loaded=True)],
+        )
+        self.daemon_thread = threading.Thread(target=self.daemon.serve_forever, daemon=True)
+        self.daemon_thread.start()
+        self.assertTrue(wait_for_daemon(self.socket_path, DAEMON_START_TIMEOUT_SEC))
+
+    def tearDown(self) -> None:
+        request_control(REQUEST_STOP, self.socket_path)
+        self.daemon_thread.join(timeout=DAEMON_START_TIMEOUT_SEC)
+        shutil.rmtree(self.work_dir)
+
+    def run_captured(self, argv) -> tuple:
+        output_path = os.path.join(self.work_dir, "output.txt")
+        with open(os.devnull, "r") as stdin, open(output_path, "w") as output:
+            exit_code = run_on_daemon(
+                argv, socket_path=self.socket_path, fds=[stdin.fileno(), output.fileno(), output.fileno()]
+            )
+        with open(output_path) as output:
+            return exit_code, output.read()
+
+    def test_run_commands_on_warm_worker_with_client_cwd_and_env(self) -> None:
+        os.environ["PROV_TEST_USER"] = "tester"
+        try:
+            exit_code, output = self.run_captured(["greet", "pi"])
+        finally:
+            del os.environ["PROV_TEST_USER"]
+        self.assertEqual(exit_code, 0)
+        self.assertIn(f"Hello pi from {os.getcwd()} as tester", output)
+        self.assertIn("warm: True", output)
+
+    def test_return_command_exit_code(self) -> None:
+        self.assertEqual(self.run_captured(["fail"])[0], 3)
+        exit_code, output = self.run_captured(["unknown-command"])
+        self.assertEqual(exit_code, 2)
+        self.assertIn("No such command", output)
+
+    def test_report_status_and_stop(self) -> None:
+        self.run_captured(["greet", "pi"])
+        status = request_control(REQUEST_STATUS, self.socket_path)
+        self.assertEqual((status["pid"], status["served"]), (os.getpid(), 1))
+
+        request_control(REQUEST_STOP, self.socket_path)
+        self.daemon_thread.join(timeout=DAEMON_START_TIMEOUT_SEC)
+        self.assertFalse(os.path.exists(self.socket_path))
+        self.assertIsNone(run_on_daemon(["greet", "pi"], socket_path=self.socket_path))
+
+    def test_stop_once_running_commands_complete(self) -> None:
+        marker_path = os.path.join(self.work_dir, "slow.done")
+        completed_before_stop = []
+
+        def stop_while_running() -> None:
+            deadline = time.monotonic() + DAEMON_START_TIMEOUT_SEC
+            while request_control(REQUEST_STATUS, self.socket_path)["running"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            request_control(REQUEST_STOP, self.socket_path)
+            self.daemon_thread.join(timeout=DAEMON_START_TIMEOUT_SEC)
+            completed_before_stop.append(os.path.exists(marker_path))
+
+        # Signal handlers of the client can only be installed by the main thread
+        stop_thread = threading.Thread(target=stop_while_running, daemon=True)
+        stop_thread.start()
+        self.assertEqual(self.run_captured(["slow", marker_path])[0], 0)
+        stop_thread.join(timeout=DAEMON_START_TIMEOUT_SEC)
+
+        self.assertEqual(completed_before_stop, [True])
+        self.assertEqual(self.daemon.status()["running"], 0)
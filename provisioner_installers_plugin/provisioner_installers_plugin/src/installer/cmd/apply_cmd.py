@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import os
+from typing import Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.domain.command import InstallerSubCommandName
+from provisioner_installers_plugin.src.installer.domain.lockfile import ToolsetLockfile, default_lockfile_path
+from provisioner_installers_plugin.src.installer.domain.manifest import ToolsetManifest
+from provisioner_installers_plugin.src.installer.runner.installer_runner import (
+    InstallerEnv,
+    UtilityInstallerRunnerCmdArgs,
+)
+from provisioner_installers_plugin.src.installer.runner.toolset_runner import (
+    DEFAULT_TOOLSET_MAX_WORKERS,
+    ToolsetApplyRunner,
+    ToolsetApplyRunnerArgs,
+)
+from provisioner_installers_plugin.src.utilities.utilities_cli import SupportedToolingsCli
+
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+
+class ToolsetApplyCmdArgs:
+
+    def __init__(
+        self,
+        manifest_path: str,
+        lockfile_path: Optional[str] = None,
+        prune: bool = False,
+        max_workers: int = DEFAULT_TOOLSET_MAX_WORKERS,
+        git_access_token: str = None,
+    ) -> None:
+
+        self.manifest_path = manifest_path
+        self.lockfile_path = lockfile_path
+        self.prune = prune
+        self.max_workers = max_workers
+        if git_access_token:
+            self.git_access_token = git_access_token
+        else:
+            self.git_access_token = os.getenv("GITHUB_TOKEN", default="")
+
+    def print(self) -> None:
+        logger.debug(
+            "ToolsetApplyCmdArgs: \n"
+            + f"  manifest_path: {self.manifest_path}\n"
+            + f"  lockfile_path: {self.lockfile_path}\n"
+            + f"  prune: {str(self.prune)}\n"
+            + f"  max_workers: {str(self.max_workers)}\n"
+            + "  git_access_token: REDACTED\n"
+        )
+
+
+class ToolsetApplyCmd:
+    def run(self, ctx: Context, args: ToolsetApplyCmdArgs) -> bool:
+        logger.debug("Inside ToolsetApplyCmd run()")
+        args.print()
+        manifest = ToolsetManifest.from_file(args.manifest_path)
+        lockfile = load_toolset_lockfile(args.manifest_path, args.lockfile_path)
+        changes = ToolsetApplyRunner.run(
+            env=InstallerEnv(
+                ctx=ctx,
+                collaborators=CoreCollaborators(ctx),
+                supported_utilities=SupportedToolingsCli,
+                args=UtilityInstallerRunnerCmdArgs(
+                    utilities=manifest.tools,
+                    remote_opts=None,
+                    sub_command_name=InstallerSubCommandName.CLI,
+                    git_access_token=args.git_access_token,
+                    force=True,
+                ),
+                lockfile=lockfile,
+            ),
+            args=ToolsetApplyRunnerArgs(prune=args.prune, max_workers=args.max_workers),
+        )
+        return changes is not None
+
+
+def load_toolset_lockfile(manifest_path: str, lockfile_path: Optional[str] = None) -> Optional[ToolsetLockfile]:
+    """An explicit lockfile must exist, the default one next to the manifest is used when present"""
+    if lockfile_path:
+        return ToolsetLockfile.from_file(lockfile_path)
+    default_path = default_lockfile_path(manifest_path)
+    if os.path.exists(default_path):
+        logger.debug(f"Using toolset lockfile. path: {default_path}")
+        return ToolsetLockfile.from_file(default_path)
+    return None
@@ -31,6 +31,7 @@ class UtilityInstallerCmdArgs:
         git_access_token: str = None,
         force: bool = False,
         uninstall: bool = False,
+        max_concurrent_downloads: int = 1,
     ) -> None:
 
         self.utils_to_install = utils_to_install
@@ -38,6 +39,7 @@ class UtilityInstallerCmdArgs:
         self.sub_command_name = sub_command_name
         self.force = force
         self.uninstall = uninstall
+        self.max_concurrent_downloads = max_concurrent_downloads
         if git_access_token:
             self.git_access_token = git_access_token
         else:
@@ -52,6 +54,7 @@ class UtilityInstallerCmdArgs:
             + f"  sub_command_name: {str(self.sub_command_name.value)}\n"
             + f"  force: {str(self.force)}\n"
             + f"  uninstall: {str(self.uninstall)}\n"
+            + f"  max_concurrent_downloads: {str(self.max_concurrent_downloads)}\n"
             + "  git_access_token: REDACTED\n"
         )
 
@@ -73,6 +76,7 @@ class UtilityInstallerCmd:
                     git_access_token=args.git_access_token,
                     force=args.force,
                     uninstall=args.uninstall,
+                    max_concurrent_downloads=args.max_concurrent_downloads,
                 ),
             )
         )
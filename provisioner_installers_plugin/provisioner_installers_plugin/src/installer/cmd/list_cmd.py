@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
+from typing import Optional
+
 from loguru import logger
+from provisioner_installers_plugin.src.installer.state.installed_state import InstalledStateRegistry
 from provisioner_installers_plugin.src.utilities.utilities_cli import SupportedToolingsCli
 
 from provisioner_shared.components.runtime.infra.context import Context
@@ -8,14 +11,23 @@ from provisioner_shared.components.runtime.shared.collaborators import CoreColla
 
 
 class UtilityListCmd:
-    def run(self, ctx: Context) -> None:
+    def run(self, ctx: Context, installed_registry: InstalledStateRegistry = None, query: Optional[str] = None) -> None:
         logger.debug("Inside UtilityListCmd run()")
         collaborators = CoreCollaborators(ctx)
-
-        # Convert to list and sort by display_name
-        sorted_utilities = sorted(
-            SupportedToolingsCli.values(), key=lambda x: x.display_name.lower()  # Case-insensitive sorting
-        )
+        installed = (installed_registry or InstalledStateRegistry()).all()
+
+        if query:
+            # Ordered by relevance, prefix matches first
+            sorted_utilities = [SupportedToolingsCli.describe(name) for name in SupportedToolingsCli.search(query)]
+            if not sorted_utilities:
+                collaborators.printer().print_fn(f"No utility matches '{query}'")
+                return
+        else:
+            # Catalog summaries are listed without building the utilities, sorted case-insensitively by name
+            sorted_utilities = sorted(
+                (SupportedToolingsCli.describe(name) for name in SupportedToolingsCli),
+                key=lambda x: x.display_name.lower(),
+            )
 
         # Find the maximum length of utility names for proper padding
         max_name_length = max(len(utility.display_name) for utility in sorted_utilities)
@@ -26,12 +38,19 @@ class UtilityListCmd:
         for utility in sorted_utilities:
             # Pad the display name to align all descriptions
             padded_name = utility.display_name.ljust(max_name_length)
-            utilities += f"{new_line}{padded_name}    {utility.description}"
+            installed_utility = installed.get(utility.binary_name)
+            if installed_utility:
+                utilities += (
+                    f"{new_line}{padded_name}    {utility.description} (installed: {installed_utility.version})"
+                )
+            else:
+                utilities += f"{new_line}{padded_name}    {utility.description}"
             new_line = "\n"
 
         help_info = ""
         help_info += 'Use "provisioner install cli <name>" to install any utility'
         help_info += '\nUse "provisioner install cli <name>@<ver>" to install specific version'
+        help_info += '\nUse "provisioner install cli --search <text>" to search utilities by name or description'
         help_info += '\n\nUse "-h" for help on any command'
         help_info += "\n\nExamples:\n"
         help_info += "  provisioner install cli helm\n"
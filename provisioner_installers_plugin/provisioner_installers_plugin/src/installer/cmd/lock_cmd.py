@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import os
+from typing import List, Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.domain.command import InstallerSubCommandName
+from provisioner_installers_plugin.src.installer.domain.lockfile import ToolsetLockfile, default_lockfile_path
+from provisioner_installers_plugin.src.installer.domain.manifest import ToolsetManifest
+from provisioner_installers_plugin.src.installer.runner.installer_runner import (
+    InstallerEnv,
+    UtilityInstallerRunnerCmdArgs,
+)
+from provisioner_installers_plugin.src.installer.runner.lock_runner import (
+    ToolsetLockRunner,
+    ToolsetLockRunnerArgs,
+    generate_lockfile_summary,
+)
+from provisioner_installers_plugin.src.installer.runner.toolset_runner import DEFAULT_TOOLSET_MAX_WORKERS
+from provisioner_installers_plugin.src.utilities.utilities_cli import SupportedToolingsCli
+
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+
+class ToolsetLockCmdArgs:
+
+    def __init__(
+        self,
+        manifest_path: str,
+        lockfile_path: Optional[str] = None,
+        os_arch_pairs: Optional[List[str]] = None,
+        upgrade: bool = False,
+        max_workers: int = DEFAULT_TOOLSET_MAX_WORKERS,
+        git_access_token: str = None,
+    ) -> None:
+
+        self.manifest_path = manifest_path
+        self.lockfile_path = lockfile_path if lockfile_path else default_lockfile_path(manifest_path)
+        self.os_arch_pairs = os_arch_pairs
+        self.upgrade = upgrade
+        self.max_workers = max_workers
+        if git_access_token:
+            self.git_access_token = git_access_token
+        else:
+            self.git_access_token = os.getenv("GITHUB_TOKEN", default="")
+
+    def print(self) -> None:
+        logger.debug(
+            "ToolsetLockCmdArgs: \n"
+            + f"  manifest_path: {self.manifest_path}\n"
+            + f"  lockfile_path: {self.lockfile_path}\n"
+            + f"  os_arch_pairs: {str(self.os_arch_pairs)}\n"
+            + f"  upgrade: {str(self.upgrade)}\n"
+            + f"  max_workers: {str(self.max_workers)}\n"
+            + "  git_access_token: REDACTED\n"
+        )
+
+
+class ToolsetLockCmd:
+    def run(self, ctx: Context, args: ToolsetLockCmdArgs) -> bool:
+        logger.debug("Inside ToolsetLockCmd run()")
+        args.print()
+        manifest = ToolsetManifest.from_file(args.manifest_path)
+        previous_lockfile = (
+            ToolsetLockfile.from_file(args.lockfile_path) if os.path.exists(args.lockfile_path) else None
+        )
+        collaborators = CoreCollaborators(ctx)
+        lockfile = ToolsetLockRunner.run(
+            env=InstallerEnv(
+                ctx=ctx,
+                collaborators=collaborators,
+                supported_utilities=SupportedToolingsCli,
+                args=UtilityInstallerRunnerCmdArgs(
+                    utilities=manifest.tools,
+                    remote_opts=None,
+                    sub_command_name=InstallerSubCommandName.CLI,
+                    git_access_token=args.git_access_token,
+                ),
+            ),
+            args=ToolsetLockRunnerArgs(
+                os_arch_pairs=args.os_arch_pairs,
+                previous_lockfile=previous_lockfile,
+                upgrade=args.upgrade,
+                max_workers=args.max_workers,
+            ),
+        )
+        if not ctx.is_dry_run():
+            lockfile.to_file(args.lockfile_path)
+        collaborators.printer().print_with_rich_table_fn(generate_lockfile_summary(lockfile, args.lockfile_path))
+        return True
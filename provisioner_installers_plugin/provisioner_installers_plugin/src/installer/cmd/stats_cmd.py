@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import json
+import time
+from typing import List, Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.tracing.timing_history import (
+    DEFAULT_ETA_FORKS,
+    FleetEta,
+    OperationStats,
+    TimingHistory,
+)
+
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+OUTPUT_FORMAT_TABLE = "table"
+OUTPUT_FORMAT_JSON = "json"
+
+
+class TimingStatsCmdArgs:
+
+    def __init__(
+        self,
+        match: Optional[str] = None,
+        by_host: bool = False,
+        since_days: Optional[float] = None,
+        eta_operation: Optional[str] = None,
+        eta_hosts: Optional[List[str]] = None,
+        forks: int = DEFAULT_ETA_FORKS,
+        output_format: str = OUTPUT_FORMAT_TABLE,
+    ) -> None:
+
+        self.match = match
+        self.by_host = by_host
+        self.since_days = since_days
+        self.eta_operation = eta_operation
+        self.eta_hosts = eta_hosts if eta_hosts else []
+        self.forks = forks
+        self.output_format = output_format
+
+    def since(self) -> Optional[float]:
+        return time.time() - self.since_days * 24 * 60 * 60 if self.since_days else None
+
+    def print(self) -> None:
+        logger.debug(
+            "TimingStatsCmdArgs: \n"
+            + f"  match: {self.match}\n"
+            + f"  by_host: {self.by_host}\n"
+            + f"  since_days: {self.since_days}\n"
+            + f"  eta_operation: {self.eta_operation}\n"
+            + f"  eta_hosts: {self.eta_hosts}\n"
+            + f"  forks: {self.forks}\n"
+            + f"  output_format: {self.output_format}\n"
+        )
+
+
+class TimingStatsCmd:
+    def run(self, ctx: Context, args: TimingStatsCmdArgs, history: Optional[TimingHistory] = None) -> None:
+        logger.debug("Inside TimingStatsCmd run()")
+        args.print()
+        printer = CoreCollaborators(ctx).printer()
+        history = history or TimingHistory()
+
+        if args.eta_operation:
+            eta = history.estimate_fleet_eta(args.eta_operation, args.eta_hosts, args.forks, since=args.since())
+            if eta is None:
+                printer.print_fn(f"No successful '{args.eta_operation}' runs recorded yet, nothing to estimate from")
+            elif args.output_format == OUTPUT_FORMAT_JSON:
+                print(json.dumps(eta.to_dict(), indent=2))
+            else:
+                printer.print_with_rich_table_fn(generate_fleet_eta(eta))
+            return
+
+        stats = history.stats(match=args.match, since=args.since(), by_host=args.by_host)
+        if args.output_format == OUTPUT_FORMAT_JSON:
+            print(json.dumps([operation_stats.to_dict() for operation_stats in stats], indent=2))
+        elif not stats:
+            printer.print_fn("No timings recorded yet, every provisioner command records its step durations")
+        else:
+            printer.print_with_rich_table_fn(generate_timing_stats(stats))
+
+
+def format_duration(duration_ms: Optional[float]) -> str:
+    if duration_ms is None:
+        return "-"
+    if duration_ms < 1000:
+        return f"{duration_ms:.0f}ms"
+    if duration_ms < 60_000:
+        return f"{duration_ms / 1000:.1f}s"
+    minutes, seconds = divmod(round(duration_ms / 1000), 60)
+    return f"{minutes}m{seconds:02d}s"
+
+
+def format_bytes(count: Optional[int]) -> str:
+    if count is None:
+        return ""
+    for unit in ["B", "KB", "MB"]:
+        if count < 1024:
+            return f"{count}{unit}"
+        count //= 1024
+    return f"{count}GB"
+
+
+def generate_timing_stats(stats: List[OperationStats]) -> str:
+    names = [f"{item.operation} @ {item.host}" if item.host else item.operation for item in stats]
+    name_width = max(len(name) for name in names)
+    lines = [
+        f"  {'operation'.ljust(name_width)}  {'runs':>5}  {'failed':>6}  {'p50':>7}  {'p90':>7}  {'p99':>7}  avg size"
+    ]
+    for name, item in zip(names, stats):
+        failed = f"[red]{item.failures:>6}[/red]" if item.failures else f"{item.failures:>6}"
+        lines.append(
+            f"  {name.ljust(name_width)}  {item.runs:>5}  {failed}  {format_duration(item.p50_ms):>7}  "
+            + f"{format_duration(item.p90_ms):>7}  {format_duration(item.p99_ms):>7}  {format_bytes(item.avg_bytes)}"
+        )
+    return f"""
+[green]Timing Statistics[/green]
+
+{chr(10).join(lines)}
+"""
+
+
+def generate_fleet_eta(eta: FleetEta) -> str:
+    lines = [
+        (
+            f"  [green]{host.host}[/green]: {format_duration(host.estimate_ms)}"
+            if host.from_history
+            else f"  [yellow]{host.host}[/yellow]: {format_duration(host.estimate_ms)} (no history, fleet median)"
+        )
+        for host in eta.hosts
+    ]
+    title = f"Estimated '{eta.operation}' on {len(eta.hosts)} hosts, {eta.forks} at a time"
+    return f"""
+[green]{title}: {format_duration(eta.total_ms)}[/green]
+
+{chr(10).join(lines)}
+"""
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+LOCKFILE_FORMAT_VERSION = 1
+LOCKFILE_SUFFIX = ".lock"
+
+
+def default_lockfile_path(manifest_path: str) -> str:
+    """tools.yaml is locked by tools.lock next to it"""
+    return f"{os.path.splitext(manifest_path)[0]}{LOCKFILE_SUFFIX}"
+
+
+class LockedAsset:
+
+    os_arch: str
+    name: str
+    url: str
+    digest: Optional[str]
+
+    def __init__(self, os_arch: str, name: str, url: str, digest: Optional[str] = None) -> None:
+        self.os_arch = os_arch
+        self.name = name
+        self.url = url
+        self.digest = digest
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "url": self.url, "sha256": self.digest}
+
+    @staticmethod
+    def from_dict(os_arch: str, values: Dict[str, Any]) -> "LockedAsset":
+        return LockedAsset(os_arch=os_arch, name=values["name"], url=values["url"], digest=values.get("sha256"))
+
+
+class LockedUtility:
+
+    name: str
+    version: str
+    assets: Dict[str, LockedAsset]
+
+    def __init__(self, name: str, version: str, assets: Optional[Dict[str, LockedAsset]] = None) -> None:
+        self.name = name
+        self.version = version
+        self.assets = assets if assets is not None else {}
+
+    def get_asset(self, os_arch_pair: str) -> Optional[LockedAsset]:
+        return self.assets.get(os_arch_pair)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "assets": {os_arch: self.assets[os_arch].to_dict() for os_arch in sorted(self.assets)},
+        }
+
+    @staticmethod
+    def from_dict(name: str, values: Dict[str, Any]) -> "LockedUtility":
+        return LockedUtility(
+            name=name,
+            version=values["version"],
+            assets={
+                os_arch: LockedAsset.from_dict(os_arch, asset) for os_arch, asset in values.get("assets", {}).items()
+            },
+        )
+
+
+class ToolsetLockfile:
+    """
+    Exact resolution of a toolset manifest: the version each utility resolved to and, for GitHub released
+    utilities, the release asset name, download URL and SHA-256 digest per supported OS/Arch.
+    Installing from a lockfile needs neither the GitHub API nor the release name resolvers.
+    """
+
+    utilities: Dict[str, LockedUtility]
+
+    def __init__(self, utilities: Optional[Dict[str, LockedUtility]] = None) -> None:
+        self.utilities = utilities if utilities is not None else {}
+
+    def get(self, name: str) -> Optional[LockedUtility]:
+        return self.utilities.get(name)
+
+    def names(self) -> List[str]:
+        return sorted(self.utilities)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": LOCKFILE_FORMAT_VERSION,
+            "utilities": {name: self.utilities[name].to_dict() for name in sorted(self.utilities)},
+        }
+
+    @staticmethod
+    def from_dict(content: Any) -> "ToolsetLockfile":
+        if not isinstance(content, dict) or not isinstance(content.get("utilities"), dict):
+            raise ValueError("Toolset lockfile must contain a 'utilities' mapping")
+        if content.get("version") != LOCKFILE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported toolset lockfile version. version: {content.get('version')}")
+        return ToolsetLockfile(
+            {name: LockedUtility.from_dict(name, values) for name, values in content["utilities"].items()}
+        )
+
+    @staticmethod
+    def from_file(path: str) -> "ToolsetLockfile":
+        with open(path, "r") as lock_file:
+            return ToolsetLockfile.from_dict(json.load(lock_file))
+
+    def to_file(self, path: str) -> None:
+        lock_dir = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(prefix=".lock-", dir=lock_dir)
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump(self.to_dict(), temp_file, indent=2)
+                temp_file.write("\n")
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+from typing import Any, List
+
+import yaml
+from provisioner_installers_plugin.src.installer.domain.dynamic_args import DynamicArgs
+from provisioner_installers_plugin.src.installer.domain.version import NameVersionArgsTuple
+
+
+class ToolsetManifest:
+    """
+    Declarative list of the utilities a host should have, e.g.
+
+      tools:
+        helm: v3.14.0
+        kubectl: latest
+        k9s:
+
+    A missing version means the latest release.
+    """
+
+    tools: List[NameVersionArgsTuple]
+
+    def __init__(self, tools: List[NameVersionArgsTuple]) -> None:
+        self.tools = tools
+
+    def names(self) -> List[str]:
+        return [tool.name for tool in self.tools]
+
+    @staticmethod
+    def from_dict(content: Any) -> "ToolsetManifest":
+        if not isinstance(content, dict) or not isinstance(content.get("tools"), dict):
+            raise ValueError("Toolset manifest must contain a 'tools' mapping of utility name to version")
+        tools: List[NameVersionArgsTuple] = []
+        for name, version in content["tools"].items():
+            if isinstance(version, float):
+                raise ValueError(f"Quote numeric versions in the toolset manifest, YAML reads {version} as a number")
+            if version is not None and not isinstance(version, (str, int)):
+                raise ValueError(f"Invalid version in toolset manifest. name: {name}, version: {version}")
+            tools.append(
+                NameVersionArgsTuple(
+                    name=str(name),
+                    version=str(version) if version is not None else "latest",
+                    maybe_args=DynamicArgs({}),
+                )
+            )
+        return ToolsetManifest(tools)
+
+    @staticmethod
+    def from_file(path: str) -> "ToolsetManifest":
+        with open(path, "r") as manifest_file:
+            return ToolsetManifest.from_dict(yaml.safe_load(manifest_file))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+from typing import List
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.remote.runtime_bundle import RuntimeBundle, build_runtime_bundle
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import get_tracer
+
+from provisioner_shared.components.remote.ansible.remote_provisioner_runner import RemoteProvisionerRunnerArgs
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsiblePlaybook
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+REMOTE_RUNTIME_ENV_VAR = "PROV_REMOTE_RUNTIME"
+# Falls back to the provisioner wrapper role which installs provisioner and the plugins using pip on every run
+REMOTE_RUNTIME_PIP = "pip"
+# Every run refreshes the bundle it uses, bundles no run used for this many days are removed from the target
+REMOTE_BUNDLE_RETENTION_DAYS = 14
+
+# Bundles are unpacked once per content hash, compiled once on the target and run directly afterwards.
+# The virtual env holding the third party requirements is created once per requirements hash.
+ANSIBLE_PLAYBOOK_REMOTE_BUNDLE_RUNNER = """
+---
+- name: Provisioner runtime bundle run command
+  hosts: selected_hosts
+  gather_facts: no
+  {modifiers}
+
+  vars:
+    # Expanded by the remote shell and by the path arguments of the file modules
+    bundles_path: "$HOME/.provisioner/bundles"
+    python_version: "3.11"
+    bundle_path: "{{{{ bundles_path }}}}/{{{{ bundle_hash }}}}"
+    venv_path: "{{{{ bundles_path }}}}/venvs/{{{{ requirements_hash }}}}"
+
+  tasks:
+    - name: Check for the runtime bundle on the remote host
+      stat:
+        path: "{{{{ bundle_path }}}}/.ready"
+      register: bundle_ready
+      tags: ['provisioner_bundle']
+
+    - name: Install the runtime bundle on the remote host
+      when: not bundle_ready.stat.exists
+      tags: ['provisioner_bundle']
+      block:
+        - name: Create the runtime bundle folder
+          file:
+            path: "{{{{ bundle_path }}}}"
+            state: directory
+            mode: '0755'
+
+        - name: Upload and unpack the runtime bundle
+          unarchive:
+            src: "{{{{ bundle_archive_path }}}}"
+            dest: "{{{{ bundle_path }}}}"
+
+        - name: Prepare the runtime bundle virtual env and bytecode
+          shell: |
+            set -e
+            python_bin=$(command -v python{{{{ python_version }}}} || command -v python3)
+            if [ ! -f "{{{{ venv_path }}}}/.ready" ]; then
+              rm -rf "{{{{ venv_path }}}}"
+              "$python_bin" -m venv "{{{{ venv_path }}}}"
+              "{{{{ venv_path }}}}/bin/python" -m pip install --quiet --disable-pip-version-check \\
+                -r "{{{{ bundle_path }}}}/requirements.txt"
+              touch "{{{{ venv_path }}}}/.ready"
+            fi
+            "{{{{ venv_path }}}}/bin/python" -m compileall -q "{{{{ bundle_path }}}}"
+            touch "{{{{ bundle_path }}}}/.ready"
+            # Other controllers may still run older bundles, only bundles unused for the retention period are removed
+            find "{{{{ bundles_path }}}}" -mindepth 2 -maxdepth 2 -name .ready ! -path "*/venvs/*" \\
+              -mtime +{{{{ bundle_retention_days }}}} | while read -r ready; do rm -rf "$(dirname "$ready")"; done
+
+    - name: Mark the runtime bundle as in use
+      when: bundle_ready.stat.exists
+      shell: 'touch "{{{{ bundle_path }}}}/.ready"'
+      changed_when: False
+      tags: ['provisioner_bundle']
+
+    - name: Run the provisioner command from the runtime bundle
+      shell: '"{{{{ venv_path }}}}/bin/python" "{{{{ bundle_path }}}}" {{{{ provisioner_command }}}}'
+      register: bundle_run
+      changed_when: False
+      environment:
+        GITHUB_TOKEN: "{{{{ git_access_token | default('', true) }}}}"
+      tags: ['provisioner_bundle']
+
+    - debug: msg={{{{ bundle_run.stdout }}}}
+      tags: ['provisioner_bundle']
+"""
+
+
+class RemoteBundleRunner:
+    """
+    Runs provisioner commands remotely from a prebuilt runtime bundle (see runtime_bundle.py) instead of
+    installing provisioner and the required plugins on every run. The bundle is uploaded only when the
+    remote host does not hold one with the same content hash, later runs start the command right away.
+    """
+
+    def run(self, ctx: Context, args: RemoteProvisionerRunnerArgs, collaborators: CoreCollaborators) -> str:
+        logger.debug(f"Running provisioner command remotely from a runtime bundle: {args.provisioner_command}")
+        with get_tracer().span("build runtime bundle"):
+            bundle = build_runtime_bundle(args.required_plugins)
+        return collaborators.ansible_runner().run_fn(
+            selected_hosts=args.ssh_connection_info.ansible_hosts,
+            playbook=AnsiblePlaybook(
+                name="provisioner_bundle",
+                content=ANSIBLE_PLAYBOOK_REMOTE_BUNDLE_RUNNER,
+                remote_context=args.remote_context,
+            ),
+            ansible_vars=self._prepare_ansible_vars(args, bundle),
+            ansible_tags=["provisioner_bundle"] + args.ansible_tags,
+        )
+
+    def _prepare_ansible_vars(self, args: RemoteProvisionerRunnerArgs, bundle: RuntimeBundle) -> List[str]:
+        return [
+            f"provisioner_command='{args.provisioner_command}'",
+            f"bundle_archive_path='{bundle.archive_path}'",
+            f"bundle_hash='{bundle.bundle_hash}'",
+            f"requirements_hash='{bundle.requirements_hash}'",
+            f"bundle_retention_days={REMOTE_BUNDLE_RETENTION_DAYS}",
+        ] + args.ansible_vars
+
+
+def is_remote_bundle_runtime(collaborators: CoreCollaborators) -> bool:
+    """Bundles are the default, the pip wrapper stays available and keeps serving the local sdists test mode"""
+    checks = collaborators.checks()
+    return not (
+        checks.is_env_var_equals_fn(REMOTE_RUNTIME_ENV_VAR, REMOTE_RUNTIME_PIP)
+        or checks.is_env_var_equals_fn("PROVISIONER_INSTALLER_PLUGIN_TEST", "true")
+    )
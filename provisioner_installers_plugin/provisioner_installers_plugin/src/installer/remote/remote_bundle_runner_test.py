@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest import mock
+
+from provisioner_installers_plugin.src.installer.remote.remote_bundle_runner import (
+    ANSIBLE_PLAYBOOK_REMOTE_BUNDLE_RUNNER,
+    REMOTE_BUNDLE_RETENTION_DAYS,
+    REMOTE_RUNTIME_ENV_VAR,
+    REMOTE_RUNTIME_PIP,
+    RemoteBundleRunner,
+    is_remote_bundle_runtime,
+)
+from provisioner_installers_plugin.src.installer.remote.runtime_bundle import RuntimeBundle
+
+from provisioner_shared.components.remote.ansible.remote_provisioner_runner import RemoteProvisionerRunnerArgs
+from provisioner_shared.components.remote.remote_connector import SSHConnectionInfo
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.remote_context import RemoteContext
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/remote/remote_bundle_runner_test.py
+#
+
+REMOTE_BUNDLE_RUNNER_PATH = "provisioner_installers_plugin.src.installer.remote.remote_bundle_runner"
+
+TEST_BUNDLE = RuntimeBundle(
+    archive_path="/tmp/provisioner-runtime-0123456789abcdef.tar.gz",
+    bundle_hash="0123456789abcdef",
+    requirements_hash="fedcba9876543210",
+    plugins=["provisioner_installers_plugin"],
+)
+TEST_ANSIBLE_HOSTS = [AnsibleHost(host="node1", ip_address="192.168.1.200", username="pi", password="secret")]
+
+
+def create_fake_collaborators(env_vars: dict) -> mock.MagicMock:
+    collaborators = mock.MagicMock()
+    collaborators.checks().is_env_var_equals_fn.side_effect = lambda name, value: env_vars.get(name) == value
+    return collaborators
+
+
+def create_runner_args() -> RemoteProvisionerRunnerArgs:
+    return RemoteProvisionerRunnerArgs(
+        provisioner_command="provisioner install cli helm -y",
+        remote_context=RemoteContext.no_op(),
+        ssh_connection_info=SSHConnectionInfo(ansible_hosts=TEST_ANSIBLE_HOSTS),
+        required_plugins=["provisioner_installers_plugin"],
+        ansible_vars=["git_access_token=top-secret"],
+    )
+
+
+class RemoteBundleRunnerTestShould(unittest.TestCase):
+
+    def test_use_runtime_bundles_by_default(self) -> None:
+        self.assertTrue(is_remote_bundle_runtime(create_fake_collaborators({})))
+        self.assertTrue(is_remote_bundle_runtime(create_fake_collaborators({REMOTE_RUNTIME_ENV_VAR: "bundle"})))
+
+    def test_use_the_pip_wrapper_when_requested_or_testing_local_sdists(self) -> None:
+        self.assertFalse(
+            is_remote_bundle_runtime(create_fake_collaborators({REMOTE_RUNTIME_ENV_VAR: REMOTE_RUNTIME_PIP}))
+        )
+        self.assertFalse(
+            is_remote_bundle_runtime(create_fake_collaborators({"PROVISIONER_INSTALLER_PLUGIN_TEST": "true"}))
+        )
+
+    def test_prepare_ansible_vars_of_the_bundle_ahead_of_the_command_vars(self) -> None:
+        ansible_vars = RemoteBundleRunner()._prepare_ansible_vars(create_runner_args(), TEST_BUNDLE)
+        self.assertEqual(
+            ansible_vars,
+            [
+                "provisioner_command='provisioner install cli helm -y'",
+                f"bundle_archive_path='{TEST_BUNDLE.archive_path}'",
+                "bundle_hash='0123456789abcdef'",
+                "requirements_hash='fedcba9876543210'",
+                f"bundle_retention_days={REMOTE_BUNDLE_RETENTION_DAYS}",
+                "git_access_token=top-secret",
+            ],
+        )
+
+    def test_run_the_bundle_playbook_on_the_selected_hosts(self) -> None:
+        collaborators = create_fake_collaborators({})
+        collaborators.ansible_runner().run_fn.return_value = "installed"
+        with mock.patch(f"{REMOTE_BUNDLE_RUNNER_PATH}.build_runtime_bundle", return_value=TEST_BUNDLE) as build_call:
+            output = RemoteBundleRunner().run(Context.create(dry_run=False), create_runner_args(), collaborators)
+
+        self.assertEqual(output, "installed")
+        build_call.assert_called_once_with(["provisioner_installers_plugin"])
+        run_kwargs = collaborators.ansible_runner().run_fn.call_args.kwargs
+        self.assertEqual(run_kwargs["selected_hosts"], TEST_ANSIBLE_HOSTS)
+        self.assertEqual(run_kwargs["playbook"].get_name(), "provisioner_bundle")
+        self.assertEqual(run_kwargs["ansible_tags"], ["provisioner_bundle"])
+        self.assertIn("bundle_hash='0123456789abcdef'", run_kwargs["ansible_vars"])
+
+    def test_prune_only_bundles_unused_for_the_retention_period(self) -> None:
+        playbook = ANSIBLE_PLAYBOOK_REMOTE_BUNDLE_RUNNER.format(modifiers="")
+        # Bundles of other controllers sharing the host are never removed by their hash alone
+        self.assertNotIn('! -name "{{ bundle_hash }}"', playbook)
+        self.assertIn("-mtime +{{ bundle_retention_days }}", playbook)
+        self.assertIn("- name: Mark the runtime bundle as in use", playbook)
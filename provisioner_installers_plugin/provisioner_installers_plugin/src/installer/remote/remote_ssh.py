@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+import atexit
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import paramiko
+from loguru import logger
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+STDIN_STREAM_CHUNK_SIZE = 1024 * 1024
+DEFAULT_SSH_TIMEOUT_SECONDS = 15
+DEFAULT_SSH_MAX_WORKERS = 16
+# Keeps pooled connections from being dropped by NAT and firewalls between commands
+SSH_KEEPALIVE_INTERVAL_SECONDS = 30
+REMOTE_PYTHON_COMMAND = "python3 -"
+
+StdinData = Optional[Union[str, bytes, BinaryIO]]
+
+
+class RemoteCommandResult(NamedTuple):
+    host: str
+    ip_address: str
+    # None when the command never ran, i.e. the host was unreachable
+    exit_code: Optional[int]
+    stdout: str
+    stderr: str
+    elapsed_seconds: float
+    error: Optional[str] = None
+
+    def is_ok(self) -> bool:
+        return self.error is None and self.exit_code == 0
+
+    def json(self) -> Any:
+        return json.loads(self.stdout)
+
+
+class SSHConnectionPool:
+    """
+    One authenticated SSH connection per host, reused by every command sent to it.
+    Paramiko multiplexes each command on a channel of its own, so a single connection serves
+    concurrent commands and only the first command of a host pays for the TCP and SSH handshakes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._host_locks: Dict[Tuple, threading.Lock] = {}
+        self._clients: Dict[Tuple, paramiko.SSHClient] = {}
+
+    def _key(self, ansible_host: AnsibleHost) -> Tuple:
+        return (ansible_host.ip_address, int(ansible_host.port) if ansible_host.port else 22, ansible_host.username)
+
+    def _is_alive(self, client: paramiko.SSHClient) -> bool:
+        transport = client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def _connect(self, ansible_host: AnsibleHost, timeout_seconds: float) -> paramiko.SSHClient:
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            client.connect(
+                ansible_host.ip_address,
+                port=int(ansible_host.port) if ansible_host.port else 22,
+                username=ansible_host.username,
+                password=ansible_host.password,
+                key_filename=None if ansible_host.password else ansible_host.ssh_private_key_file_path,
+                timeout=timeout_seconds,
+                banner_timeout=timeout_seconds,
+                auth_timeout=timeout_seconds,
+            )
+        except BaseException:
+            client.close()
+            raise
+        client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL_SECONDS)
+        return client
+
+    def acquire(self, ansible_host: AnsibleHost, timeout_seconds: float) -> paramiko.SSHClient:
+        key = self._key(ansible_host)
+        with self._lock:
+            host_lock = self._host_locks.setdefault(key, threading.Lock())
+        # Concurrent commands to a host wait for its single handshake instead of opening connections of their own
+        with host_lock:
+            with self._lock:
+                pooled = self._clients.get(key)
+            if pooled and self._is_alive(pooled):
+                return pooled
+            if pooled:
+                self.discard(ansible_host)
+            client = self._connect(ansible_host, timeout_seconds)
+            with self._lock:
+                self._clients[key] = client
+            return client
+
+    def is_pooled(self, ansible_host: AnsibleHost) -> bool:
+        with self._lock:
+            return self._key(ansible_host) in self._clients
+
+    def discard(self, ansible_host: AnsibleHost) -> None:
+        with self._lock:
+            pooled = self._clients.pop(self._key(ansible_host), None)
+        if pooled:
+            pooled.close()
+
+    def discard_if_broken(self, ansible_host: AnsibleHost) -> bool:
+        """A failed command leaves a healthy connection to the other commands running on it"""
+        with self._lock:
+            pooled = self._clients.get(self._key(ansible_host))
+        if pooled and not self._is_alive(pooled):
+            self.discard(ansible_host)
+            return True
+        return False
+
+    def close_all(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+_default_pool = SSHConnectionPool()
+atexit.register(_default_pool.close_all)
+
+
+def get_ssh_pool() -> SSHConnectionPool:
+    return _default_pool
+
+
+def _exec_on_client(
+    client: paramiko.SSHClient, command: str, timeout_seconds: float, stdin_data: StdinData
+) -> Tuple[int, str, str]:
+    stdin, stdout, stderr = client.exec_command(command, timeout=timeout_seconds)
+    if hasattr(stdin_data, "read"):
+        for chunk in iter(lambda: stdin_data.read(STDIN_STREAM_CHUNK_SIZE), b""):
+            stdin.write(chunk)
+    elif stdin_data is not None:
+        stdin.write(stdin_data)
+    stdin.channel.shutdown_write()
+    output = stdout.read().decode("utf-8").strip()
+    errors = stderr.read().decode("utf-8").strip()
+    return stdout.channel.recv_exit_status(), output, errors
+
+
+def exec_ssh_command(
+    ansible_host: AnsibleHost,
+    command: str,
+    timeout_seconds: Optional[float] = DEFAULT_SSH_TIMEOUT_SECONDS,
+    stdin_data: StdinData = None,
+    pool: Optional[SSHConnectionPool] = None,
+) -> RemoteCommandResult:
+    """
+    Run a single command on a pooled SSH connection, never raises, failures are reported on the result.
+    A pooled connection dropped by the host since its last use is replaced once before giving up,
+    unless the stdin was a stream which cannot be replayed. A failing fresh connection is not retried.
+    """
+    pool = pool if pool else _default_pool
+    started = time.monotonic()
+    error = None
+    reused = pool.is_pooled(ansible_host)
+    while True:
+        try:
+            client = pool.acquire(ansible_host, timeout_seconds)
+            exit_code, output, errors = _exec_on_client(client, command, timeout_seconds, stdin_data)
+            return RemoteCommandResult(
+                ansible_host.host, ansible_host.ip_address, exit_code, output, errors, time.monotonic() - started
+            )
+        except Exception as ex:
+            is_stale_connection = pool.discard_if_broken(ansible_host) and reused
+            error = str(ex) or type(ex).__name__
+            logger.debug(f"SSH command failed. host: {ansible_host.host}, reused: {reused}, error: {error}")
+            if not is_stale_connection or hasattr(stdin_data, "read"):
+                break
+            # Only the first attempt may find a stale connection, the retry connects from scratch
+            reused = False
+    return RemoteCommandResult(
+        ansible_host.host, ansible_host.ip_address, None, "", "", time.monotonic() - started, error=error
+    )
+
+
+def run_ssh_command(
+    ansible_host: AnsibleHost,
+    command: str,
+    timeout_seconds: float,
+    stdin_data: StdinData = None,
+    pool: Optional[SSHConnectionPool] = None,
+) -> str:
+    """
+    Run a single command over a direct SSH session and return its stdout.
+    Every network operation is bounded by the timeout, a non zero exit status raises with the remote stderr.
+    A file object as stdin data is streamed in chunks, large images are never held in memory.
+    """
+    result = exec_ssh_command(ansible_host, command, timeout_seconds, stdin_data, pool)
+    if result.error is not None:
+        raise Exception(result.error)
+    if result.exit_code != 0:
+        raise Exception(result.stderr or f"remote command failed: {command}")
+    return result.stdout
+
+
+def run_ssh_python(
+    ansible_host: AnsibleHost,
+    script: str,
+    timeout_seconds: float,
+    pool: Optional[SSHConnectionPool] = None,
+) -> Any:
+    """Run a python payload with the remote interpreter, the payload prints its result as JSON"""
+    return json.loads(run_ssh_command(ansible_host, REMOTE_PYTHON_COMMAND, timeout_seconds, script, pool))
+
+
+def exec_ssh_command_many(
+    ansible_hosts: List[AnsibleHost],
+    command: str,
+    timeout_seconds: Optional[float] = DEFAULT_SSH_TIMEOUT_SECONDS,
+    stdin_data: Optional[Union[str, bytes]] = None,
+    max_workers: Optional[int] = DEFAULT_SSH_MAX_WORKERS,
+    pool: Optional[SSHConnectionPool] = None,
+) -> List[RemoteCommandResult]:
+    """Run a read only command on many hosts concurrently, results keep the order of the given hosts"""
+    if not ansible_hosts:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(ansible_hosts))) as executor:
+        return list(
+            executor.map(
+                lambda ansible_host: exec_ssh_command(ansible_host, command, timeout_seconds, stdin_data, pool),
+                ansible_hosts,
+            )
+        )
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+import socket
+import unittest
+
+import paramiko
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import (
+    SSHConnectionPool,
+    exec_ssh_command,
+    exec_ssh_command_many,
+    run_ssh_command,
+    run_ssh_python,
+)
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/remote/remote_ssh_test.py
+#
+
+
+class FakeStream:
+
+    def __init__(self, content: bytes = b"", exit_code: int = 0) -> None:
+        self.content = content
+        self.written = b""
+        self.channel = self
+        self.exit_code = exit_code
+
+    def write(self, data) -> None:
+        self.written += data.encode("utf-8") if isinstance(data, str) else data
+
+    def read(self) -> bytes:
+        return self.content
+
+    def shutdown_write(self) -> None:
+        pass
+
+    def recv_exit_status(self) -> int:
+        return self.exit_code
+
+
+class FakeTransport:
+
+    def __init__(self) -> None:
+        self.active = True
+
+    def is_active(self) -> bool:
+        return self.active
+
+
+class FakeSSHClient:
+
+    def __init__(self, responses: dict) -> None:
+        self.responses = responses
+        self.transport = FakeTransport()
+        self.commands = []
+
+    def get_transport(self) -> FakeTransport:
+        return self.transport
+
+    def exec_command(self, command: str, timeout: float):
+        if not self.transport.active:
+            raise paramiko.SSHException("SSH session not active")
+        self.commands.append(command)
+        stdout, exit_code, stderr = self.responses.get(command, (b"", 127, b"command not found"))
+        stdin = FakeStream()
+        self.last_stdin = stdin
+        return stdin, FakeStream(stdout, exit_code), FakeStream(stderr)
+
+    def close(self) -> None:
+        self.transport.active = False
+
+
+class FakeSSHConnectionPool(SSHConnectionPool):
+
+    def __init__(self, responses: dict) -> None:
+        super().__init__()
+        self.responses = responses
+        self.connected = []
+
+    def _connect(self, ansible_host: AnsibleHost, timeout_seconds: float) -> FakeSSHClient:
+        client = FakeSSHClient(self.responses)
+        self.connected.append(client)
+        return client
+
+
+def create_host(index: int = 1) -> AnsibleHost:
+    return AnsibleHost(host=f"node{index}", ip_address=f"10.0.0.{index}", username="pi", password="secret")
+
+
+class RemoteSSHTestShould(unittest.TestCase):
+
+    def test_reuse_one_connection_per_host(self) -> None:
+        pool = FakeSSHConnectionPool({"uptime": (b"up 3 days\n", 0, b"")})
+        for _ in range(3):
+            self.assertEqual(run_ssh_command(create_host(), "uptime", 5, pool=pool), "up 3 days")
+        run_ssh_command(create_host(2), "uptime", 5, pool=pool)
+        self.assertEqual(len(pool.connected), 2)
+        self.assertEqual(pool.connected[0].commands, ["uptime"] * 3)
+
+    def test_replace_a_connection_dropped_by_the_host(self) -> None:
+        pool = FakeSSHConnectionPool({"hostname": (b"node1", 0, b"")})
+        run_ssh_command(create_host(), "hostname", 5, pool=pool)
+        pool.connected[0].transport.active = False
+        self.assertEqual(run_ssh_command(create_host(), "hostname", 5, pool=pool), "node1")
+        self.assertEqual(len(pool.connected), 2)
+
+    def test_report_failures_on_the_result(self) -> None:
+        pool = FakeSSHConnectionPool({"false": (b"", 1, b"failed")})
+        result = exec_ssh_command(create_host(), "false", pool=pool)
+        self.assertFalse(result.is_ok())
+        self.assertEqual((result.exit_code, result.stderr, result.error), (1, "failed", None))
+        with self.assertRaisesRegex(Exception, "failed"):
+            run_ssh_command(create_host(), "false", 5, pool=pool)
+
+    def test_run_python_payload_and_parse_its_output(self) -> None:
+        pool = FakeSSHConnectionPool({"python3 -": (b'{"model": "Raspberry Pi 4"}', 0, b"")})
+        self.assertEqual(run_ssh_python(create_host(), "print('payload')", 5, pool=pool), {"model": "Raspberry Pi 4"})
+        self.assertEqual(pool.connected[0].last_stdin.written, b"print('payload')")
+
+    def test_run_on_many_hosts_keeping_hosts_order(self) -> None:
+        pool = FakeSSHConnectionPool({"uname -m": (b"aarch64", 0, b"")})
+        hosts = [create_host(index) for index in range(4)]
+        results = exec_ssh_command_many(hosts, "uname -m", max_workers=4, pool=pool)
+        self.assertEqual([result.host for result in results], ["node0", "node1", "node2", "node3"])
+        self.assertTrue(all(result.stdout == "aarch64" for result in results))
+        self.assertEqual(exec_ssh_command_many([], "uname -m", pool=pool), [])
+
+    def test_unreachable_host_is_reported_without_pooling(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        closed_port = sock.getsockname()[1]
+        sock.close()
+
+        pool = SSHConnectionPool()
+        host = AnsibleHost(host="node1", ip_address="127.0.0.1", port=closed_port, username="pi", password="secret")
+        result = exec_ssh_command(host, "uptime", timeout_seconds=1, pool=pool)
+        self.assertIsNone(result.exit_code)
+        self.assertIsNotNone(result.error)
+        self.assertFalse(pool.is_pooled(host))
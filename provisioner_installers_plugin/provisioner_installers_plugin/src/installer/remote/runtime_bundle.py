@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+import gzip
+import hashlib
+import importlib.metadata
+import importlib.util
+import io
+import json
+import os
+import pathlib
+import re
+import tarfile
+import tempfile
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+ProvisionerRuntimeBundlesPath = os.path.expanduser("~/.cache/provisioner/bundles")
+
+# Packages every bundle carries, plugins are added on top of them
+RUNTIME_PACKAGES = ["provisioner_runtime", "provisioner_shared"]
+BUNDLE_ENTRYPOINT = "__main__.py"
+BUNDLE_REQUIREMENTS = "requirements.txt"
+BUNDLE_INDEX = "index.json"
+BUNDLE_HASH_LENGTH = 16
+EXCLUDED_DIRS = {"__pycache__", "tests-outputs", ".pytest_cache"}
+EXCLUDED_SUFFIXES = ("_test.py", ".pyc", ".pyo")
+
+# Mirrors provisioner_runtime.main without the plugins discovery and version checks,
+# the bundle already knows which plugins it carries
+_ENTRYPOINT_TEMPLATE = """#!/usr/bin/env python3
+# Generated by the provisioner runtime bundle builder, run with: python <bundle-folder> <command>
+
+import importlib
+import os
+import sys
+
+from provisioner_shared.components.runtime.cli.arg_reader import PreRunArgs
+from provisioner_shared.components.runtime.cli.entrypoint import EntryPoint
+from provisioner_shared.components.runtime.command.config.cli import CONFIG_USER_PATH
+from provisioner_shared.components.runtime.config.domain.config import ProvisionerConfig
+from provisioner_shared.components.runtime.config.manager.config_manager import ConfigManager
+from provisioner_shared.components.runtime.infra.context import Context
+
+BUNDLE_ROOT_PATH = os.path.dirname(os.path.abspath(__file__))
+CONFIG_INTERNAL_PATH = os.path.join(BUNDLE_ROOT_PATH, "provisioner_runtime", "resources", "config.yaml")
+BUNDLED_PLUGINS = {plugins}
+
+PreRunArgs().handle_pre_click_args(ctx=Context.create_empty())
+root_menu = EntryPoint.create_cli_menu()
+ConfigManager.instance().load(CONFIG_INTERNAL_PATH, CONFIG_USER_PATH, ProvisionerConfig)
+for plugin_name in BUNDLED_PLUGINS:
+    plugin_module = importlib.import_module(f"{{plugin_name}}.main")
+    plugin_module.load_config()
+    plugin_module.append_to_cli(root_menu)
+
+sys.exit(root_menu(prog_name="provisioner"))
+"""
+
+
+class RuntimeBundle(NamedTuple):
+    archive_path: str
+    # Identifies the bundle content, a target holding a bundle with the same hash skips the upload
+    bundle_hash: str
+    # Identifies the third party requirements, bundles with equal requirements share a virtual env on the target
+    requirements_hash: str
+    plugins: List[str]
+
+
+def _short_hash(hasher) -> str:
+    return hasher.hexdigest()[:BUNDLE_HASH_LENGTH]
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _package_root(package: str) -> str:
+    spec = importlib.util.find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        raise ValueError(f"Cannot bundle a package which is not installed. name: {package}")
+    # Namespace packages (provisioner_runtime has no __init__.py) expose their folder the same way
+    return list(spec.submodule_search_locations)[0]
+
+
+def collect_package_files(package: str) -> List[Tuple[str, str]]:
+    """(archive name, file path) of the package sources and resources, tests and bytecode excluded"""
+    root = _package_root(package)
+    files = []
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(name for name in dir_names if name not in EXCLUDED_DIRS)
+        for file_name in sorted(file_names):
+            if file_name.endswith(EXCLUDED_SUFFIXES):
+                continue
+            file_path = os.path.join(dir_path, file_name)
+            files.append((os.path.join(package, os.path.relpath(file_path, root)), file_path))
+    return files
+
+
+def collect_requirements(packages: List[str]) -> List[str]:
+    """
+    Third party requirements of the bundled packages, pinned to the versions installed on this machine
+    so the target runs what the controller was tested with. Packages without installed metadata
+    (i.e. plugins loaded from a source checkout) contribute nothing.
+    """
+    bundled = {_normalize_name(package) for package in packages}
+    requirements: Dict[str, str] = {}
+    for package in packages:
+        try:
+            package_requirements = importlib.metadata.requires(package) or []
+        except importlib.metadata.PackageNotFoundError:
+            continue
+        for requirement in package_requirements:
+            if "extra ==" in requirement:
+                continue
+            match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+            if not match or _normalize_name(match.group(1)) in bundled:
+                continue
+            name = _normalize_name(match.group(1))
+            try:
+                requirements[name] = f"{name}=={importlib.metadata.version(name)}"
+            except importlib.metadata.PackageNotFoundError:
+                requirements[name] = requirement.split(";")[0].replace(" ", "")
+    return sorted(requirements.values())
+
+
+def render_entrypoint(plugins: List[str]) -> str:
+    return _ENTRYPOINT_TEMPLATE.format(plugins=json.dumps(plugins))
+
+
+def _sources_fingerprint(files: List[Tuple[str, str]], plugins: List[str]) -> str:
+    """Cheap stat based fingerprint, saves reading and hashing every file when nothing changed since the last build"""
+    hasher = hashlib.sha256(json.dumps(plugins).encode("utf-8"))
+    for arcname, file_path in files:
+        stat = os.stat(file_path)
+        hasher.update(f"{arcname}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _read_index(output_dir: str) -> Dict[str, Dict[str, str]]:
+    try:
+        with open(os.path.join(output_dir, BUNDLE_INDEX)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(output_dir: str, index: Dict[str, Dict[str, str]]) -> None:
+    fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(index, f)
+    os.replace(temp_path, os.path.join(output_dir, BUNDLE_INDEX))
+
+
+def _add_file(archive: tarfile.TarFile, arcname: str, content: bytes) -> None:
+    # Fixed metadata keeps the archive bytes identical across builds of the same content
+    info = tarfile.TarInfo(arcname)
+    info.size = len(content)
+    info.mode = 0o644
+    archive.addfile(info, io.BytesIO(content))
+
+
+def _write_archive(archive_path: str, contents: List[Tuple[str, bytes]]) -> None:
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(archive_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as compressed:
+            with tarfile.open(fileobj=compressed, mode="w", format=tarfile.PAX_FORMAT) as archive:
+                for arcname, content in contents:
+                    _add_file(archive, arcname, content)
+        os.replace(temp_path, archive_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def build_runtime_bundle(plugins: List[str], output_dir: Optional[str] = None) -> RuntimeBundle:
+    """
+    Self contained provisioner runtime for remote hosts: the runtime, shared and plugin packages with their
+    resources, an entrypoint loading exactly these plugins and the pinned third party requirements.
+    The archive is named after its content hash and reused as long as the sources are unchanged.
+    """
+    output_dir = output_dir if output_dir else ProvisionerRuntimeBundlesPath
+    os.makedirs(output_dir, exist_ok=True)
+    packages = RUNTIME_PACKAGES + [plugin for plugin in plugins if plugin not in RUNTIME_PACKAGES]
+    files = [entry for package in packages for entry in collect_package_files(package)]
+
+    fingerprint = _sources_fingerprint(files, plugins)
+    index = _read_index(output_dir)
+    cached = index.get(fingerprint)
+    if cached and os.path.exists(cached["archive_path"]):
+        return RuntimeBundle(cached["archive_path"], cached["bundle_hash"], cached["requirements_hash"], plugins)
+
+    requirements = "\n".join(collect_requirements(packages)) + "\n"
+    contents = [(arcname, pathlib.Path(file_path).read_bytes()) for arcname, file_path in files]
+    contents.append((BUNDLE_ENTRYPOINT, render_entrypoint(plugins).encode("utf-8")))
+    contents.append((BUNDLE_REQUIREMENTS, requirements.encode("utf-8")))
+    contents.sort()
+
+    bundle_hasher = hashlib.sha256()
+    for arcname, content in contents:
+        bundle_hasher.update(f"{arcname}:{len(content)}\n".encode("utf-8"))
+        bundle_hasher.update(content)
+    bundle_hash = _short_hash(bundle_hasher)
+    requirements_hash = _short_hash(hashlib.sha256(requirements.encode("utf-8")))
+
+    archive_path = os.path.join(output_dir, f"provisioner-runtime-{bundle_hash}.tar.gz")
+    if not os.path.exists(archive_path):
+        logger.debug(f"Building provisioner runtime bundle. path: {archive_path}, files: {len(contents)}")
+        _write_archive(archive_path, contents)
+
+    # Entries of archives removed from the cache folder are dropped
+    index = {key: entry for key, entry in index.items() if os.path.exists(entry["archive_path"])}
+    index[fingerprint] = {
+        "archive_path": archive_path,
+        "bundle_hash": bundle_hash,
+        "requirements_hash": requirements_hash,
+    }
+    _write_index(output_dir, index)
+    return RuntimeBundle(archive_path, bundle_hash, requirements_hash, plugins)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+from provisioner_installers_plugin.src.installer.remote.runtime_bundle import (
+    BUNDLE_ENTRYPOINT,
+    BUNDLE_REQUIREMENTS,
+    build_runtime_bundle,
+    collect_requirements,
+)
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/remote/runtime_bundle_test.py
+#
+
+TEST_PLUGINS = ["provisioner_installers_plugin"]
+
+
+class RuntimeBundleTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.output_dir = tempfile.mkdtemp(prefix="provisioner-bundle-test")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.output_dir)
+
+    def test_bundle_packages_resources_and_entrypoint_without_tests(self) -> None:
+        bundle = build_runtime_bundle(TEST_PLUGINS, output_dir=self.output_dir)
+        self.assertTrue(bundle.archive_path.endswith(f"provisioner-runtime-{bundle.bundle_hash}.tar.gz"))
+        with tarfile.open(bundle.archive_path) as archive:
+            names = archive.getnames()
+            entrypoint = archive.extractfile(BUNDLE_ENTRYPOINT).read().decode("utf-8")
+        self.assertIn(BUNDLE_REQUIREMENTS, names)
+        self.assertIn("provisioner_installers_plugin/main.py", names)
+        self.assertIn("provisioner_runtime/resources/config.yaml", names)
+        self.assertTrue(any(name.startswith("provisioner_shared/") for name in names))
+        self.assertFalse(any(name.endswith(("_test.py", ".pyc")) or "__pycache__" in name for name in names))
+        self.assertIn('BUNDLED_PLUGINS = ["provisioner_installers_plugin"]', entrypoint)
+
+    def test_same_sources_produce_the_same_bundle(self) -> None:
+        first = build_runtime_bundle(TEST_PLUGINS, output_dir=self.output_dir)
+        with open(first.archive_path, "rb") as f:
+            first_content = f.read()
+        os.remove(first.archive_path)
+
+        rebuilt = build_runtime_bundle(TEST_PLUGINS, output_dir=self.output_dir)
+        self.assertEqual(first, rebuilt)
+        with open(rebuilt.archive_path, "rb") as f:
+            self.assertEqual(first_content, f.read())
+        self.assertEqual(build_runtime_bundle(TEST_PLUGINS, output_dir=self.output_dir), rebuilt)
+
+    def test_pin_third_party_requirements_only(self) -> None:
+        requirements = collect_requirements(["provisioner_runtime", "provisioner_shared"])
+        self.assertTrue(any(requirement.startswith("click==") for requirement in requirements))
+        self.assertFalse(any(requirement.startswith("provisioner") for requirement in requirements))
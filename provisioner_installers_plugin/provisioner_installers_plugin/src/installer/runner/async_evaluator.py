@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Generic, List, Optional, TypeVar, Union
+
+from provisioner_shared.framework.functional.pyfn import PyFn, PyFnEnvBase, PyFnEvaluator
+
+# Sequential unless asked for, download progress bars are only shown while downloads run one at a time
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 1
+
+ENV = TypeVar("ENV", bound=PyFnEnvBase)
+VAL = TypeVar("VAL")
+
+
+class AsyncPyFnEvaluator(Generic[ENV]):
+    """
+    Evaluates PyFn chains as awaitables so chains of several utilities overlap on a single event loop.
+    Collaborator effects block, network bound chains are awaited on an I/O thread pool sized to the number
+    of concurrent downloads and CPU bound chains (unpacking) on a pool sized to the CPU count, a large
+    archive being unpacked never holds back the downloads of other utilities.
+    """
+
+    _environment: ENV
+
+    def __init__(
+        self,
+        environment: ENV,
+        max_concurrent_downloads: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+        max_cpu_workers: Optional[int] = None,
+    ) -> None:
+        self._environment = environment
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=max(1, max_concurrent_downloads), thread_name_prefix="provisioner-io"
+        )
+        self._cpu_executor = ThreadPoolExecutor(
+            max_workers=max(1, max_cpu_workers or os.cpu_count() or 1), thread_name_prefix="provisioner-cpu"
+        )
+
+    def __enter__(self) -> "AsyncPyFnEvaluator[ENV]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self._io_executor.shutdown(wait=True)
+        self._cpu_executor.shutdown(wait=True)
+
+    async def eval_io(self, arg: PyFn[ENV, Exception, VAL]) -> VAL:
+        """Await a network bound chain, failures raise just like PyFnEvaluator.eval"""
+        return await self._eval_on(self._io_executor, arg)
+
+    async def eval_cpu(self, arg: PyFn[ENV, Exception, VAL]) -> VAL:
+        """Await a CPU bound chain, failures raise just like PyFnEvaluator.eval"""
+        return await self._eval_on(self._cpu_executor, arg)
+
+    async def _eval_on(self, executor: ThreadPoolExecutor, arg: PyFn[ENV, Exception, VAL]) -> VAL:
+        # Evaluators carry the chain environment, every worker thread evaluates with its own
+        evaluator = PyFnEvaluator.new(self._environment)
+        return await asyncio.get_running_loop().run_in_executor(executor, evaluator.eval, arg)
+
+    def run_all(self, awaitables: List[Awaitable[Any]]) -> List[Union[Any, Exception]]:
+        """
+        Run the awaitables concurrently on a new event loop until all of them complete.
+        Results keep the awaitables order, a failed awaitable has its exception in place of a result.
+        """
+
+        async def _gather() -> List[Union[Any, Exception]]:
+            return await asyncio.gather(*awaitables, return_exceptions=True)
+
+        return asyncio.run(_gather())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from provisioner_installers_plugin.src.installer.domain.command import InstallerSubCommandName
+from provisioner_installers_plugin.src.installer.domain.installable import Installable
+from provisioner_installers_plugin.src.installer.domain.source import ActiveInstallSource, InstallSource
+from provisioner_installers_plugin.src.installer.domain.version import NameVersionArgsTuple
+from provisioner_installers_plugin.src.installer.runner.async_evaluator import AsyncPyFnEvaluator
+from provisioner_installers_plugin.src.installer.runner.installer_runner import (
+    InstallerEnv,
+    UtilityInstallerCmdRunner,
+    UtilityInstallerRunnerCmdArgs,
+)
+from provisioner_installers_plugin.src.installer.state.installed_state import InstalledStateRegistry
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import SpanTracer
+
+from provisioner_shared.components.runtime.errors.cli_errors import InstallerSourceError, StepEvaluationFailure
+from provisioner_shared.components.runtime.utils.os import OsArch
+from provisioner_shared.framework.functional.pyfn import PyFn
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/runner/async_evaluator_test.py
+#
+
+BARRIER_TIMEOUT_SEC = 5
+
+INSTALLER_RUNNER_PATH = "provisioner_installers_plugin.src.installer.runner.installer_runner"
+
+
+def create_github_utility(name: str) -> Installable.Utility:
+    return Installable.Utility(
+        display_name=name,
+        binary_name=name,
+        description="test description",
+        version="v1.0.0",
+        active_source=ActiveInstallSource.GitHub,
+        source=InstallSource(
+            github=InstallSource.GitHub(
+                owner="TestOwner",
+                repo=name,
+                supported_releases=["linux_amd64"],
+                arch_map={"x86_64": "amd64"},
+                release_name_resolver=lambda version, os, arch: f"{name}_{version}_{os}_{arch}",
+            )
+        ),
+    )
+
+
+TestSupportedToolings = {name: create_github_utility(name) for name in ["tool-a", "tool-b"]}
+
+
+class AsyncPyFnEvaluatorTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-async-evaluator-test")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def create_fake_installer_env(self) -> InstallerEnv:
+        ctx = mock.MagicMock()
+        ctx.is_dry_run.return_value = False
+        ctx.os_arch = OsArch(os="linux", arch="x86_64")
+        collaborators = mock.MagicMock()
+        collaborators.io_utils().is_archive_fn.return_value = False
+        return InstallerEnv(
+            ctx=ctx,
+            collaborators=collaborators,
+            args=UtilityInstallerRunnerCmdArgs(
+                utilities=[NameVersionArgsTuple(name, "v1.0.0") for name in TestSupportedToolings],
+                remote_opts=None,
+                sub_command_name=InstallerSubCommandName.CLI,
+                max_concurrent_downloads=2,
+            ),
+            supported_utilities=TestSupportedToolings,
+            installed_registry=InstalledStateRegistry(os.path.join(self.work_dir, "installed.json")),
+        )
+
+    def test_overlap_network_bound_chains(self) -> None:
+        # Both effects must be in flight at once for the barrier to release them
+        barrier = threading.Barrier(2, timeout=BARRIER_TIMEOUT_SEC)
+
+        def wait_for_other(value: str) -> str:
+            barrier.wait()
+            return value
+
+        with AsyncPyFnEvaluator(mock.MagicMock(), max_concurrent_downloads=2) as async_eval:
+            results = async_eval.run_all(
+                [
+                    async_eval.eval_io(PyFn.effect(lambda: wait_for_other("first"))),
+                    async_eval.eval_io(PyFn.effect(lambda: wait_for_other("second"))),
+                    async_eval.eval_cpu(PyFn.of("unpacked")),
+                ]
+            )
+        self.assertEqual(results, ["first", "second", "unpacked"])
+
+    def test_return_failures_in_place_of_results(self) -> None:
+        error = InstallerSourceError("test error")
+        with AsyncPyFnEvaluator(mock.MagicMock()) as async_eval:
+            results = async_eval.run_all([async_eval.eval_io(PyFn.fail(error)), async_eval.eval_cpu(PyFn.of(1))])
+        self.assertIs(results[0], error)
+        self.assertEqual(results[1], 1)
+
+    def test_download_github_utilities_concurrently(self) -> None:
+        env = self.create_fake_installer_env()
+        barrier = threading.Barrier(2, timeout=BARRIER_TIMEOUT_SEC)
+
+        def download_file_fn(url, progress_bar, download_folder, verify_already_downloaded) -> str:
+            barrier.wait()
+            return os.path.join(self.work_dir, os.path.basename(url))
+
+        env.collaborators.http_client().download_file_fn.side_effect = download_file_fn
+        tracer = SpanTracer(enabled=True)
+        runner = UtilityInstallerCmdRunner(ctx=env.ctx)
+        with mock.patch(f"{INSTALLER_RUNNER_PATH}.get_tracer", return_value=tracer):
+            runner._run_github_installs_on_event_loop(env, list(TestSupportedToolings.values()))
+
+        self.assertEqual(sorted(env.installed_registry.all()), ["tool-a", "tool-b"])
+        self.assertEqual(env.installed_registry.get("tool-b").version, "v1.0.0")
+        self.assertEqual(env.collaborators.io_utils().write_symlink_fn.call_count, 2)
+        # Progress bars are live displays, concurrent downloads leave the console to the calling thread
+        env.collaborators.github().download_release_binary_fn.assert_not_called()
+        self.assertEqual(
+            sorted(call.kwargs["url"] for call in env.collaborators.http_client().download_file_fn.call_args_list),
+            [
+                "https://github.com/TestOwner/tool-a/releases/download/v1.0.0/tool-a_v1.0.0_linux_amd64",
+                "https://github.com/TestOwner/tool-b/releases/download/v1.0.0/tool-b_v1.0.0_linux_amd64",
+            ],
+        )
+        self.assertTrue(
+            all(
+                not call.kwargs["progress_bar"]
+                for call in env.collaborators.http_client().download_file_fn.call_args_list
+            )
+        )
+        install_spans = [event for event in tracer.events() if event["name"].startswith("install ")]
+        self.assertEqual(sorted(event["name"] for event in install_spans), ["install tool-a", "install tool-b"])
+        self.assertEqual(len({event["tid"] for event in install_spans}), 2)
+
+    def test_report_every_failed_utility(self) -> None:
+        env = self.create_fake_installer_env()
+        env.collaborators.http_client().download_file_fn.side_effect = Exception("download failed")
+        runner = UtilityInstallerCmdRunner(ctx=env.ctx)
+        with self.assertRaises(StepEvaluationFailure) as raised:
+            runner._run_github_installs_on_event_loop(env, list(TestSupportedToolings.values()))
+        self.assertIn("tool-a: download failed", str(raised.exception))
+        self.assertIn("tool-b: download failed", str(raised.exception))
+        self.assertEqual(env.installed_registry.all(), {})
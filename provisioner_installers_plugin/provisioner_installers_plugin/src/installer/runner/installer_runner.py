@@ -8,8 +8,25 @@ from loguru import logger
 from provisioner_installers_plugin.src.installer.domain.command import InstallerSubCommandName
 from provisioner_installers_plugin.src.installer.domain.dynamic_args import DynamicArgs
 from provisioner_installers_plugin.src.installer.domain.installable import Installable
+from provisioner_installers_plugin.src.installer.domain.lockfile import LockedAsset, ToolsetLockfile
 from provisioner_installers_plugin.src.installer.domain.source import ActiveInstallSource
 from provisioner_installers_plugin.src.installer.domain.version import NameVersionArgsTuple
+from provisioner_installers_plugin.src.installer.remote.remote_bundle_runner import (
+    RemoteBundleRunner,
+    is_remote_bundle_runtime,
+)
+from provisioner_installers_plugin.src.installer.runner.async_evaluator import AsyncPyFnEvaluator
+from provisioner_installers_plugin.src.installer.state.installed_state import (
+    InstalledStateRegistry,
+    InstalledUtility,
+    file_sha256,
+    normalize_version,
+)
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import (
+    HOSTS_ARG_SEPARATOR,
+    TRACE_TO_STDOUT,
+    get_tracer,
+)
 
 from provisioner_shared.components.remote.ansible.remote_provisioner_runner import (
     RemoteProvisionerRunner,
@@ -31,6 +48,7 @@ from provisioner_shared.components.runtime.runner.ansible.ansible_runner import
     AnsiblePlaybook,
 )
 from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+from provisioner_shared.components.runtime.utils.github import GitHubDownloadBinaryUrl, GitHubUrl
 from provisioner_shared.components.runtime.utils.os import OsArch
 from provisioner_shared.framework.functional.pyfn import Environment, PyFn, PyFnEnvBase, PyFnEvaluator
 
@@ -73,6 +91,16 @@ class UnpackedReleaseFolderPath_Utility_OsArch_Tuple(NamedTuple):
     os_arch_adjusted: OsArch
 
 
+class Version_ReleaseDownloadInfo_Tuple(NamedTuple):
+    version: str
+    download_info: ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple
+
+
+class LockedVersion_Asset_Tuple(NamedTuple):
+    version: str
+    asset: LockedAsset
+
+
 class RemoteConnector_Utility_Tuple(NamedTuple):
     connector: RemoteMachineConnector
     utility: Installable.Utility
@@ -93,6 +121,7 @@ class UtilityInstallerRunnerCmdArgs:
         git_access_token: str = None,
         force: bool = False,
         uninstall: bool = False,
+        max_concurrent_downloads: int = 1,
     ) -> None:
         self.utilities = utilities
         self.remote_opts = remote_opts
@@ -100,6 +129,7 @@ class UtilityInstallerRunnerCmdArgs:
         self.git_access_token = git_access_token
         self.force = force
         self.uninstall = uninstall
+        self.max_concurrent_downloads = max_concurrent_downloads
 
 
 class InstallerEnv:
@@ -108,6 +138,8 @@ class InstallerEnv:
     collaborators: CoreCollaborators
     args: UtilityInstallerRunnerCmdArgs
     supported_utilities: dict[str, Installable.Utility]
+    installed_registry: InstalledStateRegistry
+    lockfile: Optional[ToolsetLockfile]
 
     def __init__(
         self,
@@ -115,11 +147,15 @@ class InstallerEnv:
         collaborators: CoreCollaborators,
         args: UtilityInstallerRunnerCmdArgs,
         supported_utilities: dict[str, Installable.Utility],
+        installed_registry: Optional[InstalledStateRegistry] = None,
+        lockfile: Optional[ToolsetLockfile] = None,
     ) -> None:
         self.ctx = ctx
         self.collaborators = collaborators
         self.args = args
         self.supported_utilities = supported_utilities
+        self.installed_registry = installed_registry if installed_registry is not None else InstalledStateRegistry()
+        self.lockfile = lockfile
 
 
 class UtilityInstallerCmdRunner(PyFnEnvBase):
@@ -326,9 +362,83 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
             logger.warning("No utilities to install")
             return PyFn.success([])
 
+        if self._should_install_concurrently(env, utilities):
+            logger.debug(f"Installing GitHub utilities concurrently, downloads: {env.args.max_concurrent_downloads}")
+            return self._install_utilities_concurrently(env, utilities)
+
         # Process each utility and collect results
         return self._process_utility_list(env=env, utilities=utilities, processing_fn=self._install_single_utility)
 
+    def _should_install_concurrently(self, env: InstallerEnv, utilities: List[Installable.Utility]) -> bool:
+        if env.args.max_concurrent_downloads <= 1:
+            return False
+        return sum(1 for utility in utilities if utility.active_source == ActiveInstallSource.GitHub) > 1
+
+    def _install_utilities_concurrently(
+        self, env: InstallerEnv, utilities: List[Installable.Utility]
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, List[Installable.Utility]]:
+        """
+        Checks and summaries may prompt, they run one utility at a time before anything is downloaded.
+        GitHub releases are then downloaded and unpacked concurrently, other sources install one by one
+        after them and every installed utility is verified and summarized in the requested order.
+        """
+        return (
+            self._process_utility_list(env=env, utilities=utilities, processing_fn=self._prepare_utility_for_install)
+            .flat_map(lambda to_install: self._install_github_utilities_concurrently(env, to_install))
+            .flat_map(
+                lambda to_install: self._process_utility_list(
+                    env=env, utilities=to_install, processing_fn=self._install_remaining_and_finalize
+                )
+            )
+        )
+
+    def _show_download_progress(self, env: InstallerEnv) -> bool:
+        """Progress bars are live console displays, concurrent downloads would draw over each other"""
+        return env.args.max_concurrent_downloads <= 1
+
+    def _install_remaining_and_finalize(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, Installable.Utility]:
+        # GitHub utilities were already installed concurrently
+        return (
+            PyFn.of(utility)
+            if utility.active_source == ActiveInstallSource.GitHub
+            else self._install_by_source_type(env, utility)
+        ).flat_map(lambda installed: self._finalize_installed_utility(env, installed))
+
+    def _install_github_utilities_concurrently(
+        self, env: InstallerEnv, utilities: List[Installable.Utility]
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, List[Installable.Utility]]:
+        github_utilities = [utility for utility in utilities if utility.active_source == ActiveInstallSource.GitHub]
+        if not github_utilities:
+            return PyFn.success(utilities)
+        return PyFn.effect(lambda: self._run_github_installs_on_event_loop(env, github_utilities)).map(
+            lambda _: utilities
+        )
+
+    def _run_github_installs_on_event_loop(self, env: InstallerEnv, utilities: List[Installable.Utility]) -> None:
+        with AsyncPyFnEvaluator(self, max_concurrent_downloads=env.args.max_concurrent_downloads) as async_eval:
+            results = async_eval.run_all(
+                [self._install_github_utility_async(async_eval, env, utility) for utility in utilities]
+            )
+        failures = [
+            f"{utility.display_name}: {result}"
+            for utility, result in zip(utilities, results)
+            if isinstance(result, Exception)
+        ]
+        if failures:
+            raise StepEvaluationFailure("Failed to install utilities. " + ", ".join(failures))
+
+    async def _install_github_utility_async(
+        self, async_eval: AsyncPyFnEvaluator, env: InstallerEnv, utility: Installable.Utility
+    ) -> Installable.Utility:
+        if not utility.source.github:
+            raise InstallerSourceError("Missing installation source. name: GitHub")
+        with get_tracer().concurrent_span(f"install {utility.display_name}", concurrent=True):
+            fetched = await async_eval.eval_io(self._fetch_github_release(env, utility))
+            await async_eval.eval_cpu(self._install_fetched_github_release(env, fetched))
+        return utility
+
     def _execute_uninstall_flow(
         self, env: InstallerEnv, utilities: List[Installable.Utility]
     ) -> PyFn["UtilityInstallerCmdRunner", Exception, List[Installable.Utility]]:
@@ -373,6 +483,9 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
                 installed_utilities.append(result)
             return result
 
+        if not utilities:
+            return PyFn.success(installed_utilities)
+
         return (
             PyFn.of(utilities)
             .for_each(lambda utility: processing_fn(env, utility).map(lambda result: collect_result(result)))
@@ -383,9 +496,37 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
         self, env: InstallerEnv, utility: Installable.Utility
     ) -> PyFn["UtilityInstallerCmdRunner", Exception, Installable.Utility]:
         """Install a single utility with proper checks and validation."""
+        tracer = get_tracer()
+        return tracer.span_pyfn(
+            f"install {utility.display_name}",
+            # Steps 1-3: Check, notify and summarize (returns None to skip installation)
+            self._prepare_utility_for_install(env, utility)
+            # Step 4: Install the utility based on its source type
+            .flat_map(
+                lambda maybe_utility: (
+                    PyFn.empty()
+                    if maybe_utility is None
+                    else tracer.span_pyfn(
+                        f"install from {maybe_utility.active_source}",
+                        self._install_by_source_type(env, maybe_utility),
+                        version=maybe_utility.version,
+                    )
+                )
+            )
+            # Steps 5-7: Record, verify and summarize the installed utility
+            .flat_map(
+                lambda maybe_utility: (
+                    PyFn.empty() if maybe_utility is None else self._finalize_installed_utility(env, maybe_utility)
+                )
+            ),
+        )
+
+    def _prepare_utility_for_install(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, Optional[Installable.Utility]]:
         return (
             # Step 1: Check if utility is already installed
-            self._check_if_utility_already_installed(env, utility)
+            get_tracer().span_pyfn("check installed", self._check_if_utility_already_installed(env, utility))
             # Step 2: Handle already installed utilities (may return None to skip installation)
             .flat_map(
                 lambda util_install_tuple: self._notify_if_utility_already_installed(
@@ -398,24 +539,23 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
                     PyFn.empty() if maybe_utility is None else self._print_pre_install_summary(env, maybe_utility)
                 )
             )
-            # Step 4: Install the utility based on its source type
-            .flat_map(
-                lambda maybe_utility: (
-                    PyFn.empty() if maybe_utility is None else self._install_by_source_type(env, maybe_utility)
-                )
-            )
-            # Step 5: Trigger version command to verify installation
-            .flat_map(
-                lambda maybe_utility: (
-                    PyFn.empty() if maybe_utility is None else self._trigger_utility_version_command(env, maybe_utility)
-                )
-            )
-            # Step 6: Print post-install summary
+        )
+
+    def _finalize_installed_utility(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, Installable.Utility]:
+        tracer = get_tracer()
+        return (
+            # Step 5: Keep track of the installed utility, GitHub installs record their own release details
+            self._maybe_record_installed_utility(env, utility)
+            # Step 6: Trigger version command to verify installation
             .flat_map(
-                lambda maybe_utility: (
-                    PyFn.empty() if maybe_utility is None else self._print_post_install_summary(env, maybe_utility)
+                lambda installed: tracer.span_pyfn(
+                    "version check", self._trigger_utility_version_command(env, installed)
                 )
             )
+            # Step 7: Print post-install summary
+            .flat_map(lambda installed: self._print_post_install_summary(env, installed))
         )
 
     def _uninstall_single_utility(
@@ -424,7 +564,11 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
         """Uninstall a single utility."""
         return PyFn.effect(
             lambda: env.collaborators.printer().print_fn(f"Uninstalling utility: {utility.display_name}")
-        ).flat_map(lambda _: self._uninstall_utility_locally(env, utility))
+        ).flat_map(
+            lambda _: self._uninstall_utility_locally(env, utility).flat_map(
+                lambda uninstalled: self._forget_installed_utility(env, uninstalled)
+            )
+        )
 
     def _uninstall_github_utility(
         self, env: InstallerEnv, utility: Installable.Utility
@@ -485,11 +629,61 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
         self, env: InstallerEnv, utility: Installable.Utility
     ) -> PyFn["UtilityInstallerCmdRunner", Exception, Utility_InstallStatus_Tuple]:
         return PyFn.effect(
-            lambda: Utility_InstallStatus_Tuple(
-                utility=utility, installed=env.collaborators.checks().is_tool_exist_fn(utility.binary_name)
-            )
+            lambda: Utility_InstallStatus_Tuple(utility=utility, installed=self._is_utility_installed(env, utility))
         )
 
+    def _is_utility_installed(self, env: InstallerEnv, utility: Installable.Utility) -> bool:
+        """
+        Utilities installed by provisioner are answered from the installed state registry,
+        only utilities it has no record of are looked up on PATH.
+        """
+        if env.installed_registry.get(utility.binary_name) is not None:
+            return env.installed_registry.is_installed(utility.binary_name, utility.version)
+        return env.collaborators.checks().is_tool_exist_fn(utility.binary_name)
+
+    def _maybe_record_installed_utility(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, Installable.Utility]:
+        if env.ctx.is_dry_run() or utility.active_source == ActiveInstallSource.GitHub:
+            return PyFn.of(utility)
+        return PyFn.effect(
+            lambda: env.installed_registry.record(
+                InstalledUtility(
+                    name=utility.binary_name,
+                    version=utility.version,
+                    source=str(utility.active_source),
+                )
+            )
+        ).map(lambda _: utility)
+
+    def _record_installed_github_utility(
+        self,
+        env: InstallerEnv,
+        version: str,
+        download_info: ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple,
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, Installable.Utility]:
+        utility = download_info.utility
+        if env.ctx.is_dry_run():
+            return PyFn.of(utility)
+        return PyFn.effect(
+            lambda: env.installed_registry.record(
+                InstalledUtility(
+                    name=utility.binary_name,
+                    version=version,
+                    source=str(ActiveInstallSource.GitHub),
+                    digest=file_sha256(download_info.release_download_filepath),
+                    symlink_target=self._genreate_binary_symlink_path(utility.binary_name),
+                )
+            )
+        ).map(lambda _: utility)
+
+    def _forget_installed_utility(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, Installable.Utility]:
+        if env.ctx.is_dry_run():
+            return PyFn.of(utility)
+        return PyFn.effect(lambda: env.installed_registry.remove(utility.binary_name)).map(lambda _: utility)
+
     def _notify_if_utility_already_installed(
         self, env: InstallerEnv, utility: Installable.Utility, exists: bool
     ) -> PyFn["UtilityInstallerCmdRunner", Exception, Optional[Installable.Utility]]:
@@ -777,7 +971,7 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
         return PyFn.effect(
             lambda: env.collaborators.http_client().download_file_fn(
                 url=f"{util_ver_name_tuple.utility.source.github.alternative_base_url}/{util_ver_name_tuple.release_filename}",
-                progress_bar=True,
+                progress_bar=self._show_download_progress(env),
                 download_folder=self._genreate_binary_folder_path(
                     util_ver_name_tuple.utility.binary_name, util_ver_name_tuple.version
                 ),
@@ -788,6 +982,8 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
     def _download_from_github(
         self, env: InstallerEnv, util_ver_name_tuple: Utility_Version_ReleaseFileName_OsArch_Tuple
     ) -> PyFn["UtilityInstallerCmdRunner", Exception, ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple]:
+        if not self._show_download_progress(env):
+            return self._download_from_github_without_progress(env, util_ver_name_tuple)
         return PyFn.effect(
             lambda: env.collaborators.github().download_release_binary_fn(
                 owner=util_ver_name_tuple.utility.source.github.owner,
@@ -800,6 +996,27 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
             )
         ).flat_map(lambda filepath: self._create_release_tuple(filepath, util_ver_name_tuple))
 
+    def _download_from_github_without_progress(
+        self, env: InstallerEnv, util_ver_name_tuple: Utility_Version_ReleaseFileName_OsArch_Tuple
+    ) -> PyFn["UtilityInstallerCmdRunner", Exception, ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple]:
+        """The GitHub collaborator always draws a progress bar, concurrent downloads fetch the release URL directly"""
+        return PyFn.effect(
+            lambda: env.collaborators.http_client().download_file_fn(
+                url=GitHubDownloadBinaryUrl.format(
+                    github_url=GitHubUrl,
+                    owner=util_ver_name_tuple.utility.source.github.owner,
+                    repo=util_ver_name_tuple.utility.source.github.repo,
+                    version=util_ver_name_tuple.version,
+                    binary_name=util_ver_name_tuple.release_filename,
+                ),
+                progress_bar=False,
+                download_folder=self._genreate_binary_folder_path(
+                    util_ver_name_tuple.utility.binary_name, util_ver_name_tuple.version
+                ),
+                verify_already_downloaded=True,
+            )
+        ).flat_map(lambda filepath: self._create_release_tuple(filepath, util_ver_name_tuple))
+
     def _create_release_tuple(
         self, download_filepath: str, util_ver_name_tuple: Utility_Version_ReleaseFileName_OsArch_Tuple
     ) -> PyFn["UtilityInstallerCmdRunner", Exception, ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple]:
@@ -886,16 +1103,136 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
             return PyFn.fail(error=InstallerSourceError("Missing installation source. name: GitHub"))
 
         return (
-            # Resolve version & validate source
-            self._resolve_github_release_info(env, utility)
-            # Download the binary
-            .flat_map(lambda release_info: self._download_github_binary(env, release_info))
-            # Extract and prepare the binary
-            .flat_map(lambda download_info: self._prepare_github_binary(env, download_info))
+            # Resolve version & download the release
+            self._fetch_github_release(env, utility)
+            # Extract and prepare the binary, then record the installed release
+            .flat_map(lambda fetched: self._install_fetched_github_release(env, fetched))
             # Return the original utility
             .map(lambda _: utility)
         )
 
+    def _fetch_github_release(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> PyFn["UtilityInstallerCmdRunner", InstallerSourceError, Version_ReleaseDownloadInfo_Tuple]:
+        """Network bound part of a GitHub install, resolve the release and download it."""
+        # Locked releases skip version resolution and the release name lookup
+        locked_release = self._get_locked_release(env, utility)
+        tracer = get_tracer()
+        return (
+            # Resolve version & validate source
+            tracer.span_pyfn(
+                "resolve release",
+                (
+                    self._resolve_locked_release_info(env, utility, locked_release)
+                    if locked_release
+                    else self._resolve_github_release_info(env, utility)
+                ),
+                locked=locked_release is not None,
+            )
+            # Download the release binary or archive
+            .flat_map(
+                lambda release_info: tracer.span_pyfn(
+                    "download",
+                    (
+                        self._download_locked_asset(env, release_info, locked_release)
+                        if locked_release
+                        else self._download_github_binary(env, release_info)
+                    ).map(self._annotate_downloaded_bytes),
+                    release=release_info.release_filename,
+                    version=release_info.version,
+                ).map(lambda download_info: Version_ReleaseDownloadInfo_Tuple(release_info.version, download_info))
+            )
+        )
+
+    def _annotate_downloaded_bytes(
+        self, download_info: ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple
+    ) -> ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple:
+        if download_info.release_download_filepath and os.path.isfile(download_info.release_download_filepath):
+            get_tracer().annotate(bytes=os.path.getsize(download_info.release_download_filepath))
+        return download_info
+
+    def _install_fetched_github_release(
+        self, env: InstallerEnv, fetched: Version_ReleaseDownloadInfo_Tuple
+    ) -> PyFn["UtilityInstallerCmdRunner", InstallerSourceError, Installable.Utility]:
+        """CPU and disk bound part of a GitHub install, unpack and link the binary then record the release."""
+        return self._prepare_github_binary(env, fetched.download_info).flat_map(
+            lambda _: get_tracer().span_pyfn(
+                "record installed",
+                self._record_installed_github_utility(env, fetched.version, fetched.download_info),
+            )
+        )
+
+    def _get_locked_release(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> Optional[LockedVersion_Asset_Tuple]:
+        if env.lockfile is None:
+            return None
+        locked_utility = env.lockfile.get(utility.binary_name)
+        if locked_utility is None:
+            return None
+        if utility.version and utility.version != "latest":
+            if normalize_version(utility.version) != normalize_version(locked_utility.version):
+                logger.debug(f"Requested version is not the locked one, resolving. name: {utility.binary_name}")
+                return None
+        locked_asset = locked_utility.get_asset(env.ctx.os_arch.as_pair(mapping=utility.source.github.arch_map))
+        if locked_asset is None:
+            return None
+        return LockedVersion_Asset_Tuple(locked_utility.version, locked_asset)
+
+    def _resolve_locked_release_info(
+        self, env: InstallerEnv, utility: Installable.Utility, locked_release: LockedVersion_Asset_Tuple
+    ) -> PyFn["UtilityInstallerCmdRunner", InstallerSourceError, Utility_Version_ReleaseFileName_OsArch_Tuple]:
+        return PyFn.success(
+            Utility_Version_ReleaseFileName_OsArch_Tuple(
+                utility,
+                locked_release.version,
+                locked_release.asset.name,
+                OsArch.from_string(locked_release.asset.os_arch),
+            )
+        ).flat_map(lambda util_ver_name_tuple: self._print_before_downloading(env, util_ver_name_tuple))
+
+    def _download_locked_asset(
+        self,
+        env: InstallerEnv,
+        release_info: Utility_Version_ReleaseFileName_OsArch_Tuple,
+        locked_release: LockedVersion_Asset_Tuple,
+    ) -> PyFn[
+        "UtilityInstallerCmdRunner", InstallerSourceError, ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple
+    ]:
+        """Download the locked asset URL, a previously downloaded asset is reused once its digest matches."""
+        return (
+            PyFn.effect(
+                lambda: env.collaborators.http_client().download_file_fn(
+                    url=locked_release.asset.url,
+                    progress_bar=self._show_download_progress(env),
+                    download_folder=self._genreate_binary_folder_path(
+                        release_info.utility.binary_name, release_info.version
+                    ),
+                    verify_already_downloaded=True,
+                )
+            )
+            .flat_map(lambda filepath: self._verify_locked_asset_digest(env, filepath, locked_release.asset))
+            .flat_map(lambda filepath: self._create_release_tuple(filepath, release_info))
+        )
+
+    def _verify_locked_asset_digest(
+        self, env: InstallerEnv, filepath: str, locked_asset: LockedAsset
+    ) -> PyFn["UtilityInstallerCmdRunner", InstallerSourceError, str]:
+        if env.ctx.is_dry_run() or not locked_asset.digest:
+            return PyFn.success(filepath)
+        digest = file_sha256(filepath)
+        if digest == locked_asset.digest:
+            return PyFn.success(filepath)
+        if digest is not None:
+            # Drop the file so the next run downloads it again instead of hitting the bad cached copy
+            os.remove(filepath)
+        return PyFn.fail(
+            error=InstallerSourceError(
+                f"Downloaded asset does not match the lockfile digest. name: {locked_asset.name}, "
+                f"expected: {locked_asset.digest}, actual: {digest}"
+            )
+        )
+
     def _resolve_github_release_info(
         self, env: InstallerEnv, utility: Installable.Utility
     ) -> PyFn["UtilityInstallerCmdRunner", InstallerSourceError, Utility_Version_ReleaseFileName_OsArch_Tuple]:
@@ -921,13 +1258,18 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
         self, env: InstallerEnv, download_info: ReleaseFilename_ReleaseDownloadFilePath_Utility_OsArch_Tuple
     ) -> PyFn["UtilityInstallerCmdRunner", InstallerSourceError, None]:
         """Extract, prepare, and install the GitHub binary."""
+        tracer = get_tracer()
         return (
             # Extract archive if needed
-            self._maybe_extract_downloaded_binary(env, download_info)
+            tracer.span_pyfn("unpack", self._maybe_extract_downloaded_binary(env, download_info))
             # Move binary to root if needed
             .flat_map(lambda extraction_info: self._force_binary_at_download_path_root(env, extraction_info))
             # Set permissions and create symlink
-            .flat_map(lambda extraction_info: self._setup_binary_permissions_and_symlink(env, extraction_info))
+            .flat_map(
+                lambda extraction_info: tracer.span_pyfn(
+                    "chmod and symlink", self._setup_binary_permissions_and_symlink(env, extraction_info)
+                )
+            )
         )
 
     def _setup_binary_permissions_and_symlink(
@@ -992,7 +1334,11 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
         self, env: InstallerEnv, ssh_conn_info: SSHConnectionInfo, utility: Installable.Utility
     ) -> str:
         """Execute the Ansible playbook that installs utilities on remote machines."""
-        command = self._build_provisioner_command(env, utility)
+        # The runtime bundle is pushed once per content hash, the pip wrapper reinstalls plugins on every run
+        use_bundle = is_remote_bundle_runtime(env.collaborators)
+        tracer = get_tracer()
+        # The pip wrapper installs the published plugin, which may predate the trace option
+        command = self._build_provisioner_command(env, utility, trace_remote=use_bundle and tracer.enabled)
         logger.debug(f"Remote provisioner command: {command}")
 
         ansible_vars = self._prepare_ansible_vars(env)
@@ -1004,7 +1350,12 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
             required_plugins=["provisioner_installers_plugin"],
             ansible_vars=ansible_vars,
         )
-        return RemoteProvisionerRunner().run(env.ctx, args, env.collaborators)
+        hosts = [ansible_host.host for ansible_host in ssh_conn_info.ansible_hosts]
+        with tracer.span("remote install", hosts=HOSTS_ARG_SEPARATOR.join(hosts), utility=utility.display_name):
+            runner = RemoteBundleRunner() if use_bundle else RemoteProvisionerRunner()
+            output = runner.run(env.ctx, args, env.collaborators)
+            # Spans of the remote provisioner nest under this one
+            return tracer.merge_remote_trace(output, hosts=hosts)
 
     def _prepare_ansible_vars(self, env: InstallerEnv) -> List[str]:
         """Prepare Ansible variables for the remote installation."""
@@ -1013,15 +1364,17 @@ class UtilityInstallerCmdRunner(PyFnEnvBase):
         ]
         return ansible_vars
 
-    def _build_provisioner_command(self, env: InstallerEnv, utility: Installable.Utility) -> str:
+    def _build_provisioner_command(
+        self, env: InstallerEnv, utility: Installable.Utility, trace_remote: bool = False
+    ) -> str:
         """Build the provisioner command to run on the remote machine."""
         # Determine if this is an uninstall operation
         is_uninstall = env.args.uninstall or (
             utility.maybe_args and utility.maybe_args.as_dict().get("uninstall", False)
         )
 
-        # Always use "install" as the base command
-        operation = "install"
+        # Always use "install" as the base command, a traced run collects the remote trace from its output
+        operation = f"install --trace {TRACE_TO_STDOUT}" if trace_remote else "install"
 
         # Format utility name with version if applicable
         if env.args.sub_command_name == InstallerSubCommandName.CLI:
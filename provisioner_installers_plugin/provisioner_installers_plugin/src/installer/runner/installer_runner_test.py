@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import os
+import shutil
+import tempfile
 import unittest
 from typing import Callable, List
 from unittest import mock
@@ -27,6 +30,11 @@ from provisioner_installers_plugin.src.installer.runner.installer_runner import
     UtilityInstallerRunnerCmdArgs,
     generate_installer_welcome,
 )
+from provisioner_installers_plugin.src.installer.state.installed_state import (
+    InstalledStateRegistry,
+    InstalledUtility,
+)
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import SpanTracer
 
 from provisioner_shared.components.remote.domain.config import RunEnvironment
 from provisioner_shared.components.remote.remote_connector import RemoteMachineConnector
@@ -66,6 +74,7 @@ TEST_UTILITY_2_SCRIPT: NameVersionArgsTuple = NameVersionArgsTuple(
     name=TEST_UTILITY_2_SCRIPT_NAME, version=TEST_UTILITY_2_SCRIPT_VER
 )
 
+INSTALLER_RUNNER_PATH = "provisioner_installers_plugin.src.installer.runner.installer_runner"
 UTILITY_INSTALLER_CMD_RUNNER_PATH = (
     "provisioner_installers_plugin.src.installer.runner.installer_runner.UtilityInstallerCmdRunner"
 )
@@ -159,6 +168,13 @@ class UtilityInstallerRunnerTestShould(unittest.TestCase):
 
     env = TestEnv.create(verbose=True)
 
+    def setUp(self) -> None:
+        self.state_dir = tempfile.mkdtemp(prefix="provisioner-installer-runner-test")
+        self.installed_registry = InstalledStateRegistry(os.path.join(self.state_dir, "installed.json"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.state_dir)
+
     def create_fake_installer_env(
         self,
         test_env: TestEnv,
@@ -178,6 +194,7 @@ class UtilityInstallerRunnerTestShould(unittest.TestCase):
                 force=is_force_install,
             ),
             supported_utilities=TestSupportedToolings,
+            installed_registry=self.installed_registry,
         )
 
     def create_evaluator(self, installer_env: InstallerEnv) -> "PyFnEvaluator[InstallerEnv, None]":
@@ -429,6 +446,18 @@ class UtilityInstallerRunnerTestShould(unittest.TestCase):
         result = eval << self.get_runner(eval)._check_if_utility_already_installed(fake_installer_env, utility)
         Assertion.expect_equal_objects(self, result, Utility_InstallStatus_Tuple(utility=utility, installed=True))
 
+    def test_check_if_utility_already_installed_from_installed_state(self) -> None:
+        utility = TestSupportedToolings[TEST_UTILITY_1_GITHUB_NAME]
+        test_env = TestEnv.create()
+        test_env.get_collaborators().checks().on("is_tool_exist_fn", str).side_effect = lambda name: self.fail(
+            "PATH should not be scanned for utilities with installed state"
+        )
+        self.installed_registry.record(InstalledUtility(name=utility.binary_name, version="v1.0.0"))
+        fake_installer_env = self.create_fake_installer_env(test_env)
+        eval = self.create_evaluator(fake_installer_env)
+        result = eval << self.get_runner(eval)._check_if_utility_already_installed(fake_installer_env, utility)
+        Assertion.expect_equal_objects(self, result, Utility_InstallStatus_Tuple(utility=utility, installed=True))
+
     def test_notify_if_utility_already_installed(self) -> None:
         utility = TestSupportedToolings[TEST_UTILITY_1_GITHUB_NAME]
         test_env = TestEnv.create()
@@ -959,6 +988,65 @@ class UtilityInstallerRunnerTestShould(unittest.TestCase):
         self.assertEqual(execute_ansible_call.call_count, 1)
         self.assertEqual(result, "Mock ansible execution completed")
 
+    @mock.patch(f"{INSTALLER_RUNNER_PATH}.get_tracer", return_value=SpanTracer(enabled=True))
+    @mock.patch(f"{INSTALLER_RUNNER_PATH}.RemoteProvisionerRunner")
+    @mock.patch(f"{INSTALLER_RUNNER_PATH}.RemoteBundleRunner")
+    @mock.patch(f"{INSTALLER_RUNNER_PATH}.is_remote_bundle_runtime", return_value=True)
+    def test_install_on_remote_machine_from_runtime_bundle(
+        self,
+        is_bundle_call: mock.MagicMock,
+        bundle_runner_cls: mock.MagicMock,
+        pip_runner_cls: mock.MagicMock,
+        get_tracer_call: mock.MagicMock,
+    ) -> None:
+        bundle_runner_cls.return_value.run.return_value = "Installed from bundle"
+        test_env = TestEnv.create()
+        fake_installer_env = self.create_fake_installer_env(test_env, remote_context=RemoteContext.create(verbose=True))
+
+        output = UtilityInstallerCmdRunner(test_env.get_context())._execute_remote_ansible_playbook(
+            env=fake_installer_env,
+            ssh_conn_info=TestDataRemoteConnector.create_fake_ssh_conn_info(),
+            utility=TestSupportedToolings[TEST_UTILITY_1_GITHUB_NAME],
+        )
+
+        self.assertEqual(output, "Installed from bundle")
+        is_bundle_call.assert_called_once_with(fake_installer_env.collaborators)
+        pip_runner_cls.assert_not_called()
+        ctx, args, collaborators = bundle_runner_cls.return_value.run.call_args.args
+        self.assertEqual((ctx, collaborators), (fake_installer_env.ctx, fake_installer_env.collaborators))
+        self.assertIn(f"{TEST_UTILITY_1_GITHUB_NAME}@{TEST_UTILITY_1_GITHUB_VER}", args.provisioner_command)
+        # The bundle carries this plugin version, its remote trace is merged into the local one
+        self.assertTrue(args.provisioner_command.startswith("install --trace - "))
+        self.assertEqual(args.required_plugins, ["provisioner_installers_plugin"])
+        self.assertEqual(args.ansible_vars, [f"git_access_token={TEST_GITHUB_ACCESS_TOKEN}"])
+
+    @mock.patch(f"{INSTALLER_RUNNER_PATH}.get_tracer", return_value=SpanTracer(enabled=True))
+    @mock.patch(f"{INSTALLER_RUNNER_PATH}.RemoteProvisionerRunner")
+    @mock.patch(f"{INSTALLER_RUNNER_PATH}.RemoteBundleRunner")
+    @mock.patch(f"{INSTALLER_RUNNER_PATH}.is_remote_bundle_runtime", return_value=False)
+    def test_install_on_remote_machine_with_pip_wrapper(
+        self,
+        is_bundle_call: mock.MagicMock,
+        bundle_runner_cls: mock.MagicMock,
+        pip_runner_cls: mock.MagicMock,
+        get_tracer_call: mock.MagicMock,
+    ) -> None:
+        pip_runner_cls.return_value.run.return_value = "Installed with pip"
+        test_env = TestEnv.create()
+        fake_installer_env = self.create_fake_installer_env(test_env, remote_context=RemoteContext.create(verbose=True))
+
+        output = UtilityInstallerCmdRunner(test_env.get_context())._execute_remote_ansible_playbook(
+            env=fake_installer_env,
+            ssh_conn_info=TestDataRemoteConnector.create_fake_ssh_conn_info(),
+            utility=TestSupportedToolings[TEST_UTILITY_1_GITHUB_NAME],
+        )
+
+        self.assertEqual(output, "Installed with pip")
+        bundle_runner_cls.assert_not_called()
+        _, args, _ = pip_runner_cls.return_value.run.call_args.args
+        # The published plugin installed by the pip wrapper may not know the trace option
+        self.assertNotIn("--trace", args.provisioner_command)
+
     @mock.patch(
         f"{UTILITY_INSTALLER_CMD_RUNNER_PATH}._install_on_remote_machine",
         side_effect=[
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.domain.installable import Installable
+from provisioner_installers_plugin.src.installer.domain.lockfile import LockedAsset, LockedUtility, ToolsetLockfile
+from provisioner_installers_plugin.src.installer.domain.version import NameVersionArgsTuple
+from provisioner_installers_plugin.src.installer.runner.installer_runner import (
+    InstallerEnv,
+    Utility_Version_Tuple,
+    UtilityInstallerCmdRunner,
+)
+from provisioner_installers_plugin.src.installer.runner.toolset_runner import DEFAULT_TOOLSET_MAX_WORKERS
+from provisioner_installers_plugin.src.installer.state.installed_state import file_sha256, normalize_version
+
+from provisioner_shared.components.runtime.errors.cli_errors import InstallerUtilityNotSupported
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.utils.github import GitHubDownloadBinaryUrl, GitHubUrl
+from provisioner_shared.components.runtime.utils.os import OsArch
+from provisioner_shared.framework.functional.pyfn import Environment, PyFnEvaluator
+
+
+class ToolsetLockRunnerArgs:
+
+    def __init__(
+        self,
+        os_arch_pairs: Optional[List[str]] = None,
+        previous_lockfile: Optional[ToolsetLockfile] = None,
+        upgrade: bool = False,
+        max_workers: int = DEFAULT_TOOLSET_MAX_WORKERS,
+    ) -> None:
+        self.os_arch_pairs = os_arch_pairs
+        self.previous_lockfile = previous_lockfile
+        self.upgrade = upgrade
+        self.max_workers = max_workers
+
+
+class ToolsetLockRunner(UtilityInstallerCmdRunner):
+    """
+    Resolves every utility of a toolset manifest once and records the result in a lockfile.
+    GitHub released utilities get the asset name, URL and SHA-256 digest of every supported OS/Arch,
+    digests are computed by downloading each asset. Entries of a previous lockfile that still satisfy
+    the manifest are kept as is unless upgrading, re-locking does not drift 'latest' versions.
+    """
+
+    def __init__(self, ctx: Context):
+        super().__init__(ctx=ctx)
+
+    @staticmethod
+    def run(env: InstallerEnv, args: ToolsetLockRunnerArgs) -> ToolsetLockfile:
+        logger.debug("Inside ToolsetLockRunner run()")
+        runner = ToolsetLockRunner(ctx=env.ctx)
+        for tool in env.args.utilities:
+            if tool.name not in env.supported_utilities:
+                raise InstallerUtilityNotSupported(f"{tool.name} is not supported as an installable utility")
+
+        max_workers = max(1, min(args.max_workers, len(env.args.utilities)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            locked_utilities = list(executor.map(lambda tool: runner._lock_tool(env, args, tool), env.args.utilities))
+        return ToolsetLockfile({locked.name: locked for locked in locked_utilities})
+
+    def _lock_tool(self, env: InstallerEnv, args: ToolsetLockRunnerArgs, tool: NameVersionArgsTuple) -> LockedUtility:
+        utility = Installable.Utility(**env.supported_utilities[tool.name].__dict__)
+        utility.version = tool.version
+        previous = self._maybe_get_previous_lock(args, utility)
+        if previous is not None:
+            logger.debug(f"Keeping locked version. name: {utility.binary_name}, version: {previous.version}")
+            return previous
+        if not utility.has_github_active_source():
+            return LockedUtility(name=utility.binary_name, version=tool.version)
+
+        # Evaluators carry the chain environment, every worker thread evaluates with its own
+        eval: PyFnEvaluator = PyFnEvaluator[ToolsetLockRunner, Exception].new(ToolsetLockRunner(ctx=env.ctx))
+        chain: ToolsetLockRunner = eval << Environment[ToolsetLockRunner]()
+        util_ver_tuple: Utility_Version_Tuple = eval << chain._try_resolve_utility_version(env, utility)
+        env.collaborators.printer().print_fn(
+            f"Locking utility. name: {utility.binary_name}, version: {util_ver_tuple.version}"
+        )
+        return LockedUtility(
+            name=utility.binary_name,
+            version=util_ver_tuple.version,
+            assets={
+                os_arch_pair: self._lock_asset(env, utility, util_ver_tuple.version, os_arch_pair)
+                for os_arch_pair in self._get_os_arch_pairs_to_lock(args, utility)
+            },
+        )
+
+    def _maybe_get_previous_lock(
+        self, args: ToolsetLockRunnerArgs, utility: Installable.Utility
+    ) -> Optional[LockedUtility]:
+        if args.upgrade or args.previous_lockfile is None:
+            return None
+        previous = args.previous_lockfile.get(utility.binary_name)
+        if previous is None:
+            return None
+        if utility.version != "latest" and normalize_version(utility.version) != normalize_version(previous.version):
+            return None
+        if utility.has_github_active_source():
+            if any(pair not in previous.assets for pair in self._get_os_arch_pairs_to_lock(args, utility)):
+                return None
+        return previous
+
+    def _get_os_arch_pairs_to_lock(self, args: ToolsetLockRunnerArgs, utility: Installable.Utility) -> List[str]:
+        supported_releases = utility.source.github.supported_releases or []
+        if not args.os_arch_pairs:
+            return list(supported_releases)
+        return [pair for pair in supported_releases if pair in args.os_arch_pairs]
+
+    def _lock_asset(
+        self, env: InstallerEnv, utility: Installable.Utility, version: str, os_arch_pair: str
+    ) -> LockedAsset:
+        os_arch = OsArch.from_string(os_arch_pair)
+        github = utility.source.github
+        asset_name = github.release_name_resolver(version, os_arch.os, os_arch.arch)
+        if github.alternative_base_url:
+            url = f"{github.alternative_base_url}/{asset_name}"
+        else:
+            url = GitHubDownloadBinaryUrl.format(
+                github_url=GitHubUrl, owner=github.owner, repo=github.repo, version=version, binary_name=asset_name
+            )
+        return LockedAsset(os_arch=os_arch_pair, name=asset_name, url=url, digest=self._download_and_digest(env, url))
+
+    def _download_and_digest(self, env: InstallerEnv, url: str) -> Optional[str]:
+        if env.ctx.is_dry_run():
+            return None
+        download_folder = tempfile.mkdtemp(prefix="provisioner-lock-")
+        try:
+            return file_sha256(
+                env.collaborators.http_client().download_file_fn(url=url, download_folder=download_folder)
+            )
+        finally:
+            shutil.rmtree(download_folder, ignore_errors=True)
+
+
+def generate_lockfile_summary(lockfile: ToolsetLockfile, lockfile_path: str) -> str:
+    lines = [f"Locked {len(lockfile.utilities)} utilities to {lockfile_path}:", ""]
+    for name in lockfile.names():
+        locked = lockfile.get(name)
+        assets = f"{len(locked.assets)} assets" if locked.assets else "no release assets"
+        lines.append(f"  {name}  {locked.version}  ({assets})")
+    return "\n".join(lines)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from provisioner_installers_plugin.src.installer.domain.command import InstallerSubCommandName
+from provisioner_installers_plugin.src.installer.domain.installable import Installable
+from provisioner_installers_plugin.src.installer.domain.lockfile import (
+    LockedAsset,
+    LockedUtility,
+    ToolsetLockfile,
+    default_lockfile_path,
+)
+from provisioner_installers_plugin.src.installer.domain.manifest import ToolsetManifest
+from provisioner_installers_plugin.src.installer.domain.source import ActiveInstallSource, InstallSource
+from provisioner_installers_plugin.src.installer.runner.installer_runner import (
+    InstallerEnv,
+    LockedVersion_Asset_Tuple,
+    UtilityInstallerCmdRunner,
+    UtilityInstallerRunnerCmdArgs,
+)
+from provisioner_installers_plugin.src.installer.runner.lock_runner import ToolsetLockRunner, ToolsetLockRunnerArgs
+from provisioner_installers_plugin.src.installer.runner.toolset_runner import pin_locked_versions
+from provisioner_installers_plugin.src.installer.state.installed_state import InstalledStateRegistry
+
+from provisioner_shared.components.runtime.errors.cli_errors import InstallerSourceError
+from provisioner_shared.components.runtime.utils.os import OsArch
+from provisioner_shared.framework.functional.pyfn import Environment, PyFnEvaluator
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/runner/lock_runner_test.py
+#
+
+TEST_ASSET_CONTENT = b"binary"
+TEST_ASSET_DIGEST = "9a3a45d01531a20e89ac6ae10b0b0beb0492acd7216a368aa062d1a5fecaf9cd"
+
+TestSupportedToolings = {
+    "tool-github": Installable.Utility(
+        display_name="tool-github",
+        binary_name="tool-github",
+        description="test description",
+        active_source=ActiveInstallSource.GitHub,
+        source=InstallSource(
+            github=InstallSource.GitHub(
+                owner="TestOwner",
+                repo="TestRepo",
+                supported_releases=["darwin_arm64", "linux_amd64", "linux_arm64"],
+                arch_map={"x86_64": "amd64", "aarch64": "arm64"},
+                release_name_resolver=lambda version, os, arch: f"tool-github_{version}_{os}_{arch}.tar.gz",
+            )
+        ),
+    ),
+    "tool-script": Installable.Utility(
+        display_name="tool-script",
+        binary_name="tool-script",
+        description="test description",
+        active_source=ActiveInstallSource.Script,
+        source=InstallSource(script=InstallSource.Script(install_script="install-tool-script.sh")),
+    ),
+}
+
+
+class ToolsetLockRunnerTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-lock-runner-test")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def download_file_fn(self, url: str, download_folder: str, **kwargs) -> str:
+        os.makedirs(download_folder, exist_ok=True)
+        file_path = os.path.join(download_folder, url.rsplit("/")[-1])
+        with open(file_path, "wb") as f:
+            f.write(TEST_ASSET_CONTENT)
+        return file_path
+
+    def create_fake_installer_env(self, manifest: ToolsetManifest, lockfile: ToolsetLockfile = None) -> InstallerEnv:
+        ctx = mock.MagicMock()
+        ctx.is_dry_run.return_value = False
+        ctx.os_arch = OsArch(os="linux", arch="x86_64")
+        collaborators = mock.MagicMock()
+        collaborators.github().get_latest_version_fn.return_value = "v1.2.0"
+        collaborators.http_client().download_file_fn.side_effect = self.download_file_fn
+        return InstallerEnv(
+            ctx=ctx,
+            collaborators=collaborators,
+            args=UtilityInstallerRunnerCmdArgs(
+                utilities=manifest.tools, remote_opts=None, sub_command_name=InstallerSubCommandName.CLI
+            ),
+            supported_utilities=TestSupportedToolings,
+            installed_registry=InstalledStateRegistry(os.path.join(self.work_dir, "installed.json")),
+            lockfile=lockfile,
+        )
+
+    def test_round_trip_lockfile(self) -> None:
+        lockfile = ToolsetLockfile(
+            {
+                "tool-github": LockedUtility(
+                    "tool-github", "v1.2.0", {"linux_amd64": LockedAsset("linux_amd64", "asset", "url", "digest")}
+                )
+            }
+        )
+        lockfile_path = default_lockfile_path(os.path.join(self.work_dir, "tools.yaml"))
+        self.assertEqual(lockfile_path, os.path.join(self.work_dir, "tools.lock"))
+        lockfile.to_file(lockfile_path)
+        self.assertEqual(ToolsetLockfile.from_file(lockfile_path).to_dict(), lockfile.to_dict())
+
+    def test_lock_resolved_versions_assets_and_digests(self) -> None:
+        manifest = ToolsetManifest.from_dict({"tools": {"tool-github": "latest", "tool-script": "v2.0.0"}})
+        env = self.create_fake_installer_env(manifest)
+        lockfile = ToolsetLockRunner.run(env, ToolsetLockRunnerArgs(os_arch_pairs=["linux_amd64", "linux_arm64"]))
+
+        locked_github = lockfile.get("tool-github")
+        self.assertEqual(locked_github.version, "v1.2.0")
+        self.assertEqual(sorted(locked_github.assets), ["linux_amd64", "linux_arm64"])
+        asset = locked_github.get_asset("linux_arm64")
+        self.assertEqual(asset.name, "tool-github_v1.2.0_linux_arm64.tar.gz")
+        self.assertEqual(
+            asset.url,
+            "https://github.com/TestOwner/TestRepo/releases/download/v1.2.0/tool-github_v1.2.0_linux_arm64.tar.gz",
+        )
+        self.assertEqual(asset.digest, TEST_ASSET_DIGEST)
+        self.assertEqual(lockfile.get("tool-script").version, "v2.0.0")
+        self.assertEqual(lockfile.get("tool-script").assets, {})
+
+    def test_keep_previously_locked_versions(self) -> None:
+        manifest = ToolsetManifest.from_dict({"tools": {"tool-github": "latest"}})
+        previous = ToolsetLockfile(
+            {
+                "tool-github": LockedUtility(
+                    "tool-github", "v1.1.0", {"linux_amd64": LockedAsset("linux_amd64", "asset", "url", "digest")}
+                )
+            }
+        )
+        env = self.create_fake_installer_env(manifest)
+        args = ToolsetLockRunnerArgs(os_arch_pairs=["linux_amd64"], previous_lockfile=previous)
+        self.assertEqual(ToolsetLockRunner.run(env, args).get("tool-github").version, "v1.1.0")
+        env.collaborators.github().get_latest_version_fn.assert_not_called()
+
+        args.upgrade = True
+        self.assertEqual(ToolsetLockRunner.run(env, args).get("tool-github").version, "v1.2.0")
+
+    def test_pin_manifest_versions_to_the_lockfile(self) -> None:
+        manifest = ToolsetManifest.from_dict({"tools": {"tool-github": "latest", "tool-script": "v3.0.0"}})
+        lockfile = ToolsetLockfile(
+            {
+                "tool-github": LockedUtility("tool-github", "v1.1.0"),
+                "tool-script": LockedUtility("tool-script", "v2.0.0"),
+            }
+        )
+        self.assertEqual(
+            [tool.version for tool in pin_locked_versions(manifest.tools, TestSupportedToolings, lockfile)],
+            ["v1.1.0", "v3.0.0"],
+        )
+
+    def test_install_locked_asset_without_resolving(self) -> None:
+        manifest = ToolsetManifest.from_dict({"tools": {"tool-github": "latest"}})
+        lockfile = ToolsetLockfile(
+            {
+                "tool-github": LockedUtility(
+                    "tool-github",
+                    "v1.1.0",
+                    {"linux_amd64": LockedAsset("linux_amd64", "asset.tar.gz", "https://test/asset.tar.gz", "bad")},
+                )
+            }
+        )
+        env = self.create_fake_installer_env(manifest, lockfile)
+        eval = PyFnEvaluator[UtilityInstallerCmdRunner, Exception].new(UtilityInstallerCmdRunner(ctx=env.ctx))
+        runner: UtilityInstallerCmdRunner = eval << Environment[UtilityInstallerCmdRunner]()
+        utility = TestSupportedToolings["tool-github"]
+
+        locked_release = runner._get_locked_release(env, utility)
+        self.assertEqual(
+            locked_release, LockedVersion_Asset_Tuple("v1.1.0", lockfile.get("tool-github").assets["linux_amd64"])
+        )
+
+        file_path = self.download_file_fn("https://test/asset.tar.gz", self.work_dir)
+        with self.assertRaises(InstallerSourceError):
+            eval << runner._verify_locked_asset_digest(env, file_path, locked_release.asset)
+        self.assertFalse(os.path.exists(file_path))
+
+        file_path = self.download_file_fn("https://test/asset.tar.gz", self.work_dir)
+        locked_release.asset.digest = TEST_ASSET_DIGEST
+        self.assertEqual(eval << runner._verify_locked_asset_digest(env, file_path, locked_release.asset), file_path)
+        env.collaborators.github().get_latest_version_fn.assert_not_called()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.domain.installable import Installable
+from provisioner_installers_plugin.src.installer.domain.lockfile import ToolsetLockfile
+from provisioner_installers_plugin.src.installer.domain.version import NameVersionArgsTuple
+from provisioner_installers_plugin.src.installer.runner.installer_runner import (
+    InstallerEnv,
+    UtilityInstallerCmdRunner,
+)
+from provisioner_installers_plugin.src.installer.state.installed_state import InstalledUtility, normalize_version
+
+from provisioner_shared.components.runtime.errors.cli_errors import (
+    InstallerUtilityNotSupported,
+    StepEvaluationFailure,
+)
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.framework.functional.pyfn import Environment, PyFn, PyFnEvaluator
+
+DEFAULT_TOOLSET_MAX_WORKERS = 4
+
+
+class ToolsetAction(str, Enum):
+    Install = "install"
+    Upgrade = "upgrade"
+    Remove = "remove"
+    NoOp = "no-op"
+
+    def __str__(self):
+        return self.value
+
+
+class ToolsetChange(NamedTuple):
+    action: ToolsetAction
+    name: str
+    installed_version: Optional[str]
+    target_version: Optional[str]
+
+    def is_pending(self) -> bool:
+        return self.action != ToolsetAction.NoOp
+
+
+def pin_locked_versions(
+    tools: List[NameVersionArgsTuple],
+    supported_utilities: Dict[str, Installable.Utility],
+    lockfile: ToolsetLockfile,
+) -> List[NameVersionArgsTuple]:
+    """Tools install the version they are locked to, a manifest pinning another version wins over a stale lock"""
+    result: List[NameVersionArgsTuple] = []
+    for tool in tools:
+        locked = lockfile.get(supported_utilities[tool.name].binary_name)
+        if locked is None:
+            result.append(tool)
+        elif tool.version == "latest" or normalize_version(tool.version) == normalize_version(locked.version):
+            result.append(tool._replace(version=locked.version))
+        else:
+            logger.warning(f"Lockfile is stale, using the manifest version. name: {tool.name}, version: {tool.version}")
+            result.append(tool)
+    return result
+
+
+def plan_toolset_changes(
+    tools: List[NameVersionArgsTuple],
+    supported_utilities: Dict[str, Installable.Utility],
+    installed: Dict[str, InstalledUtility],
+    is_tool_exist_fn: Callable[[str], bool],
+    prune: bool = False,
+) -> List[ToolsetChange]:
+    """
+    Compare the wanted toolset against the installed state, the result lists every tool with the action
+    that converges it. Utilities on PATH that provisioner did not install are left alone unless pinned.
+    """
+    changes: List[ToolsetChange] = []
+    wanted_binaries = set()
+    for tool in tools:
+        utility = supported_utilities[tool.name]
+        wanted_binaries.add(utility.binary_name)
+        installed_utility = installed.get(utility.binary_name)
+        if installed_utility is not None and installed_utility.is_present():
+            action = ToolsetAction.NoOp if installed_utility.matches(tool.version) else ToolsetAction.Upgrade
+            changes.append(ToolsetChange(action, tool.name, installed_utility.version, tool.version))
+        elif tool.version == "latest" and is_tool_exist_fn(utility.binary_name):
+            changes.append(ToolsetChange(ToolsetAction.NoOp, tool.name, None, tool.version))
+        else:
+            changes.append(ToolsetChange(ToolsetAction.Install, tool.name, None, tool.version))
+
+    if prune:
+        for name, utility in supported_utilities.items():
+            installed_utility = installed.get(utility.binary_name)
+            if installed_utility is not None and utility.binary_name not in wanted_binaries:
+                changes.append(ToolsetChange(ToolsetAction.Remove, name, installed_utility.version, None))
+    return changes
+
+
+class ToolsetApplyRunnerArgs:
+
+    def __init__(self, prune: bool = False, max_workers: int = DEFAULT_TOOLSET_MAX_WORKERS) -> None:
+        self.prune = prune
+        self.max_workers = max_workers
+
+
+class ToolsetApplyRunner(UtilityInstallerCmdRunner):
+    """
+    Converges the local machine to a toolset manifest. Only the planned changes run, each on its own
+    worker thread, a converged machine is answered from the installed state without installing anything.
+    """
+
+    def __init__(self, ctx: Context):
+        super().__init__(ctx=ctx)
+
+    @staticmethod
+    def run(env: InstallerEnv, args: ToolsetApplyRunnerArgs) -> List[ToolsetChange]:
+        logger.debug("Inside ToolsetApplyRunner run()")
+        runner = ToolsetApplyRunner(ctx=env.ctx)
+        runner._verify_toolset(env)
+        tools = env.args.utilities
+        if env.lockfile is not None:
+            tools = pin_locked_versions(tools, env.supported_utilities, env.lockfile)
+        changes = plan_toolset_changes(
+            tools=tools,
+            supported_utilities=env.supported_utilities,
+            installed=env.installed_registry.all(),
+            is_tool_exist_fn=env.collaborators.checks().is_tool_exist_fn,
+            prune=args.prune,
+        )
+        env.collaborators.printer().print_with_rich_table_fn(generate_toolset_plan(changes))
+
+        pending = [change for change in changes if change.is_pending()]
+        if not pending:
+            env.collaborators.printer().print_fn("Toolset is up to date, nothing to apply.")
+            return changes
+        if env.ctx.is_dry_run() or not runner._confirm_removals(env, pending):
+            return changes
+
+        failures = runner._apply_changes(env, pending, args.max_workers)
+        if failures:
+            raise StepEvaluationFailure(
+                "Failed to apply toolset changes. "
+                + ", ".join(f"{change.action} {change.name}: {error}" for change, error in failures)
+            )
+        env.collaborators.printer().print_fn(f"Applied {len(pending)} toolset change(s).")
+        return changes
+
+    def _verify_toolset(self, env: InstallerEnv) -> None:
+        for tool in env.args.utilities:
+            if tool.name not in env.supported_utilities:
+                raise InstallerUtilityNotSupported(f"{tool.name} is not supported as an installable utility")
+
+    def _confirm_removals(self, env: InstallerEnv, pending: List[ToolsetChange]) -> bool:
+        removals = ", ".join(change.name for change in pending if change.action == ToolsetAction.Remove)
+        if not removals or env.ctx.is_auto_prompt():
+            return True
+        return env.collaborators.prompter().prompt_yes_no_fn(
+            message=f"Are you sure you want to uninstall {removals}",
+            post_yes_message=f"Uninstalling {removals}",
+            post_no_message=f"Aborting toolset apply, {removals} were not removed",
+        )
+
+    def _apply_changes(
+        self, env: InstallerEnv, pending: List[ToolsetChange], max_workers: int
+    ) -> List[tuple[ToolsetChange, Exception]]:
+        failures: List[tuple[ToolsetChange, Exception]] = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            futures = [(change, executor.submit(self._apply_change, env, change)) for change in pending]
+            for change, future in futures:
+                try:
+                    future.result()
+                except Exception as ex:
+                    logger.error(f"Toolset change failed. action: {change.action}, name: {change.name}, error: {ex}")
+                    failures.append((change, ex))
+        return failures
+
+    def _apply_change(self, env: InstallerEnv, change: ToolsetChange) -> Installable.Utility:
+        # Evaluators carry the chain environment, every worker thread evaluates with its own
+        eval: PyFnEvaluator = PyFnEvaluator[ToolsetApplyRunner, Exception].new(ToolsetApplyRunner(ctx=env.ctx))
+        chain: ToolsetApplyRunner = eval << Environment[ToolsetApplyRunner]()
+        utility = chain._utility_for_change(env, change)
+        if change.action == ToolsetAction.Remove:
+            return eval << chain._remove_toolset_utility(env, utility)
+        return eval << chain._install_toolset_utility(env, utility)
+
+    def _utility_for_change(self, env: InstallerEnv, change: ToolsetChange) -> Installable.Utility:
+        utility = Installable.Utility(**env.supported_utilities[change.name].__dict__)
+        utility.version = change.target_version if change.target_version else change.installed_version
+        return utility
+
+    def _install_toolset_utility(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> PyFn["ToolsetApplyRunner", Exception, Installable.Utility]:
+        return self._install_by_source_type(env, utility).flat_map(
+            lambda installed: self._maybe_record_installed_utility(env, installed)
+        )
+
+    def _remove_toolset_utility(
+        self, env: InstallerEnv, utility: Installable.Utility
+    ) -> PyFn["ToolsetApplyRunner", Exception, Installable.Utility]:
+        return self._uninstall_by_source_type(env, utility).flat_map(
+            lambda removed: self._forget_installed_utility(env, removed)
+        )
+
+
+def generate_toolset_plan(changes: List[ToolsetChange]) -> str:
+    if not changes:
+        return "Toolset manifest is empty."
+    name_width = max(len(change.name) for change in changes)
+    lines = ["Toolset plan:", ""]
+    for change in changes:
+        versions = change.target_version or ""
+        if change.action == ToolsetAction.Upgrade:
+            versions = f"{change.installed_version} -> {change.target_version}"
+        elif change.action == ToolsetAction.Remove:
+            versions = change.installed_version or ""
+        elif change.action == ToolsetAction.NoOp and change.installed_version:
+            versions = change.installed_version
+        lines.append(f"  {change.name.ljust(name_width)}  {str(change.action).ljust(7)}  {versions}")
+    pending = sum(1 for change in changes if change.is_pending())
+    lines.append("")
+    lines.append(f"{pending} to change, {len(changes) - pending} up to date")
+    return "\n".join(lines)
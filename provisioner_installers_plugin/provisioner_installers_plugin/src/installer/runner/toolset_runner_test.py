@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from provisioner_installers_plugin.src.installer.domain.command import InstallerSubCommandName
+from provisioner_installers_plugin.src.installer.domain.installable import Installable
+from provisioner_installers_plugin.src.installer.domain.manifest import ToolsetManifest
+from provisioner_installers_plugin.src.installer.domain.source import ActiveInstallSource, InstallSource
+from provisioner_installers_plugin.src.installer.runner.installer_runner import (
+    InstallerEnv,
+    UtilityInstallerRunnerCmdArgs,
+)
+from provisioner_installers_plugin.src.installer.runner.toolset_runner import (
+    ToolsetAction,
+    ToolsetApplyRunner,
+    ToolsetApplyRunnerArgs,
+    ToolsetChange,
+    generate_toolset_plan,
+    plan_toolset_changes,
+)
+from provisioner_installers_plugin.src.installer.state.installed_state import (
+    InstalledStateRegistry,
+    InstalledUtility,
+)
+
+from provisioner_shared.components.runtime.errors.cli_errors import InstallerUtilityNotSupported
+from provisioner_shared.framework.functional.pyfn import PyFn
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/runner/toolset_runner_test.py
+#
+
+TOOLSET_APPLY_RUNNER_PATH = "provisioner_installers_plugin.src.installer.runner.toolset_runner.ToolsetApplyRunner"
+
+
+def create_script_utility(name: str) -> Installable.Utility:
+    return Installable.Utility(
+        display_name=name,
+        binary_name=name,
+        description="test description",
+        version_command="--version",
+        active_source=ActiveInstallSource.Script,
+        source=InstallSource(script=InstallSource.Script(install_script=f"install-{name}.sh")),
+    )
+
+
+TestSupportedToolings = {name: create_script_utility(name) for name in ["tool-a", "tool-b", "tool-c", "tool-d"]}
+
+
+class ToolsetApplyRunnerTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.state_dir = tempfile.mkdtemp(prefix="provisioner-toolset-runner-test")
+        self.installed_registry = InstalledStateRegistry(os.path.join(self.state_dir, "installed.json"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.state_dir)
+
+    def create_fake_installer_env(self, manifest: ToolsetManifest) -> InstallerEnv:
+        ctx = mock.MagicMock()
+        ctx.is_dry_run.return_value = False
+        ctx.is_auto_prompt.return_value = True
+        collaborators = mock.MagicMock()
+        collaborators.checks().is_tool_exist_fn.return_value = False
+        return InstallerEnv(
+            ctx=ctx,
+            collaborators=collaborators,
+            args=UtilityInstallerRunnerCmdArgs(
+                utilities=manifest.tools,
+                remote_opts=None,
+                sub_command_name=InstallerSubCommandName.CLI,
+                force=True,
+            ),
+            supported_utilities=TestSupportedToolings,
+            installed_registry=self.installed_registry,
+        )
+
+    def test_parse_toolset_manifest(self) -> None:
+        manifest = ToolsetManifest.from_dict({"tools": {"tool-a": "v1.0.0", "tool-b": None, "tool-c": 2}})
+        self.assertEqual(
+            [(tool.name, tool.version) for tool in manifest.tools],
+            [("tool-a", "v1.0.0"), ("tool-b", "latest"), ("tool-c", "2")],
+        )
+        with self.assertRaises(ValueError):
+            ToolsetManifest.from_dict({"tools": ["tool-a"]})
+        with self.assertRaises(ValueError):
+            ToolsetManifest.from_dict({"tools": {"tool-a": 1.30}})
+
+    def test_plan_only_the_diff(self) -> None:
+        manifest = ToolsetManifest.from_dict(
+            {"tools": {"tool-a": "v1.0.0", "tool-b": "v2.0.0", "tool-c": "latest", "tool-d": "latest"}}
+        )
+        installed = {
+            "tool-a": InstalledUtility(name="tool-a", version="1.0.0"),
+            "tool-b": InstalledUtility(name="tool-b", version="v1.9.0"),
+        }
+        changes = plan_toolset_changes(
+            manifest.tools, TestSupportedToolings, installed, is_tool_exist_fn=lambda name: name == "tool-d"
+        )
+        self.assertEqual(
+            changes,
+            [
+                ToolsetChange(ToolsetAction.NoOp, "tool-a", "1.0.0", "v1.0.0"),
+                ToolsetChange(ToolsetAction.Upgrade, "tool-b", "v1.9.0", "v2.0.0"),
+                ToolsetChange(ToolsetAction.Install, "tool-c", None, "latest"),
+                ToolsetChange(ToolsetAction.NoOp, "tool-d", None, "latest"),
+            ],
+        )
+        self.assertIn("1 to change", generate_toolset_plan(changes[:2]))
+
+    def test_plan_removals_only_when_pruning(self) -> None:
+        manifest = ToolsetManifest.from_dict({"tools": {"tool-a": "latest"}})
+        installed = {
+            "tool-a": InstalledUtility(name="tool-a", version="v1.0.0"),
+            "tool-b": InstalledUtility(name="tool-b", version="v2.0.0"),
+        }
+        self.assertEqual(
+            [change.action for change in plan_toolset_changes(manifest.tools, TestSupportedToolings, installed, bool)],
+            [ToolsetAction.NoOp],
+        )
+        self.assertEqual(
+            plan_toolset_changes(manifest.tools, TestSupportedToolings, installed, bool, prune=True)[1],
+            ToolsetChange(ToolsetAction.Remove, "tool-b", "v2.0.0", None),
+        )
+
+    @mock.patch(f"{TOOLSET_APPLY_RUNNER_PATH}._uninstall_by_source_type")
+    @mock.patch(f"{TOOLSET_APPLY_RUNNER_PATH}._install_by_source_type")
+    def test_apply_only_pending_changes(self, install_call: mock.MagicMock, uninstall_call: mock.MagicMock) -> None:
+        install_call.side_effect = lambda env, utility: PyFn.of(utility)
+        uninstall_call.side_effect = lambda env, utility: PyFn.of(utility)
+        self.installed_registry.record(InstalledUtility(name="tool-a", version="v1.0.0"))
+        self.installed_registry.record(InstalledUtility(name="tool-b", version="v1.0.0"))
+        self.installed_registry.record(InstalledUtility(name="tool-d", version="v1.0.0"))
+        manifest = ToolsetManifest.from_dict({"tools": {"tool-a": "v1.0.0", "tool-b": "v2.0.0", "tool-c": "v3.0.0"}})
+
+        ToolsetApplyRunner.run(self.create_fake_installer_env(manifest), ToolsetApplyRunnerArgs(prune=True))
+
+        self.assertEqual(sorted(call.args[1].binary_name for call in install_call.call_args_list), ["tool-b", "tool-c"])
+        self.assertEqual([call.args[1].binary_name for call in uninstall_call.call_args_list], ["tool-d"])
+        installed = InstalledStateRegistry(self.installed_registry.path).all()
+        self.assertEqual(
+            {name: installed_utility.version for name, installed_utility in installed.items()},
+            {"tool-a": "v1.0.0", "tool-b": "v2.0.0", "tool-c": "v3.0.0"},
+        )
+
+    @mock.patch(f"{TOOLSET_APPLY_RUNNER_PATH}._install_by_source_type")
+    def test_skip_converged_toolset(self, install_call: mock.MagicMock) -> None:
+        self.installed_registry.record(InstalledUtility(name="tool-a", version="v1.0.0"))
+        manifest = ToolsetManifest.from_dict({"tools": {"tool-a": "v1.0.0"}})
+        changes = ToolsetApplyRunner.run(self.create_fake_installer_env(manifest), ToolsetApplyRunnerArgs())
+        self.assertFalse(any(change.is_pending() for change in changes))
+        install_call.assert_not_called()
+
+    def test_fail_on_unsupported_utilities(self) -> None:
+        manifest = ToolsetManifest.from_dict({"tools": {"unknown": "latest"}})
+        with self.assertRaises(InstallerUtilityNotSupported):
+            ToolsetApplyRunner.run(self.create_fake_installer_env(manifest), ToolsetApplyRunnerArgs())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from loguru import logger
+
+ProvisionerInstalledStatePath = os.path.expanduser("~/.config/provisioner/installed.json")
+
+INSTALLED_STATE_FORMAT_VERSION = 1
+DIGEST_READ_CHUNK_SIZE = 1024 * 1024
+LATEST_VERSION = "latest"
+
+
+def normalize_version(version: Optional[str]) -> Optional[str]:
+    """GitHub release tags come with and without a 'v' prefix, v1.2.3 and 1.2.3 are the same version"""
+    if version is None:
+        return None
+    return version[1:] if version.startswith("v") and version[1:2].isdigit() else version
+
+
+def file_sha256(file_path: Optional[str]) -> Optional[str]:
+    if not file_path or not os.path.isfile(file_path):
+        return None
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(DIGEST_READ_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class InstalledUtility:
+
+    name: str
+    version: Optional[str]
+    source: Optional[str]
+    digest: Optional[str]
+    symlink_target: Optional[str]
+    installed_at: float
+
+    def __init__(
+        self,
+        name: str,
+        version: Optional[str] = None,
+        source: Optional[str] = None,
+        digest: Optional[str] = None,
+        symlink_target: Optional[str] = None,
+        installed_at: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.version = version
+        self.source = source
+        self.digest = digest
+        self.symlink_target = symlink_target
+        self.installed_at = installed_at if installed_at is not None else time.time()
+
+    def matches(self, version: Optional[str] = None) -> bool:
+        """Any installed version satisfies an unpinned request, a pinned one must match exactly"""
+        if version is None or version == LATEST_VERSION:
+            return True
+        return normalize_version(self.version) == normalize_version(version)
+
+    def is_present(self) -> bool:
+        """A binary removed behind provisioner's back leaves a stale record, a single stat tells"""
+        return self.symlink_target is None or os.path.exists(self.symlink_target)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "version": self.version,
+            "source": self.source,
+            "digest": self.digest,
+            "symlink_target": self.symlink_target,
+            "installed_at": self.installed_at,
+        }
+
+    @staticmethod
+    def from_dict(values: Dict[str, Any]) -> "InstalledUtility":
+        return InstalledUtility(
+            name=values["name"],
+            version=values.get("version"),
+            source=values.get("source"),
+            digest=values.get("digest"),
+            symlink_target=values.get("symlink_target"),
+            installed_at=values.get("installed_at"),
+        )
+
+
+class InstalledStateRegistry:
+    """
+    Index of the utilities installed by provisioner, keyed by binary name.
+    The file is read once per process and lookups are dictionary lookups, checking whether a utility is
+    installed neither scans PATH nor runs the utility. Every update re-reads the file and replaces it
+    atomically while holding an exclusive lock on a sidecar lock file, a crashed install never leaves a
+    truncated index behind and concurrent installs never drop each other's records.
+    """
+
+    path: str
+
+    def __init__(self, path: Optional[str] = ProvisionerInstalledStatePath) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, InstalledUtility]] = None
+
+    def _read(self) -> Dict[str, InstalledUtility]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as state_file:
+                content = json.load(state_file)
+            return {name: InstalledUtility.from_dict(values) for name, values in content.get("utilities", {}).items()}
+        except (OSError, ValueError, KeyError) as ex:
+            logger.warning(f"Ignoring unreadable installed state file. path: {self.path}, error: {ex}")
+            return {}
+
+    def _write(self, entries: Dict[str, InstalledUtility]) -> None:
+        state_dir = os.path.dirname(self.path)
+        os.makedirs(state_dir, exist_ok=True)
+        content = {
+            "version": INSTALLED_STATE_FORMAT_VERSION,
+            "utilities": {name: entries[name].to_dict() for name in sorted(entries)},
+        }
+        fd, temp_path = tempfile.mkstemp(prefix=".installed-", suffix=".json", dir=state_dir)
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump(content, temp_file, indent=2)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Serializes updates across threads and processes. The state file itself is replaced on every update,
+        the lock is taken on a sidecar file which stays in place.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            with open(f"{self.path}.lock", "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _loaded(self) -> Dict[str, InstalledUtility]:
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = self._read()
+        return self._entries
+
+    def get(self, name: str) -> Optional[InstalledUtility]:
+        return self._loaded().get(name)
+
+    def all(self) -> Dict[str, InstalledUtility]:
+        return dict(self._loaded())
+
+    def is_installed(self, name: str, version: Optional[str] = None) -> bool:
+        installed = self.get(name)
+        return installed is not None and installed.matches(version) and installed.is_present()
+
+    def record(self, installed: InstalledUtility) -> None:
+        with self._locked():
+            entries = self._read()
+            entries[installed.name] = installed
+            self._write(entries)
+            self._entries = entries
+
+    def remove(self, name: str) -> bool:
+        with self._locked():
+            entries = self._read()
+            removed = entries.pop(name, None)
+            if removed is not None:
+                self._write(entries)
+            self._entries = entries
+            return removed is not None
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+from provisioner_installers_plugin.src.installer.state.installed_state import (
+    InstalledStateRegistry,
+    InstalledUtility,
+    file_sha256,
+)
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/state/installed_state_test.py
+#
+
+
+def record_tools(state_path: str, prefix: str, count: int) -> None:
+    for i in range(count):
+        InstalledStateRegistry(state_path).record(InstalledUtility(name=f"{prefix}-{i}"))
+
+
+class InstalledStateRegistryTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-installed-state-test")
+        self.state_path = os.path.join(self.work_dir, "config", "installed.json")
+        self.binary_path = os.path.join(self.work_dir, "test-tool")
+        with open(self.binary_path, "wb") as f:
+            f.write(b"binary")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def test_report_nothing_installed_without_state_file(self) -> None:
+        registry = InstalledStateRegistry(self.state_path)
+        self.assertIsNone(registry.get("test-tool"))
+        self.assertFalse(registry.is_installed("test-tool"))
+
+    def test_record_and_reload_installed_utility(self) -> None:
+        InstalledStateRegistry(self.state_path).record(
+            InstalledUtility(name="test-tool", version="v1.2.3", source="GitHub", symlink_target=self.binary_path)
+        )
+        registry = InstalledStateRegistry(self.state_path)
+        self.assertEqual(registry.get("test-tool").version, "v1.2.3")
+        self.assertTrue(registry.is_installed("test-tool"))
+        self.assertTrue(registry.is_installed("test-tool", "latest"))
+        self.assertTrue(registry.is_installed("test-tool", "1.2.3"))
+        self.assertFalse(registry.is_installed("test-tool", "v1.2.4"))
+
+    def test_treat_removed_binaries_as_not_installed(self) -> None:
+        registry = InstalledStateRegistry(self.state_path)
+        registry.record(InstalledUtility(name="test-tool", version="v1.2.3", symlink_target=self.binary_path))
+        os.remove(self.binary_path)
+        self.assertFalse(registry.is_installed("test-tool"))
+
+    def test_remove_installed_utility(self) -> None:
+        registry = InstalledStateRegistry(self.state_path)
+        registry.record(InstalledUtility(name="test-tool", version="v1.2.3"))
+        self.assertTrue(registry.remove("test-tool"))
+        self.assertFalse(registry.remove("test-tool"))
+        self.assertEqual(InstalledStateRegistry(self.state_path).all(), {})
+
+    def test_keep_records_written_by_other_registries(self) -> None:
+        first = InstalledStateRegistry(self.state_path)
+        second = InstalledStateRegistry(self.state_path)
+        self.assertEqual(second.all(), {})
+        first.record(InstalledUtility(name="first-tool"))
+        second.record(InstalledUtility(name="second-tool"))
+        self.assertEqual(sorted(InstalledStateRegistry(self.state_path).all()), ["first-tool", "second-tool"])
+        self.assertEqual(
+            sorted(os.listdir(os.path.dirname(self.state_path))), ["installed.json", "installed.json.lock"]
+        )
+
+    def test_keep_records_written_by_concurrent_processes(self) -> None:
+        processes = [
+            multiprocessing.Process(target=record_tools, args=(self.state_path, f"tool-{index}", 10))
+            for index in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual([process.exitcode for process in processes], [0] * 4)
+        self.assertEqual(
+            sorted(InstalledStateRegistry(self.state_path).all()),
+            sorted(f"tool-{index}-{i}" for index in range(4) for i in range(10)),
+        )
+
+    def test_ignore_corrupted_state_file(self) -> None:
+        os.makedirs(os.path.dirname(self.state_path))
+        with open(self.state_path, "w") as f:
+            f.write("{not json")
+        registry = InstalledStateRegistry(self.state_path)
+        self.assertEqual(registry.all(), {})
+        registry.record(InstalledUtility(name="test-tool"))
+        with open(self.state_path, "r") as f:
+            self.assertIn("test-tool", json.load(f)["utilities"])
+
+    def test_digest_files(self) -> None:
+        self.assertEqual(
+            file_sha256(self.binary_path), "9a3a45d01531a20e89ac6ae10b0b0beb0492acd7216a368aa062d1a5fecaf9cd"
+        )
+        self.assertIsNone(file_sha256(os.path.join(self.work_dir, "missing")))
+        self.assertIsNone(file_sha256(None))
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+
+import base64
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from loguru import logger
+
+from provisioner_shared.framework.functional.pyfn import PyFn
+
+# Trace path that prints the trace to stdout for the provisioner which started this one remotely
+TRACE_TO_STDOUT = "-"
+# Remote traces travel inside Ansible output, base64 survives the JSON escaping of captured stdout
+REMOTE_TRACE_MARKER = "PROVISIONER_TRACE_EVENTS:"
+REMOTE_TRACE_PATTERN = re.compile(re.escape(REMOTE_TRACE_MARKER) + r"([A-Za-z0-9+/=]+)")
+# Spans which ran on several hosts at once list them in their hosts arg, e.g. "rpi-01, rpi-02"
+HOSTS_ARG_SEPARATOR = ", "
+# Ansible prints the result of every task once per host, e.g. 'ok: [rpi-01] => {'
+ANSIBLE_HOST_RESULT_PATTERN = re.compile(r"^(?:ok|changed|failed|fatal|skipping): \[([^\]]+)\]", re.MULTILINE)
+
+
+def _now_us() -> int:
+    return time.perf_counter_ns() // 1000
+
+
+class SpanTracer:
+    """
+    Records timed spans as Chrome trace events, the exported file opens in chrome://tracing or Perfetto.
+    Spans nest by time on the thread they ran on. A disabled tracer records nothing and spans cost
+    a single attribute check, instrumented steps are always wrapped.
+    """
+
+    enabled: bool
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._pid = os.getpid()
+        self._remote_pids: Dict[str, int] = {}
+        self._open_spans = threading.local()
+        self._concurrent_tracks = 0
+
+    def enable(self) -> "SpanTracer":
+        self.enabled = True
+        return self
+
+    def epoch_seconds(self, ts: int) -> float:
+        """Wall clock time of an event timestamp, timestamps come from a monotonic clock"""
+        return time.time() - (_now_us() - ts) / 1_000_000
+
+    def events(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._events)
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Dict[str, Any]]:
+        """Time the enclosed block, the yielded event args may be extended while it runs"""
+        if not self.enabled:
+            yield {}
+            return
+        event = {
+            "name": name,
+            "ph": "X",
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+            "ts": _now_us(),
+            "args": {key: str(value) for key, value in args.items()},
+        }
+        open_spans = self._get_open_spans()
+        open_spans.append(event)
+        try:
+            yield event
+        except BaseException as ex:
+            event["args"]["error"] = str(ex)
+            raise
+        finally:
+            open_spans.pop()
+            event["dur"] = _now_us() - event["ts"]
+            self._append([event])
+
+    @contextmanager
+    def concurrent_span(self, name: str, **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block which overlaps other blocks on the same thread, e.g. coroutines sharing an event loop.
+        The span is shown on a track of its own and spans opened on the thread never nest under it.
+        """
+        if not self.enabled:
+            yield {}
+            return
+        with self._lock:
+            self._concurrent_tracks += 1
+            track = self._concurrent_tracks
+        event = {
+            "name": name,
+            "ph": "X",
+            "pid": self._pid,
+            "tid": f"concurrent-{track}",
+            "ts": _now_us(),
+            "args": {key: str(value) for key, value in args.items()},
+        }
+        try:
+            yield event
+        except BaseException as ex:
+            event["args"]["error"] = str(ex)
+            raise
+        finally:
+            event["dur"] = _now_us() - event["ts"]
+            self._append([event])
+
+    def annotate(self, **args: Any) -> None:
+        """Add args to the innermost span open on this thread, e.g. the bytes a download transferred"""
+        open_spans = self._get_open_spans()
+        if self.enabled and open_spans:
+            open_spans[-1]["args"].update({key: str(value) for key, value in args.items()})
+
+    def span_pyfn(self, name: str, pyfn: PyFn, **args: Any) -> PyFn:
+        """Time the evaluation of a PyFn chain, a failed chain marks its span with the error"""
+        if not self.enabled:
+            return pyfn
+
+        def _run(environment):
+            with self.span(name, **args) as event:
+                result = pyfn._run(environment)
+                result.fold(lambda error: event["args"].update(error=str(error)), lambda _: None)
+                return result
+
+        return PyFn(_run)
+
+    def merge_remote_trace(self, output: str, hosts: List[str]) -> str:
+        """
+        Collect the traces remote provisioners printed to their output into this one and return the output
+        without them. A single Ansible run covers every selected host, each trace is attributed to the host
+        of the result block it was printed in (`ok: [host] => ...`) and shows under a process named after it.
+        Remote clocks are unrelated to the local one and to each other, the spans of every host are shifted
+        to end when the remote command returned, the gap before them is the connection and Ansible startup time.
+        Called from within the local span that ran the remote command.
+        """
+        if not output:
+            return output
+        events_by_host: Dict[str, List[Dict[str, Any]]] = {}
+        host_results = [(match.start(), match.group(1)) for match in ANSIBLE_HOST_RESULT_PATTERN.finditer(output)]
+        for match in REMOTE_TRACE_PATTERN.finditer(output):
+            preceding = [host for start, host in host_results if start < match.start()]
+            # Output which does not come from Ansible carries no result blocks, a single host printed it
+            host = preceding[-1] if preceding else (hosts[0] if len(hosts) == 1 else None)
+            if host is None:
+                logger.debug("Ignoring a remote trace printed outside of a host result")
+                continue
+            try:
+                events_by_host.setdefault(host, []).extend(json.loads(base64.b64decode(match.group(1)))["traceEvents"])
+            except (ValueError, KeyError) as ex:
+                logger.debug(f"Ignoring unreadable remote trace. host: {host}, error: {ex}")
+        stripped_output = REMOTE_TRACE_PATTERN.sub("", output)
+        if self.enabled:
+            for host, remote_events in events_by_host.items():
+                self._merge_host_events(host, remote_events)
+        return stripped_output
+
+    def _merge_host_events(self, host: str, remote_events: List[Dict[str, Any]]) -> None:
+        timed_events = [event for event in remote_events if "ts" in event]
+        if not timed_events:
+            return
+        offset = _now_us() - max(event["ts"] + event.get("dur", 0) for event in timed_events)
+        pid = self._get_remote_pid(host)
+        merged = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": host}}]
+        for event in timed_events:
+            merged.append({**event, "pid": pid, "ts": event["ts"] + offset})
+        self._append(merged)
+
+    def export(self, path: str) -> None:
+        content = json.dumps({"traceEvents": self.events(), "displayTimeUnit": "ms"})
+        if path == TRACE_TO_STDOUT:
+            print(REMOTE_TRACE_MARKER + base64.b64encode(content.encode("utf-8")).decode("ascii"), flush=True)
+            return
+        trace_dir = os.path.dirname(os.path.abspath(path))
+        os.makedirs(trace_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".trace-", dir=trace_dir)
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                temp_file.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        logger.debug(f"Exported trace. path: {path}, events: {len(self._events)}")
+
+    def _get_open_spans(self) -> List[Dict[str, Any]]:
+        if not hasattr(self._open_spans, "stack"):
+            self._open_spans.stack = []
+        return self._open_spans.stack
+
+    def _get_remote_pid(self, host: str) -> int:
+        with self._lock:
+            if host not in self._remote_pids:
+                self._remote_pids[host] = self._pid + len(self._remote_pids) + 1
+            return self._remote_pids[host]
+
+    def _append(self, events: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._events.extend(events)
+
+
+_tracer = SpanTracer()
+
+
+def get_tracer() -> SpanTracer:
+    return _tracer
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+import base64
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import (
+    REMOTE_TRACE_MARKER,
+    TRACE_TO_STDOUT,
+    SpanTracer,
+)
+
+from provisioner_shared.framework.functional.pyfn import PyFn, PyFnEvaluator
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/tracing/span_tracer_test.py
+#
+
+
+def encode_remote_trace(events) -> str:
+    return REMOTE_TRACE_MARKER + base64.b64encode(json.dumps({"traceEvents": events}).encode("utf-8")).decode("ascii")
+
+
+class SpanTracerTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-span-tracer-test")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def test_record_nothing_when_disabled(self) -> None:
+        tracer = SpanTracer()
+        pyfn = PyFn.of(1)
+        with tracer.span("step"):
+            pass
+        self.assertIs(tracer.span_pyfn("step", pyfn), pyfn)
+        self.assertEqual(tracer.events(), [])
+
+    def test_record_nested_spans(self) -> None:
+        tracer = SpanTracer(enabled=True)
+        with tracer.span("install helm", version="v3.17.3"):
+            with tracer.span("download"):
+                pass
+        inner, outer = tracer.events()
+        self.assertEqual(outer["name"], "install helm")
+        self.assertEqual(outer["args"], {"version": "v3.17.3"})
+        self.assertLessEqual(outer["ts"], inner["ts"])
+        self.assertGreaterEqual(outer["ts"] + outer["dur"], inner["ts"] + inner["dur"])
+
+    def test_record_overlapping_spans_on_tracks_of_their_own(self) -> None:
+        tracer = SpanTracer(enabled=True)
+        first = tracer.concurrent_span("install helm")
+        second = tracer.concurrent_span("install anchor")
+        first.__enter__()
+        second.__enter__()
+        with tracer.span("download"):
+            pass
+        first.__exit__(None, None, None)
+        second.__exit__(None, None, None)
+
+        download, helm, anchor = tracer.events()
+        self.assertEqual([helm["name"], anchor["name"]], ["install helm", "install anchor"])
+        self.assertNotEqual(helm["tid"], anchor["tid"])
+        self.assertNotIn(download["tid"], [helm["tid"], anchor["tid"]])
+        self.assertLessEqual(anchor["ts"], helm["ts"] + helm["dur"])
+
+    def test_mark_failed_pyfn_spans(self) -> None:
+        tracer = SpanTracer(enabled=True)
+        eval = PyFnEvaluator.new(mock.MagicMock())
+        self.assertEqual(eval << tracer.span_pyfn("resolve release", PyFn.of("v1.0.0")), "v1.0.0")
+        with self.assertRaises(ValueError):
+            eval << tracer.span_pyfn("download", PyFn.fail(ValueError("not found")))
+        resolve_event, download_event = tracer.events()
+        self.assertNotIn("error", resolve_event["args"])
+        self.assertEqual(download_event["args"]["error"], "not found")
+
+    def test_export_chrome_trace_file(self) -> None:
+        tracer = SpanTracer(enabled=True)
+        with tracer.span("unpack"):
+            pass
+        trace_path = os.path.join(self.work_dir, "out", "trace.json")
+        tracer.export(trace_path)
+        with open(trace_path) as f:
+            content = json.load(f)
+        self.assertEqual([event["name"] for event in content["traceEvents"]], ["unpack"])
+        self.assertEqual(content["traceEvents"][0]["ph"], "X")
+
+    def test_merge_remote_traces_of_every_host_on_their_own_clock(self) -> None:
+        # Every host runs on an unrelated clock, rpi-02 booted long before rpi-01
+        output = "\n".join(
+            [
+                "TASK [debug] ***",
+                'ok: [rpi-01] => {"msg": "Installed helm\\n'
+                + encode_remote_trace([{"name": "download", "ph": "X", "pid": 1, "tid": 1, "ts": 1_000, "dur": 500}])
+                + '"}',
+                'ok: [rpi-02] => {"msg": "Installed helm\\n'
+                + encode_remote_trace(
+                    [{"name": "download", "ph": "X", "pid": 1, "tid": 1, "ts": 900_000_000_000, "dur": 2_000}]
+                )
+                + '"}',
+            ]
+        )
+
+        tracer = SpanTracer(enabled=True)
+        with tracer.span("remote install"):
+            stripped_output = tracer.merge_remote_trace(output, hosts=["rpi-01", "rpi-02"])
+        self.assertNotIn(REMOTE_TRACE_MARKER, stripped_output)
+
+        events = tracer.events()
+        remote_install = events[-1]
+        pids = {event["args"]["name"]: event["pid"] for event in events if event["ph"] == "M"}
+        self.assertEqual(sorted(pids), ["rpi-01", "rpi-02"])
+        self.assertNotEqual(pids["rpi-01"], pids["rpi-02"])
+        for host, duration in [("rpi-01", 500), ("rpi-02", 2_000)]:
+            (download,) = [event for event in events if event["ph"] == "X" and event["pid"] == pids[host]]
+            self.assertEqual(download["dur"], duration)
+            # Shifted by an offset of its own to end when the remote command returned
+            self.assertGreaterEqual(download["ts"] + download["dur"], remote_install["ts"])
+            self.assertLessEqual(download["ts"] + download["dur"], remote_install["ts"] + remote_install["dur"])
+
+    def test_merge_remote_trace_from_output(self) -> None:
+        remote_tracer = SpanTracer(enabled=True)
+        with remote_tracer.span("download"):
+            pass
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            remote_tracer.export(TRACE_TO_STDOUT)
+        # Captured stdout reaches the local side escaped inside Ansible's JSON output
+        output = json.dumps({"stdout": "Installed helm\n" + stdout.getvalue()})
+
+        tracer = SpanTracer(enabled=True)
+        with tracer.span("remote install"):
+            stripped_output = tracer.merge_remote_trace(output, hosts=["rpi-01"])
+        self.assertEqual(json.loads(stripped_output)["stdout"], "Installed helm\n\n")
+
+        metadata, remote_download, remote_install = tracer.events()
+        self.assertEqual(metadata["args"], {"name": "rpi-01"})
+        self.assertEqual(remote_download["name"], "download")
+        self.assertEqual(remote_download["pid"], metadata["pid"])
+        self.assertNotEqual(remote_download["pid"], remote_install["pid"])
+        self.assertGreaterEqual(remote_download["ts"], remote_install["ts"])
+        self.assertLessEqual(
+            remote_download["ts"] + remote_download["dur"], remote_install["ts"] + remote_install["dur"]
+        )
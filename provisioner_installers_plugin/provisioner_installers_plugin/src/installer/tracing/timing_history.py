@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+
+import heapq
+import math
+import os
+import sqlite3
+import time
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import HOSTS_ARG_SEPARATOR, SpanTracer
+
+ProvisionerTimingHistoryPath = os.path.expanduser("~/.config/provisioner/history.db")
+
+# Oldest timings are dropped past this many rows, trends only need the recent history
+MAX_HISTORY_ROWS = 100_000
+# Ansible's default number of hosts configured at once
+DEFAULT_ETA_FORKS = 5
+LOCAL_HOST = "local"
+OUTCOME_OK = "ok"
+OUTCOME_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS timings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    command TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    host TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    duration_ms REAL NOT NULL,
+    bytes INTEGER,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS timings_operation_host ON timings (operation, host, started_at);
+"""
+
+_COLUMNS = "run_id, command, operation, host, started_at, duration_ms, bytes, outcome"
+
+
+class StepTiming(NamedTuple):
+    run_id: str
+    command: str
+    operation: str
+    host: str
+    started_at: float
+    duration_ms: float
+    bytes: Optional[int]
+    outcome: str
+
+
+class OperationStats(NamedTuple):
+    operation: str
+    # None when aggregated over all hosts
+    host: Optional[str]
+    runs: int
+    failures: int
+    p50_ms: Optional[float]
+    p90_ms: Optional[float]
+    p99_ms: Optional[float]
+    avg_bytes: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+class HostEta(NamedTuple):
+    host: str
+    estimate_ms: float
+    # False when the host has no history and the operation median over all hosts is used
+    from_history: bool
+
+
+class FleetEta(NamedTuple):
+    operation: str
+    forks: int
+    hosts: List[HostEta]
+    total_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "forks": self.forks,
+            "total_ms": self.total_ms,
+            "hosts": [host._asdict() for host in self.hosts],
+        }
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest rank percentile of values sorted in ascending order"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class TimingHistory:
+    """
+    Local SQLite history of command and step durations, one row per recorded span.
+    Every command appends to it once it completes, percentiles and fleet ETAs are computed from it.
+    """
+
+    _path: str
+    _max_rows: int
+
+    def __init__(self, path: str = ProvisionerTimingHistoryPath, max_rows: int = MAX_HISTORY_ROWS) -> None:
+        self._path = path
+        self._max_rows = max_rows
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+        # Concurrent commands append to the same history, writers wait for each other
+        conn = sqlite3.connect(self._path, timeout=5)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def record(self, timings: List[StepTiming]) -> None:
+        if not timings:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(f"INSERT INTO timings ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", timings)
+                conn.execute("DELETE FROM timings WHERE id <= (SELECT MAX(id) FROM timings) - ?", (self._max_rows,))
+        finally:
+            conn.close()
+        logger.debug(f"Recorded timing history. path: {self._path}, timings: {len(timings)}")
+
+    def timings(
+        self,
+        operation: Optional[str] = None,
+        host: Optional[str] = None,
+        since: Optional[float] = None,
+        match: Optional[str] = None,
+    ) -> List[StepTiming]:
+        """Recorded timings oldest first, operation and host match exactly, match is a case-insensitive substring"""
+        clauses: List[str] = []
+        params: List[Any] = []
+        for clause, value in [
+            ("operation = ?", operation),
+            ("host = ?", host),
+            ("started_at >= ?", since),
+            ("operation LIKE ?", f"%{match}%" if match else None),
+        ]:
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        if not os.path.exists(self._path):
+            return []
+        conn = self._connect()
+        try:
+            rows = conn.execute(f"SELECT {_COLUMNS} FROM timings {where} ORDER BY id", params).fetchall()
+        finally:
+            conn.close()
+        return [StepTiming(*row) for row in rows]
+
+    def stats(
+        self, match: Optional[str] = None, since: Optional[float] = None, by_host: bool = False
+    ) -> List[OperationStats]:
+        """Duration percentiles of successful runs per operation, or per operation and host, sorted by name"""
+        grouped: Dict[Tuple[str, Optional[str]], List[StepTiming]] = {}
+        for timing in self.timings(since=since, match=match):
+            grouped.setdefault((timing.operation, timing.host if by_host else None), []).append(timing)
+
+        result = []
+        for (operation, host), timings in sorted(grouped.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+            durations = sorted(timing.duration_ms for timing in timings if timing.outcome == OUTCOME_OK)
+            transferred = [timing.bytes for timing in timings if timing.bytes is not None]
+            result.append(
+                OperationStats(
+                    operation=operation,
+                    host=host,
+                    runs=len(timings),
+                    failures=len(timings) - len(durations),
+                    p50_ms=percentile(durations, 50),
+                    p90_ms=percentile(durations, 90),
+                    p99_ms=percentile(durations, 99),
+                    avg_bytes=sum(transferred) // len(transferred) if transferred else None,
+                )
+            )
+        return result
+
+    def estimate_fleet_eta(
+        self, operation: str, hosts: List[str], forks: int = DEFAULT_ETA_FORKS, since: Optional[float] = None
+    ) -> Optional[FleetEta]:
+        """
+        Estimate how long running an operation on the hosts takes, forks hosts at a time.
+        Each host is expected to take its own median, hosts without history the median over all hosts.
+        Returns None when the operation never succeeded before.
+        """
+        durations_by_host: Dict[str, List[float]] = {}
+        for timing in self.timings(operation=operation, since=since):
+            if timing.outcome == OUTCOME_OK:
+                durations_by_host.setdefault(timing.host, []).append(timing.duration_ms)
+        if not durations_by_host:
+            return None
+
+        fallback_ms = percentile(sorted(sum(durations_by_host.values(), [])), 50)
+        host_etas = []
+        for host in hosts:
+            durations = sorted(durations_by_host.get(host, []))
+            if durations:
+                host_etas.append(HostEta(host=host, estimate_ms=percentile(durations, 50), from_history=True))
+            else:
+                host_etas.append(HostEta(host=host, estimate_ms=fallback_ms, from_history=False))
+
+        # Longest hosts first, each one goes to the fork that frees up first
+        forks = max(1, forks)
+        fork_loads = [0.0] * min(forks, len(host_etas))
+        for host_eta in sorted(host_etas, key=lambda host_eta: host_eta.estimate_ms, reverse=True):
+            heapq.heapreplace(fork_loads, fork_loads[0] + host_eta.estimate_ms)
+        return FleetEta(operation=operation, forks=forks, hosts=host_etas, total_ms=max(fork_loads, default=0.0))
+
+
+def _remote_extent_us(events: List[Dict[str, Any]], pid: int, start_ts: int, end_ts: int) -> Optional[int]:
+    """Time the spans a remote host reported within a local span took, None when it reported none"""
+    remote = [
+        event
+        for event in events
+        if event.get("ph") == "X" and event["pid"] == pid and start_ts <= event["ts"] + event.get("dur", 0) <= end_ts
+    ]
+    if not remote:
+        return None
+    return max(event["ts"] + event.get("dur", 0) for event in remote) - min(event["ts"] for event in remote)
+
+
+def timings_from_trace(tracer: SpanTracer, run_id: str, command: str) -> List[StepTiming]:
+    """
+    Step timings of the spans a tracer recorded. A span is attributed to its host arg, merged remote spans
+    to the host they ran on and any other span to the local machine. A span which ran on several hosts at once
+    is recorded once per host, taking the time the spans of that host took when it reported any.
+    """
+    events = tracer.events()
+    hosts_by_pid = {
+        event["pid"]: event["args"]["name"]
+        for event in events
+        if event.get("ph") == "M" and event.get("name") == "process_name"
+    }
+    pids_by_host = {host: pid for pid, host in hosts_by_pid.items()}
+    timings = []
+    for event in events:
+        if event.get("ph") != "X":
+            continue
+        args = event.get("args", {})
+        duration_us = event.get("dur", 0)
+        if args.get("hosts"):
+            host_durations_us = []
+            for host in args["hosts"].split(HOSTS_ARG_SEPARATOR):
+                remote_us = None
+                if host in pids_by_host:
+                    remote_us = _remote_extent_us(events, pids_by_host[host], event["ts"], event["ts"] + duration_us)
+                host_durations_us.append((host, duration_us if remote_us is None else remote_us))
+        else:
+            host = args.get("host") or hosts_by_pid.get(event["pid"], LOCAL_HOST)
+            host_durations_us = [(host, duration_us)]
+        for host, host_duration_us in host_durations_us:
+            timings.append(
+                StepTiming(
+                    run_id=run_id,
+                    command=command,
+                    operation=event["name"],
+                    host=host,
+                    started_at=tracer.epoch_seconds(event["ts"]),
+                    duration_ms=host_duration_us / 1000,
+                    bytes=int(args["bytes"]) if "bytes" in args else None,
+                    outcome=OUTCOME_FAILED if "error" in args else OUTCOME_OK,
+                )
+            )
+    return timings
+
+
+def record_command_history(
+    tracer: SpanTracer, command: str, started_at: float, failed: bool, history: Optional[TimingHistory] = None
+) -> None:
+    """Append a completed command and its steps to the history, a history failure never fails the command"""
+    run_id = uuid.uuid4().hex
+    command_timing = StepTiming(
+        run_id=run_id,
+        command=command,
+        operation=command,
+        host=LOCAL_HOST,
+        started_at=started_at,
+        duration_ms=(time.time() - started_at) * 1000,
+        bytes=None,
+        outcome=OUTCOME_FAILED if failed else OUTCOME_OK,
+    )
+    try:
+        (history or TimingHistory()).record([command_timing] + timings_from_trace(tracer, run_id, command))
+    except (sqlite3.Error, OSError) as ex:
+        logger.debug(f"Failed to record timing history. command: {command}, error: {ex}")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+import base64
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import REMOTE_TRACE_MARKER, SpanTracer
+from provisioner_installers_plugin.src.installer.tracing.timing_history import (
+    LOCAL_HOST,
+    OUTCOME_FAILED,
+    OUTCOME_OK,
+    StepTiming,
+    TimingHistory,
+    percentile,
+    record_command_history,
+)
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/installer/tracing/timing_history_test.py
+#
+
+
+def create_timing(
+    operation: str, host: str, duration_ms: float, outcome: str = OUTCOME_OK, started_at: float = None
+) -> StepTiming:
+    return StepTiming(
+        run_id="run",
+        command="single-board raspberry-pi",
+        operation=operation,
+        host=host,
+        started_at=started_at if started_at is not None else time.time(),
+        duration_ms=duration_ms,
+        bytes=None,
+        outcome=outcome,
+    )
+
+
+class TimingHistoryTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-timing-history-test")
+        self.history = TimingHistory(os.path.join(self.work_dir, "config", "history.db"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def test_compute_percentiles_of_successful_runs(self) -> None:
+        self.assertIsNone(percentile([], 50))
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2)
+        self.assertEqual(percentile([1, 2, 3, 4], 99), 4)
+
+        self.history.record(
+            [create_timing("download", LOCAL_HOST, duration_ms) for duration_ms in [300, 100, 200]]
+            + [create_timing("download", LOCAL_HOST, 5000, outcome=OUTCOME_FAILED)]
+        )
+        (stats,) = self.history.stats(match="DOWN")
+        self.assertEqual((stats.runs, stats.failures), (4, 1))
+        self.assertEqual((stats.p50_ms, stats.p90_ms, stats.p99_ms), (200, 300, 300))
+        self.assertIsNone(stats.host)
+
+    def test_break_stats_down_per_host_and_time_window(self) -> None:
+        self.history.record(
+            [
+                create_timing("ansible configure os", "rpi-01", 60_000, started_at=time.time() - 3600),
+                create_timing("ansible configure os", "rpi-01", 40_000),
+                create_timing("ansible configure os", "rpi-02", 90_000),
+            ]
+        )
+        stats = self.history.stats(by_host=True)
+        self.assertEqual([(item.host, item.runs) for item in stats], [("rpi-01", 2), ("rpi-02", 1)])
+        recent = self.history.stats(by_host=True, since=time.time() - 60)
+        self.assertEqual([(item.host, item.p50_ms) for item in recent], [("rpi-01", 40_000), ("rpi-02", 90_000)])
+
+    def test_estimate_fleet_eta_from_host_history(self) -> None:
+        self.assertIsNone(self.history.estimate_fleet_eta("ansible configure os", ["rpi-01"]))
+        self.history.record(
+            [
+                create_timing("ansible configure os", "rpi-01", 60_000),
+                create_timing("ansible configure os", "rpi-02", 30_000),
+                create_timing("ansible configure os", "rpi-03", 20_000),
+            ]
+        )
+        eta = self.history.estimate_fleet_eta("ansible configure os", ["rpi-01", "rpi-02", "rpi-09"], forks=2)
+        self.assertEqual([(host.host, host.from_history) for host in eta.hosts][-1], ("rpi-09", False))
+        # The unknown host takes the fleet median and shares a fork with rpi-02 while rpi-01 runs alone
+        self.assertEqual(eta.hosts[-1].estimate_ms, 30_000)
+        self.assertEqual(eta.total_ms, 60_000)
+        self.assertEqual(
+            self.history.estimate_fleet_eta("ansible configure os", ["rpi-01", "rpi-02", "rpi-09"], forks=1).total_ms,
+            120_000,
+        )
+
+    def test_record_command_and_traced_steps(self) -> None:
+        tracer = SpanTracer(enabled=True)
+        with tracer.span("download"):
+            tracer.annotate(bytes=2048)
+        with self.assertRaises(ValueError):
+            with tracer.span("wait for reboot", host="rpi-01"):
+                raise ValueError("timed out")
+
+        record_command_history(tracer, "install cli", time.time(), failed=True, history=self.history)
+        timings = {timing.operation: timing for timing in self.history.timings()}
+        self.assertEqual(sorted(timings), ["download", "install cli", "wait for reboot"])
+        self.assertEqual(timings["install cli"].outcome, OUTCOME_FAILED)
+        self.assertEqual((timings["download"].host, timings["download"].bytes), (LOCAL_HOST, 2048))
+        self.assertEqual((timings["wait for reboot"].host, timings["wait for reboot"].outcome), ("rpi-01", "failed"))
+        self.assertEqual(len({timing.run_id for timing in timings.values()}), 1)
+
+    def test_record_multi_host_steps_once_per_host(self) -> None:
+        remote_trace = json.dumps({"traceEvents": [{"name": "download", "ph": "X", "pid": 1, "ts": 0, "dur": 500}]})
+        output = f"ok: [rpi-01] => {REMOTE_TRACE_MARKER}{base64.b64encode(remote_trace.encode()).decode()}"
+        tracer = SpanTracer(enabled=True)
+        with tracer.span("remote install", hosts="rpi-01, rpi-02"):
+            tracer.merge_remote_trace(output, hosts=["rpi-01", "rpi-02"])
+            time.sleep(0.01)
+
+        record_command_history(tracer, "install cli", time.time(), failed=False, history=self.history)
+        timings = {(timing.operation, timing.host): timing for timing in self.history.timings()}
+        self.assertEqual(
+            sorted(timings),
+            [
+                ("download", "rpi-01"),
+                ("install cli", LOCAL_HOST),
+                ("remote install", "rpi-01"),
+                ("remote install", "rpi-02"),
+            ],
+        )
+        # A host which reported its spans took their time, the others the time of the whole run
+        self.assertEqual(timings[("remote install", "rpi-01")].duration_ms, 0.5)
+        self.assertGreaterEqual(timings[("remote install", "rpi-02")].duration_ms, 10)
+        eta = self.history.estimate_fleet_eta("remote install", ["rpi-01", "rpi-02"], forks=2)
+        self.assertEqual([host.from_history for host in eta.hosts], [True, True])
+
+    def test_drop_oldest_timings_past_max_rows(self) -> None:
+        history = TimingHistory(os.path.join(self.work_dir, "history.db"), max_rows=2)
+        history.record([create_timing(f"step {index}", LOCAL_HOST, 1) for index in range(3)])
+        self.assertEqual([timing.operation for timing in history.timings()], ["step 1", "step 2"])
+
+    def test_never_fail_the_command_on_history_errors(self) -> None:
+        blocked_dir = os.path.join(self.work_dir, "blocked")
+        with open(blocked_dir, "w") as f:
+            f.write("not a directory")
+        history = TimingHistory(os.path.join(blocked_dir, "history.db"))
+        record_command_history(SpanTracer(enabled=True), "install cli", time.time(), failed=False, history=history)
+        self.assertEqual(self.history.timings(), [])
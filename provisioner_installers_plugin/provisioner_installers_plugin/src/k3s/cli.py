@@ -11,7 +11,7 @@ from provisioner_installers_plugin.src.k3s.cmd.k3s_download_kubeconfig import (
     K3sKubeConfigDownloadCmdArgs,
 )
 from provisioner_installers_plugin.src.k3s.cmd.k3s_gather_info_cmd import K3sGatherInfoCmd, K3sGatherInfoCmdArgs
-from provisioner_installers_plugin.src.utilities.utilities_versions import ToolingVersions
+from provisioner_installers_plugin.src.utilities.utilities_k8s import SupportedToolingsK8s
 
 from provisioner_shared.components.remote.remote_opts import RemoteOpts
 from provisioner_shared.components.runtime.cli.cli_modifiers import cli_modifiers
@@ -82,7 +82,7 @@ def register_k3s_commands(cli_group: click.Group):
         "--version",
         show_default=True,
         required=False,
-        default=ToolingVersions.k3s_server_ver,
+        default=lambda: SupportedToolingsK8s.describe("k3s-server").version,
         help="K3s version",
         envvar="PROV_K3S_SERVER_VERSION",
     )
@@ -157,7 +157,7 @@ def register_k3s_commands(cli_group: click.Group):
         "--version",
         show_default=True,
         required=False,
-        default=ToolingVersions.k3s_agent_ver,
+        default=lambda: SupportedToolingsK8s.describe("k3s-agent").version,
         help="K3s version",
         envvar="PROV_K3S_AGENT_VERSION",
     )
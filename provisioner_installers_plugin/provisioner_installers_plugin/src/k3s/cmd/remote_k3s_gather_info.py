@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
+import os
 from typing import Optional
 
 from loguru import logger
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import RemoteCommandResult, exec_ssh_command
 
 from provisioner_shared.components.remote.remote_connector import (
     RemoteMachineConnector,
@@ -13,6 +15,7 @@ from provisioner_shared.components.runtime.infra.context import Context
 from provisioner_shared.components.runtime.infra.evaluator import Evaluator
 from provisioner_shared.components.runtime.infra.remote_context import RemoteContext
 from provisioner_shared.components.runtime.runner.ansible.ansible_runner import (
+    ANSIBLE_PLAYBOOKS_DIR_NAME,
     AnsibleHost,
     AnsiblePlaybook,
     AnsibleRunnerLocal,
@@ -32,6 +35,16 @@ ANSIBLE_PLAYBOOK_K3S_GATHER_INFO = """
       tags: ['k3s_gather_info_on_node']
 """
 
+ANSIBLE_PLAYBOOKS_PACKAGE = "provisioner_shared.components.external.ansible_playbooks"
+# The gather info role is a single read only script, running it over SSH skips the Ansible startup
+# and module shipping, the role stays as the fallback
+K3S_GATHER_INFO_FILES_PATH = "roles/k3s_gather_info_on_node/files"
+K3S_GATHER_INFO_SCRIPT_NAME = "k3s_gather_info.sh"
+SHELL_LIB_SCRIPT_NAME = "shell_lib.sh"
+# The gather info script sources the shell library from this path
+REMOTE_SHELL_LIB_PATH = "/tmp/shell_lib.sh"
+K3S_GATHER_INFO_SSH_TIMEOUT_SECONDS = 30
+
 
 class RemoteK3sGatherInfoArgs:
 
@@ -67,13 +80,31 @@ class RemoteK3sGatherInfoRunner:
 
         collaborators.summary().show_summary_and_prompt_for_enter("Collecting K3s Info")
 
+        remote_ctx = args.remote_opts.get_remote_context()
+        if not remote_ctx.is_dry_run():
+            result = (
+                collaborators.progress_indicator()
+                .get_status()
+                .long_running_process_fn(
+                    call=lambda: self._run_direct_ssh(collaborators, remote_ctx, ansible_host),
+                    desc_run="Collecting K3s info over SSH",
+                    desc_end="K3s info collected.",
+                )
+            )
+            if result.error is None:
+                if result.exit_code != 0:
+                    raise Exception(result.stderr or f"K3s gather info failed. host: {ansible_host.host}")
+                collaborators.printer().new_line_fn().print_fn(result.stdout)
+                return ansible_host
+            logger.debug(f"Direct SSH gather info failed, falling back to Ansible. error: {result.error}")
+
         output = (
             collaborators.progress_indicator()
             .get_status()
             .long_running_process_fn(
                 call=lambda: self._run_ansible(
                     collaborators.ansible_runner(),
-                    args.remote_opts.get_remote_context(),
+                    remote_ctx,
                     ansible_host.host,
                     ssh_conn_info,
                 ),
@@ -84,6 +115,47 @@ class RemoteK3sGatherInfoRunner:
         collaborators.printer().new_line_fn().print_fn(output)
         return ansible_host
 
+    def _run_direct_ssh(
+        self, collaborators: CoreCollaborators, remote_ctx: RemoteContext, ansible_host: AnsibleHost
+    ) -> RemoteCommandResult:
+        files_path = os.path.join(
+            str(
+                collaborators.paths().get_dir_path_from_python_package(
+                    ANSIBLE_PLAYBOOKS_PACKAGE, ANSIBLE_PLAYBOOKS_DIR_NAME
+                )
+            ),
+            K3S_GATHER_INFO_FILES_PATH,
+        )
+        io_utils = collaborators.io_utils()
+        shell_lib = io_utils.read_file_safe_fn(os.path.join(files_path, SHELL_LIB_SCRIPT_NAME))
+        gather_info_script = io_utils.read_file_safe_fn(os.path.join(files_path, K3S_GATHER_INFO_SCRIPT_NAME))
+        if shell_lib is None or gather_info_script is None:
+            error = f"K3s gather info scripts are missing. path: {files_path}"
+            return RemoteCommandResult(ansible_host.host, ansible_host.ip_address, None, "", "", 0, error=error)
+
+        # The K3s tokens are readable by root only, the role runs as root, hosts which ask for a sudo password
+        # are left to Ansible and its become password
+        elevated = exec_ssh_command(ansible_host, "sudo -n true", K3S_GATHER_INFO_SSH_TIMEOUT_SECONDS)
+        if not elevated.is_ok():
+            error = elevated.error or f"Passwordless sudo is unavailable. host: {ansible_host.host}"
+            return elevated._replace(error=error)
+        # All commands share the pooled connection of the host, only the first one pays for the handshake
+        copied = exec_ssh_command(
+            ansible_host, f"cat > {REMOTE_SHELL_LIB_PATH}", K3S_GATHER_INFO_SSH_TIMEOUT_SECONDS, stdin_data=shell_lib
+        )
+        if not copied.is_ok():
+            return copied
+        # Same environment the Ansible modifiers set on the play
+        env_vars = ["TERM=xterm"]
+        env_vars += ["VERBOSE=True"] if remote_ctx.is_verbose() else []
+        env_vars += ["SILENT=True"] if remote_ctx.is_silent() else []
+        return exec_ssh_command(
+            ansible_host,
+            f"sudo -n env {' '.join(env_vars)} bash -s",
+            K3S_GATHER_INFO_SSH_TIMEOUT_SECONDS,
+            stdin_data=gather_info_script,
+        )
+
     def _run_ansible(
         self,
         runner: AnsibleRunnerLocal,
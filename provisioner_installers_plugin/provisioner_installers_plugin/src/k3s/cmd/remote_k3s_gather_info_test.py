@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest import mock
+
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import RemoteCommandResult
+from provisioner_installers_plugin.src.k3s.cmd.remote_k3s_gather_info import (
+    K3S_GATHER_INFO_SCRIPT_NAME,
+    REMOTE_SHELL_LIB_PATH,
+    SHELL_LIB_SCRIPT_NAME,
+    RemoteK3sGatherInfoArgs,
+    RemoteK3sGatherInfoRunner,
+)
+
+from provisioner_shared.components.remote.remote_connector import SSHConnectionInfo
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.remote_context import RemoteContext
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/k3s/cmd/remote_k3s_gather_info_test.py
+#
+
+REMOTE_K3S_GATHER_INFO_PATH = "provisioner_installers_plugin.src.k3s.cmd.remote_k3s_gather_info"
+
+TEST_ANSIBLE_HOST = AnsibleHost(host="k3s-master", ip_address="192.168.1.200", username="pi", password="secret")
+TEST_SCRIPTS = {SHELL_LIB_SCRIPT_NAME: "# shell lib", K3S_GATHER_INFO_SCRIPT_NAME: "# gather info"}
+
+
+def create_result(exit_code=0, stdout="", error=None) -> RemoteCommandResult:
+    return RemoteCommandResult(TEST_ANSIBLE_HOST.host, TEST_ANSIBLE_HOST.ip_address, exit_code, stdout, "", 0.1, error)
+
+
+def create_fake_collaborators() -> mock.MagicMock:
+    collaborators = mock.MagicMock()
+    collaborators.paths().get_dir_path_from_python_package.return_value = "/playbooks"
+    collaborators.io_utils().read_file_safe_fn.side_effect = lambda path: TEST_SCRIPTS.get(path.split("/")[-1])
+    collaborators.progress_indicator().get_status().long_running_process_fn.side_effect = (
+        lambda call, desc_run, desc_end: call()
+    )
+    collaborators.ansible_runner().run_fn.return_value = "K3s info from Ansible"
+    return collaborators
+
+
+def run_gather_info(collaborators: mock.MagicMock, remote_ctx: RemoteContext) -> None:
+    remote_opts = mock.MagicMock()
+    remote_opts.get_remote_context.return_value = remote_ctx
+    RemoteK3sGatherInfoRunner()._run_ansible_k3s_gather_info_playbook_with_progress_bar(
+        ctx=Context.create(dry_run=remote_ctx.is_dry_run()),
+        ssh_conn_info=SSHConnectionInfo(ansible_hosts=[TEST_ANSIBLE_HOST]),
+        collaborators=collaborators,
+        args=RemoteK3sGatherInfoArgs(remote_opts=remote_opts),
+    )
+
+
+class RemoteK3sGatherInfoTestShould(unittest.TestCase):
+
+    def test_stream_the_role_scripts_over_ssh_as_root(self) -> None:
+        collaborators = create_fake_collaborators()
+        with mock.patch(
+            f"{REMOTE_K3S_GATHER_INFO_PATH}.exec_ssh_command",
+            side_effect=[create_result(), create_result(), create_result(stdout="K3s info")],
+        ) as exec_call:
+            run_gather_info(collaborators, RemoteContext.create(verbose=True))
+
+        commands = [(call.args[1], call.kwargs.get("stdin_data")) for call in exec_call.call_args_list]
+        self.assertEqual(
+            commands,
+            [
+                ("sudo -n true", None),
+                (f"cat > {REMOTE_SHELL_LIB_PATH}", "# shell lib"),
+                ("sudo -n env TERM=xterm VERBOSE=True bash -s", "# gather info"),
+            ],
+        )
+        collaborators.printer().new_line_fn().print_fn.assert_called_once_with("K3s info")
+        collaborators.ansible_runner().run_fn.assert_not_called()
+
+    def test_fall_back_to_ansible_without_passwordless_sudo(self) -> None:
+        collaborators = create_fake_collaborators()
+        with mock.patch(f"{REMOTE_K3S_GATHER_INFO_PATH}.exec_ssh_command", return_value=create_result(exit_code=1)):
+            run_gather_info(collaborators, RemoteContext.no_op())
+
+        collaborators.printer().new_line_fn().print_fn.assert_called_once_with("K3s info from Ansible")
+
+    def test_fall_back_to_ansible_when_ssh_fails_to_connect(self) -> None:
+        collaborators = create_fake_collaborators()
+        with mock.patch(
+            f"{REMOTE_K3S_GATHER_INFO_PATH}.exec_ssh_command", return_value=create_result(None, error="timed out")
+        ) as exec_call:
+            run_gather_info(collaborators, RemoteContext.no_op())
+
+        self.assertEqual(exec_call.call_count, 1)
+        collaborators.printer().new_line_fn().print_fn.assert_called_once_with("K3s info from Ansible")
+
+    def test_run_dry_runs_through_ansible_only(self) -> None:
+        collaborators = create_fake_collaborators()
+        with mock.patch(f"{REMOTE_K3S_GATHER_INFO_PATH}.exec_ssh_command") as exec_call:
+            run_gather_info(collaborators, RemoteContext.create(dry_run=True))
+
+        exec_call.assert_not_called()
+        collaborators.ansible_runner().run_fn.assert_called_once()
+
+    def test_fail_when_the_gather_info_script_fails(self) -> None:
+        collaborators = create_fake_collaborators()
+        failed = create_result(exit_code=2)._replace(stderr="k3s is not installed")
+        with mock.patch(
+            f"{REMOTE_K3S_GATHER_INFO_PATH}.exec_ssh_command", side_effect=[create_result(), create_result(), failed]
+        ):
+            with self.assertRaisesRegex(Exception, "k3s is not installed"):
+                run_gather_info(collaborators, RemoteContext.no_op())
+        collaborators.ansible_runner().run_fn.assert_not_called()
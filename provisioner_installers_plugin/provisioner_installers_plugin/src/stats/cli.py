@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+from typing import List, Optional
+
+import click
+from provisioner_installers_plugin.src.installer.cmd.stats_cmd import (
+    OUTPUT_FORMAT_JSON,
+    OUTPUT_FORMAT_TABLE,
+    TimingStatsCmd,
+    TimingStatsCmdArgs,
+)
+from provisioner_installers_plugin.src.installer.tracing.timing_history import DEFAULT_ETA_FORKS
+
+from provisioner_shared.components.runtime.cli.cli_modifiers import cli_modifiers
+from provisioner_shared.components.runtime.cli.modifiers import CliModifiers
+from provisioner_shared.components.runtime.infra.context import CliContextManager
+from provisioner_shared.components.runtime.infra.evaluator import Evaluator
+
+STATS_COMMAND_NAME = "stats"
+
+
+def register_stats_commands(cli_group: click.Group):
+    # Every plugin records to the same history, the first plugin loaded provides the command
+    if STATS_COMMAND_NAME in cli_group.commands:
+        return
+
+    @cli_group.command(name=STATS_COMMAND_NAME)
+    @click.option("--operation", "match", help="Show only operations containing this text, e.g. 'install helm'")
+    @click.option("--by-host", is_flag=True, help="Break the statistics down per host")
+    @click.option("--since-days", type=float, help="Use only timings recorded in the last number of days")
+    @click.option("--eta", "eta_operation", help="Estimate how long an operation takes on the --hosts fleet")
+    @click.option(
+        "--hosts",
+        "eta_hosts",
+        help="Comma separated hosts of the planned fleet run, or the number of hosts",
+        envvar="PROV_STATS_ETA_HOSTS",
+    )
+    @click.option(
+        "--forks",
+        type=int,
+        default=DEFAULT_ETA_FORKS,
+        show_default=True,
+        help="Number of hosts the planned fleet run configures at once",
+    )
+    @click.option(
+        "--output-format",
+        type=click.Choice([OUTPUT_FORMAT_TABLE, OUTPUT_FORMAT_JSON], case_sensitive=False),
+        default=OUTPUT_FORMAT_TABLE,
+        show_default=True,
+        help="Report format of the statistics",
+    )
+    @cli_modifiers
+    @click.pass_context
+    def stats(
+        ctx: click.Context,
+        match: Optional[str],
+        by_host: bool,
+        since_days: Optional[float],
+        eta_operation: Optional[str],
+        eta_hosts: Optional[str],
+        forks: int,
+        output_format: str,
+    ):
+        """Duration percentiles of past commands and steps per operation and host, and fleet run ETAs"""
+        if eta_operation and not eta_hosts:
+            raise click.UsageError("--eta requires the --hosts of the planned fleet run")
+        show_stats(
+            TimingStatsCmdArgs(
+                match=match,
+                by_host=by_host,
+                since_days=since_days,
+                eta_operation=eta_operation,
+                eta_hosts=parse_eta_hosts(eta_hosts),
+                forks=forks,
+                output_format=output_format.lower(),
+            ),
+            modifiers=CliModifiers.from_click_ctx(ctx),
+        )
+
+
+def parse_eta_hosts(eta_hosts: Optional[str]) -> List[str]:
+    if not eta_hosts:
+        return []
+    if eta_hosts.strip().isdigit():
+        # Hosts without history are estimated from the median over all hosts
+        return [f"host-{index + 1}" for index in range(int(eta_hosts))]
+    return [host.strip() for host in eta_hosts.split(",") if host.strip()]
+
+
+def show_stats(args: TimingStatsCmdArgs, modifiers: CliModifiers) -> None:
+    cli_ctx = CliContextManager.create(modifiers)
+    Evaluator.eval_cli_entrypoint_step(
+        name="Timing Stats",
+        call=lambda: TimingStatsCmd().run(ctx=cli_ctx, args=args),
+        error_message="Failed to read the timing history",
+        verbose=cli_ctx.is_verbose(),
+    )
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+import bisect
+import difflib
+import glob
+import importlib
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+import yaml
+from loguru import logger
+from provisioner_installers_plugin.src.installer.domain.installable import Installable
+from provisioner_installers_plugin.src.installer.domain.source import ActiveInstallSource, InstallSource
+
+CatalogResourcePath = str(pathlib.Path(__file__).parent.parent.parent / "resources" / "catalog" / "catalog.yaml")
+ProvisionerUserCatalogsPath = os.path.expanduser("~/.config/provisioner/catalog.d")
+ProvisionerCatalogCachePath = os.path.expanduser("~/.cache/provisioner/catalog.pickle")
+
+CATALOG_CACHE_FORMAT_VERSION = 1
+DEFAULT_SEARCH_LIMIT = 20
+FUZZY_SEARCH_CUTOFF = 0.6
+
+# The libyaml bindings parse an order of magnitude faster, they are optional
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class UtilitySummary(NamedTuple):
+    name: str
+    display_name: str
+    description: str
+    binary_name: str
+    version: Optional[str]
+
+
+def catalog_source_paths(user_catalogs_path: Optional[str] = ProvisionerUserCatalogsPath) -> List[str]:
+    """Built-in catalog first, user catalogs after it in name order so they override built-in entries"""
+    paths = [CatalogResourcePath]
+    if user_catalogs_path and os.path.isdir(user_catalogs_path):
+        paths.extend(sorted(glob.glob(os.path.join(user_catalogs_path, "*.yaml"))))
+    return paths
+
+
+def _sources_fingerprint(source_paths: List[str]) -> List[Tuple[str, int, int]]:
+    fingerprint = []
+    for path in source_paths:
+        stat = os.stat(path)
+        fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+    return fingerprint
+
+
+def compile_catalog(source_paths: List[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Parse catalog files into plain category -> name -> entry mappings, no utility is built here"""
+    compiled: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for path in source_paths:
+        with open(path, "r") as catalog_file:
+            content = yaml.load(catalog_file, Loader=YamlLoader) or {}
+        if not isinstance(content, dict):
+            raise ValueError(f"Utility catalog must map categories to utilities. path: {path}")
+        for category, entries in content.items():
+            if not isinstance(entries, dict):
+                raise ValueError(
+                    f"Utility catalog category must map names to utilities. path: {path}, category: {category}"
+                )
+            for name, entry in entries.items():
+                if not isinstance(entry, dict) or not entry.get("description"):
+                    raise ValueError(f"Utility catalog entry must have a description. path: {path}, name: {name}")
+                compiled.setdefault(category, {})[str(name)] = entry
+    return compiled
+
+
+def load_compiled_catalog(
+    source_paths: List[str], cache_path: Optional[str] = ProvisionerCatalogCachePath
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    The compiled catalog is pickled and reused for as long as no catalog file changed,
+    checking that costs a stat per catalog file instead of parsing YAML on every run.
+    """
+    fingerprint = _sources_fingerprint(source_paths)
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cached = pickle.load(cache_file)
+            if cached.get("format") == CATALOG_CACHE_FORMAT_VERSION and cached.get("fingerprint") == fingerprint:
+                return cached["catalog"]
+        except Exception as ex:
+            logger.debug(f"Ignoring unreadable utility catalog cache. path: {cache_path}, error: {ex}")
+
+    compiled = compile_catalog(source_paths)
+    if cache_path:
+        _write_catalog_cache(
+            cache_path, {"format": CATALOG_CACHE_FORMAT_VERSION, "fingerprint": fingerprint, "catalog": compiled}
+        )
+    return compiled
+
+
+def _write_catalog_cache(cache_path: str, content: Dict[str, Any]) -> None:
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".catalog-", dir=cache_dir)
+        with os.fdopen(fd, "wb") as temp_file:
+            pickle.dump(content, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError as ex:
+        # A read-only home directory only costs the cache, never the command
+        logger.debug(f"Failed to write utility catalog cache. path: {cache_path}, error: {ex}")
+
+
+def _render_template(template: str) -> Callable[..., str]:
+    def render(version: str, os: str, arch: str) -> str:
+        version = version or ""
+        return template.format(version=version, version_number=version.removeprefix("v"), os=os, arch=arch)
+
+    return render
+
+
+def _import_callable(reference: str) -> Callable:
+    module_name, _, function_name = reference.partition(":")
+    if not function_name:
+        raise ValueError(f"Callback reference must be 'module:function'. value: {reference}")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _lazy_callable(reference: Optional[str]) -> Optional[Callable]:
+    if not reference:
+        return None
+    return lambda version, collaborators, maybe_args: _import_callable(reference)(version, collaborators, maybe_args)
+
+
+def materialize_utility(name: str, entry: Dict[str, Any]) -> Installable.Utility:
+    source = InstallSource()
+    active_source = None
+    if "callback" in entry:
+        callback = entry["callback"]
+        source.callback = InstallSource.Callback(
+            install_fn=_lazy_callable(callback.get("install")),
+            uninstall_fn=_lazy_callable(callback.get("uninstall")),
+        )
+        active_source = ActiveInstallSource.Callback
+    if "script" in entry:
+        script = entry["script"]
+        source.script = InstallSource.Script(install_script=script["install"], uninstall_script=script.get("uninstall"))
+        active_source = ActiveInstallSource.Script
+    if "github" in entry:
+        github = entry["github"]
+        source.github = InstallSource.GitHub(
+            owner=github["owner"],
+            repo=github["repo"],
+            supported_releases=list(github.get("supported_releases", [])),
+            arch_map=dict(github.get("arch_map", {})),
+            release_name_resolver=_render_template(github["release_name"]),
+            alternative_base_url=github.get("alternative_base_url"),
+            archive_nested_binary_path=(
+                _render_template(github["archive_nested_binary_path"])
+                if github.get("archive_nested_binary_path")
+                else None
+            ),
+        )
+        active_source = ActiveInstallSource.GitHub
+    if entry.get("active_source"):
+        active_source = ActiveInstallSource(entry["active_source"])
+
+    return Installable.Utility(
+        display_name=entry.get("display_name", name),
+        description=entry["description"],
+        binary_name=entry.get("binary_name", name),
+        version=entry.get("version"),
+        version_command=entry.get("version_command"),
+        active_source=active_source,
+        source=source,
+    )
+
+
+class _CompiledCatalogLoader:
+    """Loads the compiled catalog once per process, shared by all categories"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._compiled: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+
+    def get(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if self._compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = load_compiled_catalog(catalog_source_paths())
+        return self._compiled
+
+
+_compiled_catalog_loader = _CompiledCatalogLoader()
+
+
+class UtilityCatalog(Mapping[str, Installable.Utility]):
+    """
+    Read-only mapping of utility name to utility for a single catalog category.
+    Membership, listing and search run on the compiled catalog entries, a utility is only built
+    the first time it is looked up by name and the same instance is returned afterwards.
+    """
+
+    category: str
+
+    def __init__(
+        self,
+        category: str,
+        entries_loader: Optional[Callable[[], Dict[str, Dict[str, Any]]]] = None,
+    ) -> None:
+        self.category = category
+        self._entries_loader = (
+            entries_loader if entries_loader else lambda: _compiled_catalog_loader.get().get(category, {})
+        )
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._sorted_names: Optional[List[str]] = None
+        self._materialized: Dict[str, Installable.Utility] = {}
+
+    def _get_entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._entries_loader()
+        return self._entries
+
+    def _get_sorted_names(self) -> List[str]:
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._get_entries(), key=str.lower)
+        return self._sorted_names
+
+    def __getitem__(self, name: str) -> Installable.Utility:
+        utility = self._materialized.get(name)
+        if utility is None:
+            utility = materialize_utility(name, self._get_entries()[name])
+            self._materialized[name] = utility
+        return utility
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._get_entries()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_sorted_names())
+
+    def __len__(self) -> int:
+        return len(self._get_entries())
+
+    def describe(self, name: str) -> UtilitySummary:
+        """Listing details of a utility without building it"""
+        entry = self._get_entries()[name]
+        return UtilitySummary(
+            name=name,
+            display_name=entry.get("display_name", name),
+            description=entry["description"],
+            binary_name=entry.get("binary_name", name),
+            version=entry.get("version"),
+        )
+
+    def materialized_names(self) -> List[str]:
+        return sorted(self._materialized)
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[str]:
+        """Names starting with the query first, then names or descriptions containing it, then close matches"""
+        query = query.strip().lower()
+        names = self._get_sorted_names()
+        if not query:
+            return names[:limit]
+
+        lowered_names = [name.lower() for name in names]
+        results: List[str] = []
+        start = bisect.bisect_left(lowered_names, query)
+        while start < len(names) and lowered_names[start].startswith(query):
+            results.append(names[start])
+            start += 1
+
+        entries = self._get_entries()
+        for name in names:
+            if name not in results and (query in name.lower() or query in entries[name]["description"].lower()):
+                results.append(name)
+
+        by_lowered_name = dict(zip(lowered_names, names))
+        for match in difflib.get_close_matches(query, lowered_names, n=limit, cutoff=FUZZY_SEARCH_CUTOFF):
+            if by_lowered_name[match] not in results:
+                results.append(by_lowered_name[match])
+        return results[:limit]
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from provisioner_installers_plugin.src.installer.domain.source import ActiveInstallSource
+from provisioner_installers_plugin.src.utilities.catalog import (
+    UtilityCatalog,
+    catalog_source_paths,
+    compile_catalog,
+    load_compiled_catalog,
+)
+
+# To run as a single test target:
+#  poetry run coverage run -m pytest plugins/provisioner_installers_plugin/provisioner_installers_plugin/src/utilities/catalog_test.py
+#
+
+TEST_CATALOG = """
+cli:
+  anchor:
+    description: Create Dynamic CLI's as your GitOps Marketplace
+    version: v0.12.0
+    github:
+      owner: ZachiNachshon
+      repo: anchor
+      supported_releases: [linux_amd64]
+      release_name: "anchor_{version_number}_{os}_{arch}.tar.gz"
+  helm:
+    description: Package Manager for Kubernetes
+    github:
+      owner: helm
+      repo: helm
+      release_name: "helm-{version}-{os}-{arch}.tar.gz"
+      archive_nested_binary_path: "{os}-{arch}/helm"
+  kubectl:
+    description: Kubernetes command line tool
+    callback:
+      install: os.path:join
+"""
+
+TEST_USER_CATALOG = """
+cli:
+  helm:
+    description: Helm from a private mirror
+    script:
+      install: install-helm.sh
+"""
+
+
+class UtilityCatalogTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-catalog-test")
+        self.catalog_path = self.write_catalog("catalog.yaml", TEST_CATALOG)
+        self.cache_path = os.path.join(self.work_dir, "cache", "catalog.pickle")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def write_catalog(self, file_name: str, content: str) -> str:
+        path = os.path.join(self.work_dir, file_name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def create_catalog(self) -> UtilityCatalog:
+        compiled = load_compiled_catalog([self.catalog_path], self.cache_path)
+        return UtilityCatalog("cli", entries_loader=lambda: compiled["cli"])
+
+    def test_reuse_cache_until_a_catalog_file_changes(self) -> None:
+        self.assertEqual(
+            sorted(load_compiled_catalog([self.catalog_path], self.cache_path)["cli"]), ["anchor", "helm", "kubectl"]
+        )
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        # Same size edit with the original mtime keeps the fingerprint, the cache is served as is
+        stat = os.stat(self.catalog_path)
+        self.write_catalog("catalog.yaml", TEST_CATALOG.replace("kubectl:", "kubectx:"))
+        os.utime(self.catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertIn("kubectl", load_compiled_catalog([self.catalog_path], self.cache_path)["cli"])
+
+        os.utime(self.catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertIn("kubectx", load_compiled_catalog([self.catalog_path], self.cache_path)["cli"])
+
+    def test_user_catalogs_override_built_in_entries(self) -> None:
+        user_catalogs_dir = os.path.join(self.work_dir, "catalog.d")
+        os.makedirs(user_catalogs_dir)
+        with open(os.path.join(user_catalogs_dir, "private.yaml"), "w") as f:
+            f.write(TEST_USER_CATALOG)
+        source_paths = catalog_source_paths(user_catalogs_dir)
+        self.assertEqual(source_paths[-1], os.path.join(user_catalogs_dir, "private.yaml"))
+
+        compiled = compile_catalog([self.catalog_path, source_paths[-1]])
+        self.assertEqual(compiled["cli"]["helm"]["description"], "Helm from a private mirror")
+        self.assertIn("anchor", compiled["cli"])
+
+    def test_materialize_utilities_only_when_looked_up(self) -> None:
+        catalog = self.create_catalog()
+        self.assertEqual(list(catalog), ["anchor", "helm", "kubectl"])
+        self.assertIn("helm", catalog)
+        self.assertEqual(catalog.describe("helm").description, "Package Manager for Kubernetes")
+        self.assertEqual(catalog.describe("anchor").version, "v0.12.0")
+        self.assertEqual(catalog.materialized_names(), [])
+
+        anchor = catalog["anchor"]
+        self.assertIs(catalog["anchor"], anchor)
+        self.assertEqual(catalog.materialized_names(), ["anchor"])
+        self.assertEqual(anchor.active_source, ActiveInstallSource.GitHub)
+        self.assertEqual(
+            anchor.source.github.release_name_resolver("v0.12.0", "linux", "amd64"), "anchor_0.12.0_linux_amd64.tar.gz"
+        )
+        helm = catalog["helm"]
+        self.assertEqual(helm.source.github.archive_nested_binary_path("v3.17.3", "linux", "amd64"), "linux-amd64/helm")
+
+    def test_import_callbacks_when_invoked(self) -> None:
+        kubectl = self.create_catalog()["kubectl"]
+        self.assertEqual(kubectl.active_source, ActiveInstallSource.Callback)
+        self.assertEqual(kubectl.source.callback.install_fn("a", "b", "c"), os.path.join("a", "b", "c"))
+        self.assertIsNone(kubectl.source.callback.uninstall_fn)
+
+    def test_search_by_prefix_description_and_close_names(self) -> None:
+        catalog = self.create_catalog()
+        self.assertEqual(catalog.search("he"), ["helm"])
+        self.assertEqual(catalog.search("kubernetes"), ["helm", "kubectl"])
+        self.assertEqual(catalog.search("anchr"), ["anchor"])
+        self.assertEqual(catalog.search("nothing-alike"), [])
+        self.assertEqual(catalog.materialized_names(), [])
+
+    def test_load_built_in_catalog(self) -> None:
+        compiled = load_compiled_catalog(catalog_source_paths(user_catalogs_path=None), self.cache_path)
+        self.assertIn("helm", compiled["cli"])
+        self.assertIn("k3s-server", compiled["k8s"])
+        self.assertIn("python", compiled["system"])
+        self.assertEqual(compiled["system"]["python"]["version"], "3.11")
@@ -1,38 +1,15 @@
 #!/usr/bin/env python3
 
 from provisioner_installers_plugin.src.installer.domain.dynamic_args import DynamicArgs
-from provisioner_installers_plugin.src.installer.domain.installable import Installable
-from provisioner_installers_plugin.src.installer.domain.source import (
-    ActiveInstallSource,
-    InstallSource,
-)
-from provisioner_installers_plugin.src.utilities.utilities_versions import ToolingVersions
+from provisioner_installers_plugin.src.utilities.catalog import UtilityCatalog
 
 from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
 
 SupportedOS = ["linux", "darwin"]
 SupportedArchitectures = ["x86_64", "arm", "amd64", "armv6l", "armv7l", "arm64", "aarch64"]
 
-SupportedToolingsSystem = {
-    "python": Installable.Utility(
-        display_name="python",
-        description="Python / pip package manager",
-        binary_name="python",
-        version=ToolingVersions.helm_ver,
-        version_command="-V",
-        active_source=ActiveInstallSource.Callback,
-        source=InstallSource(
-            callback=InstallSource.Callback(
-                install_fn=lambda version, collaborators, maybe_args: install_python(
-                    version, collaborators, maybe_args
-                ),
-                uninstall_fn=lambda version, collaborators, maybe_args: uninstall_python(
-                    version, collaborators, maybe_args
-                ),
-            ),
-        ),
-    ),
-}
+# Entries are defined in resources/catalog/catalog.yaml and user catalogs, see the catalog module
+SupportedToolingsSystem = UtilityCatalog("system")
 
 
 # Move from here
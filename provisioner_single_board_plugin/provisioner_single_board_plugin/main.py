@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 
 import pathlib
+import sys
+import time
+from typing import Optional
 
 import click
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import TRACE_TO_STDOUT, get_tracer
+from provisioner_installers_plugin.src.installer.tracing.timing_history import record_command_history
 
 from provisioner_shared.components.runtime.cli.cli_modifiers import cli_modifiers
 from provisioner_shared.components.runtime.cli.menu_format import CustomGroup
@@ -30,11 +35,28 @@ def append_to_cli(root_menu: click.Group):
 
     @root_menu.group(invoke_without_command=True, no_args_is_help=True, cls=CustomGroup)
     @cli_modifiers
+    @click.option(
+        "--trace",
+        "trace_path",
+        type=click.Path(dir_okay=False),
+        help="Write a Chrome trace of every runner step to this file ('-' prints it to stdout)",
+        envvar="PROV_TRACE_FILE",
+    )
+    @click.option(
+        "--history/--no-history",
+        "record_history",
+        default=True,
+        show_default=True,
+        help="Record the command and step durations shown by 'provisioner stats'",
+        envvar="PROV_HISTORY",
+    )
     @click.pass_context
-    def single_board(ctx):
+    def single_board(ctx, trace_path: str, record_history: bool):
         """Single boards management as simple as it gets"""
         if ctx.invoked_subcommand is None:
             click.echo(ctx.get_help())
+        else:
+            _trace_command(ctx, trace_path, record_history)
 
     append_version_cmd_to_cli(
         root_menu=single_board,
@@ -44,3 +66,24 @@ def append_to_cli(root_menu: click.Group):
 
     register_raspberry_pi_commands(cli_group=single_board, single_board_cfg=single_board_cfg)
     register_remote_info_commands(cli_group=single_board, single_board_cfg=single_board_cfg)
+
+
+def _trace_command(ctx: click.Context, trace_path: Optional[str], record_history: bool) -> None:
+    # A remote run prints its trace for the provisioner which started it, that one records the history
+    record_history = record_history and trace_path != TRACE_TO_STDOUT
+    if not trace_path and not record_history:
+        return
+    tracer = get_tracer().enable()
+    command = f"{ctx.info_name} {ctx.invoked_subcommand}"
+    started_at = time.time()
+
+    def on_close() -> None:
+        # Runs once the sub command completes or fails, a failure is still being raised at this point
+        if trace_path:
+            tracer.export(trace_path)
+        if record_history:
+            error = sys.exc_info()[1]
+            failed = error is not None and not (isinstance(error, click.exceptions.Exit) and error.exit_code == 0)
+            record_command_history(tracer, command, started_at, failed=failed)
+
+    ctx.call_on_close(on_close)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.utils.process import Process
+
+HOSTS_FILE_PATH = "/etc/hosts"
+MANAGED_BLOCK_BEGIN_MARKER = "# BEGIN provisioner managed hosts"
+MANAGED_BLOCK_END_MARKER = "# END provisioner managed hosts"
+
+
+class ManagedHostsFile:
+    """
+    Accumulates hosts file entries across an operation and writes them with a single privileged replace.
+
+    Entries live in a block delimited by provisioner markers, re-running with the same entries renders the
+    same file and the write is skipped altogether. The new content is staged next to the hosts file and
+    renamed over it, readers never observe a partially written file.
+    """
+
+    _process: Process
+    _dry_run: bool
+    _hosts_file_path: str
+    _pending: Dict[str, List[str]]
+
+    def __init__(self, process: Process, dry_run: bool, hosts_file_path: Optional[str] = HOSTS_FILE_PATH) -> None:
+        self._process = process
+        self._dry_run = dry_run
+        self._hosts_file_path = hosts_file_path
+        self._pending = {}
+
+    @staticmethod
+    def create(ctx: Context, process: Process) -> "ManagedHostsFile":
+        logger.debug(f"Creating managed hosts file (dry_run: {ctx.is_dry_run()})...")
+        return ManagedHostsFile(process, ctx.is_dry_run())
+
+    def add_entry(self, ip_address: str, dns_names: List[str]) -> None:
+        """A later entry for the same address or the same name replaces the earlier one"""
+        for address in list(self._pending.keys()):
+            self._pending[address] = [name for name in self._pending[address] if name not in dns_names]
+            if not self._pending[address]:
+                del self._pending[address]
+        self._pending[ip_address] = list(dict.fromkeys(self._pending.get(ip_address, []) + dns_names))
+
+    def has_pending_entries(self) -> bool:
+        return len(self._pending) > 0
+
+    def render(self, content: str) -> str:
+        """Merge pending entries into the managed block of the given hosts file content"""
+        outside_lines, managed = _split_managed_block(content)
+        for address, names in self._pending.items():
+            for managed_address in list(managed.keys()):
+                managed[managed_address] = [name for name in managed[managed_address] if name not in names]
+                if not managed[managed_address]:
+                    del managed[managed_address]
+            managed[address] = names
+
+        # Unmanaged entries for the same names would shadow the managed ones, only the conflicting names are
+        # removed from them, names that are not managed by provisioner are kept as they are
+        pending_addresses = set(self._pending.keys())
+        pending_names = {name for names in self._pending.values() for name in names}
+        outside_lines = [
+            line
+            for line in (_without_shadowing_names(line, pending_addresses, pending_names) for line in outside_lines)
+            if line is not None
+        ]
+        while outside_lines and not outside_lines[-1].strip():
+            outside_lines.pop()
+
+        block = [MANAGED_BLOCK_BEGIN_MARKER]
+        block += [f"{address}\t{' '.join(names)}" for address, names in sorted(managed.items())]
+        block.append(MANAGED_BLOCK_END_MARKER)
+        separator = [""] if outside_lines else []
+        return "\n".join(outside_lines + separator + block) + "\n"
+
+    def flush(self) -> bool:
+        """
+        Write all pending entries at once, returns True if the hosts file was replaced.
+        Using 'sudo' it'll prompt the user for password, at most once per flush.
+        """
+        if not self.has_pending_entries():
+            return False
+
+        with open(self._hosts_file_path, "r") as f:
+            current_content = f.read()
+        new_content = self.render(current_content)
+        self._pending = {}
+        if new_content == current_content:
+            logger.debug("Hosts file already contains all managed entries, skipping write")
+            return False
+        if self._dry_run:
+            return False
+
+        tmp_dir = tempfile.mkdtemp(prefix="provisioner-hosts")
+        try:
+            tmp_hosts_file_path = os.path.join(tmp_dir, "hosts")
+            with open(tmp_hosts_file_path, "w") as f:
+                f.write(new_content)
+
+            # Staging on the same filesystem as the target makes the final rename atomic
+            staged_path = f"{self._hosts_file_path}.provisioner"
+            self._process.run_fn(
+                [
+                    f"sudo sh -c 'install -m 0644 {tmp_hosts_file_path} {staged_path} "
+                    + f"&& mv -f {staged_path} {self._hosts_file_path}'"
+                ],
+                allow_single_shell_command_str=True,
+            )
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return True
+
+
+def _parse_entry(line: str) -> Tuple[Optional[str], List[str]]:
+    tokens = line.split("#", 1)[0].split()
+    if len(tokens) < 2:
+        return (None, [])
+    return (tokens[0], tokens[1:])
+
+
+def _without_shadowing_names(line: str, addresses: Set[str], names: Set[str]) -> Optional[str]:
+    """
+    Returns the unmanaged line without the managed names, None if no name is left on it.
+    Lines sharing a managed address but none of its names are kept, they do not shadow the name lookups.
+    """
+    address, entry_names = _parse_entry(line)
+    if address is None:
+        return line
+
+    kept_names = [name for name in entry_names if name not in names]
+    if len(kept_names) == len(entry_names):
+        if address in addresses:
+            logger.warning(f"Unmanaged hosts file entry shares a managed address, keeping it. entry: {line.strip()}")
+        return line
+    if not kept_names:
+        return None
+
+    comment = line.split("#", 1)[1] if "#" in line else None
+    logger.warning(f"Removing managed names from unmanaged hosts file entry. entry: {line.strip()}")
+    return f"{address}\t{' '.join(kept_names)}" + (f" #{comment}" if comment is not None else "")
+
+
+def _split_managed_block(content: str) -> Tuple[List[str], Dict[str, List[str]]]:
+    outside_lines: List[str] = []
+    managed: Dict[str, List[str]] = {}
+    in_block = False
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped == MANAGED_BLOCK_BEGIN_MARKER:
+            in_block = True
+        elif stripped == MANAGED_BLOCK_END_MARKER:
+            in_block = False
+        elif in_block:
+            address, names = _parse_entry(line)
+            if address:
+                managed[address] = list(dict.fromkeys(managed.get(address, []) + names))
+        else:
+            outside_lines.append(line)
+    return (outside_lines, managed)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+import unittest
+from typing import List
+
+from provisioner_single_board_plugin.src.common.hosts.managed_hosts_file import (
+    MANAGED_BLOCK_BEGIN_MARKER,
+    MANAGED_BLOCK_END_MARKER,
+    ManagedHostsFile,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/hosts/managed_hosts_file_test.py
+#
+
+SYSTEM_HOSTS_CONTENT = """127.0.0.1\tlocalhost
+192.168.1.50\tnode1 # Added by provisioner for node1
+"""
+
+
+class FakeProcess:
+
+    def __init__(self) -> None:
+        self.commands: List[str] = []
+
+    def run_fn(self, args: List[str], allow_single_shell_command_str: bool = False) -> str:
+        self.commands.append(args[0])
+        return ""
+
+
+class ManagedHostsFileTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.hosts_file_path = os.path.join(tempfile.mkdtemp(prefix="provisioner-hosts-test"), "hosts")
+        with open(self.hosts_file_path, "w") as f:
+            f.write(SYSTEM_HOSTS_CONTENT)
+        self.process = FakeProcess()
+
+    def tearDown(self) -> None:
+        os.remove(self.hosts_file_path)
+        os.rmdir(os.path.dirname(self.hosts_file_path))
+
+    def create_hosts_file(self, dry_run: bool = False) -> ManagedHostsFile:
+        return ManagedHostsFile(self.process, dry_run, self.hosts_file_path)
+
+    def test_render_entries_into_managed_block(self) -> None:
+        hosts_file = self.create_hosts_file()
+        hosts_file.add_entry("192.168.1.201", ["node2"])
+        hosts_file.add_entry("192.168.1.200", ["node1"])
+
+        self.assertEqual(
+            hosts_file.render(SYSTEM_HOSTS_CONTENT),
+            "127.0.0.1\tlocalhost\n\n"
+            + f"{MANAGED_BLOCK_BEGIN_MARKER}\n"
+            + "192.168.1.200\tnode1\n"
+            + "192.168.1.201\tnode2\n"
+            + f"{MANAGED_BLOCK_END_MARKER}\n",
+        )
+
+    def test_replace_existing_entries_by_address_and_name(self) -> None:
+        content = self.create_hosts_file().render("")
+        first = self.create_hosts_file()
+        first.add_entry("192.168.1.200", ["node1"])
+        first.add_entry("192.168.1.201", ["node2"])
+        content = first.render(content)
+
+        second = self.create_hosts_file()
+        second.add_entry("192.168.1.210", ["node1"])
+        second.add_entry("192.168.1.201", ["node3"])
+        content = second.render(content)
+
+        self.assertIn("192.168.1.210\tnode1\n", content)
+        self.assertIn("192.168.1.201\tnode3\n", content)
+        self.assertNotIn("192.168.1.200", content)
+        self.assertEqual(content.count(MANAGED_BLOCK_BEGIN_MARKER), 1)
+
+    def test_remove_only_conflicting_names_from_unmanaged_entries(self) -> None:
+        hosts_file = self.create_hosts_file()
+        hosts_file.add_entry("192.168.1.200", ["node1"])
+        content = hosts_file.render(
+            "127.0.0.1\tlocalhost\n"
+            + "192.168.1.200\tnas nas.local backup\n"
+            + "10.0.0.5\tnode1 node1.lan # lab network\n"
+            + "10.0.0.6\tnode1\n"
+        )
+
+        self.assertEqual(
+            content,
+            "127.0.0.1\tlocalhost\n"
+            + "192.168.1.200\tnas nas.local backup\n"
+            + "10.0.0.5\tnode1.lan # lab network\n\n"
+            + f"{MANAGED_BLOCK_BEGIN_MARKER}\n"
+            + "192.168.1.200\tnode1\n"
+            + f"{MANAGED_BLOCK_END_MARKER}\n",
+        )
+
+    def test_deduplicate_pending_entries(self) -> None:
+        hosts_file = self.create_hosts_file()
+        hosts_file.add_entry("192.168.1.200", ["node1"])
+        hosts_file.add_entry("192.168.1.201", ["node1"])
+        hosts_file.add_entry("192.168.1.201", ["node1"])
+        content = hosts_file.render("")
+        self.assertEqual(content.count("node1"), 1)
+        self.assertIn("192.168.1.201\tnode1\n", content)
+
+    def test_flush_many_entries_with_single_privileged_command(self) -> None:
+        hosts_file = self.create_hosts_file()
+        for i in range(20):
+            hosts_file.add_entry(f"192.168.1.{200 + i}", [f"node{i}"])
+
+        self.assertTrue(hosts_file.flush())
+        self.assertEqual(len(self.process.commands), 1)
+        self.assertTrue(self.process.commands[0].startswith("sudo "))
+        self.assertIn(f"mv -f {self.hosts_file_path}.provisioner {self.hosts_file_path}", self.process.commands[0])
+        self.assertFalse(hosts_file.has_pending_entries())
+
+    def test_remove_staging_dir_when_privileged_write_fails(self) -> None:
+        staging_dirs = []
+
+        def failing_run_fn(args: List[str], allow_single_shell_command_str: bool = False) -> str:
+            staging_dirs.append(os.path.dirname(args[0].split()[6]))
+            raise Exception("sudo: a password is required")
+
+        self.process.run_fn = failing_run_fn
+        hosts_file = self.create_hosts_file()
+        hosts_file.add_entry("192.168.1.200", ["node1"])
+
+        with self.assertRaisesRegex(Exception, "password is required"):
+            hosts_file.flush()
+        self.assertEqual(len(staging_dirs), 1)
+        self.assertTrue(os.path.basename(staging_dirs[0]).startswith("provisioner-hosts"))
+        self.assertFalse(os.path.exists(staging_dirs[0]))
+
+    def test_skip_write_when_entries_already_present(self) -> None:
+        hosts_file = self.create_hosts_file()
+        hosts_file.add_entry("192.168.1.200", ["node1"])
+        with open(self.hosts_file_path, "w") as f:
+            f.write(hosts_file.render(SYSTEM_HOSTS_CONTENT))
+
+        self.assertFalse(hosts_file.flush())
+        self.assertEqual(self.process.commands, [])
+
+    def test_skip_write_on_dry_run(self) -> None:
+        hosts_file = self.create_hosts_file(dry_run=True)
+        hosts_file.add_entry("192.168.1.200", ["node1"])
+        self.assertFalse(hosts_file.flush())
+        self.assertEqual(self.process.commands, [])
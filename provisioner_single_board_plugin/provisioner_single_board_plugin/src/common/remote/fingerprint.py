@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from typing import Dict, List, Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import run_ssh_command
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# Relative to the remote user home directory, no privilege escalation is needed to read or write it
+DESIRED_STATE_FINGERPRINT_DIR = "~/.provisioner/fingerprints"
+DEFAULT_FINGERPRINT_SSH_TIMEOUT_SECONDS = 5
+DEFAULT_FINGERPRINT_MAX_WORKERS = 10
+
+# Roles are shipped by the shared package, a new version may change their outcome
+ROLES_PACKAGE_NAME = "provisioner_shared"
+
+# Playbook fragment, formatted by the Ansible runner hence the escaped Jinja braces.
+# Plays run pre_tasks, roles, tasks and post_tasks in this order, the fingerprint is stored once all
+# roles succeeded and before any reboot is scheduled. The per host value is derived on the node from the
+# shared base so a single extra var serves a whole fleet, see DesiredStateFingerprint.for_host.
+ANSIBLE_TASKS_STORE_DESIRED_STATE_FINGERPRINT = f"""
+  tasks:
+    - name: Create desired state fingerprint directory
+      file:
+        path: "{DESIRED_STATE_FINGERPRINT_DIR}"
+        state: directory
+        mode: '0700'
+      become: no
+      when: desired_state_fingerprint_base is defined
+      tags: ['always']
+
+    - name: Store desired state fingerprint
+      copy:
+        content: "{{{{{{{{ (desired_state_fingerprint_base ~ ':' ~ inventory_hostname) | hash('sha256') }}}}}}}}"
+        dest: "{DESIRED_STATE_FINGERPRINT_DIR}/{{{{{{{{ desired_state_operation }}}}}}}}"
+        mode: '0600'
+      become: no
+      when: desired_state_fingerprint_base is defined
+      tags: ['always']
+"""
+
+
+class DesiredStateFingerprint:
+    """
+    Hash of everything that defines the outcome of a configure operation: the operation name, the playbook
+    content, the roles package version and the role inputs. A node whose stored fingerprint equals the
+    expected one already matches the desired state and the playbook run can be skipped.
+    """
+
+    operation: str
+    base: str
+
+    def __init__(self, operation: str, playbook_content: str, inputs: Dict[str, str]) -> None:
+        self.operation = operation
+        payload = json.dumps(
+            {
+                "operation": operation,
+                "playbook": playbook_content,
+                "roles_version": _get_roles_package_version(),
+                "inputs": inputs,
+            },
+            sort_keys=True,
+        )
+        self.base = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def for_host(self, host_name: str) -> str:
+        """Must match the value computed by the playbook fragment from the inventory host name"""
+        return hashlib.sha256(f"{self.base}:{host_name}".encode("utf-8")).hexdigest()
+
+    def to_ansible_vars(self) -> List[str]:
+        return [
+            f"desired_state_operation={self.operation}",
+            f"desired_state_fingerprint_base={self.base}",
+        ]
+
+
+class RemoteFingerprintReader:
+    """Read stored fingerprints with a single SSH command per host, without starting Ansible"""
+
+    timeout_seconds: float
+    max_workers: int
+
+    def __init__(
+        self,
+        timeout_seconds: Optional[float] = DEFAULT_FINGERPRINT_SSH_TIMEOUT_SECONDS,
+        max_workers: Optional[int] = DEFAULT_FINGERPRINT_MAX_WORKERS,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.max_workers = max_workers
+
+    def read(self, ansible_host: AnsibleHost, operation: str) -> Optional[str]:
+        try:
+            fingerprint = run_ssh_command(
+                ansible_host,
+                f"cat {DESIRED_STATE_FINGERPRINT_DIR}/{operation} 2>/dev/null || true",
+                self.timeout_seconds,
+            )
+            return fingerprint if fingerprint else None
+        except Exception as ex:
+            # Any failure means the state is unknown, the node is treated as not converged
+            logger.debug(f"Failed to read desired state fingerprint. host: {ansible_host.host}, error: {ex}")
+            return None
+
+    def read_many(self, ansible_hosts: List[AnsibleHost], operation: str) -> Dict[str, Optional[str]]:
+        if not ansible_hosts:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ansible_hosts))) as executor:
+            fingerprints = executor.map(lambda host: self.read(host, operation), ansible_hosts)
+            return {host.host: fingerprint for host, fingerprint in zip(ansible_hosts, fingerprints)}
+
+
+def _get_roles_package_version() -> str:
+    try:
+        return metadata.version(ROLES_PACKAGE_NAME)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def find_converged_hosts(
+    ansible_hosts: List[AnsibleHost],
+    fingerprint: DesiredStateFingerprint,
+    reader: Optional[RemoteFingerprintReader] = None,
+) -> List[AnsibleHost]:
+    reader = reader if reader else RemoteFingerprintReader()
+    stored = reader.read_many(ansible_hosts, fingerprint.operation)
+    return [host for host in ansible_hosts if stored.get(host.host) == fingerprint.for_host(host.host)]
+
+
+def generate_instructions_converged(ansible_host: AnsibleHost) -> str:
+    return (
+        f"Node [yellow]{ansible_host.host}[/yellow] ([yellow]{ansible_host.ip_address}[/yellow]) already matches "
+        + "the desired state, nothing to configure (use --force to run anyway)"
+    )
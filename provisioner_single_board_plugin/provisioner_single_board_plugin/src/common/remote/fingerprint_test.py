@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import socket
+import unittest
+from typing import Dict, Optional
+
+from ansible.plugins.filter.core import get_hash
+from provisioner_single_board_plugin.src.common.remote.fingerprint import (
+    DesiredStateFingerprint,
+    RemoteFingerprintReader,
+    find_converged_hosts,
+)
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/fingerprint_test.py
+#
+
+TEST_OPERATION = "rpi_configure_node"
+TEST_PLAYBOOK_CONTENT = "- name: Test playbook"
+
+
+class FakeRemoteFingerprintReader(RemoteFingerprintReader):
+
+    def __init__(self, stored: Dict[str, Optional[str]]) -> None:
+        super().__init__()
+        self.stored = stored
+        self.read_hosts = []
+
+    def read(self, ansible_host: AnsibleHost, operation: str) -> Optional[str]:
+        self.read_hosts.append(ansible_host.host)
+        return self.stored.get(ansible_host.host)
+
+
+def create_fingerprint(**inputs) -> DesiredStateFingerprint:
+    return DesiredStateFingerprint(operation=TEST_OPERATION, playbook_content=TEST_PLAYBOOK_CONTENT, inputs=inputs)
+
+
+class DesiredStateFingerprintTestShould(unittest.TestCase):
+
+    def test_same_inputs_produce_same_fingerprint_regardless_of_order(self) -> None:
+        first = DesiredStateFingerprint(
+            TEST_OPERATION, TEST_PLAYBOOK_CONTENT, {"static_ip": "1.1.1.1", "dns": "2.2.2.2"}
+        )
+        second = DesiredStateFingerprint(
+            TEST_OPERATION, TEST_PLAYBOOK_CONTENT, {"dns": "2.2.2.2", "static_ip": "1.1.1.1"}
+        )
+        self.assertEqual(first.base, second.base)
+
+    def test_any_input_change_produces_different_fingerprint(self) -> None:
+        fingerprint = create_fingerprint(static_ip="1.1.1.1")
+        self.assertNotEqual(fingerprint.base, create_fingerprint(static_ip="1.1.1.2").base)
+        self.assertNotEqual(
+            fingerprint.base,
+            DesiredStateFingerprint(TEST_OPERATION, TEST_PLAYBOOK_CONTENT + " changed", {"static_ip": "1.1.1.1"}).base,
+        )
+        self.assertNotEqual(fingerprint.for_host("node1"), fingerprint.for_host("node2"))
+
+    def test_host_fingerprint_matches_ansible_hash_filter(self) -> None:
+        fingerprint = create_fingerprint(host_name="node1")
+        self.assertEqual(fingerprint.for_host("node1"), get_hash(f"{fingerprint.base}:node1", "sha256"))
+
+    def test_ansible_vars_carry_operation_and_base(self) -> None:
+        fingerprint = create_fingerprint()
+        self.assertEqual(
+            fingerprint.to_ansible_vars(),
+            [f"desired_state_operation={TEST_OPERATION}", f"desired_state_fingerprint_base={fingerprint.base}"],
+        )
+
+    def test_find_only_hosts_with_matching_stored_fingerprint(self) -> None:
+        fingerprint = create_fingerprint()
+        hosts = [AnsibleHost(host=f"node{i}", ip_address=f"10.0.0.{i}") for i in range(3)]
+        reader = FakeRemoteFingerprintReader(
+            {"node0": fingerprint.for_host("node0"), "node1": fingerprint.for_host("other"), "node2": None}
+        )
+        converged = find_converged_hosts(hosts, fingerprint, reader)
+        self.assertEqual([host.host for host in converged], ["node0"])
+        self.assertEqual(sorted(reader.read_hosts), ["node0", "node1", "node2"])
+
+    def test_unreachable_host_is_not_converged(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        closed_port = sock.getsockname()[1]
+        sock.close()
+
+        host = AnsibleHost(host="node1", ip_address="127.0.0.1", port=closed_port, username="pi", password="secret")
+        self.assertIsNone(RemoteFingerprintReader(timeout_seconds=1).read(host, TEST_OPERATION))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import ipaddress
+from typing import Dict, List, Optional, Set
+
+from provisioner_shared.components.runtime.errors.cli_errors import CliApplicationException
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+IP_POOL_RANGE_SEPARATOR = "-"
+IP_POOL_LIST_SEPARATOR = ","
+
+
+class IpPool:
+    """
+    Ordered set of IPv4 addresses static IPs are assigned from. Supported formats:
+      - CIDR.........: 192.168.1.200/29 (network and broadcast addresses are excluded)
+      - Range........: 192.168.1.200-192.168.1.210 (inclusive)
+      - List.........: 192.168.1.200,192.168.1.201
+    """
+
+    addresses: List[str]
+    scan_ranges: List[str]
+
+    def __init__(self, addresses: List[str], scan_ranges: List[str]) -> None:
+        self.addresses = addresses
+        self.scan_ranges = scan_ranges
+
+    @staticmethod
+    def parse(pool: str) -> "IpPool":
+        if not pool or not pool.strip():
+            raise CliApplicationException("IP pool must not be empty")
+        pool = pool.strip()
+        try:
+            if IP_POOL_LIST_SEPARATOR in pool:
+                addresses = [ipaddress.IPv4Address(item.strip()) for item in pool.split(IP_POOL_LIST_SEPARATOR)]
+                addresses = list(dict.fromkeys(addresses))
+                return IpPool(
+                    addresses=[str(address) for address in addresses],
+                    scan_ranges=[f"{address}/32" for address in addresses],
+                )
+
+            if IP_POOL_RANGE_SEPARATOR in pool:
+                first, last = [ipaddress.IPv4Address(item.strip()) for item in pool.split(IP_POOL_RANGE_SEPARATOR, 1)]
+                if last < first:
+                    raise CliApplicationException(f"IP pool range end is lower than its start. pool: {pool}")
+                return IpPool(
+                    addresses=[str(ipaddress.IPv4Address(value)) for value in range(int(first), int(last) + 1)],
+                    scan_ranges=[str(network) for network in ipaddress.summarize_address_range(first, last)],
+                )
+
+            network = ipaddress.IPv4Network(pool, strict=False)
+            hosts = list(network.hosts()) if network.num_addresses > 2 else list(network)
+            return IpPool(addresses=[str(address) for address in hosts], scan_ranges=[str(network)])
+        except ValueError as ex:
+            raise CliApplicationException(f"Invalid IP pool. pool: {pool}, error: {ex}")
+
+
+def assign_static_ips(
+    ansible_hosts: List[AnsibleHost],
+    ip_pool: IpPool,
+    occupied_addresses: Optional[Set[str]] = None,
+    reserved_addresses: Optional[Set[str]] = None,
+) -> Dict[str, str]:
+    """
+    Deterministic host name to static IP address assignment.
+
+    Hosts already using an address from the pool keep it so repeated runs are stable. The remaining
+    hosts get the lowest free pool addresses in host order. Addresses answered by other LAN devices
+    (occupied) and infrastructure addresses such as the gateway and DNS (reserved) are never assigned.
+    """
+    occupied_addresses = occupied_addresses if occupied_addresses else set()
+    reserved_addresses = reserved_addresses if reserved_addresses else set()
+    pool_addresses = set(ip_pool.addresses)
+
+    assignments: Dict[str, str] = {}
+    for host in ansible_hosts:
+        if host.ip_address in pool_addresses and host.ip_address not in reserved_addresses:
+            if host.ip_address not in assignments.values():
+                assignments[host.host] = host.ip_address
+
+    # Addresses of hosts being configured are about to be released, they are not conflicts
+    fleet_addresses = {host.ip_address for host in ansible_hosts}
+    taken = set(assignments.values()) | reserved_addresses | (occupied_addresses - fleet_addresses)
+    free_addresses = iter([address for address in ip_pool.addresses if address not in taken])
+    for host in ansible_hosts:
+        if host.host in assignments:
+            continue
+        address = next(free_addresses, None)
+        if address is None:
+            raise CliApplicationException(
+                f"IP pool exhausted, no free address left for host {host.host} "
+                + f"(pool size: {len(ip_pool.addresses)}, occupied: {sorted(occupied_addresses & pool_addresses)})"
+            )
+        assignments[host.host] = address
+    return assignments
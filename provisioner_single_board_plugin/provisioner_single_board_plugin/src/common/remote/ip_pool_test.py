@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from provisioner_single_board_plugin.src.common.remote.ip_pool import IpPool, assign_static_ips
+
+from provisioner_shared.components.runtime.errors.cli_errors import CliApplicationException
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/ip_pool_test.py
+#
+
+
+def create_hosts(*ip_addresses: str):
+    return [AnsibleHost(host=f"node{i}", ip_address=ip_address) for i, ip_address in enumerate(ip_addresses)]
+
+
+class IpPoolTestShould(unittest.TestCase):
+
+    def test_parse_cidr_without_network_and_broadcast(self) -> None:
+        pool = IpPool.parse("192.168.1.200/29")
+        self.assertEqual(pool.addresses[0], "192.168.1.201")
+        self.assertEqual(pool.addresses[-1], "192.168.1.206")
+        self.assertEqual(pool.scan_ranges, ["192.168.1.200/29"])
+
+    def test_parse_inclusive_range(self) -> None:
+        pool = IpPool.parse("192.168.1.200 - 192.168.1.203")
+        self.assertEqual(pool.addresses, ["192.168.1.200", "192.168.1.201", "192.168.1.202", "192.168.1.203"])
+        self.assertEqual(pool.scan_ranges, ["192.168.1.200/30"])
+
+    def test_parse_address_list(self) -> None:
+        pool = IpPool.parse("192.168.1.210,192.168.1.205,192.168.1.210")
+        self.assertEqual(pool.addresses, ["192.168.1.210", "192.168.1.205"])
+
+    def test_fail_on_invalid_pool(self) -> None:
+        for pool in ["", "not-an-ip", "192.168.1.210-192.168.1.200", "192.168.1.300/24"]:
+            with self.assertRaises(CliApplicationException):
+                IpPool.parse(pool)
+
+    def test_assign_lowest_free_addresses_in_host_order(self) -> None:
+        hosts = create_hosts("192.168.1.50", "192.168.1.51", "192.168.1.52")
+        assignments = assign_static_ips(
+            hosts,
+            IpPool.parse("192.168.1.200-192.168.1.205"),
+            occupied_addresses={"192.168.1.201", "192.168.1.50"},
+            reserved_addresses={"192.168.1.200"},
+        )
+        self.assertEqual(assignments, {"node0": "192.168.1.202", "node1": "192.168.1.203", "node2": "192.168.1.204"})
+
+    def test_hosts_already_in_pool_keep_their_address(self) -> None:
+        hosts = create_hosts("192.168.1.50", "192.168.1.202")
+        assignments = assign_static_ips(
+            hosts, IpPool.parse("192.168.1.200-192.168.1.205"), occupied_addresses={"192.168.1.202"}
+        )
+        self.assertEqual(assignments, {"node0": "192.168.1.200", "node1": "192.168.1.202"})
+
+    def test_fail_when_pool_is_exhausted(self) -> None:
+        with self.assertRaises(CliApplicationException):
+            assign_static_ips(
+                create_hosts("192.168.1.50", "192.168.1.51"),
+                IpPool.parse("192.168.1.200,192.168.1.201"),
+                occupied_addresses={"192.168.1.201"},
+            )
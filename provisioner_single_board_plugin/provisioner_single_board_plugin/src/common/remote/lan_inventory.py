@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.lan_scanner import LanHost, LanScanner
+from provisioner_single_board_plugin.src.config.domain.config import SingleBoardLanInventoryConfig
+
+from provisioner_shared.components.remote.remote_connector import RemoteMachineConnector
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+ProvisionerLanInventoryPath = os.path.expanduser("~/.config/provisioner/cache/lan_inventory.json")
+
+DEFAULT_LAN_INVENTORY_TTL_SECONDS = 600
+
+
+class LanHostInventory:
+    """
+    Local cache of LAN scan results, keyed by the scanned IP range.
+
+    Structure -
+
+    {
+      "ranges": {
+        "192.168.1.1/24": {
+          "scanned_at": 1700000000.0,
+          "hosts": [ {ip_address, hostname, mac_address, ssh_banner, last_seen}, ... ]
+        }
+      }
+    }
+    """
+
+    path: str
+    ttl_seconds: int
+
+    def __init__(
+        self,
+        path: Optional[str] = ProvisionerLanInventoryPath,
+        ttl_seconds: Optional[int] = DEFAULT_LAN_INVENTORY_TTL_SECONDS,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else DEFAULT_LAN_INVENTORY_TTL_SECONDS
+
+    def get_fresh_hosts(self, ip_range: str, now: Optional[float] = None) -> Optional[List[LanHost]]:
+        """Return the cached hosts of a range, None if the range was never scanned or the entry expired"""
+        entry = self._read().get("ranges", {}).get(ip_range)
+        if entry is None:
+            return None
+
+        age = (now if now is not None else time.time()) - entry.get("scanned_at", 0)
+        if age > self.ttl_seconds:
+            logger.debug(f"LAN inventory entry is stale. range: {ip_range}, age: {age:.0f}s, ttl: {self.ttl_seconds}s")
+            return None
+        return [LanHost.from_dict(host_dict) for host_dict in entry.get("hosts", [])]
+
+    def get_all_hosts(self) -> List[LanHost]:
+        """Return every cached host regardless of age, latest sighting wins on duplicate addresses"""
+        by_ip: dict[str, LanHost] = {}
+        for entry in self._read().get("ranges", {}).values():
+            for host_dict in entry.get("hosts", []):
+                host = LanHost.from_dict(host_dict)
+                known = by_ip.get(host.ip_address)
+                if known is None or (host.last_seen or 0) > (known.last_seen or 0):
+                    by_ip[host.ip_address] = host
+        return list(by_ip.values())
+
+    def store(self, ip_range: str, hosts: List[LanHost], now: Optional[float] = None) -> None:
+        content = self._read()
+        content.setdefault("ranges", {})[ip_range] = {
+            "scanned_at": now if now is not None else time.time(),
+            "hosts": [host.to_dict() for host in hosts],
+        }
+        self._write_atomic(content)
+
+    def _read(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError) as ex:
+            logger.warning(f"Ignoring unreadable LAN inventory cache. path: {self.path}, error: {ex}")
+            return {}
+
+    def _write_atomic(self, content: dict) -> None:
+        dir_path = os.path.dirname(self.path)
+        os.makedirs(dir_path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix=".lan_inventory.")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(content, tmp_file, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class LanInventoryRemoteMachineConnector(RemoteMachineConnector):
+    """
+    Remote machine connector that answers LAN scan host selection from the local inventory cache.
+    A new scan runs only when the cached entry of the requested range is missing or stale.
+    """
+
+    inventory: LanHostInventory = None
+    scanner: LanScanner = None
+
+    def __init__(
+        self,
+        collaborators: CoreCollaborators,
+        inventory: Optional[LanHostInventory] = None,
+        scanner: Optional[LanScanner] = None,
+    ) -> None:
+        super().__init__(collaborators)
+        self.inventory = inventory if inventory is not None else LanHostInventory()
+        self.scanner = scanner if scanner is not None else LanScanner()
+
+    @staticmethod
+    def create(
+        collaborators: CoreCollaborators, lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None
+    ) -> "LanInventoryRemoteMachineConnector":
+        if lan_inventory_cfg is None:
+            return LanInventoryRemoteMachineConnector(collaborators)
+        return LanInventoryRemoteMachineConnector(
+            collaborators=collaborators,
+            inventory=LanHostInventory(ttl_seconds=lan_inventory_cfg.ttl_seconds),
+            scanner=LanScanner(
+                concurrency=lan_inventory_cfg.concurrency,
+                probe_timeout_seconds=lan_inventory_cfg.probe_timeout_seconds,
+                ssh_port=lan_inventory_cfg.ssh_port,
+            ),
+        )
+
+    def _run_lan_scan_host_selection(
+        self, ip_discovery_range: str, dns_server: str, force_single_conn_info: bool
+    ) -> List[AnsibleHost]:
+        hosts = self.resolve_lan_hosts(ip_discovery_range)
+        self.collaborators.printer().new_line_fn()
+
+        # Remote commands need SSH, prefer hosts that answered on the SSH port
+        ssh_hosts = [host for host in hosts if host.is_ssh_open()]
+        selectable_hosts = ssh_hosts if len(ssh_hosts) > 0 else hosts
+
+        options_list: List[str] = []
+        option_to_value_dict: dict[str, dict] = {}
+        for host in selectable_hosts:
+            hostname = host.hostname if host.hostname else host.ip_address
+            identifier = f"{hostname}, {host.ip_address}"
+            if host.mac_address:
+                identifier += f", {host.mac_address}"
+            options_list.append(identifier)
+            option_to_value_dict[identifier] = {
+                "hostname": hostname,
+                "ip_address": host.ip_address,
+                "port": self.scanner.ssh_port,
+            }
+
+        return self._convert_prompted_host_selection_to_ansible_hosts(
+            options_list=options_list,
+            option_to_value_dict=option_to_value_dict,
+            force_single_conn_info=force_single_conn_info,
+        )
+
+    def resolve_lan_hosts(self, ip_discovery_range: str) -> List[LanHost]:
+        hosts = self.inventory.get_fresh_hosts(ip_discovery_range)
+        if hosts is not None:
+            self.collaborators.printer().print_fn(
+                f"Using cached LAN inventory for range {ip_discovery_range} ({len(hosts)} hosts)"
+            )
+            return hosts
+
+        self.collaborators.printer().print_with_rich_table_fn(
+            generate_instructions_lan_inventory_scan(
+                ip_discovery_range=ip_discovery_range,
+                concurrency=self.scanner.concurrency,
+                ttl_seconds=self.inventory.ttl_seconds,
+            )
+        )
+        hosts = (
+            self.collaborators.progress_indicator()
+            .get_status()
+            .long_running_process_fn(
+                call=lambda: self.scanner.scan(ip_discovery_range),
+                desc_run=f"Scanning LAN range {ip_discovery_range}",
+                desc_end="LAN scan finished.",
+            )
+        )
+        self.inventory.store(ip_discovery_range, hosts)
+        return hosts
+
+
+def generate_instructions_lan_inventory_scan(ip_discovery_range: str, concurrency: int, ttl_seconds: int) -> str:
+    return f"""
+  No fresh LAN inventory for range [yellow]{ip_discovery_range}[/yellow], scanning concurrently ({concurrency} probes).
+
+  This step probes every address on the SSH port and lists the following:
+
+    • IP Address
+    • Device Name
+    • MAC Address
+    • SSH Banner
+
+  Results are cached locally for [yellow]{ttl_seconds}[/yellow] seconds.
+"""
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanHostInventory
+from provisioner_single_board_plugin.src.common.remote.lan_scanner import LanHost, LanScanner
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/lan_inventory_test.py
+#
+TEST_IP_RANGE = "192.168.1.1/24"
+TEST_SSH_BANNER = "SSH-2.0-OpenSSH_9.2p1 Raspbian-2"
+
+
+def create_fake_lan_host(ip_address: str = "192.168.1.200", last_seen: float = 1000.0) -> LanHost:
+    return LanHost(
+        ip_address=ip_address,
+        hostname="rpi-node",
+        mac_address="dc:a6:32:00:00:01",
+        ssh_banner=TEST_SSH_BANNER,
+        last_seen=last_seen,
+    )
+
+
+class FakeSSHServer:
+    """Minimal TCP server that greets every connection with an SSH banner"""
+
+    def __init__(self, banner: str) -> None:
+        self.banner = banner
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(16)
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with conn:
+                conn.sendall(f"{self.banner}\r\n".encode())
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class LanHostInventoryTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, "cache", "lan_inventory.json")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_return_none_when_range_was_never_scanned(self) -> None:
+        inventory = LanHostInventory(path=self.cache_path, ttl_seconds=60)
+        self.assertIsNone(inventory.get_fresh_hosts(TEST_IP_RANGE))
+
+    def test_return_cached_hosts_within_ttl(self) -> None:
+        inventory = LanHostInventory(path=self.cache_path, ttl_seconds=60)
+        inventory.store(TEST_IP_RANGE, [create_fake_lan_host()], now=1000.0)
+
+        hosts = inventory.get_fresh_hosts(TEST_IP_RANGE, now=1059.0)
+        self.assertEqual(len(hosts), 1)
+        self.assertEqual(hosts[0].to_dict(), create_fake_lan_host().to_dict())
+
+    def test_return_none_when_cached_entry_is_stale(self) -> None:
+        inventory = LanHostInventory(path=self.cache_path, ttl_seconds=60)
+        inventory.store(TEST_IP_RANGE, [create_fake_lan_host()], now=1000.0)
+        self.assertIsNone(inventory.get_fresh_hosts(TEST_IP_RANGE, now=1061.0))
+
+    def test_keep_other_ranges_when_storing(self) -> None:
+        inventory = LanHostInventory(path=self.cache_path, ttl_seconds=60)
+        inventory.store(TEST_IP_RANGE, [create_fake_lan_host()], now=1000.0)
+        inventory.store("10.0.0.1/24", [create_fake_lan_host(ip_address="10.0.0.5")], now=1000.0)
+
+        self.assertIsNotNone(inventory.get_fresh_hosts(TEST_IP_RANGE, now=1000.0))
+        self.assertEqual(len(inventory.get_all_hosts()), 2)
+
+    def test_ignore_corrupted_cache_file(self) -> None:
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w") as cache_file:
+            cache_file.write("{not-json")
+        inventory = LanHostInventory(path=self.cache_path, ttl_seconds=60)
+        self.assertIsNone(inventory.get_fresh_hosts(TEST_IP_RANGE))
+
+
+class LanScannerTestShould(unittest.TestCase):
+
+    def test_collect_ssh_banner_from_listening_host(self) -> None:
+        server = FakeSSHServer(banner=TEST_SSH_BANNER)
+        try:
+            scanner = LanScanner(concurrency=4, probe_timeout_seconds=1.0, ssh_port=server.port, arp_table_path=None)
+            hosts = scanner.scan("127.0.0.1/32")
+        finally:
+            server.close()
+
+        self.assertEqual(len(hosts), 1)
+        self.assertEqual(hosts[0].ip_address, "127.0.0.1")
+        self.assertEqual(hosts[0].ssh_banner, TEST_SSH_BANNER)
+        self.assertTrue(hosts[0].is_ssh_open())
+        self.assertIsNotNone(hosts[0].last_seen)
+
+    def test_report_alive_host_without_ssh_when_port_is_refused(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        closed_port = sock.getsockname()[1]
+        sock.close()
+
+        scanner = LanScanner(concurrency=4, probe_timeout_seconds=1.0, ssh_port=closed_port, arp_table_path=None)
+        hosts = scanner.scan("127.0.0.1/32")
+
+        self.assertEqual(len(hosts), 1)
+        self.assertFalse(hosts[0].is_ssh_open())
+
+    def test_read_complete_entries_from_arp_table(self) -> None:
+        with tempfile.NamedTemporaryFile("w", suffix="arp", delete=False) as arp_file:
+            arp_file.write(
+                "IP address       HW type     Flags       HW address            Mask     Device\n"
+                "192.168.1.10     0x1         0x2         dc:a6:32:00:00:0a     *        eth0\n"
+                "192.168.1.11     0x1         0x0         00:00:00:00:00:00     *        eth0\n"
+            )
+        try:
+            arp_table = LanScanner(arp_table_path=arp_file.name)._read_arp_table()
+        finally:
+            os.remove(arp_file.name)
+
+        self.assertEqual(arp_table, {"192.168.1.10": "dc:a6:32:00:00:0a"})
+
+    def test_expand_ip_range_to_usable_hosts(self) -> None:
+        addresses = LanScanner()._expand_ip_range("192.168.1.1/30")
+        self.assertEqual(addresses, ["192.168.1.1", "192.168.1.2"])
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+import asyncio
+import ipaddress
+import os
+import socket
+import time
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+DEFAULT_LAN_SCAN_CONCURRENCY = 128
+DEFAULT_LAN_SCAN_PROBE_TIMEOUT_SECONDS = 1.0
+DEFAULT_LAN_SCAN_SSH_PORT = 22
+
+LINUX_ARP_TABLE_PATH = "/proc/net/arp"
+ARP_FLAG_COMPLETE = 0x2
+ARP_EMPTY_MAC_ADDRESS = "00:00:00:00:00:00"
+
+
+class LanHost:
+    ip_address: str
+    hostname: str
+    mac_address: str
+    ssh_banner: str
+    last_seen: float
+
+    def __init__(
+        self,
+        ip_address: str,
+        hostname: Optional[str] = None,
+        mac_address: Optional[str] = None,
+        ssh_banner: Optional[str] = None,
+        last_seen: Optional[float] = None,
+    ) -> None:
+        self.ip_address = ip_address
+        self.hostname = hostname
+        self.mac_address = mac_address
+        self.ssh_banner = ssh_banner
+        self.last_seen = last_seen
+
+    def is_ssh_open(self) -> bool:
+        return self.ssh_banner is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "ip_address": self.ip_address,
+            "hostname": self.hostname,
+            "mac_address": self.mac_address,
+            "ssh_banner": self.ssh_banner,
+            "last_seen": self.last_seen,
+        }
+
+    @staticmethod
+    def from_dict(host_dict: dict) -> "LanHost":
+        return LanHost(
+            ip_address=host_dict["ip_address"],
+            hostname=host_dict.get("hostname"),
+            mac_address=host_dict.get("mac_address"),
+            ssh_banner=host_dict.get("ssh_banner"),
+            last_seen=host_dict.get("last_seen"),
+        )
+
+
+class LanScanner:
+    """
+    Concurrent LAN scanner based on asyncio.
+
+    Every address in the range gets a TCP connect probe on the SSH port, bounded by a
+    semaphore so that large ranges do not exhaust file descriptors. A refused connection
+    still proves the host is alive. Hosts that drop the probe are resolved from the kernel
+    ARP table, which the probes themselves populate, so no raw ICMP socket (root) is needed.
+    """
+
+    concurrency: int
+    probe_timeout_seconds: float
+    ssh_port: int
+    arp_table_path: str
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = DEFAULT_LAN_SCAN_CONCURRENCY,
+        probe_timeout_seconds: Optional[float] = DEFAULT_LAN_SCAN_PROBE_TIMEOUT_SECONDS,
+        ssh_port: Optional[int] = DEFAULT_LAN_SCAN_SSH_PORT,
+        arp_table_path: Optional[str] = LINUX_ARP_TABLE_PATH,
+    ) -> None:
+        self.concurrency = concurrency if concurrency and concurrency > 0 else DEFAULT_LAN_SCAN_CONCURRENCY
+        self.probe_timeout_seconds = probe_timeout_seconds or DEFAULT_LAN_SCAN_PROBE_TIMEOUT_SECONDS
+        self.ssh_port = ssh_port or DEFAULT_LAN_SCAN_SSH_PORT
+        self.arp_table_path = arp_table_path
+
+    def scan(self, ip_range: str) -> List[LanHost]:
+        addresses = self._expand_ip_range(ip_range)
+        logger.debug(f"Scanning LAN range. range: {ip_range}, addresses: {len(addresses)}, workers: {self.concurrency}")
+        started = time.monotonic()
+        hosts = asyncio.run(self._scan_addresses(addresses))
+        logger.debug(f"LAN scan finished. alive: {len(hosts)}, elapsed: {time.monotonic() - started:.2f}s")
+        return hosts
+
+    async def _scan_addresses(self, addresses: List[str]) -> List[LanHost]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        probe_results = await asyncio.gather(*[self._probe_host(semaphore, address) for address in addresses])
+        arp_table = self._read_arp_table()
+        now = time.time()
+
+        hosts: List[LanHost] = []
+        for address, (alive, ssh_banner) in zip(addresses, probe_results):
+            mac_address = arp_table.get(address)
+            if not alive and mac_address is None:
+                continue
+            hosts.append(LanHost(ip_address=address, mac_address=mac_address, ssh_banner=ssh_banner, last_seen=now))
+
+        hostnames = await asyncio.gather(*[self._resolve_hostname(semaphore, host.ip_address) for host in hosts])
+        for host, hostname in zip(hosts, hostnames):
+            host.hostname = hostname
+        return hosts
+
+    async def _probe_host(self, semaphore: asyncio.Semaphore, ip_address: str) -> tuple[bool, Optional[str]]:
+        async with semaphore:
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(ip_address, self.ssh_port), timeout=self.probe_timeout_seconds
+                )
+            except ConnectionRefusedError:
+                return (True, None)
+            except (asyncio.TimeoutError, OSError):
+                return (False, None)
+
+            try:
+                banner = await asyncio.wait_for(reader.readline(), timeout=self.probe_timeout_seconds)
+                ssh_banner = banner.decode(errors="replace").strip()
+            except (asyncio.TimeoutError, OSError):
+                ssh_banner = ""
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+            return (True, ssh_banner)
+
+    async def _resolve_hostname(self, semaphore: asyncio.Semaphore, ip_address: str) -> Optional[str]:
+        async with semaphore:
+            try:
+                hostname, _ = await asyncio.wait_for(
+                    asyncio.get_running_loop().getnameinfo((ip_address, 0), socket.NI_NAMEREQD),
+                    timeout=self.probe_timeout_seconds,
+                )
+                return hostname
+            except (asyncio.TimeoutError, OSError):
+                return None
+
+    def _read_arp_table(self) -> Dict[str, str]:
+        result: Dict[str, str] = {}
+        if not self.arp_table_path or not os.path.exists(self.arp_table_path):
+            return result
+
+        with open(self.arp_table_path, "r") as arp_file:
+            # Columns: IP address, HW type, Flags, HW address, Mask, Device
+            for line in arp_file.readlines()[1:]:
+                columns = line.split()
+                if len(columns) < 4:
+                    continue
+                ip_address, flags, mac_address = columns[0], columns[2], columns[3]
+                if int(flags, 16) & ARP_FLAG_COMPLETE and mac_address != ARP_EMPTY_MAC_ADDRESS:
+                    result[ip_address] = mac_address
+        return result
+
+    def _expand_ip_range(self, ip_range: str) -> List[str]:
+        network = ipaddress.ip_network(ip_range, strict=False)
+        if network.num_addresses == 1:
+            return [str(network.network_address)]
+        return [str(address) for address in network.hosts()]
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+import asyncio
+import time
+from typing import List, Optional
+
+from loguru import logger
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+DEFAULT_REACHABILITY_TIMEOUT_SECONDS = 300
+DEFAULT_REACHABILITY_INITIAL_BACKOFF_SECONDS = 0.5
+DEFAULT_REACHABILITY_MAX_BACKOFF_SECONDS = 5.0
+DEFAULT_REACHABILITY_PROBE_TIMEOUT_SECONDS = 2.0
+DEFAULT_REACHABILITY_SHUTDOWN_GRACE_SECONDS = 60.0
+
+# Delay used by the playbooks when scheduling a detached reboot on a single node
+REBOOT_TRIGGER_DELAY_SECONDS = 2
+
+SSH_BANNER_PREFIX = b"SSH-"
+
+
+class ReachabilityTarget:
+    """
+    A rebooting host that may come back on any of its candidate addresses,
+    e.g. the address it was reached on and the newly assigned static IP address.
+    """
+
+    name: str
+    addresses: List[str]
+    port: int
+    reboot_delay_seconds: float
+
+    def __init__(
+        self, name: str, addresses: List[str], port: Optional[int] = 22, reboot_delay_seconds: Optional[float] = 0
+    ) -> None:
+        self.name = name
+        # Keep order, drop duplicates when the new address equals the old one
+        self.addresses = list(dict.fromkeys([address for address in addresses if address]))
+        self.port = int(port) if port else 22
+        self.reboot_delay_seconds = reboot_delay_seconds or 0
+
+    @staticmethod
+    def from_ansible_host(
+        ansible_host: AnsibleHost, new_ip_address: Optional[str] = None, reboot_delay_seconds: Optional[float] = 0
+    ) -> "ReachabilityTarget":
+        return ReachabilityTarget(
+            name=ansible_host.host,
+            addresses=[ansible_host.ip_address, new_ip_address],
+            port=ansible_host.port,
+            reboot_delay_seconds=reboot_delay_seconds,
+        )
+
+
+class ReadyHost:
+    name: str
+    ip_address: str
+    port: int
+    reboot_to_ready_seconds: float
+    ready: bool
+    rebooted: bool
+
+    def __init__(
+        self,
+        name: str,
+        ip_address: Optional[str],
+        port: int,
+        reboot_to_ready_seconds: Optional[float],
+        ready: bool,
+        rebooted: Optional[bool] = True,
+    ) -> None:
+        self.name = name
+        self.ip_address = ip_address
+        self.port = port
+        self.reboot_to_ready_seconds = reboot_to_ready_seconds
+        self.ready = ready
+        self.rebooted = rebooted
+
+    @staticmethod
+    def without_reboot(ansible_host: AnsibleHost) -> "ReadyHost":
+        """Host whose configuration did not require a reboot, it stays reachable on its current address"""
+        return ReadyHost(
+            name=ansible_host.host,
+            ip_address=ansible_host.ip_address,
+            port=int(ansible_host.port) if ansible_host.port else 22,
+            reboot_to_ready_seconds=None,
+            ready=True,
+            rebooted=False,
+        )
+
+    def to_ansible_host(self, auth_from: AnsibleHost) -> AnsibleHost:
+        """Connection details of the ready host, authentication is carried over from the original host"""
+        return AnsibleHost(
+            host=self.name,
+            ip_address=self.ip_address,
+            port=self.port,
+            username=auth_from.username,
+            password=auth_from.password,
+            ssh_private_key_file_path=auth_from.ssh_private_key_file_path,
+        )
+
+
+class SSHReachabilityPoller:
+    """
+    Poll rebooting hosts until SSH answers, all hosts and all of their candidate addresses concurrently.
+
+    Every target first waits for its scheduled reboot, then for SSH to stop answering (bounded by a
+    shutdown grace period), and then probes its addresses with exponential backoff. The first address
+    that returns an SSH banner wins and the reboot-to-ready latency is recorded on the returned host.
+    """
+
+    timeout_seconds: float
+    initial_backoff_seconds: float
+    max_backoff_seconds: float
+    probe_timeout_seconds: float
+    shutdown_grace_seconds: float
+
+    def __init__(
+        self,
+        timeout_seconds: Optional[float] = DEFAULT_REACHABILITY_TIMEOUT_SECONDS,
+        initial_backoff_seconds: Optional[float] = DEFAULT_REACHABILITY_INITIAL_BACKOFF_SECONDS,
+        max_backoff_seconds: Optional[float] = DEFAULT_REACHABILITY_MAX_BACKOFF_SECONDS,
+        probe_timeout_seconds: Optional[float] = DEFAULT_REACHABILITY_PROBE_TIMEOUT_SECONDS,
+        shutdown_grace_seconds: Optional[float] = DEFAULT_REACHABILITY_SHUTDOWN_GRACE_SECONDS,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.initial_backoff_seconds = initial_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.shutdown_grace_seconds = shutdown_grace_seconds
+
+    def wait_until_ready(self, targets: List[ReachabilityTarget]) -> List[ReadyHost]:
+        return asyncio.run(self._wait_for_all(targets))
+
+    def wait_until_ready_single(self, target: ReachabilityTarget) -> ReadyHost:
+        return self.wait_until_ready([target])[0]
+
+    async def _wait_for_all(self, targets: List[ReachabilityTarget]) -> List[ReadyHost]:
+        return list(await asyncio.gather(*[self._wait_for_target(target) for target in targets]))
+
+    async def _wait_for_target(self, target: ReachabilityTarget) -> ReadyHost:
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(target.reboot_delay_seconds)
+        rebooted_at = time.monotonic()
+        deadline = loop.time() + self.timeout_seconds
+
+        # The reboot is detached on the node, SSH keeps answering until the shutdown actually starts
+        shutdown_deadline = min(deadline, loop.time() + self.shutdown_grace_seconds)
+        while loop.time() < shutdown_deadline and await self._probe_any(target) is not None:
+            await asyncio.sleep(self.initial_backoff_seconds)
+
+        backoff = self.initial_backoff_seconds
+        while loop.time() < deadline:
+            ip_address = await self._probe_any(target)
+            if ip_address is not None:
+                latency = time.monotonic() - rebooted_at
+                logger.debug(f"Host is ready. name: {target.name}, ip: {ip_address}, reboot_to_ready: {latency:.1f}s")
+                return ReadyHost(
+                    name=target.name,
+                    ip_address=ip_address,
+                    port=target.port,
+                    reboot_to_ready_seconds=latency,
+                    ready=True,
+                )
+            await asyncio.sleep(min(backoff, max(0, deadline - loop.time())))
+            backoff = min(backoff * 2, self.max_backoff_seconds)
+
+        logger.warning(f"Timed out waiting for SSH. name: {target.name}, addresses: {target.addresses}")
+        return ReadyHost(name=target.name, ip_address=None, port=target.port, reboot_to_ready_seconds=None, ready=False)
+
+    async def _probe_any(self, target: ReachabilityTarget) -> Optional[str]:
+        """Probe all candidate addresses at once, return the first address answering with an SSH banner"""
+        results = await asyncio.gather(*[self._probe_ssh(address, target.port) for address in target.addresses])
+        for address, answered in zip(target.addresses, results):
+            if answered:
+                return address
+        return None
+
+    async def _probe_ssh(self, ip_address: str, port: int) -> bool:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip_address, port), timeout=self.probe_timeout_seconds
+            )
+        except (asyncio.TimeoutError, OSError):
+            return False
+
+        try:
+            banner = await asyncio.wait_for(reader.readline(), timeout=self.probe_timeout_seconds)
+            return banner.startswith(SSH_BANNER_PREFIX)
+        except (asyncio.TimeoutError, OSError):
+            return False
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+def generate_reboot_status(ready_host: Optional[ReadyHost]) -> str:
+    if ready_host is None:
+        return ""
+    if not ready_host.rebooted:
+        return "    • Reboot.......: [green]skipped, no reboot sensitive changes[/green]\n"
+    if not ready_host.ready:
+        return "    • Reboot.......: [red]node did not answer on SSH after reboot[/red]\n"
+    return f"    • Reboot.......: [green]ready on {ready_host.ip_address} in {ready_host.reboot_to_ready_seconds:.1f}s[/green]\n"
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+import socket
+import threading
+import unittest
+
+from provisioner_single_board_plugin.src.common.remote.reachability import (
+    ReachabilityTarget,
+    ReadyHost,
+    SSHReachabilityPoller,
+)
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/reachability_test.py
+#
+
+UNREACHABLE_LOOPBACK_IP_ADDRESS = "127.0.0.2"
+
+
+class FakeBannerServer:
+    """Minimal TCP server that greets every connection with a banner line"""
+
+    def __init__(self, banner: str) -> None:
+        self.banner = banner
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(16)
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with conn:
+                conn.sendall(f"{self.banner}\r\n".encode())
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+def create_fast_poller(timeout_seconds: float = 3) -> SSHReachabilityPoller:
+    return SSHReachabilityPoller(
+        timeout_seconds=timeout_seconds,
+        initial_backoff_seconds=0.05,
+        max_backoff_seconds=0.2,
+        probe_timeout_seconds=0.5,
+        shutdown_grace_seconds=0,
+    )
+
+
+class SSHReachabilityPollerTestShould(unittest.TestCase):
+
+    def test_ready_on_any_candidate_address(self) -> None:
+        server = FakeBannerServer("SSH-2.0-OpenSSH_9.2p1 Debian-2")
+        try:
+            target = ReachabilityTarget(
+                name="node1", addresses=[UNREACHABLE_LOOPBACK_IP_ADDRESS, "127.0.0.1"], port=server.port
+            )
+            ready_host = create_fast_poller().wait_until_ready_single(target)
+        finally:
+            server.close()
+
+        self.assertTrue(ready_host.ready)
+        self.assertEqual(ready_host.name, "node1")
+        self.assertEqual(ready_host.ip_address, "127.0.0.1")
+        self.assertIsNotNone(ready_host.reboot_to_ready_seconds)
+
+    def test_not_ready_when_port_does_not_answer_with_ssh_banner(self) -> None:
+        server = FakeBannerServer("HTTP/1.1 400 Bad Request")
+        try:
+            target = ReachabilityTarget(name="node1", addresses=["127.0.0.1"], port=server.port)
+            ready_host = create_fast_poller(timeout_seconds=0.5).wait_until_ready_single(target)
+        finally:
+            server.close()
+
+        self.assertFalse(ready_host.ready)
+        self.assertIsNone(ready_host.ip_address)
+        self.assertIsNone(ready_host.reboot_to_ready_seconds)
+
+    def test_wait_for_multiple_targets_concurrently(self) -> None:
+        server = FakeBannerServer("SSH-2.0-OpenSSH_9.2p1")
+        try:
+            targets = [
+                ReachabilityTarget(name="node1", addresses=["127.0.0.1"], port=server.port),
+                ReachabilityTarget(name="node2", addresses=["127.0.0.1"], port=server.port, reboot_delay_seconds=0.1),
+            ]
+            ready_hosts = create_fast_poller().wait_until_ready(targets)
+        finally:
+            server.close()
+
+        self.assertEqual([host.name for host in ready_hosts], ["node1", "node2"])
+        self.assertTrue(all(host.ready for host in ready_hosts))
+
+    def test_target_from_ansible_host_drops_duplicate_addresses(self) -> None:
+        ansible_host = AnsibleHost(host="node1", ip_address="192.168.1.10", port=2222)
+        self.assertEqual(
+            ReachabilityTarget.from_ansible_host(ansible_host, new_ip_address="192.168.1.200").addresses,
+            ["192.168.1.10", "192.168.1.200"],
+        )
+        target = ReachabilityTarget.from_ansible_host(ansible_host, new_ip_address="192.168.1.10")
+        self.assertEqual(target.addresses, ["192.168.1.10"])
+        self.assertEqual(target.port, 2222)
+
+    def test_ready_host_keeps_authentication_of_original_host(self) -> None:
+        original = AnsibleHost(
+            host="node1",
+            ip_address="192.168.1.10",
+            username="pi",
+            password="secret",
+            ssh_private_key_file_path="/path/to/key",
+        )
+        ready_host = ReadyHost(
+            name="node1", ip_address="192.168.1.200", port=22, reboot_to_ready_seconds=12.5, ready=True
+        )
+        ansible_host = ready_host.to_ansible_host(auth_from=original)
+        self.assertEqual(ansible_host.ip_address, "192.168.1.200")
+        self.assertEqual(ansible_host.username, "pi")
+        self.assertEqual(ansible_host.password, "secret")
+        self.assertEqual(ansible_host.ssh_private_key_file_path, "/path/to/key")
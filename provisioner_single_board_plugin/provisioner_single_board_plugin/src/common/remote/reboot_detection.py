@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+# Files that are read only at boot time, a change to any of them means the node must be rebooted.
+# Both the legacy and the bookworm (/boot/firmware) locations are listed, missing files are skipped.
+REBOOT_SENSITIVE_PATHS = [
+    "/boot/config.txt",
+    "/boot/cmdline.txt",
+    "/boot/firmware/config.txt",
+    "/boot/firmware/cmdline.txt",
+    "/etc/hostname",
+    "/etc/systemd/system/default.target",
+]
+
+REBOOT_REPORT_FILE_SUFFIX = ".json"
+
+# Playbook fragments, these are formatted by the Ansible runner hence the escaped Jinja braces.
+# The configuration script always reports 'changed', instead the checksums of reboot sensitive files
+# are compared before and after the roles ran and the reboot is scheduled only if any of them differ.
+ANSIBLE_PRE_TASKS_SNAPSHOT_REBOOT_SENSITIVE_FILES = (
+    """
+  pre_tasks:
+    - name: Snapshot reboot sensitive files
+      stat:
+        path: "{{{{ item }}}}"
+        get_checksum: yes
+      loop: """
+    + json.dumps(REBOOT_SENSITIVE_PATHS)
+    + """
+      register: reboot_files_before
+      tags: ['always']
+"""
+)
+
+ANSIBLE_POST_TASKS_REBOOT_WHEN_CHANGED = (
+    """
+  post_tasks:
+    - name: Snapshot reboot sensitive files after configuration
+      stat:
+        path: "{{{{ item }}}}"
+        get_checksum: yes
+      loop: """
+    + json.dumps(REBOOT_SENSITIVE_PATHS)
+    + """
+      register: reboot_files_after
+      tags: ['always']
+
+    - name: Collect changes that require a reboot
+      set_fact:
+        reboot_changed_paths: "{{{{ (reboot_changed_paths | default([])) + [item.0.item] }}}}"
+      loop: "{{{{ reboot_files_after.results | zip(reboot_files_before.results) | list }}}}"
+      loop_control:
+        label: "{{{{ item.0.item }}}}"
+      when: (item.0.stat.checksum | default('')) != (item.1.stat.checksum | default(''))
+      tags: ['always']
+
+    - name: Schedule a detached reboot
+      command: "systemd-run --on-active={{{{ reboot_delay_seconds }}}} /bin/systemctl reboot"
+      become: "{{{{ become_root }}}}"
+      register: reboot_schedule
+      when: (reboot_required | bool) and (reboot_changed_paths | default([]) | length > 0)
+      tags: ['trigger_reboot']
+
+    - name: Report the reboot decision to the controller
+      copy:
+        content: "{{{{ reboot_report | to_json }}}}"
+        dest: "{{{{ reboot_report_dir }}}}/{{{{ inventory_hostname }}}}.json"
+      vars:
+        reboot_report:
+          changed_paths: "{{{{ reboot_changed_paths | default([]) }}}}"
+          reboot_scheduled: "{{{{ reboot_schedule is defined and reboot_schedule is not skipped }}}}"
+      delegate_to: localhost
+      become: no
+      when: reboot_report_dir is defined
+      tags: ['always']
+"""
+)
+
+
+class RebootReport:
+    host_name: str
+    changed_paths: List[str]
+    reboot_scheduled: bool
+
+    def __init__(self, host_name: str, changed_paths: List[str], reboot_scheduled: bool) -> None:
+        self.host_name = host_name
+        self.changed_paths = changed_paths
+        self.reboot_scheduled = reboot_scheduled
+
+    @staticmethod
+    def from_dict(host_name: str, report_dict: dict) -> "RebootReport":
+        return RebootReport(
+            host_name=host_name,
+            changed_paths=list(report_dict.get("changed_paths", [])),
+            # Templated values may arrive as 'True' / 'False' strings
+            reboot_scheduled=str(report_dict.get("reboot_scheduled", True)).lower() in ("true", "yes", "1"),
+        )
+
+
+def is_reboot_expected(report: Optional[RebootReport]) -> bool:
+    """A missing report means the decision is unknown, assume a reboot so the node is still waited on"""
+    return report is None or report.reboot_scheduled
+
+
+def read_reboot_reports(report_dir: str) -> Dict[str, RebootReport]:
+    """Reboot reports written by the playbook, keyed by inventory host name"""
+    reports = {}
+    if not report_dir or not os.path.isdir(report_dir):
+        return reports
+
+    for file_name in os.listdir(report_dir):
+        if not file_name.endswith(REBOOT_REPORT_FILE_SUFFIX):
+            continue
+        host_name = file_name[: -len(REBOOT_REPORT_FILE_SUFFIX)]
+        try:
+            with open(os.path.join(report_dir, file_name), "r") as report_file:
+                reports[host_name] = RebootReport.from_dict(host_name, json.load(report_file))
+        except (OSError, ValueError) as ex:
+            logger.warning(f"Failed to read reboot report, assuming a reboot. host: {host_name}, error: {ex}")
+    return reports
+
+
+@contextmanager
+def reboot_report_dir():
+    """Temporary controller side directory the playbook writes its per host reboot decisions into"""
+    report_dir = tempfile.mkdtemp(prefix="provisioner-reboot-")
+    try:
+        yield report_dir
+    finally:
+        shutil.rmtree(report_dir, ignore_errors=True)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import unittest
+
+import yaml
+from provisioner_single_board_plugin.src.common.remote.reboot_detection import (
+    REBOOT_SENSITIVE_PATHS,
+    RebootReport,
+    is_reboot_expected,
+    read_reboot_reports,
+    reboot_report_dir,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_os_configure import ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NODE
+from provisioner_single_board_plugin.src.common.remote.remote_os_fleet_configure import (
+    ANSIBLE_PLAYBOOK_RPI_CONFIGURE_FLEET,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/reboot_detection_test.py
+#
+
+
+class RebootDetectionTestShould(unittest.TestCase):
+
+    def test_read_reports_keyed_by_host_name(self) -> None:
+        with reboot_report_dir() as report_dir:
+            with open(os.path.join(report_dir, "node1.json"), "w") as f:
+                json.dump({"changed_paths": ["/boot/cmdline.txt"], "reboot_scheduled": "True"}, f)
+            with open(os.path.join(report_dir, "node2.json"), "w") as f:
+                json.dump({"changed_paths": [], "reboot_scheduled": False}, f)
+
+            reports = read_reboot_reports(report_dir)
+
+        self.assertEqual(sorted(reports.keys()), ["node1", "node2"])
+        self.assertTrue(reports["node1"].reboot_scheduled)
+        self.assertEqual(reports["node1"].changed_paths, ["/boot/cmdline.txt"])
+        self.assertFalse(reports["node2"].reboot_scheduled)
+
+    def test_skip_corrupted_and_unrelated_files(self) -> None:
+        with reboot_report_dir() as report_dir:
+            with open(os.path.join(report_dir, "node1.json"), "w") as f:
+                f.write("{not json")
+            with open(os.path.join(report_dir, "node2.txt"), "w") as f:
+                f.write("ignored")
+
+            self.assertEqual(read_reboot_reports(report_dir), {})
+
+    def test_remove_report_dir_on_exit(self) -> None:
+        with reboot_report_dir() as report_dir:
+            self.assertTrue(os.path.isdir(report_dir))
+        self.assertFalse(os.path.exists(report_dir))
+        self.assertEqual(read_reboot_reports(report_dir), {})
+
+    def test_expect_reboot_unless_report_says_otherwise(self) -> None:
+        self.assertTrue(is_reboot_expected(None))
+        self.assertTrue(is_reboot_expected(RebootReport("node1", ["/etc/hostname"], True)))
+        self.assertFalse(is_reboot_expected(RebootReport("node1", [], False)))
+
+    def test_playbooks_snapshot_reboot_sensitive_files_around_roles(self) -> None:
+        for playbook in [ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NODE, ANSIBLE_PLAYBOOK_RPI_CONFIGURE_FLEET]:
+            play = yaml.safe_load(playbook.format(ansible_playbooks_path="/playbooks", modifiers=""))[0]
+            self.assertEqual(play["pre_tasks"][0]["loop"], REBOOT_SENSITIVE_PATHS)
+            self.assertEqual(play["post_tasks"][0]["loop"], REBOOT_SENSITIVE_PATHS)
+            self.assertEqual(play["roles"][0]["tags"], ["configure_remote_node"])
+            reboot_task = next(task for task in play["post_tasks"] if "trigger_reboot" in task["tags"])
+            self.assertIn("reboot_changed_paths", reboot_task["when"])
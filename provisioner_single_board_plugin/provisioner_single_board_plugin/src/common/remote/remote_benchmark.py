@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+
+import inspect
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import run_ssh_command
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanInventoryRemoteMachineConnector
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts, resolve_fleet_hosts
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    DEFAULT_COLLECT_MAX_WORKERS,
+    OUTPUT_FORMAT_JSON,
+    OUTPUT_FORMAT_TABLE,
+)
+from provisioner_single_board_plugin.src.common.system import node_benchmark
+from provisioner_single_board_plugin.src.common.system.node_benchmark import (
+    DEFAULT_BENCHMARK_DIR,
+    DEFAULT_BENCHMARK_DISK_SIZE_MB,
+    DEFAULT_BENCHMARK_DURATION_SECONDS,
+    DEFAULT_BENCHMARK_PORT,
+)
+
+from provisioner_shared.components.remote.remote_connector import SSHConnectionInfo
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.evaluator import Evaluator
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+from provisioner_shared.components.runtime.utils.checks import Checks
+
+ProvisionerBenchmarkHistoryPath = os.path.expanduser("~/.config/provisioner/benchmark/history.jsonl")
+
+BENCHMARK_SCRIPT = inspect.getsource(node_benchmark)
+# Slack on top of the workload duration for SSH session setup and interpreter start
+BENCHMARK_SSH_TIMEOUT_SLACK_SECONDS = 30
+
+# Metric name and report label, higher is better for all of them
+BENCHMARK_METRICS: List[Tuple[str, str]] = [
+    ("cpu_sha256_mbps", "CPU sha256 MB/s"),
+    ("cpu_python_kops", "CPU python kops/s"),
+    ("disk_seq_write_mbps", "Seq write MB/s"),
+    ("disk_seq_read_mbps", "Seq read MB/s"),
+    ("disk_rand_read_iops", "4K read IOPS"),
+    ("disk_rand_write_iops", "4K write IOPS"),
+    ("net_receive_mbps", "LAN receive Mb/s"),
+]
+
+
+class NodeBenchmarkResult:
+
+    host_name: str
+    ip_address: str
+    metrics: Dict[str, Any]
+    errors: List[str]
+
+    def __init__(
+        self,
+        host_name: str,
+        ip_address: str,
+        metrics: Optional[Dict[str, Any]] = None,
+        errors: Optional[List[str]] = None,
+    ) -> None:
+        self.host_name = host_name
+        self.ip_address = ip_address
+        self.metrics = metrics if metrics else {}
+        self.errors = errors if errors else []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "host_name": self.host_name,
+            "ip_address": self.ip_address,
+            "metrics": self.metrics,
+            "errors": self.errors,
+        }
+
+
+class BenchmarkHistory:
+    """
+    Append only JSON lines file, one line per benchmark run.
+    Runs keep their parameters so only results of equally sized workloads are compared.
+    """
+
+    path: str
+
+    def __init__(self, path: Optional[str] = ProvisionerBenchmarkHistoryPath) -> None:
+        self.path = path
+
+    def append(self, run: Dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a") as history_file:
+            history_file.write(json.dumps(run) + "\n")
+
+    def read(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+        runs = []
+        with open(self.path, "r") as history_file:
+            for line in history_file:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    logger.warning(f"Ignoring unreadable benchmark history line. path: {self.path}")
+        return runs
+
+    def latest_metrics_by_host(self, params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        latest = {}
+        for run in self.read():
+            if run.get("params") != params:
+                continue
+            for result in run.get("results", []):
+                if result.get("metrics"):
+                    latest[result["host_name"]] = result["metrics"]
+        return latest
+
+
+class RemoteNodeBenchmark:
+    """
+    Local CPU and disk workloads run on all nodes concurrently. Network throughput is measured per node pair
+    along a ring (each node sends to the next one), pairs run one after the other so they do not compete
+    for the same switch ports.
+    """
+
+    benchmark_dir: str
+    disk_size_mb: int
+    duration_seconds: float
+    port: int
+    max_workers: int
+
+    def __init__(
+        self,
+        benchmark_dir: Optional[str] = DEFAULT_BENCHMARK_DIR,
+        disk_size_mb: Optional[int] = DEFAULT_BENCHMARK_DISK_SIZE_MB,
+        duration_seconds: Optional[float] = DEFAULT_BENCHMARK_DURATION_SECONDS,
+        port: Optional[int] = DEFAULT_BENCHMARK_PORT,
+        max_workers: Optional[int] = DEFAULT_COLLECT_MAX_WORKERS,
+    ) -> None:
+        self.benchmark_dir = benchmark_dir
+        self.disk_size_mb = disk_size_mb
+        self.duration_seconds = duration_seconds
+        self.port = port
+        self.max_workers = max_workers
+
+    def _ssh_timeout(self) -> float:
+        # Output is printed once the workloads are done, allow a slow SD card to move the file at 1MB/s twice
+        return self.duration_seconds * 2 + self.disk_size_mb * 2 + BENCHMARK_SSH_TIMEOUT_SLACK_SECONDS
+
+    def _run_script(self, ansible_host: AnsibleHost, *args: str) -> Dict[str, Any]:
+        command = " ".join(["python3", "-"] + list(args))
+        return json.loads(run_ssh_command(ansible_host, command, self._ssh_timeout(), stdin_data=BENCHMARK_SCRIPT))
+
+    def run_local(self, ansible_hosts: List[AnsibleHost]) -> List[NodeBenchmarkResult]:
+        def run_host(ansible_host: AnsibleHost) -> NodeBenchmarkResult:
+            try:
+                metrics = self._run_script(
+                    ansible_host,
+                    "local",
+                    "--dir",
+                    self.benchmark_dir,
+                    "--size-mb",
+                    str(self.disk_size_mb),
+                    "--duration",
+                    str(self.duration_seconds),
+                )
+                return NodeBenchmarkResult(ansible_host.host, ansible_host.ip_address, metrics=metrics)
+            except Exception as ex:
+                logger.debug(f"Local benchmark failed. host: {ansible_host.host}, error: {ex}")
+                return NodeBenchmarkResult(ansible_host.host, ansible_host.ip_address, errors=[f"local: {ex}"])
+
+        if not ansible_hosts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ansible_hosts))) as executor:
+            return list(executor.map(run_host, ansible_hosts))
+
+    def run_network_pair(self, sender: AnsibleHost, receiver: AnsibleHost) -> Dict[str, Any]:
+        received: Dict[str, Any] = {}
+        receive_error: List[Exception] = []
+
+        def receive() -> None:
+            try:
+                received.update(
+                    self._run_script(
+                        receiver, "receive", "--port", str(self.port), "--timeout", str(self._ssh_timeout())
+                    )
+                )
+            except Exception as ex:
+                receive_error.append(ex)
+
+        receiver_thread = threading.Thread(target=receive, daemon=True)
+        receiver_thread.start()
+        try:
+            self._run_script(
+                sender,
+                "send",
+                "--host",
+                receiver.ip_address,
+                "--port",
+                str(self.port),
+                "--duration",
+                str(self.duration_seconds),
+                "--timeout",
+                str(BENCHMARK_SSH_TIMEOUT_SLACK_SECONDS),
+            )
+        finally:
+            receiver_thread.join(self._ssh_timeout())
+        if receive_error:
+            raise receive_error[0]
+        return received
+
+    def run_network(self, ansible_hosts: List[AnsibleHost], results: List[NodeBenchmarkResult]) -> None:
+        if len(ansible_hosts) < 2:
+            return
+        by_name = {result.host_name: result for result in results}
+        for index, sender in enumerate(ansible_hosts):
+            receiver = ansible_hosts[(index + 1) % len(ansible_hosts)]
+            # Every node receives exactly once, two nodes end up testing both directions
+            try:
+                received = self.run_network_pair(sender, receiver)
+                by_name[receiver.host].metrics["net_receive_mbps"] = received["net_receive_mbps"]
+                by_name[receiver.host].metrics["net_receive_from"] = sender.host
+            except Exception as ex:
+                logger.debug(f"Network benchmark failed. sender: {sender.host}, receiver: {receiver.host}, {ex}")
+                by_name[receiver.host].errors.append(f"network from {sender.host}: {ex}")
+
+    def run(self, ansible_hosts: List[AnsibleHost], network: Optional[bool] = True) -> List[NodeBenchmarkResult]:
+        results = self.run_local(ansible_hosts)
+        if network:
+            self.run_network(ansible_hosts, results)
+        return results
+
+    def params(self) -> Dict[str, Any]:
+        return {"disk_size_mb": self.disk_size_mb, "duration_seconds": self.duration_seconds}
+
+
+class RemoteBenchmarkArgs:
+
+    remote_opts: RemoteOpts
+    fleet_opts: FleetOpts
+    benchmark_dir: str
+    disk_size_mb: int
+    duration_seconds: float
+    network: bool
+    output_format: str
+
+    def __init__(
+        self,
+        remote_opts: RemoteOpts,
+        fleet_opts: Optional[FleetOpts] = None,
+        benchmark_dir: Optional[str] = DEFAULT_BENCHMARK_DIR,
+        disk_size_mb: Optional[int] = DEFAULT_BENCHMARK_DISK_SIZE_MB,
+        duration_seconds: Optional[float] = DEFAULT_BENCHMARK_DURATION_SECONDS,
+        network: Optional[bool] = True,
+        output_format: Optional[str] = OUTPUT_FORMAT_TABLE,
+    ) -> None:
+        self.remote_opts = remote_opts
+        self.fleet_opts = fleet_opts
+        self.benchmark_dir = benchmark_dir
+        self.disk_size_mb = disk_size_mb
+        self.duration_seconds = duration_seconds
+        self.network = network
+        self.output_format = output_format
+
+
+class RemoteBenchmarkRunner:
+
+    def run(
+        self,
+        ctx: Context,
+        args: RemoteBenchmarkArgs,
+        collaborators: CoreCollaborators,
+        history: Optional[BenchmarkHistory] = None,
+    ) -> List[NodeBenchmarkResult]:
+        logger.debug("Inside RemoteBenchmarkRunner run()")
+
+        self._prerequisites(ctx=ctx, checks=collaborators.checks())
+        ansible_hosts = self._resolve_hosts(ctx, collaborators, args)
+        if ctx.is_dry_run():
+            return []
+
+        history = history if history else BenchmarkHistory()
+        benchmark = RemoteNodeBenchmark(
+            benchmark_dir=args.benchmark_dir,
+            disk_size_mb=args.disk_size_mb,
+            duration_seconds=args.duration_seconds,
+            max_workers=args.fleet_opts.forks if args.fleet_opts is not None else DEFAULT_COLLECT_MAX_WORKERS,
+        )
+        previous = history.latest_metrics_by_host(benchmark.params())
+        results = (
+            collaborators.progress_indicator()
+            .get_status()
+            .long_running_process_fn(
+                call=lambda: benchmark.run(ansible_hosts, network=args.network),
+                desc_run=f"Running benchmark ({len(ansible_hosts)} hosts)",
+                desc_end="Benchmark finished.",
+            )
+        )
+        history.append(
+            {"timestamp": time.time(), "params": benchmark.params(), "results": [r.to_dict() for r in results]}
+        )
+
+        if args.output_format == OUTPUT_FORMAT_JSON:
+            print(json.dumps([result.to_dict() for result in results], indent=2))
+        else:
+            collaborators.printer().print_with_rich_table_fn(generate_benchmark_report(results, previous))
+        return results
+
+    def _resolve_hosts(
+        self, ctx: Context, collaborators: CoreCollaborators, args: RemoteBenchmarkArgs
+    ) -> List[AnsibleHost]:
+        if args.fleet_opts is not None:
+            return resolve_fleet_hosts(args.remote_opts, args.fleet_opts.host_names)
+        return self._get_ssh_conn_info(ctx, collaborators, args.remote_opts).ansible_hosts
+
+    def _get_ssh_conn_info(
+        self, ctx: Context, collaborators: CoreCollaborators, remote_opts: Optional[RemoteOpts] = None
+    ) -> SSHConnectionInfo:
+
+        ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
+            call=lambda: LanInventoryRemoteMachineConnector(collaborators=collaborators).collect_ssh_connection_info(
+                ctx, remote_opts, force_single_conn_info=True
+            ),
+            ctx=ctx,
+            err_msg="Could not resolve SSH connection info",
+        )
+        collaborators.summary().append("ssh_conn_info", ssh_conn_info)
+        return ssh_conn_info
+
+    def _prerequisites(self, ctx: Context, checks: Checks) -> None:
+        if ctx.os_arch.is_linux():
+            return
+        elif ctx.os_arch.is_darwin():
+            return
+        elif ctx.os_arch.is_windows():
+            raise NotImplementedError("Windows is not supported")
+        else:
+            raise NotImplementedError("OS is not supported")
+
+
+def _format_metric(value: Any, previous_value: Any) -> str:
+    if value is None:
+        return "-"
+    if not previous_value:
+        return f"{value}"
+    change = (value - previous_value) * 100.0 / previous_value
+    color = "green" if change >= 0 else "red"
+    return f"{value} [{color}]({change:+.0f}%)[/{color}]"
+
+
+def generate_benchmark_report(
+    results: List[NodeBenchmarkResult], previous: Optional[Dict[str, Dict[str, Any]]] = None
+) -> str:
+    previous = previous if previous else {}
+    lines = []
+    for result in results:
+        lines.append(f"  [green]{result.host_name}[/green] ({result.ip_address})")
+        host_previous = previous.get(result.host_name, {})
+        for metric, label in BENCHMARK_METRICS:
+            if metric in result.metrics:
+                lines.append(f"    {label}: {_format_metric(result.metrics[metric], host_previous.get(metric))}")
+        for error in result.errors:
+            lines.append(f"    [red]{error}[/red]")
+    return f"""
+[green]Node Benchmark[/green] (change is relative to the previous run with the same parameters)
+
+{chr(10).join(lines)}
+"""
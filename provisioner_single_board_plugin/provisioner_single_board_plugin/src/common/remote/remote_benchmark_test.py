@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Any, Dict
+
+from provisioner_single_board_plugin.src.common.remote.remote_benchmark import (
+    BenchmarkHistory,
+    NodeBenchmarkResult,
+    RemoteNodeBenchmark,
+    generate_benchmark_report,
+)
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/remote_benchmark_test.py
+#
+
+TEST_PARAMS = {"disk_size_mb": 256, "duration_seconds": 5}
+
+
+class FakeRemoteNodeBenchmark(RemoteNodeBenchmark):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pairs = []
+
+    def run_network_pair(self, sender: AnsibleHost, receiver: AnsibleHost) -> Dict[str, Any]:
+        self.pairs.append((sender.host, receiver.host))
+        if receiver.host == "node2":
+            raise Exception("connection refused")
+        return {"net_receive_mbps": 940.0}
+
+
+class RemoteBenchmarkTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.history_dir = tempfile.mkdtemp(prefix="provisioner-benchmark-history-test")
+        self.history = BenchmarkHistory(os.path.join(self.history_dir, "history.jsonl"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.history_dir)
+
+    def test_pair_nodes_along_a_ring(self) -> None:
+        hosts = [AnsibleHost(host=f"node{i}", ip_address=f"10.0.0.{i}") for i in range(3)]
+        results = [NodeBenchmarkResult(host.host, host.ip_address) for host in hosts]
+        benchmark = FakeRemoteNodeBenchmark()
+        benchmark.run_network(hosts, results)
+
+        self.assertEqual(benchmark.pairs, [("node0", "node1"), ("node1", "node2"), ("node2", "node0")])
+        self.assertEqual(results[1].metrics, {"net_receive_mbps": 940.0, "net_receive_from": "node0"})
+        self.assertEqual(results[2].errors, ["network from node1: connection refused"])
+
+    def test_skip_network_for_single_node(self) -> None:
+        benchmark = FakeRemoteNodeBenchmark()
+        benchmark.run_network([AnsibleHost(host="node0", ip_address="10.0.0.1")], [])
+        self.assertEqual(benchmark.pairs, [])
+
+    def test_compare_with_latest_run_of_same_params(self) -> None:
+        self.history.append({"params": TEST_PARAMS, "results": [{"host_name": "node1", "metrics": {"a": 1}}]})
+        self.history.append({"params": TEST_PARAMS, "results": [{"host_name": "node1", "metrics": {"a": 2}}]})
+        self.history.append({"params": {"disk_size_mb": 16}, "results": [{"host_name": "node1", "metrics": {"a": 3}}]})
+        self.history.append({"params": TEST_PARAMS, "results": [{"host_name": "node1", "metrics": {}}]})
+        with open(self.history.path, "a") as f:
+            f.write("{not json\n")
+
+        self.assertEqual(self.history.latest_metrics_by_host(TEST_PARAMS), {"node1": {"a": 2}})
+        self.assertEqual(len(self.history.read()), 4)
+
+    def test_report_change_relative_to_previous_run(self) -> None:
+        results = [
+            NodeBenchmarkResult(
+                "node1", "10.0.0.1", metrics={"disk_seq_write_mbps": 30.0, "disk_rand_read_iops": 2000}
+            ),
+            NodeBenchmarkResult("node2", "10.0.0.2", errors=["local: timed out"]),
+        ]
+        report = generate_benchmark_report(results, {"node1": {"disk_seq_write_mbps": 20.0}})
+        self.assertIn("Seq write MB/s: 30.0 [green](+50%)[/green]", report)
+        self.assertIn("4K read IOPS: 2000\n", report)
+        self.assertIn("[red]local: timed out[/red]", report)
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+
+import inspect
+import json
+import os
+import zipfile
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import run_ssh_command
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import get_tracer
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanInventoryRemoteMachineConnector
+from provisioner_single_board_plugin.src.common.remote.reachability import (
+    REBOOT_TRIGGER_DELAY_SECONDS,
+    ReachabilityTarget,
+    ReadyHost,
+    SSHReachabilityPoller,
+    generate_reboot_status,
+)
+from provisioner_single_board_plugin.src.common.system import boot_migration
+from provisioner_single_board_plugin.src.common.system.boot_migration import (
+    MIGRATION_SOURCE_CLONE,
+    MIGRATION_SOURCE_IMAGE,
+)
+
+from provisioner_shared.components.remote.remote_connector import SSHConnectionInfo
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.errors.cli_errors import CliApplicationException
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.evaluator import Evaluator
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+from provisioner_shared.components.runtime.utils.checks import Checks
+from provisioner_shared.components.runtime.utils.prompter import PromptLevel
+
+MIGRATION_SOURCES = [MIGRATION_SOURCE_CLONE, MIGRATION_SOURCE_IMAGE]
+
+BOOT_MIGRATION_SCRIPT = inspect.getsource(boot_migration)
+BOOT_MIGRATION_SCRIPT_NAME = "boot_migration.py"
+# Home relative, left unquoted so the remote shell expands it
+BOOT_MIGRATION_DIR = "~/.provisioner/boot-migration"
+BOOT_FILES_DIR_NAME = "boot"
+
+# Applies to every single SSH operation, the node script reports progress while copying so long copies never idle
+DEFAULT_MIGRATION_SSH_TIMEOUT_SECONDS = 120
+DEFAULT_MIGRATION_REBOOT_TIMEOUT_SECONDS = 300
+
+
+class BootMigrationResult:
+
+    host_name: str
+    ip_address: str
+    target_device: str
+    migration: Optional[Dict[str, Any]]
+    ready_host: Optional[ReadyHost]
+    boot_device: Optional[Dict[str, Any]]
+
+    def __init__(
+        self,
+        host_name: str,
+        ip_address: str,
+        target_device: str,
+        migration: Optional[Dict[str, Any]] = None,
+        ready_host: Optional[ReadyHost] = None,
+        boot_device: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.host_name = host_name
+        self.ip_address = ip_address
+        self.target_device = target_device
+        self.migration = migration
+        self.ready_host = ready_host
+        self.boot_device = boot_device
+
+    def is_booted_from_target(self) -> bool:
+        """The root PARTUUID after the reboot must carry the disk identifier written to the target device"""
+        if not self.migration or not self.boot_device or not self.boot_device.get("root_partuuid"):
+            return False
+        return self.boot_device["root_partuuid"].lower().startswith(f"{self.migration['disk_id']}-")
+
+
+def parse_script_output(output: str) -> Dict[str, Any]:
+    """Progress lines precede the result, the last line is the result of the node script"""
+    lines = [line for line in output.strip().splitlines() if line.strip()]
+    if not lines:
+        raise ValueError("Boot migration script returned no result")
+    return json.loads(lines[-1])
+
+
+@contextmanager
+def open_image_file(image_file_path: str) -> Iterator[BinaryIO]:
+    """
+    Compressed .xz and .gz images are inflated on the node, zip archives cannot be read as a stream
+    and have their image member inflated on the controller instead
+    """
+    if not zipfile.is_zipfile(image_file_path):
+        with open(image_file_path, "rb") as image:
+            yield image
+        return
+    with zipfile.ZipFile(image_file_path) as archive:
+        members = [name for name in archive.namelist() if name.lower().endswith(".img")]
+        if not members:
+            raise ValueError(f"No .img file in archive {image_file_path}")
+        with archive.open(members[0]) as image:
+            yield image
+
+
+class RemoteBootMigration:
+    """
+    Run the boot migration script on a node over a direct SSH session.
+    The script is pushed once per migration, images are streamed from the controller compressed as they are cached
+    and inflated on the node, nothing is staged on the SD card being migrated away from.
+    """
+
+    timeout_seconds: float
+    reboot_timeout_seconds: float
+
+    def __init__(
+        self,
+        timeout_seconds: Optional[float] = DEFAULT_MIGRATION_SSH_TIMEOUT_SECONDS,
+        reboot_timeout_seconds: Optional[float] = DEFAULT_MIGRATION_REBOOT_TIMEOUT_SECONDS,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.reboot_timeout_seconds = reboot_timeout_seconds
+
+    def _exec(self, ansible_host: AnsibleHost, command: str, stdin_data: Optional[Any] = None) -> str:
+        return run_ssh_command(ansible_host, command, self.timeout_seconds, stdin_data=stdin_data)
+
+    def _script_command(self, *args: str) -> str:
+        return " ".join(["sudo", "-n", "python3", f"{BOOT_MIGRATION_DIR}/{BOOT_MIGRATION_SCRIPT_NAME}"] + list(args))
+
+    def push(self, ansible_host: AnsibleHost, boot_files: Optional[Dict[str, bytes]] = None) -> None:
+        self._exec(
+            ansible_host,
+            f"rm -rf {BOOT_MIGRATION_DIR} && mkdir -p {BOOT_MIGRATION_DIR}/{BOOT_FILES_DIR_NAME} && "
+            + f"cat > {BOOT_MIGRATION_DIR}/{BOOT_MIGRATION_SCRIPT_NAME}",
+            stdin_data=BOOT_MIGRATION_SCRIPT,
+        )
+        for file_name, content in (boot_files or {}).items():
+            self._exec(
+                ansible_host, f"cat > {BOOT_MIGRATION_DIR}/{BOOT_FILES_DIR_NAME}/{file_name}", stdin_data=content
+            )
+
+    def migrate(
+        self,
+        ansible_host: AnsibleHost,
+        source: str,
+        target_device: str,
+        image_file_path: Optional[str] = None,
+        with_boot_files: Optional[bool] = False,
+        freeze: Optional[bool] = True,
+        update_eeprom: Optional[bool] = True,
+    ) -> Dict[str, Any]:
+        args = [source, "--target", target_device]
+        if with_boot_files:
+            args += ["--boot-files-dir", f"{BOOT_MIGRATION_DIR}/{BOOT_FILES_DIR_NAME}"]
+        if not freeze:
+            args.append("--no-freeze")
+        if not update_eeprom:
+            args.append("--no-eeprom")
+
+        if source == MIGRATION_SOURCE_IMAGE:
+            with open_image_file(image_file_path) as image:
+                output = self._exec(ansible_host, self._script_command(*args), stdin_data=image)
+        else:
+            output = self._exec(ansible_host, self._script_command(*args))
+        return parse_script_output(output)
+
+    def reboot_and_wait(self, ansible_host: AnsibleHost) -> ReadyHost:
+        self._exec(
+            ansible_host, f"sudo -n systemd-run --on-active={REBOOT_TRIGGER_DELAY_SECONDS} /bin/systemctl reboot"
+        )
+        poller = SSHReachabilityPoller(timeout_seconds=self.reboot_timeout_seconds)
+        return poller.wait_until_ready_single(
+            ReachabilityTarget.from_ansible_host(ansible_host, reboot_delay_seconds=REBOOT_TRIGGER_DELAY_SECONDS)
+        )
+
+    def boot_device(self, ansible_host: AnsibleHost) -> Dict[str, Any]:
+        return parse_script_output(self._exec(ansible_host, self._script_command("boot-device")))
+
+
+class RemoteBootMigrationArgs:
+
+    remote_opts: RemoteOpts
+    target_device: str
+    source: str
+    image_download_url: str
+    image_download_path: str
+    boot_files_path: str
+    freeze: bool
+    update_eeprom: bool
+    reboot: bool
+
+    def __init__(
+        self,
+        remote_opts: RemoteOpts,
+        target_device: str,
+        source: Optional[str] = MIGRATION_SOURCE_CLONE,
+        image_download_url: Optional[str] = None,
+        image_download_path: Optional[str] = None,
+        boot_files_path: Optional[str] = None,
+        freeze: Optional[bool] = True,
+        update_eeprom: Optional[bool] = True,
+        reboot: Optional[bool] = True,
+    ) -> None:
+        self.remote_opts = remote_opts
+        self.target_device = target_device
+        self.source = source
+        self.image_download_url = image_download_url
+        self.image_download_path = image_download_path
+        self.boot_files_path = boot_files_path
+        self.freeze = freeze
+        self.update_eeprom = update_eeprom
+        self.reboot = reboot
+
+
+class RemoteBootMigrationRunner:
+
+    def run(
+        self,
+        ctx: Context,
+        args: RemoteBootMigrationArgs,
+        collaborators: CoreCollaborators,
+        migration: Optional[RemoteBootMigration] = None,
+    ) -> Optional[BootMigrationResult]:
+        logger.debug("Inside RemoteBootMigrationRunner run()")
+
+        self._prerequisites(ctx=ctx, checks=collaborators.checks())
+        ansible_host = self._get_ssh_conn_info(ctx, collaborators, args.remote_opts).ansible_hosts[0]
+        tracer = get_tracer()
+        with tracer.span("download image"):
+            image_file_path = self._maybe_download_image(ctx, collaborators, args)
+        self._approve_target_device(ctx, collaborators, ansible_host, args.target_device)
+        if ctx.is_dry_run():
+            return None
+
+        migration = migration if migration else RemoteBootMigration()
+        boot_files = self._read_boot_files(args.boot_files_path) if args.source == MIGRATION_SOURCE_IMAGE else {}
+        result = BootMigrationResult(ansible_host.host, ansible_host.ip_address, args.target_device)
+
+        def run_migration() -> None:
+            with tracer.span("push migration script", host=ansible_host.host):
+                migration.push(ansible_host, boot_files)
+            with tracer.span("migrate boot device", host=ansible_host.host, source=args.source):
+                result.migration = migration.migrate(
+                    ansible_host,
+                    source=args.source,
+                    target_device=args.target_device,
+                    image_file_path=image_file_path,
+                    with_boot_files=len(boot_files) > 0,
+                    freeze=args.freeze,
+                    update_eeprom=args.update_eeprom,
+                )
+
+        collaborators.progress_indicator().get_status().long_running_process_fn(
+            call=run_migration,
+            desc_run=f"Migrating boot device of {ansible_host.host} to {args.target_device} ({args.source})",
+            desc_end="Boot device migration finished.",
+        )
+
+        if args.reboot:
+            with tracer.span("wait for reboot", host=ansible_host.host):
+                result.ready_host = (
+                    collaborators.progress_indicator()
+                    .get_status()
+                    .long_running_process_fn(
+                        call=lambda: migration.reboot_and_wait(ansible_host),
+                        desc_run=f"Rebooting {ansible_host.host} from {args.target_device}",
+                        desc_end="Reboot finished.",
+                    )
+                )
+            if result.ready_host.ready:
+                result.boot_device = migration.boot_device(result.ready_host.to_ansible_host(ansible_host))
+
+        collaborators.printer().print_with_rich_table_fn(generate_boot_migration_report(result))
+        if args.reboot and not result.is_booted_from_target():
+            raise CliApplicationException(
+                f"Node did not boot from the migrated device. host: {ansible_host.host}, device: {args.target_device}"
+            )
+        return result
+
+    def _maybe_download_image(
+        self, ctx: Context, collaborators: CoreCollaborators, args: RemoteBootMigrationArgs
+    ) -> Optional[str]:
+        if args.source != MIGRATION_SOURCE_IMAGE:
+            return None
+        image_file_path = Evaluator.eval_step_return_value_throw_on_failure(
+            call=lambda: collaborators.http_client().download_file_fn(
+                url=args.image_download_url,
+                download_folder=args.image_download_path,
+                verify_already_downloaded=True,
+                progress_bar=True,
+            ),
+            ctx=ctx,
+            err_msg="Failed to download image to migrate to",
+        )
+        collaborators.summary().append("image_file_path", image_file_path)
+        if image_file_path and os.path.isfile(image_file_path):
+            get_tracer().annotate(bytes=os.path.getsize(image_file_path))
+        return image_file_path
+
+    def _approve_target_device(
+        self, ctx: Context, collaborators: CoreCollaborators, ansible_host: AnsibleHost, target_device: str
+    ) -> None:
+        collaborators.summary().show_summary_and_prompt_for_enter(f"Migrating boot device to {target_device}")
+        Evaluator.eval_step_return_value_throw_on_failure(
+            call=lambda: collaborators.prompter().prompt_yes_no_fn(
+                f"ARE YOU SURE YOU WANT TO FORMAT BLOCK DEVICE '{target_device}' ON '{ansible_host.host}'",
+                level=PromptLevel.CRITICAL,
+                post_no_message="Aborted by user.",
+                post_yes_message="Block device was approved by user",
+            ),
+            ctx=ctx,
+            err_msg="Aborted upon user request",
+        )
+
+    def _read_boot_files(self, boot_files_path: Optional[str]) -> Dict[str, bytes]:
+        boot_files = {}
+        if not boot_files_path or not os.path.isdir(boot_files_path):
+            return boot_files
+        for file_name in sorted(os.listdir(boot_files_path)):
+            file_path = os.path.join(boot_files_path, file_name)
+            if os.path.isfile(file_path):
+                with open(file_path, "rb") as f:
+                    boot_files[file_name] = f.read()
+        return boot_files
+
+    def _get_ssh_conn_info(
+        self, ctx: Context, collaborators: CoreCollaborators, remote_opts: Optional[RemoteOpts] = None
+    ) -> SSHConnectionInfo:
+
+        ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
+            call=lambda: LanInventoryRemoteMachineConnector(collaborators=collaborators).collect_ssh_connection_info(
+                ctx, remote_opts, force_single_conn_info=True
+            ),
+            ctx=ctx,
+            err_msg="Could not resolve SSH connection info",
+        )
+        collaborators.summary().append("ssh_conn_info", ssh_conn_info)
+        return ssh_conn_info
+
+    def _prerequisites(self, ctx: Context, checks: Checks) -> None:
+        if ctx.os_arch.is_linux():
+            return
+        elif ctx.os_arch.is_darwin():
+            return
+        elif ctx.os_arch.is_windows():
+            raise NotImplementedError("Windows is not supported")
+        else:
+            raise NotImplementedError("OS is not supported")
+
+
+def generate_boot_migration_report(result: BootMigrationResult) -> str:
+    migration = result.migration if result.migration else {}
+    written_mb = int(migration.get("bytes_written", 0) / (1024 * 1024))
+    expanded = migration.get("expanded_partition")
+    boot_order = migration.get("boot_order")
+    lines = [
+        f"    • Source.......: {migration.get('source', '-')}, {written_mb} MB written to {result.target_device}",
+        f"    • PARTUUID.....: {migration.get('previous_disk_id', '-')} -> {migration.get('disk_id', '-')}"
+        + (f" ({', '.join(migration['updated_files'])} updated)" if migration.get("updated_files") else ""),
+        "    • Root.........: "
+        + (f"partition {expanded['number']} expanded to the device end" if expanded else "partition layout kept"),
+        "    • EEPROM.......: "
+        + (
+            f"[green]BOOT_ORDER={boot_order}[/green], applied on reboot"
+            if boot_order
+            else "[yellow]boot order not updated[/yellow]"
+        ),
+    ]
+    reboot_status = generate_reboot_status(result.ready_host).rstrip("\n")
+    if reboot_status:
+        lines.append(reboot_status)
+    if result.boot_device:
+        color = "green" if result.is_booted_from_target() else "red"
+        lines.append(
+            f"    • Booted from..: [{color}]{result.boot_device.get('root_disk')} "
+            + f"(root PARTUUID {result.boot_device.get('root_partuuid')})[/{color}]"
+        )
+    return f"""
+  Boot device migration of [green]{result.host_name}[/green] ({result.ip_address}):
+
+{chr(10).join(lines)}
+"""
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from provisioner_single_board_plugin.src.common.remote.remote_boot_migration import (
+    BootMigrationResult,
+    open_image_file,
+    parse_script_output,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/remote_boot_migration_test.py
+#
+
+TEST_IMAGE_CONTENT = b"raspios image content"
+
+
+class RemoteBootMigrationTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-remote-boot-migration-test")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def test_parse_the_last_line_of_the_script_output(self) -> None:
+        output = '{"progress_bytes": 4194304}\n\n{"progress_bytes": 8388608}\n{"disk_id": "1a2b3c4d"}\n\n'
+        self.assertEqual(parse_script_output(output), {"disk_id": "1a2b3c4d"})
+        with self.assertRaises(ValueError):
+            parse_script_output(" \n")
+
+    def test_booted_from_target_when_root_partuuid_carries_the_new_disk_id(self) -> None:
+        result = BootMigrationResult("node1", "192.168.1.200", "/dev/sda", migration={"disk_id": "1a2b3c4d"})
+        self.assertFalse(result.is_booted_from_target())
+
+        result.boot_device = {"root_disk": "/dev/sda", "root_partuuid": "1A2B3C4D-02"}
+        self.assertTrue(result.is_booted_from_target())
+
+        result.boot_device = {"root_disk": "/dev/mmcblk0", "root_partuuid": "abcdef01-02"}
+        self.assertFalse(result.is_booted_from_target())
+
+        result.boot_device = {"root_disk": "/dev/mmcblk0", "root_partuuid": None}
+        self.assertFalse(result.is_booted_from_target())
+
+    def test_open_raw_image_files_as_they_are(self) -> None:
+        image_path = os.path.join(self.work_dir, "raspios.img.xz")
+        with open(image_path, "wb") as f:
+            f.write(TEST_IMAGE_CONTENT)
+        with open_image_file(image_path) as image:
+            self.assertEqual(image.read(), TEST_IMAGE_CONTENT)
+
+    def test_open_the_image_member_of_zip_archives(self) -> None:
+        archive_path = os.path.join(self.work_dir, "raspios.zip")
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("README.txt", "not an image")
+            archive.writestr("raspios.IMG", TEST_IMAGE_CONTENT)
+        with open_image_file(archive_path) as image:
+            self.assertEqual(image.read(), TEST_IMAGE_CONTENT)
+
+    def test_refuse_zip_archives_without_an_image(self) -> None:
+        archive_path = os.path.join(self.work_dir, "raspios.zip")
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("README.txt", "not an image")
+        with self.assertRaisesRegex(ValueError, "No .img file"):
+            with open_image_file(archive_path):
+                pass
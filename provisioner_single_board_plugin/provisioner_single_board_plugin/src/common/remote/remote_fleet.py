@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import os
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.errors.cli_errors import CliApplicationException
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import (
+    ANSIBLE_LOCAL_CONNECTION,
+    AnsibleHost,
+)
+
+DEFAULT_FLEET_FORKS = 10
+DEFAULT_FLEET_REBOOT_STAGGER_SECONDS = 5
+DEFAULT_FLEET_SSH_WAIT_TIMEOUT_SECONDS = 300
+
+FLEET_REBOOT_INITIAL_DELAY_SECONDS = 1
+
+ANSIBLE_FORKS_ENV_VAR = "ANSIBLE_FORKS"
+
+
+class FleetOpts:
+    forks: int
+    reboot_stagger_seconds: int
+    ssh_wait_timeout_seconds: int
+    host_names: List[str]
+
+    def __init__(
+        self,
+        forks: Optional[int] = DEFAULT_FLEET_FORKS,
+        reboot_stagger_seconds: Optional[int] = DEFAULT_FLEET_REBOOT_STAGGER_SECONDS,
+        ssh_wait_timeout_seconds: Optional[int] = DEFAULT_FLEET_SSH_WAIT_TIMEOUT_SECONDS,
+        host_names: Optional[List[str]] = None,
+    ) -> None:
+        self.forks = forks
+        self.reboot_stagger_seconds = reboot_stagger_seconds
+        self.ssh_wait_timeout_seconds = ssh_wait_timeout_seconds
+        self.host_names = host_names if host_names else []
+
+    @staticmethod
+    def parse_host_names(host_names: Optional[str]) -> List[str]:
+        if not host_names:
+            return []
+        return [name.strip() for name in host_names.split(",") if len(name.strip()) > 0]
+
+    def print(self) -> None:
+        logger.debug(
+            "FleetOpts: \n"
+            + f"  forks: {self.forks}\n"
+            + f"  reboot_stagger_seconds: {self.reboot_stagger_seconds}\n"
+            + f"  ssh_wait_timeout_seconds: {self.ssh_wait_timeout_seconds}\n"
+            + f"  host_names: {self.host_names}\n"
+        )
+
+
+def resolve_fleet_hosts(remote_opts: RemoteOpts, host_names: Optional[List[str]] = None) -> List[AnsibleHost]:
+    """
+    Fleet operations are non-interactive, hosts are read from the remote hosts user configuration.
+    Local connection entries are skipped, an optional list of names narrows the selection.
+    """
+    config_hosts = remote_opts.get_config().get_ansible_hosts() if remote_opts and remote_opts.get_config() else None
+    if not config_hosts:
+        raise CliApplicationException("Fleet mode requires remote hosts in user configuration (remote.hosts)")
+
+    hosts = [host for host in config_hosts if ANSIBLE_LOCAL_CONNECTION not in host.ip_address]
+    if host_names:
+        known_names = {host.host for host in hosts}
+        unknown_names = [name for name in host_names if name not in known_names]
+        if unknown_names:
+            raise CliApplicationException(f"Unknown fleet host names, not found in user configuration: {unknown_names}")
+        hosts = [host for host in hosts if host.host in host_names]
+
+    if len(hosts) == 0:
+        raise CliApplicationException("No remote hosts were selected for the fleet operation")
+    return hosts
+
+
+def get_staggered_reboot_delays(ansible_hosts: List[AnsibleHost], reboot_stagger_seconds: int) -> Dict[str, int]:
+    """Reboot delay per host name, must match the delay computed by the fleet playbook from the inventory order"""
+    return {
+        host.host: FLEET_REBOOT_INITIAL_DELAY_SECONDS + reboot_stagger_seconds * index
+        for index, host in enumerate(ansible_hosts)
+    }
+
+
+@contextmanager
+def ansible_forks(forks: int):
+    """
+    The Ansible runner has no forks argument, it inherits the process environment instead.
+    Set ANSIBLE_FORKS for the duration of a single run and restore the previous value afterwards.
+    """
+    previous = os.environ.get(ANSIBLE_FORKS_ENV_VAR)
+    os.environ[ANSIBLE_FORKS_ENV_VAR] = str(forks)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(ANSIBLE_FORKS_ENV_VAR, None)
+        else:
+            os.environ[ANSIBLE_FORKS_ENV_VAR] = previous
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+import csv
+import inspect
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import run_ssh_python
+from provisioner_single_board_plugin.src.common.system import native_system_reader
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS = 15
+DEFAULT_COLLECT_MAX_WORKERS = 10
+
+OUTPUT_FORMAT_TABLE = "table"
+OUTPUT_FORMAT_JSON = "json"
+OUTPUT_FORMAT_CSV = "csv"
+OUTPUT_FORMATS = [OUTPUT_FORMAT_TABLE, OUTPUT_FORMAT_JSON, OUTPUT_FORMAT_CSV]
+
+CSV_COLUMNS = [
+    "host_name",
+    "ip_address",
+    "status",
+    "model",
+    "os_name",
+    "kernel_release",
+    "cpu_cores",
+    "mem_total_kb",
+    "mem_available_kb",
+    "cpu_temperature_celsius",
+    "throttled_flags",
+    "uptime_seconds",
+    "network_interfaces",
+    "elapsed_seconds",
+    "error",
+]
+
+# The reader module is standard library only, its source is piped to the node python3 interpreter as is.
+# Nothing needs to be installed on the node and no Ansible run is involved.
+REMOTE_COLLECT_SCRIPT = inspect.getsource(native_system_reader) + """
+if __name__ == "__main__":
+    import json as _json
+    _snapshot = NativeSystemReader().read()
+    _result = _snapshot.to_dict()
+    _result["throttled_flags"] = _snapshot.throttled_flags()
+    print(_json.dumps(_result))
+"""
+
+
+class HostSystemInfo:
+
+    host_name: str
+    ip_address: str
+    snapshot: Optional[Dict[str, Any]]
+    error: Optional[str]
+    elapsed_seconds: float
+
+    def __init__(
+        self,
+        host_name: str,
+        ip_address: str,
+        snapshot: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        elapsed_seconds: Optional[float] = 0,
+    ) -> None:
+        self.host_name = host_name
+        self.ip_address = ip_address
+        self.snapshot = snapshot
+        self.error = error
+        self.elapsed_seconds = elapsed_seconds
+
+    def is_ok(self) -> bool:
+        return self.snapshot is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "host_name": self.host_name,
+            "ip_address": self.ip_address,
+            "status": "ok" if self.is_ok() else "failed",
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "error": self.error,
+            "system_info": self.snapshot,
+        }
+
+
+class RemoteSystemInfoFleetCollector:
+    """
+    Collect system information from many nodes concurrently over plain SSH.
+    Every network operation of a host is bounded by the per host timeout, a dead node is reported
+    as failed instead of stalling the whole collection.
+    """
+
+    timeout_seconds: float
+    max_workers: int
+
+    def __init__(
+        self,
+        timeout_seconds: Optional[float] = DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+        max_workers: Optional[int] = DEFAULT_COLLECT_MAX_WORKERS,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.max_workers = max_workers
+
+    def collect_host(self, ansible_host: AnsibleHost) -> HostSystemInfo:
+        started = time.monotonic()
+        try:
+            snapshot = run_ssh_python(ansible_host, REMOTE_COLLECT_SCRIPT, self.timeout_seconds)
+            return HostSystemInfo(
+                host_name=ansible_host.host,
+                ip_address=ansible_host.ip_address,
+                snapshot=snapshot,
+                elapsed_seconds=time.monotonic() - started,
+            )
+        except Exception as ex:
+            logger.debug(f"Failed to collect system info. host: {ansible_host.host}, error: {ex}")
+            return HostSystemInfo(
+                host_name=ansible_host.host,
+                ip_address=ansible_host.ip_address,
+                error=str(ex) or ex.__class__.__name__,
+                elapsed_seconds=time.monotonic() - started,
+            )
+
+    def collect(self, ansible_hosts: List[AnsibleHost]) -> List[HostSystemInfo]:
+        """Results keep the order of the given hosts"""
+        if not ansible_hosts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ansible_hosts))) as executor:
+            return list(executor.map(self.collect_host, ansible_hosts))
+
+
+def to_json(results: List[HostSystemInfo]) -> str:
+    return json.dumps([result.to_dict() for result in results], indent=2)
+
+
+def to_csv(results: List[HostSystemInfo]) -> str:
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=CSV_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    for result in results:
+        writer.writerow(_to_row(result))
+    return output.getvalue()
+
+
+def _to_row(result: HostSystemInfo) -> Dict[str, Any]:
+    snapshot = result.snapshot if result.snapshot else {}
+    row = {column: snapshot.get(column) for column in CSV_COLUMNS}
+    row.update(
+        {
+            "host_name": result.host_name,
+            "ip_address": result.ip_address,
+            "status": "ok" if result.is_ok() else "failed",
+            "throttled_flags": " ".join(snapshot.get("throttled_flags", [])),
+            "network_interfaces": " ".join(
+                [
+                    f"{interface['name']}:{interface['operstate']}"
+                    for interface in snapshot.get("network_interfaces", [])
+                ]
+            ),
+            "elapsed_seconds": round(result.elapsed_seconds, 3),
+            "error": result.error,
+        }
+    )
+    return row
+
+
+def generate_fleet_system_info_table(results: List[HostSystemInfo]) -> str:
+    lines = []
+    for result in results:
+        if not result.is_ok():
+            lines.append(f"  [red]{result.host_name}[/red] ({result.ip_address}): failed, {result.error}")
+            continue
+        row = _to_row(result)
+        mem_total_mb = int(row["mem_total_kb"] / 1024) if row["mem_total_kb"] else "-"
+        mem_available_mb = int(row["mem_available_kb"] / 1024) if row["mem_available_kb"] else "-"
+        lines.append(
+            f"  [green]{result.host_name}[/green] ({result.ip_address}): "
+            + f"{row['model'] or '-'}, {row['os_name'] or '-'}, {row['cpu_cores'] or '-'} cores, mem {mem_available_mb}/{mem_total_mb} MB available, "
+            + f"temp {row['cpu_temperature_celsius'] or '-'} C"
+            + (f", [yellow]{row['throttled_flags']}[/yellow]" if row["throttled_flags"] else "")
+        )
+
+    failed = len([result for result in results if not result.is_ok()])
+    return f"""
+[green]System Information ({len(results) - failed}/{len(results)} hosts collected)[/green]
+
+{chr(10).join(lines)}
+"""
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import csv
+import io
+import json
+import socket
+import subprocess
+import sys
+import time
+import unittest
+
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    CSV_COLUMNS,
+    REMOTE_COLLECT_SCRIPT,
+    HostSystemInfo,
+    RemoteSystemInfoFleetCollector,
+    generate_fleet_system_info_table,
+    to_csv,
+    to_json,
+)
+
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/remote_fleet_system_info_test.py
+#
+
+TEST_SNAPSHOT = {
+    "hostname": "node1",
+    "model": "Raspberry Pi 4 Model B Rev 1.4",
+    "os_name": "Raspbian GNU/Linux 12 (bookworm)",
+    "cpu_cores": 4,
+    "mem_total_kb": 3884096,
+    "mem_available_kb": 3145728,
+    "cpu_temperature_celsius": 48.2,
+    "throttled_flags": ["under-voltage-occurred"],
+    "network_interfaces": [{"name": "eth0", "operstate": "up"}],
+}
+
+
+def create_results():
+    return [
+        HostSystemInfo("node1", "192.168.1.200", snapshot=TEST_SNAPSHOT, elapsed_seconds=0.1234),
+        HostSystemInfo("node2", "192.168.1.201", error="timed out", elapsed_seconds=15),
+    ]
+
+
+class FakeRemoteSystemInfoFleetCollector(RemoteSystemInfoFleetCollector):
+
+    def collect_host(self, ansible_host: AnsibleHost) -> HostSystemInfo:
+        # Reverse completion order, results must still follow the hosts order
+        time.sleep(0.05 if ansible_host.host == "node0" else 0)
+        return HostSystemInfo(ansible_host.host, ansible_host.ip_address, snapshot={"hostname": ansible_host.host})
+
+
+class RemoteFleetSystemInfoTestShould(unittest.TestCase):
+
+    def test_remote_script_runs_with_standard_library_only(self) -> None:
+        output = subprocess.run(
+            [sys.executable, "-I", "-S", "-"], input=REMOTE_COLLECT_SCRIPT, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output)
+        self.assertIn("hostname", result)
+        self.assertIn("throttled_flags", result)
+        self.assertIsInstance(result["network_interfaces"], list)
+
+    def test_unreachable_host_is_reported_as_failed(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        closed_port = sock.getsockname()[1]
+        sock.close()
+
+        host = AnsibleHost(host="node1", ip_address="127.0.0.1", port=closed_port, username="pi", password="secret")
+        result = RemoteSystemInfoFleetCollector(timeout_seconds=1).collect_host(host)
+        self.assertFalse(result.is_ok())
+        self.assertIsNotNone(result.error)
+        self.assertEqual(result.to_dict()["status"], "failed")
+
+    def test_collect_concurrently_keeping_hosts_order(self) -> None:
+        hosts = [AnsibleHost(host=f"node{i}", ip_address=f"10.0.0.{i}") for i in range(4)]
+        results = FakeRemoteSystemInfoFleetCollector(max_workers=4).collect(hosts)
+        self.assertEqual([result.host_name for result in results], ["node0", "node1", "node2", "node3"])
+        self.assertEqual(FakeRemoteSystemInfoFleetCollector().collect([]), [])
+
+    def test_export_json(self) -> None:
+        exported = json.loads(to_json(create_results()))
+        self.assertEqual([item["status"] for item in exported], ["ok", "failed"])
+        self.assertEqual(exported[0]["system_info"]["model"], TEST_SNAPSHOT["model"])
+        self.assertEqual(exported[1]["error"], "timed out")
+
+    def test_export_csv(self) -> None:
+        rows = list(csv.DictReader(io.StringIO(to_csv(create_results()))))
+        self.assertEqual(list(rows[0].keys()), CSV_COLUMNS)
+        self.assertEqual(rows[0]["throttled_flags"], "under-voltage-occurred")
+        self.assertEqual(rows[0]["network_interfaces"], "eth0:up")
+        self.assertEqual(rows[0]["elapsed_seconds"], "0.123")
+        self.assertEqual(rows[1]["status"], "failed")
+        self.assertEqual(rows[1]["model"], "")
+
+    def test_table_counts_collected_hosts(self) -> None:
+        table = generate_fleet_system_info_table(create_results())
+        self.assertIn("1/2 hosts collected", table)
+        self.assertIn("mem 3072/3793 MB available", table)
+        self.assertIn("node2[/red] (192.168.1.201): failed, timed out", table)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import os
+import unittest
+
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import (
+    ANSIBLE_FORKS_ENV_VAR,
+    FleetOpts,
+    ansible_forks,
+    get_staggered_reboot_delays,
+    resolve_fleet_hosts,
+)
+
+from provisioner_shared.components.remote.remote_opts_fakes import (
+    TEST_DATA_SSH_HOSTNAME_1,
+    TEST_DATA_SSH_HOSTNAME_2,
+    TestDataRemoteOpts,
+)
+from provisioner_shared.components.runtime.errors.cli_errors import CliApplicationException
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/remote_fleet_test.py
+#
+
+
+class RemoteFleetTestShould(unittest.TestCase):
+
+    def test_parse_comma_separated_host_names(self) -> None:
+        self.assertEqual(FleetOpts.parse_host_names(" node1, node2,,node3 "), ["node1", "node2", "node3"])
+        self.assertEqual(FleetOpts.parse_host_names(None), [])
+
+    def test_resolve_all_hosts_from_user_config(self) -> None:
+        hosts = resolve_fleet_hosts(TestDataRemoteOpts.create_fake_cli_remote_opts())
+        self.assertEqual([host.host for host in hosts], [TEST_DATA_SSH_HOSTNAME_1, TEST_DATA_SSH_HOSTNAME_2])
+
+    def test_resolve_hosts_narrowed_by_name(self) -> None:
+        hosts = resolve_fleet_hosts(TestDataRemoteOpts.create_fake_cli_remote_opts(), [TEST_DATA_SSH_HOSTNAME_2])
+        self.assertEqual([host.host for host in hosts], [TEST_DATA_SSH_HOSTNAME_2])
+
+    def test_fail_on_unknown_host_name(self) -> None:
+        with self.assertRaises(CliApplicationException):
+            resolve_fleet_hosts(TestDataRemoteOpts.create_fake_cli_remote_opts(), ["unknown-node"])
+
+    def test_stagger_reboot_delays_by_inventory_order(self) -> None:
+        hosts = [AnsibleHost(host=f"node{i}", ip_address=f"10.0.0.{i}") for i in range(3)]
+        self.assertEqual(get_staggered_reboot_delays(hosts, 5), {"node0": 1, "node1": 6, "node2": 11})
+
+    def test_set_and_restore_ansible_forks_env_var(self) -> None:
+        previous = os.environ.pop(ANSIBLE_FORKS_ENV_VAR, None)
+        try:
+            with ansible_forks(20):
+                self.assertEqual(os.environ[ANSIBLE_FORKS_ENV_VAR], "20")
+            self.assertNotIn(ANSIBLE_FORKS_ENV_VAR, os.environ)
+        finally:
+            if previous is not None:
+                os.environ[ANSIBLE_FORKS_ENV_VAR] = previous
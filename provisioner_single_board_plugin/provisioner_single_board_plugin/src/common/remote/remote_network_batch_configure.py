@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+
+from typing import Dict, List, Optional, Set
+
+from loguru import logger
+from provisioner_single_board_plugin.src.common.hosts.managed_hosts_file import ManagedHostsFile
+from provisioner_single_board_plugin.src.common.remote.ip_pool import IpPool, assign_static_ips
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanInventoryRemoteMachineConnector
+from provisioner_single_board_plugin.src.common.remote.reachability import (
+    ReachabilityTarget,
+    ReadyHost,
+    SSHReachabilityPoller,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import (
+    FleetOpts,
+    ansible_forks,
+    get_staggered_reboot_delays,
+    resolve_fleet_hosts,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_network_configure import generate_logo_network
+from provisioner_single_board_plugin.src.config.domain.config import SingleBoardLanInventoryConfig
+
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.errors.cli_errors import CliApplicationException
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.remote_context import RemoteContext
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import (
+    AnsibleHost,
+    AnsiblePlaybook,
+    AnsibleRunnerLocal,
+)
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+from provisioner_shared.components.runtime.utils.checks import Checks
+
+# Extra vars are shared by all hosts, the per host static IP address is rendered into the play vars instead.
+# Host name is taken from the inventory, reboots are detached and staggered as in fleet OS configure.
+ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK_BATCH_HEAD = """
+---
+- name: Configure static IP addresses and hostnames on a batch of remote RPi hosts
+  hosts: selected_hosts
+  gather_facts: no
+  {modifiers}
+
+  vars:
+    host_name: "{{{{ inventory_hostname }}}}"
+    static_ip: "{{{{ static_ip_by_host[inventory_hostname] }}}}"
+    reboot_delay_seconds: "{{{{ 1 + (reboot_stagger_seconds | int) * ansible_play_hosts_all.index(inventory_hostname) }}}}"
+    static_ip_by_host:
+"""
+
+ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK_BATCH_TAIL = """
+  roles:
+    - role: {ansible_playbooks_path}/roles/rpi_config_network
+      tags: ['configure_rpi_network']
+
+    - role: {ansible_playbooks_path}/roles/dhcp_static_ip
+      tags: ['define_static_ip']
+
+  post_tasks:
+    - name: Schedule a staggered reboot
+      command: "systemd-run --on-active={{{{ reboot_delay_seconds }}}} /bin/systemctl reboot"
+      become: "{{{{ become_root }}}}"
+      when: reboot_required | bool
+      tags: ['trigger_reboot']
+"""
+
+
+class RemoteMachineNetworkBatchConfigureArgs:
+
+    remote_opts: RemoteOpts
+    fleet_opts: FleetOpts
+    ip_pool: str
+    gw_ip_address: str
+    dns_ip_address: str
+    update_hosts_file: bool
+    lan_inventory_cfg: SingleBoardLanInventoryConfig
+
+    def __init__(
+        self,
+        remote_opts: RemoteOpts,
+        fleet_opts: FleetOpts,
+        ip_pool: str,
+        gw_ip_address: str,
+        dns_ip_address: str,
+        update_hosts_file: Optional[bool] = False,
+        lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None,
+    ) -> None:
+        self.remote_opts = remote_opts
+        self.fleet_opts = fleet_opts
+        self.ip_pool = ip_pool
+        self.gw_ip_address = gw_ip_address
+        self.dns_ip_address = dns_ip_address
+        self.update_hosts_file = update_hosts_file
+        self.lan_inventory_cfg = lan_inventory_cfg
+
+
+class RemoteMachineNetworkBatchConfigureRunner:
+
+    def run(
+        self, ctx: Context, args: RemoteMachineNetworkBatchConfigureArgs, collaborators: CoreCollaborators
+    ) -> List[ReadyHost]:
+        logger.debug("Inside RemoteMachineNetworkBatchConfigureRunner run()")
+
+        self._prerequisites(ctx=ctx, checks=collaborators.checks())
+        if not args.gw_ip_address or not args.dns_ip_address:
+            raise CliApplicationException("Batch network configure requires both gateway and DNS addresses")
+
+        ansible_hosts = resolve_fleet_hosts(args.remote_opts, args.fleet_opts.host_names)
+        ip_pool = IpPool.parse(args.ip_pool)
+        occupied_addresses = self._collect_occupied_addresses(ctx, ip_pool, collaborators, args.lan_inventory_cfg)
+        assignments = assign_static_ips(
+            ansible_hosts,
+            ip_pool,
+            occupied_addresses=occupied_addresses,
+            reserved_addresses={args.gw_ip_address, args.dns_ip_address},
+        )
+        collaborators.summary().append("static_ip_assignments", assignments)
+        self._print_pre_run_instructions(ansible_hosts, assignments, collaborators)
+        collaborators.summary().show_summary_and_prompt_for_enter("Configure Network (Batch)")
+
+        output = (
+            collaborators.progress_indicator()
+            .get_status()
+            .long_running_process_fn(
+                call=lambda: self._run_ansible(
+                    collaborators.ansible_runner(),
+                    args.remote_opts.get_remote_context(),
+                    ansible_hosts,
+                    assignments,
+                    args,
+                ),
+                desc_run=f"Running Ansible playbook (Configure Network, {len(ansible_hosts)} hosts)",
+                desc_end="Ansible playbook finished (Configure Network).",
+            )
+        )
+        collaborators.printer().new_line_fn().print_fn(output)
+
+        if ctx.is_dry_run():
+            return []
+
+        ready_hosts = self._wait_for_batch_reboot(ansible_hosts, assignments, args.fleet_opts, collaborators)
+        collaborators.summary().append("ready_hosts", ready_hosts)
+        self._print_post_run_instructions(ansible_hosts, assignments, ready_hosts, collaborators)
+        self._maybe_add_hosts_file_entries(ctx, ready_hosts, collaborators, args.update_hosts_file)
+        return ready_hosts
+
+    def _collect_occupied_addresses(
+        self,
+        ctx: Context,
+        ip_pool: IpPool,
+        collaborators: CoreCollaborators,
+        lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None,
+    ) -> Set[str]:
+        if ctx.is_dry_run():
+            return set()
+
+        connector = LanInventoryRemoteMachineConnector.create(collaborators, lan_inventory_cfg)
+        occupied_addresses = set()
+        for scan_range in ip_pool.scan_ranges:
+            occupied_addresses.update([host.ip_address for host in connector.resolve_lan_hosts(scan_range)])
+        logger.debug(f"Occupied addresses within the IP pool: {sorted(occupied_addresses)}")
+        return occupied_addresses
+
+    def _run_ansible(
+        self,
+        runner: AnsibleRunnerLocal,
+        remote_ctx: RemoteContext,
+        ansible_hosts: List[AnsibleHost],
+        assignments: Dict[str, str],
+        args: RemoteMachineNetworkBatchConfigureArgs,
+    ) -> str:
+
+        with ansible_forks(args.fleet_opts.forks):
+            return runner.run_fn(
+                selected_hosts=ansible_hosts,
+                playbook=AnsiblePlaybook(
+                    name="rpi_configure_network_batch",
+                    content=generate_batch_network_playbook(assignments),
+                    remote_context=remote_ctx,
+                ),
+                ansible_vars=[
+                    f"gateway_address={args.gw_ip_address}",
+                    f"dns_address={args.dns_ip_address}",
+                    f"become_root={'no' if remote_ctx.is_dry_run() else 'yes'}",
+                    f"reboot_required={'false' if remote_ctx.is_dry_run() else 'true'}",
+                    f"reboot_stagger_seconds={args.fleet_opts.reboot_stagger_seconds}",
+                ],
+                ansible_tags=[
+                    "configure_rpi_network",
+                    "define_static_ip",
+                ]
+                + (["trigger_reboot"] if not remote_ctx.is_dry_run() else []),
+            )
+
+    def _wait_for_batch_reboot(
+        self,
+        ansible_hosts: List[AnsibleHost],
+        assignments: Dict[str, str],
+        fleet_opts: FleetOpts,
+        collaborators: CoreCollaborators,
+    ) -> List[ReadyHost]:
+
+        reboot_delays = get_staggered_reboot_delays(ansible_hosts, fleet_opts.reboot_stagger_seconds)
+        targets = [
+            ReachabilityTarget.from_ansible_host(
+                host, new_ip_address=assignments[host.host], reboot_delay_seconds=reboot_delays[host.host]
+            )
+            for host in ansible_hosts
+        ]
+        poller = SSHReachabilityPoller(timeout_seconds=fleet_opts.ssh_wait_timeout_seconds)
+        return (
+            collaborators.progress_indicator()
+            .get_status()
+            .long_running_process_fn(
+                call=lambda: poller.wait_until_ready(targets),
+                desc_run=f"Waiting for {len(ansible_hosts)} hosts to reboot",
+                desc_end="Batch reboot finished.",
+            )
+        )
+
+    def _maybe_add_hosts_file_entries(
+        self,
+        ctx: Context,
+        ready_hosts: List[ReadyHost],
+        collaborators: CoreCollaborators,
+        update_hosts_file: bool,
+    ) -> None:
+        if not update_hosts_file:
+            collaborators.printer().print_fn("Skipping hosts file update as --update-hosts-file flag was not specified")
+            return
+
+        hosts_file = ManagedHostsFile.create(ctx, collaborators.process())
+        for ready_host in ready_hosts:
+            if ready_host.ready:
+                hosts_file.add_entry(ip_address=ready_host.ip_address, dns_names=[ready_host.name])
+
+        if not hosts_file.has_pending_entries():
+            return
+        collaborators.printer().print_fn(
+            "Updating hosts file with the remote IP addresses and hostnames (Password required)\n"
+        )
+        if not hosts_file.flush():
+            collaborators.printer().print_fn("Hosts file already up to date")
+
+    def _print_pre_run_instructions(
+        self, ansible_hosts: List[AnsibleHost], assignments: Dict[str, str], collaborators: CoreCollaborators
+    ):
+        collaborators.printer().print_fn(generate_logo_network())
+        collaborators.printer().print_with_rich_table_fn(
+            generate_instructions_pre_network_batch(ansible_hosts, assignments)
+        )
+
+    def _print_post_run_instructions(
+        self,
+        ansible_hosts: List[AnsibleHost],
+        assignments: Dict[str, str],
+        ready_hosts: List[ReadyHost],
+        collaborators: CoreCollaborators,
+    ):
+        collaborators.printer().print_with_rich_table_fn(
+            generate_instructions_post_network_batch(ansible_hosts, assignments, ready_hosts)
+        )
+
+    def _prerequisites(self, ctx: Context, checks: Checks) -> None:
+        if ctx.os_arch.is_linux():
+            return
+        elif ctx.os_arch.is_darwin():
+            return
+        elif ctx.os_arch.is_windows():
+            raise NotImplementedError("Windows is not supported")
+        else:
+            raise NotImplementedError("OS is not supported")
+
+
+def generate_batch_network_playbook(assignments: Dict[str, str]) -> str:
+    static_ip_by_host = ""
+    for host_name, static_ip in assignments.items():
+        static_ip_by_host += f'      "{host_name}": "{static_ip}"\n'
+    return (
+        ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK_BATCH_HEAD
+        + static_ip_by_host
+        + ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK_BATCH_TAIL
+    )
+
+
+def generate_instructions_pre_network_batch(ansible_hosts: List[AnsibleHost], assignments: Dict[str, str]) -> str:
+    hosts = ""
+    for host in ansible_hosts:
+        hosts += (
+            f"    • [yellow]{host.host}[/yellow]: {host.ip_address} --> [yellow]{assignments[host.host]}[/yellow]\n"
+        )
+
+    return f"""
+  Assigning static IP addresses to a batch of Raspberry Pi nodes ([yellow]ethernet connected[/yellow]):
+
+{hosts}
+  Addresses answering on the LAN, the gateway and the DNS server were excluded from the pool.
+  All nodes are configured within a single Ansible run and rebooted staggered.
+"""
+
+
+def generate_instructions_post_network_batch(
+    ansible_hosts: List[AnsibleHost], assignments: Dict[str, str], ready_hosts: List[ReadyHost]
+) -> str:
+    ready_by_name = {ready_host.name: ready_host for ready_host in ready_hosts}
+    hosts = ""
+    for host in ansible_hosts:
+        ready_host = ready_by_name.get(host.host)
+        if ready_host and ready_host.ready:
+            status = f"[green]ready on {ready_host.ip_address}[/green]"
+        else:
+            status = "[red]not reachable[/red]"
+        hosts += f"    • {host.host}: {host.ip_address} --> {assignments[host.host]}, {status}\n"
+
+    return f"""
+  You have set static IP addresses for a batch of Raspberry Pi nodes:
+
+{hosts}
+  To declare the new static nodes in the provisioner config, update the remote hosts
+  addresses in ~/.config/provisioner/config.yaml accordingly.
+"""
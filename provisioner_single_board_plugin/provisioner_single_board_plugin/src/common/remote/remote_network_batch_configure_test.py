@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest import mock
+
+import yaml
+from provisioner_single_board_plugin.src.common.remote.ip_pool import IpPool
+from provisioner_single_board_plugin.src.common.remote.reachability import ReadyHost
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import (
+    FLEET_REBOOT_INITIAL_DELAY_SECONDS,
+    FleetOpts,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_network_batch_configure import (
+    RemoteMachineNetworkBatchConfigureArgs,
+    RemoteMachineNetworkBatchConfigureRunner,
+    generate_batch_network_playbook,
+)
+
+from provisioner_shared.components.remote.remote_opts_fakes import TestDataRemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.remote_context import RemoteContext
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/remote_network_batch_configure_test.py
+#
+ARG_GW_IP_ADDRESS = "192.168.1.1"
+ARG_DNS_IP_ADDRESS = "192.168.1.2"
+ARG_IP_POOL = "192.168.1.200-192.168.1.203"
+
+REMOTE_NETWORK_BATCH_CONFIGURE_PATH = "provisioner_single_board_plugin.src.common.remote.remote_network_batch_configure"
+REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH = (
+    f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.RemoteMachineNetworkBatchConfigureRunner"
+)
+
+REMOTE_CONTEXT = RemoteContext.create(verbose=True, dry_run=False, silent=False)
+
+TEST_ANSIBLE_HOSTS = [
+    AnsibleHost(host="node1", ip_address="192.168.1.10", username="pi", password="raspberry"),
+    AnsibleHost(host="node2", ip_address="192.168.1.11", username="pi", password="raspberry"),
+]
+
+
+def create_fake_collaborators() -> mock.MagicMock:
+    """Long running calls run right away, the way the progress indicator runs them"""
+    collaborators = mock.MagicMock()
+    collaborators.progress_indicator().get_status().long_running_process_fn.side_effect = (
+        lambda call, desc_run, desc_end: call()
+    )
+    return collaborators
+
+
+class RemoteMachineNetworkBatchConfigureTestShould(unittest.TestCase):
+
+    def test_render_per_host_static_ip_into_play_vars(self) -> None:
+        content = generate_batch_network_playbook({"node1": "192.168.1.200", "node2": "192.168.1.201"})
+        play = yaml.safe_load(content.format(ansible_playbooks_path="/playbooks", modifiers=""))[0]
+
+        self.assertEqual(play["vars"]["static_ip_by_host"], {"node1": "192.168.1.200", "node2": "192.168.1.201"})
+        self.assertEqual(play["vars"]["static_ip"], "{{ static_ip_by_host[inventory_hostname] }}")
+        self.assertEqual([role["tags"] for role in play["roles"]], [["configure_rpi_network"], ["define_static_ip"]])
+        self.assertEqual(play["post_tasks"][0]["tags"], ["trigger_reboot"])
+
+    def create_fake_batch_configure_args(
+        self, update_hosts_file: bool = True
+    ) -> RemoteMachineNetworkBatchConfigureArgs:
+        return RemoteMachineNetworkBatchConfigureArgs(
+            remote_opts=TestDataRemoteOpts.create_fake_cli_remote_opts(remote_context=REMOTE_CONTEXT),
+            fleet_opts=FleetOpts(reboot_stagger_seconds=10, ssh_wait_timeout_seconds=120),
+            ip_pool=ARG_IP_POOL,
+            gw_ip_address=ARG_GW_IP_ADDRESS,
+            dns_ip_address=ARG_DNS_IP_ADDRESS,
+            update_hosts_file=update_hosts_file,
+        )
+
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.resolve_fleet_hosts", return_value=TEST_ANSIBLE_HOSTS)
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._prerequisites")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._collect_occupied_addresses", return_value=set())
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._print_pre_run_instructions")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._run_ansible")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._wait_for_batch_reboot", return_value=[])
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._print_post_run_instructions")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._maybe_add_hosts_file_entries")
+    def test_main_flow_run_actions_have_expected_order(
+        self,
+        maybe_add_hosts_file_call: mock.MagicMock,
+        post_run_call: mock.MagicMock,
+        wait_for_reboot_call: mock.MagicMock,
+        run_ansible_call: mock.MagicMock,
+        pre_run_call: mock.MagicMock,
+        collect_occupied_call: mock.MagicMock,
+        prerequisites_call: mock.MagicMock,
+        resolve_fleet_hosts_call: mock.MagicMock,
+    ) -> None:
+        RemoteMachineNetworkBatchConfigureRunner().run(
+            Context.create(), self.create_fake_batch_configure_args(), create_fake_collaborators()
+        )
+        prerequisites_call.assert_called_once()
+        resolve_fleet_hosts_call.assert_called_once()
+        collect_occupied_call.assert_called_once()
+        pre_run_call.assert_called_once_with(
+            TEST_ANSIBLE_HOSTS, {"node1": "192.168.1.200", "node2": "192.168.1.201"}, mock.ANY
+        )
+        run_ansible_call.assert_called_once()
+        wait_for_reboot_call.assert_called_once()
+        post_run_call.assert_called_once()
+        maybe_add_hosts_file_call.assert_called_once()
+
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.resolve_fleet_hosts", return_value=TEST_ANSIBLE_HOSTS)
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.LanInventoryRemoteMachineConnector.create")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._print_pre_run_instructions")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._run_ansible")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._wait_for_batch_reboot", return_value=[])
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._print_post_run_instructions")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._maybe_add_hosts_file_entries")
+    def test_skip_lan_addresses_occupied_by_other_machines(
+        self,
+        maybe_add_hosts_file_call: mock.MagicMock,
+        post_run_call: mock.MagicMock,
+        wait_for_reboot_call: mock.MagicMock,
+        run_ansible_call: mock.MagicMock,
+        pre_run_call: mock.MagicMock,
+        lan_connector_create_call: mock.MagicMock,
+        resolve_fleet_hosts_call: mock.MagicMock,
+    ) -> None:
+        lan_connector_create_call.return_value.resolve_lan_hosts.return_value = [
+            mock.MagicMock(ip_address="192.168.1.200")
+        ]
+        collaborators = create_fake_collaborators()
+        RemoteMachineNetworkBatchConfigureRunner().run(
+            Context.create(), self.create_fake_batch_configure_args(), collaborators
+        )
+        self.assertEqual(
+            [
+                scan_call.args[0]
+                for scan_call in lan_connector_create_call.return_value.resolve_lan_hosts.call_args_list
+            ],
+            IpPool.parse(ARG_IP_POOL).scan_ranges,
+        )
+        collaborators.summary().append.assert_any_call(
+            "static_ip_assignments", {"node1": "192.168.1.201", "node2": "192.168.1.202"}
+        )
+
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.LanInventoryRemoteMachineConnector.create")
+    def test_collect_occupied_addresses_of_every_scan_range(self, lan_connector_create_call: mock.MagicMock) -> None:
+        lan_connector_create_call.return_value.resolve_lan_hosts.side_effect = lambda scan_range: [
+            mock.MagicMock(ip_address=scan_range.split("/")[0])
+        ]
+        occupied_addresses = RemoteMachineNetworkBatchConfigureRunner()._collect_occupied_addresses(
+            Context.create(), IpPool.parse("192.168.1.200,192.168.1.210"), create_fake_collaborators()
+        )
+        self.assertEqual(occupied_addresses, {"192.168.1.200", "192.168.1.210"})
+
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.resolve_fleet_hosts", return_value=TEST_ANSIBLE_HOSTS)
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.LanInventoryRemoteMachineConnector.create")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._print_pre_run_instructions")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._run_ansible")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._wait_for_batch_reboot")
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_RUNNER_PATH}._maybe_add_hosts_file_entries")
+    def test_dry_run_skips_lan_scan_and_reboot_wait(
+        self,
+        maybe_add_hosts_file_call: mock.MagicMock,
+        wait_for_reboot_call: mock.MagicMock,
+        run_ansible_call: mock.MagicMock,
+        pre_run_call: mock.MagicMock,
+        lan_connector_create_call: mock.MagicMock,
+        resolve_fleet_hosts_call: mock.MagicMock,
+    ) -> None:
+        ready_hosts = RemoteMachineNetworkBatchConfigureRunner().run(
+            Context.create(dry_run=True), self.create_fake_batch_configure_args(), create_fake_collaborators()
+        )
+        self.assertEqual(ready_hosts, [])
+        lan_connector_create_call.assert_not_called()
+        run_ansible_call.assert_called_once()
+        wait_for_reboot_call.assert_not_called()
+        maybe_add_hosts_file_call.assert_not_called()
+
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.SSHReachabilityPoller")
+    def test_wait_for_staggered_reboots_on_old_and_new_addresses(self, poller_class: mock.MagicMock) -> None:
+        ready_hosts = [ReadyHost("node1", "192.168.1.200", 22, 12.5, True), ReadyHost("node2", None, 22, None, False)]
+        poller_class.return_value.wait_until_ready.return_value = ready_hosts
+
+        result = RemoteMachineNetworkBatchConfigureRunner()._wait_for_batch_reboot(
+            TEST_ANSIBLE_HOSTS,
+            {"node1": "192.168.1.200", "node2": "192.168.1.201"},
+            FleetOpts(reboot_stagger_seconds=10, ssh_wait_timeout_seconds=120),
+            create_fake_collaborators(),
+        )
+
+        self.assertEqual(result, ready_hosts)
+        poller_class.assert_called_once_with(timeout_seconds=120)
+        targets = poller_class.return_value.wait_until_ready.call_args.args[0]
+        self.assertEqual([target.name for target in targets], ["node1", "node2"])
+        self.assertEqual(
+            [target.addresses for target in targets],
+            [["192.168.1.10", "192.168.1.200"], ["192.168.1.11", "192.168.1.201"]],
+        )
+        self.assertEqual(
+            [target.reboot_delay_seconds for target in targets],
+            [FLEET_REBOOT_INITIAL_DELAY_SECONDS, FLEET_REBOOT_INITIAL_DELAY_SECONDS + 10],
+        )
+
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.ManagedHostsFile.create")
+    def test_flush_hosts_file_once_for_all_ready_hosts(self, hosts_file_create_call: mock.MagicMock) -> None:
+        hosts_file = hosts_file_create_call.return_value
+        hosts_file.has_pending_entries.return_value = True
+        hosts_file.flush.return_value = True
+
+        RemoteMachineNetworkBatchConfigureRunner()._maybe_add_hosts_file_entries(
+            Context.create(),
+            [
+                ReadyHost("node1", "192.168.1.200", 22, 12.5, True),
+                ReadyHost("node2", None, 22, None, False),
+                ReadyHost("node3", "192.168.1.202", 22, 14.0, True),
+            ],
+            create_fake_collaborators(),
+            update_hosts_file=True,
+        )
+
+        hosts_file_create_call.assert_called_once()
+        self.assertEqual(
+            hosts_file.add_entry.call_args_list,
+            [
+                mock.call(ip_address="192.168.1.200", dns_names=["node1"]),
+                mock.call(ip_address="192.168.1.202", dns_names=["node3"]),
+            ],
+        )
+        hosts_file.flush.assert_called_once()
+
+    @mock.patch(f"{REMOTE_NETWORK_BATCH_CONFIGURE_PATH}.ManagedHostsFile.create")
+    def test_skip_hosts_file_without_the_update_flag(self, hosts_file_create_call: mock.MagicMock) -> None:
+        RemoteMachineNetworkBatchConfigureRunner()._maybe_add_hosts_file_entries(
+            Context.create(),
+            [ReadyHost("node1", "192.168.1.200", 22, 12.5, True)],
+            create_fake_collaborators(),
+            update_hosts_file=False,
+        )
+        hosts_file_create_call.assert_not_called()
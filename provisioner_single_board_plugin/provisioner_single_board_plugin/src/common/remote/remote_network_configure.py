@@ -3,6 +3,23 @@
 from typing import Optional
 
 from loguru import logger
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import get_tracer
+from provisioner_single_board_plugin.src.common.hosts.managed_hosts_file import ManagedHostsFile
+from provisioner_single_board_plugin.src.common.remote.fingerprint import (
+    ANSIBLE_TASKS_STORE_DESIRED_STATE_FINGERPRINT,
+    DesiredStateFingerprint,
+    find_converged_hosts,
+    generate_instructions_converged,
+)
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanInventoryRemoteMachineConnector
+from provisioner_single_board_plugin.src.common.remote.reachability import (
+    REBOOT_TRIGGER_DELAY_SECONDS,
+    ReachabilityTarget,
+    ReadyHost,
+    SSHReachabilityPoller,
+    generate_reboot_status,
+)
+from provisioner_single_board_plugin.src.config.domain.config import SingleBoardLanInventoryConfig
 
 from provisioner_shared.components.remote.remote_connector import (
     NetworkConfigurationInfo,
@@ -13,11 +30,18 @@ from provisioner_shared.components.remote.remote_opts import RemoteOpts
 from provisioner_shared.components.runtime.infra.context import Context
 from provisioner_shared.components.runtime.infra.evaluator import Evaluator
 from provisioner_shared.components.runtime.infra.remote_context import RemoteContext
-from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsiblePlaybook, AnsibleRunnerLocal
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import (
+    AnsibleHost,
+    AnsiblePlaybook,
+    AnsibleRunnerLocal,
+)
 from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
 from provisioner_shared.components.runtime.utils.checks import Checks
 
-ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK = """
+RPI_CONFIGURE_NETWORK_OPERATION = "rpi_configure_network"
+
+ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK = (
+    """
 ---
 - name: Configure static IP address and hostname on remote RPi host
   hosts: selected_hosts
@@ -31,6 +55,17 @@ ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK = """
     - role: {ansible_playbooks_path}/roles/dhcp_static_ip
       tags: ['define_static_ip']
 """
+    + ANSIBLE_TASKS_STORE_DESIRED_STATE_FINGERPRINT
+    + """
+  # Detached reboot, the controller polls both the old and the static address once the delay passed
+  post_tasks:
+    - name: Schedule a detached reboot
+      command: "systemd-run --on-active={{{{ reboot_delay_seconds }}}} /bin/systemctl reboot"
+      become: "{{{{ become_root }}}}"
+      when: reboot_required | bool
+      tags: ['trigger_reboot']
+"""
+)
 
 
 class RemoteMachineNetworkConfigureArgs:
@@ -39,6 +74,8 @@ class RemoteMachineNetworkConfigureArgs:
     static_ip_address: str
     remote_opts: RemoteOpts
     update_hosts_file: bool
+    lan_inventory_cfg: SingleBoardLanInventoryConfig
+    force: bool
 
     def __init__(
         self,
@@ -47,12 +84,16 @@ class RemoteMachineNetworkConfigureArgs:
         static_ip_address: str,
         remote_opts: RemoteOpts,
         update_hosts_file: bool = False,
+        lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None,
+        force: Optional[bool] = False,
     ) -> None:
         self.gw_ip_address = gw_ip_address
         self.dns_ip_address = dns_ip_address
         self.static_ip_address = static_ip_address
         self.remote_opts = remote_opts
         self.update_hosts_file = update_hosts_file
+        self.lan_inventory_cfg = lan_inventory_cfg
+        self.force = force
 
 
 class RemoteMachineNetworkConfigureRunner:
@@ -68,35 +109,52 @@ class RemoteMachineNetworkConfigureRunner:
             self.ssh_hostname = ssh_hostname
             self.static_ip_address = static_ip_address
 
-    def run(self, ctx: Context, args: RemoteMachineNetworkConfigureArgs, collaborators: CoreCollaborators) -> None:
+    def run(
+        self, ctx: Context, args: RemoteMachineNetworkConfigureArgs, collaborators: CoreCollaborators
+    ) -> Optional[ReadyHost]:
         logger.debug("Inside RemoteMachineNetworkConfigureRunner run()")
 
         self._prerequisites(ctx=ctx, checks=collaborators.checks())
         self._print_pre_run_instructions(collaborators)
-        ssh_conn_info = self._get_ssh_conn_info(ctx, collaborators, args.remote_opts)
+        ssh_conn_info = self._get_ssh_conn_info(ctx, collaborators, args.remote_opts, args.lan_inventory_cfg)
         network_configure_info = self._get_network_configure_info(ctx, collaborators, args, ssh_conn_info)
 
+        fingerprint = create_configure_network_fingerprint(ssh_conn_info.ansible_hosts[0].host, network_configure_info)
+        if self._is_converged(ctx, ssh_conn_info.ansible_hosts[0], fingerprint, args.force):
+            ready_host = self._skip_converged_node(ssh_conn_info.ansible_hosts[0], collaborators)
+            tuple_info = (ssh_conn_info, network_configure_info)
+            self._maybe_add_hosts_file_entry(ctx, tuple_info, collaborators, args.update_hosts_file)
+            return ready_host
+
         tuple_info = self._run_ansible_network_configure_playbook_with_progress_bar(
             ctx=ctx,
             ssh_conn_info=ssh_conn_info,
             network_configure_info=network_configure_info,
             collaborators=collaborators,
             args=args,
+            fingerprint=fingerprint,
         )
-        self._print_post_run_instructions(ctx, tuple_info, collaborators)
+        ready_host = self._wait_for_node_ready(ctx, tuple_info, collaborators)
+        self._print_post_run_instructions(ctx, tuple_info, collaborators, ready_host)
         self._maybe_add_hosts_file_entry(ctx, tuple_info, collaborators, args.update_hosts_file)
+        return ready_host
 
     def _get_ssh_conn_info(
-        self, ctx: Context, collaborators: CoreCollaborators, remote_opts: Optional[RemoteOpts] = None
+        self,
+        ctx: Context,
+        collaborators: CoreCollaborators,
+        remote_opts: Optional[RemoteOpts] = None,
+        lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None,
     ) -> SSHConnectionInfo:
 
-        ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
-            call=lambda: RemoteMachineConnector(collaborators=collaborators).collect_ssh_connection_info(
-                ctx, remote_opts, force_single_conn_info=True
-            ),
-            ctx=ctx,
-            err_msg="Could not resolve SSH connection info",
-        )
+        with get_tracer().span("resolve ssh connection"):
+            ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
+                call=lambda: LanInventoryRemoteMachineConnector.create(
+                    collaborators, lan_inventory_cfg
+                ).collect_ssh_connection_info(ctx, remote_opts, force_single_conn_info=True),
+                ctx=ctx,
+                err_msg="Could not resolve SSH connection info",
+            )
         collaborators.summary().append("ssh_conn_info", ssh_conn_info)
         return ssh_conn_info
 
@@ -108,17 +166,18 @@ class RemoteMachineNetworkConfigureRunner:
         ssh_conn_info: SSHConnectionInfo,
     ) -> NetworkConfigurationInfo:
 
-        network_configure_info = Evaluator.eval_step_return_value_throw_on_failure(
-            call=lambda: RemoteMachineConnector(collaborators=collaborators).collect_network_configuration_info(
+        with get_tracer().span("resolve network configuration"):
+            network_configure_info = Evaluator.eval_step_return_value_throw_on_failure(
+                call=lambda: RemoteMachineConnector(collaborators=collaborators).collect_network_configuration_info(
+                    ctx=ctx,
+                    ansible_hosts=ssh_conn_info.ansible_hosts,
+                    static_ip_address=args.static_ip_address,
+                    gw_ip_address=args.gw_ip_address,
+                    dns_ip_address=args.dns_ip_address,
+                ),
                 ctx=ctx,
-                ansible_hosts=ssh_conn_info.ansible_hosts,
-                static_ip_address=args.static_ip_address,
-                gw_ip_address=args.gw_ip_address,
-                dns_ip_address=args.dns_ip_address,
-            ),
-            ctx=ctx,
-            err_msg="Could not resolve network configuration info",
-        )
+                err_msg="Could not resolve network configuration info",
+            )
         collaborators.summary().append("network_configure_info", network_configure_info)
         return network_configure_info
 
@@ -129,6 +188,7 @@ class RemoteMachineNetworkConfigureRunner:
         network_configure_info: NetworkConfigurationInfo,
         collaborators: CoreCollaborators,
         args: RemoteMachineNetworkConfigureArgs,
+        fingerprint: Optional[DesiredStateFingerprint] = None,
     ) -> tuple[SSHConnectionInfo, NetworkConfigurationInfo]:
 
         tuple_info = (ssh_conn_info, network_configure_info)
@@ -144,6 +204,7 @@ class RemoteMachineNetworkConfigureRunner:
                     network_info.ssh_hostname,
                     ssh_conn_info,
                     network_configure_info,
+                    fingerprint,
                 ),
                 desc_run="Running Ansible playbook (Configure Network)",
                 desc_end="Ansible playbook finished (Configure Network).",
@@ -159,35 +220,83 @@ class RemoteMachineNetworkConfigureRunner:
         ssh_hostname: str,
         ssh_conn_info: SSHConnectionInfo,
         network_configure_info: NetworkConfigurationInfo,
+        fingerprint: Optional[DesiredStateFingerprint] = None,
     ) -> str:
 
-        return runner.run_fn(
-            selected_hosts=ssh_conn_info.ansible_hosts,
-            playbook=AnsiblePlaybook(
-                name="rpi_configure_network",
-                content=ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK,
-                remote_context=remote_ctx,
-            ),
-            ansible_vars=[
-                f"host_name={ssh_hostname}",
-                f"static_ip={network_configure_info.static_ip_address}",
-                f"gateway_address={network_configure_info.gw_ip_address}",
-                f"dns_address={network_configure_info.dns_ip_address}",
-                f"become_root={'no' if remote_ctx.is_dry_run() else 'yes'}",
-                f"reboot_required={'false' if remote_ctx.is_dry_run() else 'true'}",
-            ],
-            ansible_tags=[
-                "configure_rpi_network",
-                "define_static_ip",
-            ]
-            + (["reboot"] if not remote_ctx.is_dry_run() else []),
+        with get_tracer().span("ansible configure network", host=ssh_hostname):
+            return runner.run_fn(
+                selected_hosts=ssh_conn_info.ansible_hosts,
+                playbook=AnsiblePlaybook(
+                    name="rpi_configure_network",
+                    content=ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK,
+                    remote_context=remote_ctx,
+                ),
+                ansible_vars=[
+                    f"host_name={ssh_hostname}",
+                    f"static_ip={network_configure_info.static_ip_address}",
+                    f"gateway_address={network_configure_info.gw_ip_address}",
+                    f"dns_address={network_configure_info.dns_ip_address}",
+                    f"become_root={'no' if remote_ctx.is_dry_run() else 'yes'}",
+                    f"reboot_required={'false' if remote_ctx.is_dry_run() else 'true'}",
+                    f"reboot_delay_seconds={REBOOT_TRIGGER_DELAY_SECONDS}",
+                ]
+                + (fingerprint.to_ansible_vars() if fingerprint and not remote_ctx.is_dry_run() else []),
+                ansible_tags=[
+                    "configure_rpi_network",
+                    "define_static_ip",
+                ]
+                + (["trigger_reboot"] if not remote_ctx.is_dry_run() else []),
+            )
+
+    def _is_converged(
+        self, ctx: Context, ansible_host: AnsibleHost, fingerprint: DesiredStateFingerprint, force: bool
+    ) -> bool:
+        if force or ctx.is_dry_run():
+            return False
+        return len(find_converged_hosts([ansible_host], fingerprint)) > 0
+
+    def _skip_converged_node(self, ansible_host: AnsibleHost, collaborators: CoreCollaborators) -> ReadyHost:
+        logger.debug(f"Node already matches the desired network state, skipping. host: {ansible_host.host}")
+        ready_host = ReadyHost.without_reboot(ansible_host)
+        collaborators.summary().append("ready_host", ready_host)
+        collaborators.printer().print_fn(generate_instructions_converged(ansible_host))
+        return ready_host
+
+    def _wait_for_node_ready(
+        self,
+        ctx: Context,
+        tuple_info: tuple[SSHConnectionInfo, NetworkConfigurationInfo],
+        collaborators: CoreCollaborators,
+    ) -> Optional[ReadyHost]:
+        if ctx.is_dry_run():
+            return None
+
+        # The node may come back on the static IP address or, if it was not applied, on the previous one
+        ansible_host = tuple_info[0].ansible_hosts[0]
+        target = ReachabilityTarget.from_ansible_host(
+            ansible_host,
+            new_ip_address=tuple_info[1].static_ip_address,
+            reboot_delay_seconds=REBOOT_TRIGGER_DELAY_SECONDS,
         )
+        with get_tracer().span("wait for reboot", host=ansible_host.host):
+            ready_host = (
+                collaborators.progress_indicator()
+                .get_status()
+                .long_running_process_fn(
+                    call=lambda: SSHReachabilityPoller().wait_until_ready_single(target),
+                    desc_run=f"Waiting for {ansible_host.host} to reboot",
+                    desc_end="Reboot finished.",
+                )
+            )
+        collaborators.summary().append("ready_host", ready_host)
+        return ready_host
 
     def _print_post_run_instructions(
         self,
         ctx: Context,
         tuple_info: tuple[SSHConnectionInfo, NetworkConfigurationInfo],
         collaborators: CoreCollaborators,
+        ready_host: Optional[ReadyHost] = None,
     ):
         network_info = self._bundle_network_information_from_tuple(ctx, tuple_info)
         collaborators.printer().print_with_rich_table_fn(
@@ -196,6 +305,7 @@ class RemoteMachineNetworkConfigureRunner:
                 hostname=network_info.ssh_hostname,
                 ip_address=network_info.ssh_ip_address,
                 static_ip=network_info.static_ip_address,
+                ready_host=ready_host,
             )
         )
 
@@ -223,11 +333,10 @@ class RemoteMachineNetworkConfigureRunner:
             "Updating hosts file with the remote IP address and hostname (Password required)\n"
         )
         network_info = self._bundle_network_information_from_tuple(ctx, tuple_info)
-        collaborators.hosts_file().add_entry_fn(
-            ip_address=network_info.static_ip_address,
-            dns_names=[network_info.ssh_hostname],
-            comment=f"Added by provisioner for {network_info.ssh_hostname}",
-        )
+        hosts_file = ManagedHostsFile.create(ctx, collaborators.process())
+        hosts_file.add_entry(ip_address=network_info.static_ip_address, dns_names=[network_info.ssh_hostname])
+        if not hosts_file.flush():
+            collaborators.printer().print_fn("Hosts file already up to date")
 
     def _print_pre_run_instructions(self, collaborators: CoreCollaborators):
         collaborators.printer().print_fn(generate_logo_network())
@@ -261,6 +370,21 @@ class RemoteMachineNetworkConfigureRunner:
             raise NotImplementedError("OS is not supported")
 
 
+def create_configure_network_fingerprint(
+    host_name: str, network_configure_info: NetworkConfigurationInfo
+) -> DesiredStateFingerprint:
+    return DesiredStateFingerprint(
+        operation=RPI_CONFIGURE_NETWORK_OPERATION,
+        playbook_content=ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK,
+        inputs={
+            "host_name": host_name,
+            "static_ip": network_configure_info.static_ip_address,
+            "gateway_address": network_configure_info.gw_ip_address,
+            "dns_address": network_configure_info.dns_ip_address,
+        },
+    )
+
+
 def generate_logo_network() -> str:
     return """
  ██████╗ ███████╗    ███╗   ██╗███████╗████████╗██╗    ██╗ ██████╗ ██████╗ ██╗  ██╗
@@ -281,13 +405,15 @@ def generate_instructions_pre_network() -> str:
 """
 
 
-def generate_instructions_post_network(ip_address: str, static_ip: str, username: str, hostname: str):
+def generate_instructions_post_network(
+    ip_address: str, static_ip: str, username: str, hostname: str, ready_host: Optional[ReadyHost] = None
+):
     return f"""
   [green]Congratulations ![/green]
 
   You have successfully set a static IP for a Raspberry Pi node:
     • [yellow]{ip_address}[/yellow] --> [yellow]{static_ip}[/yellow]
-
+{generate_reboot_status(ready_host)}
   To update the node password:
     • SSH into the node - [yellow]ssh {username}@{static_ip}[/yellow]
                           [yellow]ssh {username}@{hostname}[/yellow]
@@ -4,6 +4,7 @@ import unittest
 from typing import Callable, List
 from unittest import mock
 
+from provisioner_single_board_plugin.src.common.remote.reachability import REBOOT_TRIGGER_DELAY_SECONDS
 from provisioner_single_board_plugin.src.common.remote.remote_network_configure import (
     ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NETWORK,
     RemoteMachineNetworkConfigureArgs,
@@ -29,7 +30,6 @@ from provisioner_shared.components.runtime.runner.ansible.ansible_runner import
 from provisioner_shared.components.runtime.utils.os import LINUX, MAC_OS, WINDOWS, OsArch
 from provisioner_shared.components.runtime.utils.prompter import PromptLevel
 from provisioner_shared.test_lib.assertions import Assertion
-from provisioner_shared.test_lib.docker.skip_if_not_docker import skip_if_not_in_docker
 from provisioner_shared.test_lib.test_env import TestEnv
 
 # To run as a single test target:
@@ -43,6 +43,8 @@ REMOTE_NETWORK_CONFIGURE_RUNNER_PATH = (
     "provisioner_single_board_plugin.src.common.remote.remote_network_configure.RemoteMachineNetworkConfigureRunner"
 )
 
+MANAGED_HOSTS_FILE_PATH = "provisioner_single_board_plugin.src.common.hosts.managed_hosts_file.ManagedHostsFile"
+
 REMOTE_MACHINE_CONNECTOR_PATH = "provisioner_shared.components.remote.remote_connector.RemoteMachineConnector"
 
 REMOTE_CONTEXT = RemoteContext.create(verbose=True, dry_run=False, silent=False)
@@ -125,14 +127,18 @@ class RemoteMachineNetworkConfigureTestShould(unittest.TestCase):
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._print_pre_run_instructions")
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._get_ssh_conn_info")
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._get_network_configure_info")
+    @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._is_converged", return_value=False)
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._run_ansible_network_configure_playbook_with_progress_bar")
+    @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._wait_for_node_ready")
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._print_post_run_instructions")
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._maybe_add_hosts_file_entry")
     def test_main_flow_run_actions_have_expected_order(
         self,
         maybe_add_hosts_file_call: mock.MagicMock,
         post_run_call: mock.MagicMock,
+        wait_for_node_ready_call: mock.MagicMock,
         run_ansible_call: mock.MagicMock,
+        is_converged_call: mock.MagicMock,
         get_network_configure_info_call: mock.MagicMock,
         get_ssh_conn_info_call: mock.MagicMock,
         pre_run_call: mock.MagicMock,
@@ -146,7 +152,9 @@ class RemoteMachineNetworkConfigureTestShould(unittest.TestCase):
         pre_run_call.assert_called_once()
         get_ssh_conn_info_call.assert_called_once()
         get_network_configure_info_call.assert_called_once()
+        is_converged_call.assert_called_once()
         run_ansible_call.assert_called_once()
+        wait_for_node_ready_call.assert_called_once()
         post_run_call.assert_called_once()
         maybe_add_hosts_file_call.assert_called_once()
 
@@ -238,9 +246,10 @@ class RemoteMachineNetworkConfigureTestShould(unittest.TestCase):
                         f"dns_address={TestDataRemoteConnector.TEST_DATA_DHCP_DNS_IP_ADDRESS}",
                         "become_root=yes",
                         "reboot_required=true",
+                        f"reboot_delay_seconds={REBOOT_TRIGGER_DELAY_SECONDS}",
                     ],
                 ),
-                self.assertEqual(ansible_tags, ["configure_rpi_network", "define_static_ip", "reboot"]),
+                self.assertEqual(ansible_tags, ["configure_rpi_network", "define_static_ip", "trigger_reboot"]),
             )
         )
 
@@ -252,30 +261,13 @@ class RemoteMachineNetworkConfigureTestShould(unittest.TestCase):
             network_configure_info=TestDataRemoteConnector.create_fake_get_network_configure_info(),
         )
 
-    @skip_if_not_in_docker
-    def test_add_hosts_file_entry_upon_prompt(self) -> None:
+    @mock.patch(f"{MANAGED_HOSTS_FILE_PATH}.flush", return_value=True)
+    @mock.patch(f"{MANAGED_HOSTS_FILE_PATH}.add_entry")
+    def test_add_hosts_file_entry_upon_prompt(self, add_entry_call: mock.MagicMock, flush_call: mock.MagicMock) -> None:
         env = TestEnv.create()
         env.get_collaborators().printer().on("print_fn", str).side_effect = lambda message: self.assertIn(
             "Updating hosts file with the remote IP address", message
         )
-        env.get_collaborators().prompter().on("prompt_yes_no_fn", str, PromptLevel, str, str).side_effect = (
-            lambda message, level, post_yes_message, post_no_message: (
-                self.assertIn("Add entry", message),
-                self.assertEqual(level, PromptLevel.HIGHLIGHT),
-                self.assertEqual(post_no_message, "Skipped adding new entry to /etc/hosts"),
-                self.assertEqual(post_yes_message, "Selected to update /etc/hosts file"),
-            )
-        )
-        env.get_collaborators().hosts_file().on("add_entry_fn", str, List, str, str).side_effect = (
-            lambda ip_address, dns_names, comment=None, entry_type="ipv4": (
-                self.assertEqual(ip_address, TestDataRemoteConnector.TEST_DATA_DHCP_STATIC_IP_ADDRESS),
-                self.assertEqual(dns_names, [TestDataRemoteConnector.TEST_DATA_SSH_HOSTNAME_1]),
-                self.assertEqual(
-                    comment, "Added by provisioner for " + TestDataRemoteConnector.TEST_DATA_SSH_HOSTNAME_1
-                ),
-                None,
-            )
-        )
         RemoteMachineNetworkConfigureRunner()._maybe_add_hosts_file_entry(
             env.get_context(),
             (
@@ -285,6 +277,11 @@ class RemoteMachineNetworkConfigureTestShould(unittest.TestCase):
             env.get_collaborators(),
             update_hosts_file=True,
         )
+        add_entry_call.assert_called_once_with(
+            ip_address=TestDataRemoteConnector.TEST_DATA_DHCP_STATIC_IP_ADDRESS,
+            dns_names=[TestDataRemoteConnector.TEST_DATA_SSH_HOSTNAME_1],
+        )
+        flush_call.assert_called_once()
 
     def test_pre_run_instructions_printed_successfully(self) -> None:
         env = TestEnv.create()
@@ -3,11 +3,32 @@
 from typing import Optional
 
 from loguru import logger
-
-from provisioner_shared.components.remote.remote_connector import (
-    RemoteMachineConnector,
-    SSHConnectionInfo,
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import get_tracer
+from provisioner_single_board_plugin.src.common.remote.fingerprint import (
+    ANSIBLE_TASKS_STORE_DESIRED_STATE_FINGERPRINT,
+    DesiredStateFingerprint,
+    find_converged_hosts,
+    generate_instructions_converged,
+)
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanInventoryRemoteMachineConnector
+from provisioner_single_board_plugin.src.common.remote.reachability import (
+    REBOOT_TRIGGER_DELAY_SECONDS,
+    ReachabilityTarget,
+    ReadyHost,
+    SSHReachabilityPoller,
+    generate_reboot_status,
 )
+from provisioner_single_board_plugin.src.common.remote.reboot_detection import (
+    ANSIBLE_POST_TASKS_REBOOT_WHEN_CHANGED,
+    ANSIBLE_PRE_TASKS_SNAPSHOT_REBOOT_SENSITIVE_FILES,
+    RebootReport,
+    is_reboot_expected,
+    read_reboot_reports,
+    reboot_report_dir,
+)
+from provisioner_single_board_plugin.src.config.domain.config import SingleBoardLanInventoryConfig
+
+from provisioner_shared.components.remote.remote_connector import SSHConnectionInfo
 from provisioner_shared.components.remote.remote_opts import RemoteOpts
 from provisioner_shared.components.runtime.infra.context import Context
 from provisioner_shared.components.runtime.infra.evaluator import Evaluator
@@ -20,42 +41,73 @@ from provisioner_shared.components.runtime.runner.ansible.ansible_runner import
 from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
 from provisioner_shared.components.runtime.utils.checks import Checks
 
-ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NODE = """
+RPI_CONFIGURE_NODE_OPERATION = "rpi_configure_node"
+
+# The role reboot tasks are not selected, a detached reboot is scheduled only when reboot sensitive
+# files changed and the controller polls until the node is reachable again
+ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NODE = (
+    """
 ---
 - name: Configure Raspbian OS on remote RPi host
   hosts: selected_hosts
   gather_facts: no
   {modifiers}
-
+"""
+    + ANSIBLE_PRE_TASKS_SNAPSHOT_REBOOT_SENSITIVE_FILES
+    + """
   roles:
     - role: {ansible_playbooks_path}/roles/rpi_config_node
       tags: ['configure_remote_node']
 """
+    + ANSIBLE_TASKS_STORE_DESIRED_STATE_FINGERPRINT
+    + ANSIBLE_POST_TASKS_REBOOT_WHEN_CHANGED
+)
 
 
 class RemoteMachineOsConfigureArgs:
 
     remote_opts: RemoteOpts
+    lan_inventory_cfg: SingleBoardLanInventoryConfig
+    force: bool
 
-    def __init__(self, remote_opts: RemoteOpts) -> None:
+    def __init__(
+        self,
+        remote_opts: RemoteOpts,
+        lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None,
+        force: Optional[bool] = False,
+    ) -> None:
         self.remote_opts = remote_opts
+        self.lan_inventory_cfg = lan_inventory_cfg
+        self.force = force
 
 
 class RemoteMachineOsConfigureRunner:
 
-    def run(self, ctx: Context, args: RemoteMachineOsConfigureArgs, collaborators: CoreCollaborators) -> None:
+    def run(
+        self, ctx: Context, args: RemoteMachineOsConfigureArgs, collaborators: CoreCollaborators
+    ) -> Optional[ReadyHost]:
         logger.debug("Inside RemoteMachineOsConfigureRunner run()")
 
         self._prerequisites(ctx=ctx, checks=collaborators.checks())
         self._print_pre_run_instructions(collaborators)
-        ssh_conn_info = self._get_ssh_conn_info(ctx, collaborators, args.remote_opts)
-        ansible_host = self._run_ansible_configure_os_playbook_with_progress_bar(
-            ctx=ctx,
-            ssh_conn_info=ssh_conn_info,
-            collaborators=collaborators,
-            args=args,
-        )
-        self._print_post_run_instructions(ansible_host, collaborators)
+        ssh_conn_info = self._get_ssh_conn_info(ctx, collaborators, args.remote_opts, args.lan_inventory_cfg)
+        fingerprint = create_configure_node_fingerprint(ssh_conn_info.ansible_hosts[0].host)
+        if self._is_converged(ctx, ssh_conn_info.ansible_hosts[0], fingerprint, args.force):
+            return self._skip_converged_node(ssh_conn_info.ansible_hosts[0], collaborators)
+
+        with reboot_report_dir() as report_dir:
+            ansible_host = self._run_ansible_configure_os_playbook_with_progress_bar(
+                ctx=ctx,
+                ssh_conn_info=ssh_conn_info,
+                collaborators=collaborators,
+                args=args,
+                report_dir=report_dir,
+                fingerprint=fingerprint,
+            )
+            reboot_reports = read_reboot_reports(report_dir)
+        ready_host = self._wait_for_node_ready(ctx, ansible_host, collaborators, reboot_reports.get(ansible_host.host))
+        self._print_post_run_instructions(ansible_host, collaborators, ready_host)
+        return ready_host
 
     def _run_ansible_configure_os_playbook_with_progress_bar(
         self,
@@ -63,6 +115,8 @@ class RemoteMachineOsConfigureRunner:
         ssh_conn_info: SSHConnectionInfo,
         collaborators: CoreCollaborators,
         args: RemoteMachineOsConfigureArgs,
+        report_dir: Optional[str] = None,
+        fingerprint: Optional[DesiredStateFingerprint] = None,
     ) -> AnsibleHost:
 
         ansible_host = ssh_conn_info.ansible_hosts[0]
@@ -78,6 +132,8 @@ class RemoteMachineOsConfigureRunner:
                     args.remote_opts.get_remote_context(),
                     ansible_host.host,
                     ssh_conn_info,
+                    report_dir,
+                    fingerprint,
                 ),
                 desc_run="Running Ansible playbook (Configure OS)",
                 desc_end="Ansible playbook finished (Configure OS).",
@@ -92,37 +148,92 @@ class RemoteMachineOsConfigureRunner:
         remote_ctx: RemoteContext,
         ssh_hostname: str,
         ssh_conn_info: SSHConnectionInfo,
+        report_dir: Optional[str] = None,
+        fingerprint: Optional[DesiredStateFingerprint] = None,
     ) -> str:
 
-        return runner.run_fn(
-            selected_hosts=ssh_conn_info.ansible_hosts,
-            playbook=AnsiblePlaybook(
-                name="rpi_configure_node",
-                content=ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NODE,
-                remote_context=remote_ctx,
-            ),
-            ansible_vars=[
-                f"host_name={ssh_hostname}",
-                f"become_root={'no' if remote_ctx.is_dry_run() else 'yes'}",
-                f"reboot_required={'false' if remote_ctx.is_dry_run() else 'true'}",
-            ],
-            ansible_tags=[
-                "configure_remote_node",
-            ]
-            + (["reboot"] if not remote_ctx.is_dry_run() else []),
-        )
+        with get_tracer().span("ansible configure os", host=ssh_hostname):
+            return runner.run_fn(
+                selected_hosts=ssh_conn_info.ansible_hosts,
+                playbook=AnsiblePlaybook(
+                    name="rpi_configure_node",
+                    content=ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NODE,
+                    remote_context=remote_ctx,
+                ),
+                ansible_vars=[
+                    f"host_name={ssh_hostname}",
+                    f"become_root={'no' if remote_ctx.is_dry_run() else 'yes'}",
+                    f"reboot_required={'false' if remote_ctx.is_dry_run() else 'true'}",
+                    f"reboot_delay_seconds={REBOOT_TRIGGER_DELAY_SECONDS}",
+                ]
+                + ([f"reboot_report_dir={report_dir}"] if report_dir else [])
+                + (fingerprint.to_ansible_vars() if fingerprint and not remote_ctx.is_dry_run() else []),
+                ansible_tags=[
+                    "configure_remote_node",
+                ]
+                + (["trigger_reboot"] if not remote_ctx.is_dry_run() else []),
+            )
+
+    def _is_converged(
+        self, ctx: Context, ansible_host: AnsibleHost, fingerprint: DesiredStateFingerprint, force: bool
+    ) -> bool:
+        if force or ctx.is_dry_run():
+            return False
+        return len(find_converged_hosts([ansible_host], fingerprint)) > 0
+
+    def _skip_converged_node(self, ansible_host: AnsibleHost, collaborators: CoreCollaborators) -> ReadyHost:
+        logger.debug(f"Node already matches the desired state, skipping. host: {ansible_host.host}")
+        ready_host = ReadyHost.without_reboot(ansible_host)
+        collaborators.summary().append("ready_host", ready_host)
+        collaborators.printer().print_fn(generate_instructions_converged(ansible_host))
+        return ready_host
+
+    def _wait_for_node_ready(
+        self,
+        ctx: Context,
+        ansible_host: AnsibleHost,
+        collaborators: CoreCollaborators,
+        reboot_report: Optional[RebootReport] = None,
+    ) -> Optional[ReadyHost]:
+        if ctx.is_dry_run():
+            return None
+
+        if not is_reboot_expected(reboot_report):
+            logger.debug(f"No reboot sensitive changes, skipping reboot. host: {ansible_host.host}")
+            ready_host = ReadyHost.without_reboot(ansible_host)
+            collaborators.summary().append("ready_host", ready_host)
+            return ready_host
+
+        target = ReachabilityTarget.from_ansible_host(ansible_host, reboot_delay_seconds=REBOOT_TRIGGER_DELAY_SECONDS)
+        with get_tracer().span("wait for reboot", host=ansible_host.host):
+            ready_host = (
+                collaborators.progress_indicator()
+                .get_status()
+                .long_running_process_fn(
+                    call=lambda: SSHReachabilityPoller().wait_until_ready_single(target),
+                    desc_run=f"Waiting for {ansible_host.host} to reboot",
+                    desc_end="Reboot finished.",
+                )
+            )
+        collaborators.summary().append("ready_host", ready_host)
+        return ready_host
 
     def _get_ssh_conn_info(
-        self, ctx: Context, collaborators: CoreCollaborators, remote_opts: Optional[RemoteOpts] = None
+        self,
+        ctx: Context,
+        collaborators: CoreCollaborators,
+        remote_opts: Optional[RemoteOpts] = None,
+        lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None,
     ) -> SSHConnectionInfo:
 
-        ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
-            call=lambda: RemoteMachineConnector(collaborators=collaborators).collect_ssh_connection_info(
-                ctx, remote_opts, force_single_conn_info=True
-            ),
-            ctx=ctx,
-            err_msg="Could not resolve SSH connection info",
-        )
+        with get_tracer().span("resolve ssh connection"):
+            ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
+                call=lambda: LanInventoryRemoteMachineConnector.create(
+                    collaborators, lan_inventory_cfg
+                ).collect_ssh_connection_info(ctx, remote_opts, force_single_conn_info=True),
+                ctx=ctx,
+                err_msg="Could not resolve SSH connection info",
+            )
         collaborators.summary().append("ssh_conn_info", ssh_conn_info)
         return ssh_conn_info
 
@@ -135,8 +246,9 @@ class RemoteMachineOsConfigureRunner:
         self,
         ansible_host: AnsibleHost,
         collaborators: CoreCollaborators,
+        ready_host: Optional[ReadyHost] = None,
     ):
-        collaborators.printer().print_with_rich_table_fn(generate_instructions_post_configure(ansible_host))
+        collaborators.printer().print_with_rich_table_fn(generate_instructions_post_configure(ansible_host, ready_host))
 
     def _prerequisites(self, ctx: Context, checks: Checks) -> None:
         if ctx.os_arch.is_linux():
@@ -173,10 +285,18 @@ def generate_instructions_pre_configure() -> str:
 """
 
 
-def generate_instructions_post_configure(ansible_host: AnsibleHost):
+def create_configure_node_fingerprint(host_name: str) -> DesiredStateFingerprint:
+    return DesiredStateFingerprint(
+        operation=RPI_CONFIGURE_NODE_OPERATION,
+        playbook_content=ANSIBLE_PLAYBOOK_RPI_CONFIGURE_NODE,
+        inputs={"host_name": host_name},
+    )
+
+
+def generate_instructions_post_configure(ansible_host: AnsibleHost, ready_host: Optional[ReadyHost] = None):
     return f"""
   You have successfully configured hardware and system settings for a Raspberry Pi node:
 
     • Host Name....: [yellow]{ansible_host.host}[/yellow]
     • IP Address...: [yellow]{ansible_host.ip_address}[/yellow]
-"""
+{generate_reboot_status(ready_host)}"""
@@ -107,12 +107,16 @@ class RemoteMachineConfigureTestShould(unittest.TestCase):
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._prerequisites")
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._print_pre_run_instructions")
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._get_ssh_conn_info")
+    @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._is_converged", return_value=False)
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._run_ansible_configure_os_playbook_with_progress_bar")
+    @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._wait_for_node_ready")
     @mock.patch(f"{REMOTE_NETWORK_CONFIGURE_RUNNER_PATH}._print_post_run_instructions")
     def test_main_flow_run_actions_have_expected_order(
         self,
         post_run_call: mock.MagicMock,
+        wait_for_node_ready_call: mock.MagicMock,
         run_ansible_call: mock.MagicMock,
+        is_converged_call: mock.MagicMock,
         get_ssh_conn_info_call: mock.MagicMock,
         pre_run_call: mock.MagicMock,
         prerequisites_call: mock.MagicMock,
@@ -124,7 +128,9 @@ class RemoteMachineConfigureTestShould(unittest.TestCase):
         prerequisites_call.assert_called_once()
         pre_run_call.assert_called_once()
         get_ssh_conn_info_call.assert_called_once()
+        is_converged_call.assert_called_once()
         run_ansible_call.assert_called_once()
+        wait_for_node_ready_call.assert_called_once()
         post_run_call.assert_called_once()
 
     @mock.patch(
@@ -179,7 +185,7 @@ class RemoteMachineConfigureTestShould(unittest.TestCase):
                 Assertion.expect_equal_objects(
                     self, ansible_vars, [f"host_name={TestDataRemoteConnector.TEST_DATA_SSH_HOSTNAME_1}"]
                 ),
-                self.assertEqual(ansible_tags, ["configure_remote_node", "reboot"]),
+                self.assertEqual(ansible_tags, ["configure_remote_node", "trigger_reboot"]),
             )
         )
 
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+
+from typing import Dict, List, Optional
+
+from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.fingerprint import (
+    ANSIBLE_TASKS_STORE_DESIRED_STATE_FINGERPRINT,
+    DesiredStateFingerprint,
+    RemoteFingerprintReader,
+    find_converged_hosts,
+)
+from provisioner_single_board_plugin.src.common.remote.reachability import (
+    ReachabilityTarget,
+    ReadyHost,
+    SSHReachabilityPoller,
+)
+from provisioner_single_board_plugin.src.common.remote.reboot_detection import (
+    ANSIBLE_POST_TASKS_REBOOT_WHEN_CHANGED,
+    ANSIBLE_PRE_TASKS_SNAPSHOT_REBOOT_SENSITIVE_FILES,
+    RebootReport,
+    is_reboot_expected,
+    read_reboot_reports,
+    reboot_report_dir,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import (
+    FleetOpts,
+    ansible_forks,
+    get_staggered_reboot_delays,
+    resolve_fleet_hosts,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_os_configure import (
+    RPI_CONFIGURE_NODE_OPERATION,
+    generate_logo_configure,
+)
+
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.remote_context import RemoteContext
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import (
+    AnsibleHost,
+    AnsiblePlaybook,
+    AnsibleRunnerLocal,
+)
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+from provisioner_shared.components.runtime.utils.checks import Checks
+
+# Host name is taken from the inventory so every node keeps its configured name within a single run.
+# The role reboot tasks are not selected, nodes with reboot sensitive changes schedule their own
+# delayed reboot instead so nodes do not go down at the same time and Ansible does not block on
+# reconnecting to each of them. Unchanged nodes are not rebooted at all.
+ANSIBLE_PLAYBOOK_RPI_CONFIGURE_FLEET = (
+    """
+---
+- name: Configure Raspbian OS on a fleet of remote RPi hosts
+  hosts: selected_hosts
+  gather_facts: no
+  {modifiers}
+
+  vars:
+    host_name: "{{{{ inventory_hostname }}}}"
+    reboot_delay_seconds: "{{{{ 1 + (reboot_stagger_seconds | int) * ansible_play_hosts_all.index(inventory_hostname) }}}}"
+"""
+    + ANSIBLE_PRE_TASKS_SNAPSHOT_REBOOT_SENSITIVE_FILES
+    + """
+  roles:
+    - role: {ansible_playbooks_path}/roles/rpi_config_node
+      tags: ['configure_remote_node']
+"""
+    + ANSIBLE_TASKS_STORE_DESIRED_STATE_FINGERPRINT
+    + ANSIBLE_POST_TASKS_REBOOT_WHEN_CHANGED
+)
+
+
+class RemoteMachineOsFleetConfigureArgs:
+
+    remote_opts: RemoteOpts
+    fleet_opts: FleetOpts
+    force: bool
+
+    def __init__(self, remote_opts: RemoteOpts, fleet_opts: FleetOpts, force: Optional[bool] = False) -> None:
+        self.remote_opts = remote_opts
+        self.fleet_opts = fleet_opts
+        self.force = force
+
+
+class RemoteMachineOsFleetConfigureRunner:
+
+    def run(
+        self, ctx: Context, args: RemoteMachineOsFleetConfigureArgs, collaborators: CoreCollaborators
+    ) -> List[ReadyHost]:
+        logger.debug("Inside RemoteMachineOsFleetConfigureRunner run()")
+
+        self._prerequisites(ctx=ctx, checks=collaborators.checks())
+        ansible_hosts = resolve_fleet_hosts(args.remote_opts, args.fleet_opts.host_names)
+        self._print_pre_run_instructions(ansible_hosts, args.fleet_opts, collaborators)
+
+        fingerprint = create_configure_fleet_fingerprint()
+        converged_hosts = self._find_converged_hosts(ctx, ansible_hosts, fingerprint, args)
+        pending_hosts = [host for host in ansible_hosts if host not in converged_hosts]
+        converged_ready_hosts = {host.host: ReadyHost.without_reboot(host) for host in converged_hosts}
+        if len(pending_hosts) == 0:
+            ready_hosts = list(converged_ready_hosts.values())
+            collaborators.summary().append("ready_hosts", ready_hosts)
+            self._print_post_run_instructions(ready_hosts, collaborators)
+            return ready_hosts
+
+        with reboot_report_dir() as report_dir:
+            output = (
+                collaborators.progress_indicator()
+                .get_status()
+                .long_running_process_fn(
+                    call=lambda: self._run_ansible(
+                        collaborators.ansible_runner(),
+                        args.remote_opts.get_remote_context(),
+                        pending_hosts,
+                        args.fleet_opts,
+                        report_dir,
+                        fingerprint,
+                    ),
+                    desc_run=f"Running Ansible playbook (Configure OS, {len(pending_hosts)} hosts)",
+                    desc_end="Ansible playbook finished (Configure OS).",
+                )
+            )
+            reboot_reports = read_reboot_reports(report_dir)
+        collaborators.printer().new_line_fn().print_fn(output)
+
+        if ctx.is_dry_run():
+            return []
+
+        ready_by_name = converged_ready_hosts
+        for ready_host in self._wait_for_fleet_reboot(pending_hosts, args.fleet_opts, collaborators, reboot_reports):
+            ready_by_name[ready_host.name] = ready_host
+        ready_hosts = [ready_by_name[host.host] for host in ansible_hosts]
+        collaborators.summary().append("ready_hosts", ready_hosts)
+        self._print_post_run_instructions(ready_hosts, collaborators)
+        return ready_hosts
+
+    def _run_ansible(
+        self,
+        runner: AnsibleRunnerLocal,
+        remote_ctx: RemoteContext,
+        ansible_hosts: List[AnsibleHost],
+        fleet_opts: FleetOpts,
+        report_dir: str,
+        fingerprint: Optional[DesiredStateFingerprint] = None,
+    ) -> str:
+
+        with ansible_forks(fleet_opts.forks):
+            return runner.run_fn(
+                selected_hosts=ansible_hosts,
+                playbook=AnsiblePlaybook(
+                    name="rpi_configure_fleet",
+                    content=ANSIBLE_PLAYBOOK_RPI_CONFIGURE_FLEET,
+                    remote_context=remote_ctx,
+                ),
+                ansible_vars=[
+                    f"become_root={'no' if remote_ctx.is_dry_run() else 'yes'}",
+                    f"reboot_required={'false' if remote_ctx.is_dry_run() else 'true'}",
+                    f"reboot_stagger_seconds={fleet_opts.reboot_stagger_seconds}",
+                    f"reboot_report_dir={report_dir}",
+                ]
+                + (fingerprint.to_ansible_vars() if fingerprint and not remote_ctx.is_dry_run() else []),
+                ansible_tags=[
+                    "configure_remote_node",
+                ]
+                + (["trigger_reboot"] if not remote_ctx.is_dry_run() else []),
+            )
+
+    def _find_converged_hosts(
+        self,
+        ctx: Context,
+        ansible_hosts: List[AnsibleHost],
+        fingerprint: DesiredStateFingerprint,
+        args: RemoteMachineOsFleetConfigureArgs,
+    ) -> List[AnsibleHost]:
+        if args.force or ctx.is_dry_run():
+            return []
+        converged_hosts = find_converged_hosts(
+            ansible_hosts, fingerprint, RemoteFingerprintReader(max_workers=args.fleet_opts.forks)
+        )
+        if converged_hosts:
+            logger.debug(f"Skipping converged hosts: {[host.host for host in converged_hosts]}")
+        return converged_hosts
+
+    def _wait_for_fleet_reboot(
+        self,
+        ansible_hosts: List[AnsibleHost],
+        fleet_opts: FleetOpts,
+        collaborators: CoreCollaborators,
+        reboot_reports: Dict[str, RebootReport],
+    ) -> List[ReadyHost]:
+
+        rebooting_hosts = [host for host in ansible_hosts if is_reboot_expected(reboot_reports.get(host.host))]
+        ready_by_name = {
+            host.host: ReadyHost.without_reboot(host) for host in ansible_hosts if host not in rebooting_hosts
+        }
+        if rebooting_hosts:
+            # Delays follow the inventory order of the whole play, not only of the rebooting hosts
+            reboot_delays = get_staggered_reboot_delays(ansible_hosts, fleet_opts.reboot_stagger_seconds)
+            targets = [
+                ReachabilityTarget.from_ansible_host(host, reboot_delay_seconds=reboot_delays[host.host])
+                for host in rebooting_hosts
+            ]
+            poller = SSHReachabilityPoller(timeout_seconds=fleet_opts.ssh_wait_timeout_seconds)
+            ready_hosts = (
+                collaborators.progress_indicator()
+                .get_status()
+                .long_running_process_fn(
+                    call=lambda: poller.wait_until_ready(targets),
+                    desc_run=f"Waiting for {len(rebooting_hosts)} of {len(ansible_hosts)} hosts to reboot",
+                    desc_end="Fleet reboot finished.",
+                )
+            )
+            ready_by_name.update({ready_host.name: ready_host for ready_host in ready_hosts})
+        return [ready_by_name[host.host] for host in ansible_hosts]
+
+    def _print_pre_run_instructions(
+        self, ansible_hosts: List[AnsibleHost], fleet_opts: FleetOpts, collaborators: CoreCollaborators
+    ):
+        collaborators.printer().print_fn(generate_logo_configure())
+        collaborators.printer().print_with_rich_table_fn(
+            generate_instructions_pre_fleet_configure(ansible_hosts, fleet_opts)
+        )
+
+    def _print_post_run_instructions(self, ready_hosts: List[ReadyHost], collaborators: CoreCollaborators):
+        collaborators.printer().print_with_rich_table_fn(generate_instructions_post_fleet_configure(ready_hosts))
+
+    def _prerequisites(self, ctx: Context, checks: Checks) -> None:
+        if ctx.os_arch.is_linux():
+            return
+        elif ctx.os_arch.is_darwin():
+            return
+        elif ctx.os_arch.is_windows():
+            raise NotImplementedError("Windows is not supported")
+        else:
+            raise NotImplementedError("OS is not supported")
+
+
+def create_configure_fleet_fingerprint() -> DesiredStateFingerprint:
+    # The host name is the only per host input, it is mixed in on the node from the inventory host name
+    return DesiredStateFingerprint(
+        operation=RPI_CONFIGURE_NODE_OPERATION,
+        playbook_content=ANSIBLE_PLAYBOOK_RPI_CONFIGURE_FLEET,
+        inputs={},
+    )
+
+
+def generate_instructions_pre_fleet_configure(ansible_hosts: List[AnsibleHost], fleet_opts: FleetOpts) -> str:
+    hosts = ""
+    for host in ansible_hosts:
+        hosts += f"    - [yellow]{host.host}, {host.ip_address}[/yellow]\n"
+
+    return f"""
+  Configuring Raspbian OS software and hardware settings on a fleet of Raspberry Pi nodes:
+{hosts}
+  All nodes are configured within a single Ansible run ([yellow]{fleet_opts.forks}[/yellow] forks).
+  Nodes with boot configuration changes reboot staggered by [yellow]{fleet_opts.reboot_stagger_seconds}[/yellow] seconds and are waited on in parallel.
+"""
+
+
+def generate_instructions_post_fleet_configure(ready_hosts: List[ReadyHost]) -> str:
+    hosts = ""
+    for host in ready_hosts:
+        if not host.rebooted:
+            status = "[green]unchanged, reboot skipped[/green]"
+        elif host.ready:
+            status = f"[green]ready in {host.reboot_to_ready_seconds:.1f}s[/green]"
+        else:
+            status = "[red]not reachable[/red]"
+        hosts += f"    • {host.name}, {host.ip_address or '-'}: {status}\n"
+
+    return f"""
+  You have configured hardware and system settings for a fleet of Raspberry Pi nodes:
+
+{hosts}"""
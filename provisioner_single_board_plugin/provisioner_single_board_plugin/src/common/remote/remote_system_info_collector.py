@@ -1,18 +1,31 @@
 #!/usr/bin/env python3
 
-from typing import List, Optional
+import os
+from typing import Any, List, Optional, Tuple
 
 from loguru import logger
-
-from provisioner_shared.components.remote.ansible.remote_provisioner_runner import (
-    RemoteProvisionerRunner,
-    RemoteProvisionerRunnerArgs,
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanInventoryRemoteMachineConnector
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts, resolve_fleet_hosts
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    DEFAULT_COLLECT_MAX_WORKERS,
+    DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+    OUTPUT_FORMAT_CSV,
+    OUTPUT_FORMAT_JSON,
+    OUTPUT_FORMAT_TABLE,
+    HostSystemInfo,
+    RemoteSystemInfoFleetCollector,
+    generate_fleet_system_info_table,
+    to_csv,
+    to_json,
 )
+from provisioner_single_board_plugin.src.common.system.native_system_reader import NativeSystemReader, SystemSnapshot
+
 from provisioner_shared.components.remote.domain.config import RunEnvironment
-from provisioner_shared.components.remote.remote_connector import RemoteMachineConnector, SSHConnectionInfo
+from provisioner_shared.components.remote.remote_connector import SSHConnectionInfo
 from provisioner_shared.components.remote.remote_opts import RemoteOpts
 from provisioner_shared.components.runtime.infra.context import Context
 from provisioner_shared.components.runtime.infra.evaluator import Evaluator
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
 from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
 from provisioner_shared.components.runtime.utils.checks import Checks
 from provisioner_shared.components.runtime.utils.system_reader import SystemReader
@@ -24,26 +37,75 @@ class SystemInfo:
     hardware_mem: str = ""
     hardware_network: str = ""
 
+    @staticmethod
+    def from_snapshot(snapshot: SystemSnapshot) -> "SystemInfo":
+        system_info = SystemInfo()
+        system_info.os_release = _format_lines(
+            [
+                ("Hostname", snapshot.hostname),
+                ("OS", snapshot.os_name),
+                ("Version", snapshot.os_version),
+                ("Kernel", snapshot.kernel_release),
+                ("Uptime (seconds)", snapshot.uptime_seconds),
+                ("Load average", snapshot.load_average),
+            ]
+        )
+        system_info.hardware_cpu = _format_lines(
+            [
+                ("Model", snapshot.model),
+                ("CPU", snapshot.cpu_model),
+                ("Cores", snapshot.cpu_cores),
+                ("Revision", snapshot.cpu_revision),
+                ("Serial", snapshot.cpu_serial),
+                ("Temperature (C)", snapshot.cpu_temperature_celsius),
+                ("Throttled", ", ".join(snapshot.throttled_flags()) if snapshot.throttled else None),
+            ]
+        )
+        system_info.hardware_mem = _format_lines(
+            [
+                ("Memory total (kB)", snapshot.mem_total_kb),
+                ("Memory available (kB)", snapshot.mem_available_kb),
+                ("Swap total (kB)", snapshot.swap_total_kb),
+                ("Swap free (kB)", snapshot.swap_free_kb),
+            ]
+        )
+        system_info.hardware_network = "\n  ".join(
+            [
+                f"{interface.name}: {interface.operstate}, mac {interface.mac_address}, mtu {interface.mtu}"
+                + (f", {interface.speed_mbps} Mb/s" if interface.speed_mbps else "")
+                for interface in snapshot.network_interfaces
+            ]
+        )
+        return system_info
+
+
+def _format_lines(items: List[Tuple[str, Any]]) -> str:
+    return "\n  ".join([f"{label}: {value}" for label, value in items if value is not None])
+
 
 class RemoteMachineSystemInfoCollectArgs:
     remote_opts: RemoteOpts
+    fleet_opts: FleetOpts
+    output_format: str
+    output_file: str
+    host_timeout_seconds: int
 
-    def __init__(self, remote_opts: RemoteOpts) -> None:
+    def __init__(
+        self,
+        remote_opts: RemoteOpts,
+        fleet_opts: Optional[FleetOpts] = None,
+        output_format: Optional[str] = OUTPUT_FORMAT_TABLE,
+        output_file: Optional[str] = None,
+        host_timeout_seconds: Optional[int] = DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+    ) -> None:
         self.remote_opts = remote_opts
+        self.fleet_opts = fleet_opts
+        self.output_format = output_format
+        self.output_file = output_file
+        self.host_timeout_seconds = host_timeout_seconds
 
 
 class RemoteMachineSystemInfoCollectRunner:
-    class SystemInfoBundle:
-        ssh_ip_address: str
-        ssh_username: str
-        ssh_hostname: str
-        static_ip_address: str
-
-        def __init__(self, ssh_ip_address: str, ssh_username: str, ssh_hostname: str, static_ip_address: str) -> None:
-            self.ssh_ip_address = ssh_ip_address
-            self.ssh_username = ssh_username
-            self.ssh_hostname = ssh_hostname
-            self.static_ip_address = static_ip_address
 
     def run(self, ctx: Context, args: RemoteMachineSystemInfoCollectArgs, collaborators: CoreCollaborators) -> None:
         logger.debug("Inside RemoteMachineSystemInfoCollectRunner run()")
@@ -55,63 +117,70 @@ class RemoteMachineSystemInfoCollectRunner:
                 collaborators.printer().print_with_rich_table_fn(generate_system_info_summary(system_info))
 
             elif args.remote_opts.get_environment() == RunEnvironment.Remote:
-                ssh_conn_info = self._get_ssh_conn_info(ctx, collaborators, args.remote_opts)
-                result = self._collect_system_info_on_remote_machine(ctx, collaborators, args, ssh_conn_info)
-                print(result)
+                ansible_hosts = self._resolve_hosts(ctx, collaborators, args)
+                results = self._collect_system_info_on_remote_machines(ctx, collaborators, args, ansible_hosts)
+                self._report(results, collaborators, args)
 
             else:
                 raise NotImplementedError(
                     f"RunEnvironment enum does not support label '{args.remote_opts.get_environment()}'"
                 )
 
-    def _collect_system_info_on_remote_machine(
+    def _resolve_hosts(
+        self, ctx: Context, collaborators: CoreCollaborators, args: RemoteMachineSystemInfoCollectArgs
+    ) -> List[AnsibleHost]:
+        if args.fleet_opts is not None:
+            return resolve_fleet_hosts(args.remote_opts, args.fleet_opts.host_names)
+        return self._get_ssh_conn_info(ctx, collaborators, args.remote_opts).ansible_hosts
+
+    def _collect_system_info_on_remote_machines(
         self,
         ctx: Context,
         collaborators: CoreCollaborators,
         args: RemoteMachineSystemInfoCollectArgs,
-        ssh_conn_info: SSHConnectionInfo,
-    ) -> str:
-        """Run the system info collection on a remote machine using Ansible."""
-        return self._execute_remote_ansible_playbook(
-            ctx=ctx,
-            args=args,
-            collaborators=collaborators,
-            ssh_conn_info=ssh_conn_info,
+        ansible_hosts: List[AnsibleHost],
+    ) -> List[HostSystemInfo]:
+        """Collect concurrently over direct SSH connections, each host bounded by its own timeout"""
+        if ctx.is_dry_run():
+            return []
+
+        max_workers = args.fleet_opts.forks if args.fleet_opts is not None else DEFAULT_COLLECT_MAX_WORKERS
+        collector = RemoteSystemInfoFleetCollector(timeout_seconds=args.host_timeout_seconds, max_workers=max_workers)
+        return (
+            collaborators.progress_indicator()
+            .get_status()
+            .long_running_process_fn(
+                call=lambda: collector.collect(ansible_hosts),
+                desc_run=f"Collecting system information ({len(ansible_hosts)} hosts)",
+                desc_end="System information collected.",
+            )
         )
 
-    def _execute_remote_ansible_playbook(
-        self,
-        ctx: Context,
-        args: RemoteMachineSystemInfoCollectArgs,
-        collaborators: CoreCollaborators,
-        ssh_conn_info: SSHConnectionInfo,
-    ) -> str:
-        """Execute the Ansible playbook that installs utilities on remote machines."""
-        command = self._build_provisioner_command(ctx, args)
-        logger.debug(f"Remote provisioner command: {command}")
-
-        ansible_vars = self._prepare_ansible_vars(ctx, args)
-
-        args = RemoteProvisionerRunnerArgs(
-            provisioner_command=command,
-            remote_context=args.remote_opts.get_remote_context(),
-            ssh_connection_info=ssh_conn_info,
-            required_plugins=["provisioner_single_board_plugin"],
-            ansible_vars=ansible_vars,
-        )
-        return RemoteProvisionerRunner().run(ctx, args, collaborators)
+    def _report(
+        self, results: List[HostSystemInfo], collaborators: CoreCollaborators, args: RemoteMachineSystemInfoCollectArgs
+    ) -> None:
+        if args.output_format == OUTPUT_FORMAT_JSON:
+            output = to_json(results)
+        elif args.output_format == OUTPUT_FORMAT_CSV:
+            output = to_csv(results)
+        else:
+            collaborators.printer().print_with_rich_table_fn(generate_fleet_system_info_table(results))
+            output = to_json(results) if args.output_file else None
 
-    def _prepare_ansible_vars(self, ctx: Context, args: RemoteMachineSystemInfoCollectArgs) -> List[str]:
-        """Prepare Ansible variables for the remote command."""
-        ansible_vars = []
-        return ansible_vars
+        if args.output_file:
+            with open(os.path.expanduser(args.output_file), "w") as f:
+                f.write(output)
+            collaborators.printer().print_fn(f"System information written to {args.output_file}")
+        elif output is not None:
+            # Machine readable output goes to stdout unformatted so it can be piped
+            print(output)
 
     def _get_ssh_conn_info(
         self, ctx: Context, collaborators: CoreCollaborators, remote_opts: Optional[RemoteOpts] = None
     ) -> SSHConnectionInfo:
 
         ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
-            call=lambda: RemoteMachineConnector(collaborators=collaborators).collect_ssh_connection_info(
+            call=lambda: LanInventoryRemoteMachineConnector(collaborators=collaborators).collect_ssh_connection_info(
                 ctx, remote_opts, force_single_conn_info=True
             ),
             ctx=ctx,
@@ -120,13 +189,10 @@ class RemoteMachineSystemInfoCollectRunner:
         collaborators.summary().append("ssh_conn_info", ssh_conn_info)
         return ssh_conn_info
 
-    def _build_provisioner_command(self, ctx: Context, args: RemoteMachineSystemInfoCollectArgs) -> str:
-        """Build the provisioner command to run on the remote machine."""
-        operation = "single-board"
-        verbose_flag = "-v" if args.remote_opts.get_remote_context().is_verbose() else ""
-        return f"{operation} info --environment Local collect -y {verbose_flag}"
-
     def collect_system_info(self, ctx: Context, collaborators: CoreCollaborators) -> SystemInfo:
+        if ctx.os_arch.is_linux():
+            return SystemInfo.from_snapshot(NativeSystemReader().read())
+
         system_reader = SystemReader(process=collaborators.process(), io_utils=collaborators.io_utils())
         system_info = SystemInfo()
         system_info.os_release = system_reader.read_os_release_func(ctx)
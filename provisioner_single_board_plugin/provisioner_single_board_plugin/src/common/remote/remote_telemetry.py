@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+
+import inspect
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import run_ssh_command
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanInventoryRemoteMachineConnector
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts, resolve_fleet_hosts
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    DEFAULT_COLLECT_MAX_WORKERS,
+    DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+    OUTPUT_FORMAT_JSON,
+    OUTPUT_FORMAT_TABLE,
+)
+from provisioner_single_board_plugin.src.common.system import telemetry_sampler
+from provisioner_single_board_plugin.src.common.system.native_system_reader import THROTTLED_FLAGS
+from provisioner_single_board_plugin.src.common.system.telemetry_sampler import (
+    DEFAULT_TELEMETRY_CAPACITY,
+    DEFAULT_TELEMETRY_DIR,
+    DEFAULT_TELEMETRY_INTERVAL_SECONDS,
+    DISK_SECTOR_BYTES,
+    TelemetrySample,
+)
+
+from provisioner_shared.components.remote.remote_connector import SSHConnectionInfo
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.evaluator import Evaluator
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+from provisioner_shared.components.runtime.utils.checks import Checks
+
+TELEMETRY_ACTION_START = "start"
+TELEMETRY_ACTION_STOP = "stop"
+TELEMETRY_ACTION_SUMMARY = "summary"
+
+SAMPLER_SCRIPT_NAME = "telemetry_sampler.py"
+SAMPLER_SCRIPT = inspect.getsource(telemetry_sampler)
+
+
+class TelemetrySummary:
+    """Aggregates of a node sample history, rates are derived from consecutive cumulative counters"""
+
+    samples: int
+    window_seconds: float
+    temperature_max_celsius: Optional[float]
+    temperature_avg_celsius: Optional[float]
+    cpu_freq_min_mhz: Optional[float]
+    cpu_freq_avg_mhz: Optional[float]
+    throttled_flags: List[str]
+    load1_max: Optional[float]
+    mem_available_min_kb: Optional[int]
+    disk_read_avg_kbps: Optional[float]
+    disk_write_avg_kbps: Optional[float]
+    disk_busy_max_percent: Optional[float]
+
+    def __init__(self, samples: List[TelemetrySample]) -> None:
+        self.samples = len(samples)
+        self.window_seconds = round(samples[-1].timestamp - samples[0].timestamp, 1) if samples else 0
+        temperatures = _values(samples, "temperature_celsius")
+        self.temperature_max_celsius = max(temperatures) if temperatures else None
+        self.temperature_avg_celsius = _avg(temperatures)
+        cpu_freqs = [value / 1000.0 for value in _values(samples, "cpu_freq_khz")]
+        self.cpu_freq_min_mhz = min(cpu_freqs) if cpu_freqs else None
+        self.cpu_freq_avg_mhz = _avg(cpu_freqs)
+        throttled = 0
+        for value in _values(samples, "throttled"):
+            throttled |= value
+        self.throttled_flags = [flag for bit, flag in THROTTLED_FLAGS.items() if throttled & (1 << bit)]
+        loads = _values(samples, "load1")
+        self.load1_max = max(loads) if loads else None
+        mem_available = _values(samples, "mem_available_kb")
+        self.mem_available_min_kb = min(mem_available) if mem_available else None
+
+        to_kb = DISK_SECTOR_BYTES / 1024.0
+        self.disk_read_avg_kbps = _avg(_rates(samples, "disk_sectors_read", to_kb))
+        self.disk_write_avg_kbps = _avg(_rates(samples, "disk_sectors_written", to_kb))
+        # io_ms grows by up to 1000 for every second the disk was busy
+        busy = _rates(samples, "disk_io_ms", 100 / 1000.0)
+        self.disk_busy_max_percent = round(min(max(busy), 100.0), 1) if busy else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+class HostTelemetry:
+
+    host_name: str
+    ip_address: str
+    running: bool
+    samples: List[TelemetrySample]
+    error: Optional[str]
+
+    def __init__(
+        self,
+        host_name: str,
+        ip_address: str,
+        running: Optional[bool] = False,
+        samples: Optional[List[TelemetrySample]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        self.host_name = host_name
+        self.ip_address = ip_address
+        self.running = running
+        self.samples = samples if samples else []
+        self.error = error
+
+    def summary(self) -> TelemetrySummary:
+        return TelemetrySummary(self.samples)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "host_name": self.host_name,
+            "ip_address": self.ip_address,
+            "running": self.running,
+            "error": self.error,
+            "summary": self.summary().to_dict(),
+        }
+
+
+class RemoteTelemetryController:
+    """
+    Manage the on-node sampler over direct SSH sessions, one concurrent session per host.
+    The sampler script is pushed on start, pulling only reads the node ring buffer.
+    """
+
+    timeout_seconds: float
+    max_workers: int
+    telemetry_dir: str
+
+    def __init__(
+        self,
+        timeout_seconds: Optional[float] = DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+        max_workers: Optional[int] = DEFAULT_COLLECT_MAX_WORKERS,
+        telemetry_dir: Optional[str] = DEFAULT_TELEMETRY_DIR,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.max_workers = max_workers
+        self.telemetry_dir = telemetry_dir
+
+    def _sampler_command(self, action: str, *options: str) -> str:
+        # Home relative paths are left unquoted so the remote shell expands them
+        script_path = f"{self.telemetry_dir}/{SAMPLER_SCRIPT_NAME}"
+        return " ".join(["python3", script_path, action, "--dir", self.telemetry_dir] + list(options))
+
+    def _exec(self, ansible_host: AnsibleHost, command: str, stdin_data: Optional[str] = None) -> str:
+        return run_ssh_command(ansible_host, command, self.timeout_seconds, stdin_data=stdin_data)
+
+    def _for_each_host(
+        self, ansible_hosts: List[AnsibleHost], call: Callable[[AnsibleHost], HostTelemetry]
+    ) -> List[HostTelemetry]:
+        def safe_call(ansible_host: AnsibleHost) -> HostTelemetry:
+            try:
+                return call(ansible_host)
+            except Exception as ex:
+                logger.debug(f"Telemetry operation failed. host: {ansible_host.host}, error: {ex}")
+                return HostTelemetry(ansible_host.host, ansible_host.ip_address, error=str(ex) or type(ex).__name__)
+
+        if not ansible_hosts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ansible_hosts))) as executor:
+            return list(executor.map(safe_call, ansible_hosts))
+
+    def start(
+        self,
+        ansible_hosts: List[AnsibleHost],
+        interval_seconds: Optional[float] = DEFAULT_TELEMETRY_INTERVAL_SECONDS,
+        capacity: Optional[int] = DEFAULT_TELEMETRY_CAPACITY,
+    ) -> List[HostTelemetry]:
+        sample_command = self._sampler_command(
+            "sample", "--interval", str(interval_seconds), "--capacity", str(capacity)
+        )
+        # The sampler outlives the SSH session, it is detached from the channel and guarded by its own pid file
+        command = (
+            f"mkdir -p {self.telemetry_dir} && cat > {self.telemetry_dir}/{SAMPLER_SCRIPT_NAME} && "
+            + f"(setsid nohup {sample_command} </dev/null >/dev/null 2>&1 &)"
+        )
+
+        def start_host(host: AnsibleHost) -> HostTelemetry:
+            self._exec(host, command, stdin_data=SAMPLER_SCRIPT)
+            return HostTelemetry(host.host, host.ip_address, running=True)
+
+        return self._for_each_host(ansible_hosts, start_host)
+
+    def stop(self, ansible_hosts: List[AnsibleHost]) -> List[HostTelemetry]:
+        def stop_host(host: AnsibleHost) -> HostTelemetry:
+            self._exec(host, self._sampler_command("stop"))
+            return HostTelemetry(host.host, host.ip_address, running=False)
+
+        return self._for_each_host(ansible_hosts, stop_host)
+
+    def pull(self, ansible_hosts: List[AnsibleHost]) -> List[HostTelemetry]:
+        def pull_host(host: AnsibleHost) -> HostTelemetry:
+            dump = json.loads(self._exec(host, self._sampler_command("dump")))
+            return HostTelemetry(
+                host.host,
+                host.ip_address,
+                running=dump.get("running", False),
+                samples=[TelemetrySample.from_dict(sample) for sample in dump.get("samples", [])],
+            )
+
+        return self._for_each_host(ansible_hosts, pull_host)
+
+
+class RemoteTelemetryArgs:
+
+    remote_opts: RemoteOpts
+    fleet_opts: FleetOpts
+    action: str
+    interval_seconds: float
+    capacity: int
+    host_timeout_seconds: int
+    output_format: str
+
+    def __init__(
+        self,
+        remote_opts: RemoteOpts,
+        action: str,
+        fleet_opts: Optional[FleetOpts] = None,
+        interval_seconds: Optional[float] = DEFAULT_TELEMETRY_INTERVAL_SECONDS,
+        capacity: Optional[int] = DEFAULT_TELEMETRY_CAPACITY,
+        host_timeout_seconds: Optional[int] = DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+        output_format: Optional[str] = OUTPUT_FORMAT_TABLE,
+    ) -> None:
+        self.remote_opts = remote_opts
+        self.action = action
+        self.fleet_opts = fleet_opts
+        self.interval_seconds = interval_seconds
+        self.capacity = capacity
+        self.host_timeout_seconds = host_timeout_seconds
+        self.output_format = output_format
+
+
+class RemoteTelemetryRunner:
+
+    def run(self, ctx: Context, args: RemoteTelemetryArgs, collaborators: CoreCollaborators) -> List[HostTelemetry]:
+        logger.debug("Inside RemoteTelemetryRunner run()")
+
+        self._prerequisites(ctx=ctx, checks=collaborators.checks())
+        ansible_hosts = self._resolve_hosts(ctx, collaborators, args)
+        if ctx.is_dry_run():
+            return []
+
+        controller = RemoteTelemetryController(
+            timeout_seconds=args.host_timeout_seconds,
+            max_workers=args.fleet_opts.forks if args.fleet_opts is not None else DEFAULT_COLLECT_MAX_WORKERS,
+        )
+        actions = {
+            TELEMETRY_ACTION_START: lambda: controller.start(ansible_hosts, args.interval_seconds, args.capacity),
+            TELEMETRY_ACTION_STOP: lambda: controller.stop(ansible_hosts),
+            TELEMETRY_ACTION_SUMMARY: lambda: controller.pull(ansible_hosts),
+        }
+        results = (
+            collaborators.progress_indicator()
+            .get_status()
+            .long_running_process_fn(
+                call=actions[args.action],
+                desc_run=f"Running telemetry {args.action} ({len(ansible_hosts)} hosts)",
+                desc_end=f"Telemetry {args.action} finished.",
+            )
+        )
+
+        if args.action == TELEMETRY_ACTION_SUMMARY and args.output_format == OUTPUT_FORMAT_JSON:
+            print(json.dumps([result.to_dict() for result in results], indent=2))
+        elif args.action == TELEMETRY_ACTION_SUMMARY:
+            collaborators.printer().print_with_rich_table_fn(generate_telemetry_summary(results))
+        else:
+            collaborators.printer().print_with_rich_table_fn(generate_telemetry_action_status(args.action, results))
+        return results
+
+    def _resolve_hosts(
+        self, ctx: Context, collaborators: CoreCollaborators, args: RemoteTelemetryArgs
+    ) -> List[AnsibleHost]:
+        if args.fleet_opts is not None:
+            return resolve_fleet_hosts(args.remote_opts, args.fleet_opts.host_names)
+        return self._get_ssh_conn_info(ctx, collaborators, args.remote_opts).ansible_hosts
+
+    def _get_ssh_conn_info(
+        self, ctx: Context, collaborators: CoreCollaborators, remote_opts: Optional[RemoteOpts] = None
+    ) -> SSHConnectionInfo:
+
+        ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
+            call=lambda: LanInventoryRemoteMachineConnector(collaborators=collaborators).collect_ssh_connection_info(
+                ctx, remote_opts, force_single_conn_info=True
+            ),
+            ctx=ctx,
+            err_msg="Could not resolve SSH connection info",
+        )
+        collaborators.summary().append("ssh_conn_info", ssh_conn_info)
+        return ssh_conn_info
+
+    def _prerequisites(self, ctx: Context, checks: Checks) -> None:
+        if ctx.os_arch.is_linux():
+            return
+        elif ctx.os_arch.is_darwin():
+            return
+        elif ctx.os_arch.is_windows():
+            raise NotImplementedError("Windows is not supported")
+        else:
+            raise NotImplementedError("OS is not supported")
+
+
+def _values(samples: List[TelemetrySample], field: str) -> List[Any]:
+    return [getattr(sample, field) for sample in samples if getattr(sample, field) is not None]
+
+
+def _avg(values: List[float]) -> Optional[float]:
+    return round(sum(values) / len(values), 1) if values else None
+
+
+def _rates(samples: List[TelemetrySample], field: str, scale: float) -> List[float]:
+    """Per second rates between consecutive samples, intervals spanning a counter reset (reboot) are skipped"""
+    rates = []
+    for previous, current in zip(samples, samples[1:]):
+        before, after = getattr(previous, field), getattr(current, field)
+        elapsed = current.timestamp - previous.timestamp
+        if before is None or after is None or after < before or elapsed <= 0:
+            continue
+        rates.append((after - before) * scale / elapsed)
+    return rates
+
+
+def _format(value: Any, unit: Optional[str] = "") -> str:
+    return f"{value}{unit}" if value is not None else "-"
+
+
+def generate_telemetry_summary(results: List[HostTelemetry]) -> str:
+    lines = []
+    for result in results:
+        if result.error:
+            lines.append(f"  [red]{result.host_name}[/red] ({result.ip_address}): failed, {result.error}")
+            continue
+        summary = result.summary()
+        state = "[green]sampling[/green]" if result.running else "[yellow]stopped[/yellow]"
+        lines.append(
+            f"  [green]{result.host_name}[/green] ({result.ip_address}): {state}, "
+            + f"{summary.samples} samples over {summary.window_seconds}s\n"
+            + f"    temp max/avg {_format(summary.temperature_max_celsius)}/"
+            + f"{_format(summary.temperature_avg_celsius)} C, "
+            + f"cpu freq min/avg {_format(summary.cpu_freq_min_mhz)}/{_format(summary.cpu_freq_avg_mhz)} MHz, "
+            + f"load max {_format(summary.load1_max)}\n"
+            + f"    mem available min {_format(summary.mem_available_min_kb, ' kB')}, "
+            + f"disk read/write avg {_format(summary.disk_read_avg_kbps)}/{_format(summary.disk_write_avg_kbps)} "
+            + f"kB/s, disk busy max {_format(summary.disk_busy_max_percent, '%')}"
+            + (f"\n    [yellow]{', '.join(summary.throttled_flags)}[/yellow]" if summary.throttled_flags else "")
+        )
+    return f"""
+[green]Telemetry Summary[/green]
+
+{chr(10).join(lines)}
+"""
+
+
+def generate_telemetry_action_status(action: str, results: List[HostTelemetry]) -> str:
+    lines = [
+        (
+            f"  [red]{result.host_name}[/red] ({result.ip_address}): failed, {result.error}"
+            if result.error
+            else f"  [green]{result.host_name}[/green] ({result.ip_address}): ok"
+        )
+        for result in results
+    ]
+    return f"""
+[green]Telemetry {action}[/green]
+
+{chr(10).join(lines)}
+"""
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from provisioner_single_board_plugin.src.common.remote.remote_telemetry import (
+    HostTelemetry,
+    TelemetrySummary,
+    generate_telemetry_summary,
+)
+from provisioner_single_board_plugin.src.common.system.telemetry_sampler import TelemetrySample
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/remote_telemetry_test.py
+#
+
+
+def create_samples():
+    return [
+        TelemetrySample(
+            100.0,
+            cpu_freq_khz=1500000,
+            temperature_celsius=50.0,
+            throttled=0,
+            load1=0.5,
+            mem_available_kb=2000,
+            disk_sectors_read=0,
+            disk_sectors_written=0,
+            disk_io_ms=0,
+        ),
+        TelemetrySample(
+            110.0,
+            cpu_freq_khz=600000,
+            temperature_celsius=80.0,
+            throttled=0x20002,
+            load1=3.5,
+            mem_available_kb=500,
+            disk_sectors_read=2000,
+            disk_sectors_written=4000,
+            disk_io_ms=5000,
+        ),
+        # Counters reset by a reboot, the interval is not a rate
+        TelemetrySample(
+            120.0,
+            cpu_freq_khz=1500000,
+            temperature_celsius=44.0,
+            load1=0.1,
+            mem_available_kb=2500,
+            disk_sectors_read=10,
+            disk_sectors_written=10,
+            disk_io_ms=10,
+        ),
+    ]
+
+
+class TelemetrySummaryTestShould(unittest.TestCase):
+
+    def test_summarize_samples(self) -> None:
+        summary = TelemetrySummary(create_samples())
+        self.assertEqual(summary.samples, 3)
+        self.assertEqual(summary.window_seconds, 20.0)
+        self.assertEqual(summary.temperature_max_celsius, 80.0)
+        self.assertEqual(summary.temperature_avg_celsius, 58.0)
+        self.assertEqual(summary.cpu_freq_min_mhz, 600.0)
+        self.assertEqual(summary.load1_max, 3.5)
+        self.assertEqual(summary.mem_available_min_kb, 500)
+        self.assertEqual(summary.throttled_flags, ["arm-frequency-capped", "arm-frequency-capped-occurred"])
+
+    def test_derive_disk_rates_skipping_counter_resets(self) -> None:
+        summary = TelemetrySummary(create_samples())
+        self.assertEqual(summary.disk_read_avg_kbps, 100.0)
+        self.assertEqual(summary.disk_write_avg_kbps, 200.0)
+        self.assertEqual(summary.disk_busy_max_percent, 50.0)
+
+    def test_empty_history(self) -> None:
+        summary = TelemetrySummary([])
+        self.assertEqual(summary.samples, 0)
+        self.assertIsNone(summary.temperature_max_celsius)
+        self.assertIsNone(summary.disk_busy_max_percent)
+        self.assertEqual(summary.throttled_flags, [])
+
+    def test_report_failed_hosts(self) -> None:
+        report = generate_telemetry_summary(
+            [
+                HostTelemetry("node1", "192.168.1.200", running=True, samples=create_samples()),
+                HostTelemetry("node2", "192.168.1.201", error="timed out"),
+            ]
+        )
+        self.assertIn("3 samples over 20.0s", report)
+        self.assertIn("node2[/red] (192.168.1.201): failed, timed out", report)
+        self.assertEqual(HostTelemetry("node2", "192.168.1.201").to_dict()["summary"]["samples"], 0)
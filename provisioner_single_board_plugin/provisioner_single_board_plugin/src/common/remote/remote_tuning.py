@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+
+import inspect
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from provisioner_installers_plugin.src.installer.remote.remote_ssh import run_ssh_command
+from provisioner_installers_plugin.src.installer.tracing.span_tracer import get_tracer
+from provisioner_single_board_plugin.src.common.remote.lan_inventory import LanInventoryRemoteMachineConnector
+from provisioner_single_board_plugin.src.common.remote.reachability import (
+    REBOOT_TRIGGER_DELAY_SECONDS,
+    ReachabilityTarget,
+    ReadyHost,
+    SSHReachabilityPoller,
+    generate_reboot_status,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_benchmark import RemoteNodeBenchmark
+from provisioner_single_board_plugin.src.common.system import node_tuning
+from provisioner_single_board_plugin.src.common.system.node_tuning import (
+    DEFAULT_WRITE_RATE_WINDOW_SECONDS,
+    PROFILES,
+)
+
+from provisioner_shared.components.remote.remote_connector import SSHConnectionInfo
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.evaluator import Evaluator
+from provisioner_shared.components.runtime.runner.ansible.ansible_runner import AnsibleHost
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+from provisioner_shared.components.runtime.utils.checks import Checks
+
+TUNING_SCRIPT = inspect.getsource(node_tuning)
+TUNING_SCRIPT_NAME = "node_tuning.py"
+# Home relative, left unquoted so the remote shell expands it
+TUNING_DIR = "~/.provisioner/tuning"
+
+DEFAULT_TUNING_BENCHMARK_DURATION_SECONDS = 4
+DEFAULT_TUNING_BENCHMARK_DISK_SIZE_MB = 64
+TUNING_SSH_TIMEOUT_SLACK_SECONDS = 30
+
+# Metric name, report label and whether a higher value is better, None for settings that are not measured
+TUNING_METRICS: List[Tuple[str, str, Optional[bool]]] = [
+    ("cpu_governor", "CPU governor", None),
+    ("memory_cgroups", "Memory cgroups", None),
+    ("volatile_logs", "Logs in RAM", None),
+    ("zram_swap_mb", "zram swap MB", None),
+    ("mem_available_mb", "Available memory MB", True),
+    ("root_write_kbps", "Idle root disk writes KB/s", False),
+    ("cpu_sha256_mbps", "CPU sha256 MB/s", True),
+    ("cpu_python_kops", "CPU python kops/s", True),
+    ("disk_seq_write_mbps", "Seq write MB/s", True),
+    ("disk_rand_write_iops", "4K write IOPS", True),
+]
+
+
+class NodeTuningResult:
+
+    host_name: str
+    ip_address: str
+    profile: str
+    before: Dict[str, Any]
+    after: Dict[str, Any]
+    applied: Dict[str, Any]
+    ready_host: Optional[ReadyHost]
+
+    def __init__(
+        self,
+        host_name: str,
+        ip_address: str,
+        profile: str,
+        before: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+        applied: Optional[Dict[str, Any]] = None,
+        ready_host: Optional[ReadyHost] = None,
+    ) -> None:
+        self.host_name = host_name
+        self.ip_address = ip_address
+        self.profile = profile
+        self.before = before if before else {}
+        self.after = after if after else {}
+        self.applied = applied if applied else {}
+        self.ready_host = ready_host
+
+    def is_reboot_required(self) -> bool:
+        return len(self.applied.get("reboot_required", [])) > 0
+
+
+class RemoteNodeTuning:
+    """
+    Apply a tuning profile with the node tuning script and measure the node before and after.
+    Measurements are the node status (memory, swap, background disk writes) and a short local benchmark,
+    the same workloads on both sides so the change can be read from the report.
+    """
+
+    write_rate_window_seconds: float
+    benchmark: Optional[RemoteNodeBenchmark]
+
+    def __init__(
+        self,
+        write_rate_window_seconds: Optional[float] = DEFAULT_WRITE_RATE_WINDOW_SECONDS,
+        benchmark: Optional[RemoteNodeBenchmark] = None,
+    ) -> None:
+        self.write_rate_window_seconds = write_rate_window_seconds
+        self.benchmark = benchmark
+
+    def _exec(self, ansible_host: AnsibleHost, command: str, stdin_data: Optional[str] = None) -> str:
+        timeout = self.write_rate_window_seconds + TUNING_SSH_TIMEOUT_SLACK_SECONDS
+        return run_ssh_command(ansible_host, command, timeout, stdin_data=stdin_data)
+
+    def _run_script(self, ansible_host: AnsibleHost, *args: str) -> Dict[str, Any]:
+        command = " ".join(["sudo", "-n", "python3", f"{TUNING_DIR}/{TUNING_SCRIPT_NAME}"] + list(args))
+        return json.loads(self._exec(ansible_host, command).strip().splitlines()[-1])
+
+    def push(self, ansible_host: AnsibleHost) -> None:
+        self._exec(
+            ansible_host,
+            f"mkdir -p {TUNING_DIR} && cat > {TUNING_DIR}/{TUNING_SCRIPT_NAME}",
+            stdin_data=TUNING_SCRIPT,
+        )
+
+    def measure(self, ansible_host: AnsibleHost) -> Dict[str, Any]:
+        # Background writes are sampled first, the benchmark would otherwise show up in them
+        metrics = self._run_script(ansible_host, "status", "--write-rate-window", str(self.write_rate_window_seconds))
+        if self.benchmark is not None:
+            result = self.benchmark.run_local([ansible_host])[0]
+            metrics.update(result.metrics)
+            if result.errors:
+                logger.warning(f"Benchmark failed. host: {ansible_host.host}, errors: {result.errors}")
+        return metrics
+
+    def apply(self, ansible_host: AnsibleHost, profile: str) -> Dict[str, Any]:
+        return self._run_script(ansible_host, "apply", "--profile", profile)
+
+    def reboot_and_wait(self, ansible_host: AnsibleHost) -> ReadyHost:
+        self._exec(
+            ansible_host, f"sudo -n systemd-run --on-active={REBOOT_TRIGGER_DELAY_SECONDS} /bin/systemctl reboot"
+        )
+        return SSHReachabilityPoller().wait_until_ready_single(
+            ReachabilityTarget.from_ansible_host(ansible_host, reboot_delay_seconds=REBOOT_TRIGGER_DELAY_SECONDS)
+        )
+
+
+class RemoteTuningArgs:
+
+    remote_opts: RemoteOpts
+    profile: str
+    measure: bool
+    benchmark_duration_seconds: float
+    reboot: bool
+
+    def __init__(
+        self,
+        remote_opts: RemoteOpts,
+        profile: str,
+        measure: Optional[bool] = True,
+        benchmark_duration_seconds: Optional[float] = DEFAULT_TUNING_BENCHMARK_DURATION_SECONDS,
+        reboot: Optional[bool] = True,
+    ) -> None:
+        self.remote_opts = remote_opts
+        self.profile = profile
+        self.measure = measure
+        self.benchmark_duration_seconds = benchmark_duration_seconds
+        self.reboot = reboot
+
+
+class RemoteTuningRunner:
+
+    def run(
+        self,
+        ctx: Context,
+        args: RemoteTuningArgs,
+        collaborators: CoreCollaborators,
+        tuning: Optional[RemoteNodeTuning] = None,
+    ) -> Optional[NodeTuningResult]:
+        logger.debug("Inside RemoteTuningRunner run()")
+
+        self._prerequisites(ctx=ctx, checks=collaborators.checks())
+        ansible_host = self._get_ssh_conn_info(ctx, collaborators, args.remote_opts).ansible_hosts[0]
+        collaborators.printer().print_with_rich_table_fn(generate_tuning_profile_summary(args.profile))
+        if ctx.is_dry_run():
+            return None
+
+        tuning = tuning if tuning else self._create_tuning(args)
+        result = NodeTuningResult(ansible_host.host, ansible_host.ip_address, args.profile)
+        status = collaborators.progress_indicator().get_status()
+
+        tracer = get_tracer()
+
+        def apply() -> None:
+            with tracer.span("push tuning script", host=ansible_host.host):
+                tuning.push(ansible_host)
+            if args.measure:
+                with tracer.span("measure before", host=ansible_host.host):
+                    result.before = tuning.measure(ansible_host)
+            with tracer.span("apply tuning profile", host=ansible_host.host, profile=args.profile):
+                result.applied = tuning.apply(ansible_host, args.profile)
+
+        status.long_running_process_fn(
+            call=apply,
+            desc_run=f"Applying tuning profile {args.profile} on {ansible_host.host}",
+            desc_end="Tuning profile applied.",
+        )
+
+        measure_host = ansible_host
+        if result.is_reboot_required() and args.reboot:
+            with tracer.span("wait for reboot", host=ansible_host.host):
+                result.ready_host = status.long_running_process_fn(
+                    call=lambda: tuning.reboot_and_wait(ansible_host),
+                    desc_run=f"Rebooting {ansible_host.host} to apply boot settings",
+                    desc_end="Reboot finished.",
+                )
+            measure_host = result.ready_host.to_ansible_host(ansible_host) if result.ready_host.ready else None
+
+        if args.measure and measure_host is not None:
+            with tracer.span("measure after", host=ansible_host.host):
+                result.after = status.long_running_process_fn(
+                    call=lambda: tuning.measure(measure_host),
+                    desc_run=f"Measuring {ansible_host.host} with the tuning profile applied",
+                    desc_end="Measurements finished.",
+                )
+
+        collaborators.printer().print_with_rich_table_fn(generate_tuning_report(result, args.reboot))
+        return result
+
+    def _create_tuning(self, args: RemoteTuningArgs) -> RemoteNodeTuning:
+        benchmark = RemoteNodeBenchmark(
+            disk_size_mb=DEFAULT_TUNING_BENCHMARK_DISK_SIZE_MB, duration_seconds=args.benchmark_duration_seconds
+        )
+        return RemoteNodeTuning(benchmark=benchmark if args.benchmark_duration_seconds > 0 else None)
+
+    def _get_ssh_conn_info(
+        self, ctx: Context, collaborators: CoreCollaborators, remote_opts: Optional[RemoteOpts] = None
+    ) -> SSHConnectionInfo:
+
+        ssh_conn_info = Evaluator.eval_step_return_value_throw_on_failure(
+            call=lambda: LanInventoryRemoteMachineConnector(collaborators=collaborators).collect_ssh_connection_info(
+                ctx, remote_opts, force_single_conn_info=True
+            ),
+            ctx=ctx,
+            err_msg="Could not resolve SSH connection info",
+        )
+        collaborators.summary().append("ssh_conn_info", ssh_conn_info)
+        return ssh_conn_info
+
+    def _prerequisites(self, ctx: Context, checks: Checks) -> None:
+        if ctx.os_arch.is_linux():
+            return
+        elif ctx.os_arch.is_darwin():
+            return
+        elif ctx.os_arch.is_windows():
+            raise NotImplementedError("Windows is not supported")
+        else:
+            raise NotImplementedError("OS is not supported")
+
+
+def _format_change(before: Any, after: Any, higher_is_better: Optional[bool]) -> str:
+    if after is None:
+        return f"{before if before is not None else '-'}"
+    if before is None or before == after:
+        return f"{after}"
+    if higher_is_better is None or isinstance(before, bool) or not before:
+        return f"{before} -> [yellow]{after}[/yellow]"
+    change = (after - before) * 100.0 / before
+    color = "green" if (change >= 0) == higher_is_better else "red"
+    return f"{before} -> {after} [{color}]({change:+.0f}%)[/{color}]"
+
+
+def generate_tuning_profile_summary(profile_name: str) -> str:
+    profile = PROFILES[profile_name]
+    return f"""
+  Tuning profile [green]{profile.name}[/green]: {profile.description}
+
+    • zram swap....: {profile.zram_percent}% of RAM ({profile.zram_algorithm})
+    • CPU governor.: {profile.cpu_governor}
+    • Logs in RAM..: {'yes' if profile.volatile_logs else 'no'}
+    • GPU memory...: {profile.gpu_mem_mb} MB
+    • cgroups......: {'memory cgroups enabled' if profile.cgroups else 'unchanged'}
+    • sysctl.......: {', '.join(f'{key}={value}' for key, value in sorted(profile.sysctl.items()))}
+"""
+
+
+def generate_tuning_report(result: NodeTuningResult, reboot: Optional[bool] = True) -> str:
+    lines = []
+    for file_path in result.applied.get("changed", []):
+        lines.append(f"    • Updated......: {file_path}")
+    if result.is_reboot_required() and not reboot:
+        lines.append("    • Reboot.......: [yellow]pending, boot settings apply on the next reboot[/yellow]")
+    else:
+        reboot_status = generate_reboot_status(result.ready_host).rstrip("\n")
+        if reboot_status:
+            lines.append(reboot_status)
+    for error in result.applied.get("errors", []):
+        lines.append(f"    • [red]{error}[/red]")
+
+    metric_lines = []
+    for metric, label, higher_is_better in TUNING_METRICS:
+        if metric in result.before or metric in result.after:
+            metric_lines.append(
+                f"    {label}: {_format_change(result.before.get(metric), result.after.get(metric), higher_is_better)}"
+            )
+    metrics = (
+        f"\n  Before -> after:\n\n{chr(10).join(metric_lines)}\n" if metric_lines else "\n  Measurements skipped.\n"
+    )
+    return f"""
+  Tuning profile [green]{result.profile}[/green] applied on [green]{result.host_name}[/green] ({result.ip_address}):
+
+{chr(10).join(lines) if lines else "    • Node already matched the profile"}
+{metrics}"""
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from provisioner_single_board_plugin.src.common.remote.remote_tuning import (
+    NodeTuningResult,
+    generate_tuning_profile_summary,
+    generate_tuning_report,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/remote/remote_tuning_test.py
+#
+
+
+class RemoteTuningTestShould(unittest.TestCase):
+
+    def test_report_before_and_after_metrics(self) -> None:
+        result = NodeTuningResult(
+            "node1",
+            "10.0.0.1",
+            "k3s-worker",
+            before={"cpu_governor": "ondemand", "root_write_kbps": 40.0, "cpu_sha256_mbps": 100.0, "zram_swap_mb": 0},
+            after={"cpu_governor": "performance", "root_write_kbps": 10.0, "cpu_sha256_mbps": 110.0, "zram_swap_mb": 0},
+            applied={"changed": ["/etc/sysctl.d/90-provisioner-tuning.conf"], "reboot_required": [], "errors": []},
+        )
+        report = generate_tuning_report(result)
+
+        self.assertIn("CPU governor: ondemand -> [yellow]performance[/yellow]", report)
+        self.assertIn("Idle root disk writes KB/s: 40.0 -> 10.0 [green](-75%)[/green]", report)
+        self.assertIn("CPU sha256 MB/s: 100.0 -> 110.0 [green](+10%)[/green]", report)
+        self.assertIn("zram swap MB: 0", report)
+        self.assertIn("Updated......: /etc/sysctl.d/90-provisioner-tuning.conf", report)
+
+    def test_report_pending_reboot(self) -> None:
+        result = NodeTuningResult(
+            "node1",
+            "10.0.0.1",
+            "low-memory",
+            applied={"changed": ["/boot/firmware/config.txt"], "reboot_required": ["/boot/firmware/config.txt"]},
+        )
+        self.assertTrue(result.is_reboot_required())
+        report = generate_tuning_report(result, reboot=False)
+        self.assertIn("pending, boot settings apply on the next reboot", report)
+        self.assertIn("Measurements skipped.", report)
+
+    def test_summarize_profile(self) -> None:
+        summary = generate_tuning_profile_summary("storage")
+        self.assertIn("zram swap....: 25% of RAM (lz4)", summary)
+        self.assertIn("vm.dirty_ratio=10", summary)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import shutil
+import sys
+from typing import List, Optional
+
+from loguru import logger
+from provisioner_single_board_plugin.src.common.system import block_device_check, image_writer
+from provisioner_single_board_plugin.src.common.system.block_device_check import (
+    DEFAULT_MIN_WRITE_SPEED_MBPS,
+    BlockDeviceChecker,
+    BlockDeviceCheckResult,
+)
+from provisioner_single_board_plugin.src.common.system.image_writer import ImageWriteResult
+
+from provisioner_shared.components.runtime.errors.cli_errors import CliApplicationException
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.infra.evaluator import Evaluator
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+from provisioner_shared.components.runtime.utils.prompter import PromptLevel
+from provisioner_shared.components.sd_card.image_burner import ImageBurnerArgs, ImageBurnerCmdRunner
+
+MB = 1024 * 1024
+
+
+class CheckedImageBurnerCmdRunner(ImageBurnerCmdRunner):
+    """
+    Image burner that checks the selected block device before burning it and verifies it afterwards.
+    Slow or counterfeit SD cards are reported right after the operator approved formatting the device,
+    the operator decides whether it is worth spending minutes on burning it.
+    The image is written in place of dd by a streaming writer that keeps a digest per written range,
+    only those ranges are read back for verification instead of the whole device.
+    """
+
+    min_write_speed_mbps: float
+    skip_device_check: bool
+    skip_verify: bool
+
+    def __init__(
+        self,
+        min_write_speed_mbps: Optional[float] = DEFAULT_MIN_WRITE_SPEED_MBPS,
+        skip_device_check: Optional[bool] = False,
+        skip_verify: Optional[bool] = False,
+    ) -> None:
+        self.min_write_speed_mbps = min_write_speed_mbps
+        self.skip_device_check = skip_device_check
+        self.skip_verify = skip_verify
+
+    def _run_pre_burn_approval_flow(self, ctx: Context, block_device_name: str, collaborators: CoreCollaborators):
+        super()._run_pre_burn_approval_flow(ctx, block_device_name, collaborators)
+        if self.skip_device_check:
+            logger.debug("Skipping block device check upon user request")
+            return
+        if ctx.is_dry_run():
+            collaborators.printer().print_fn("Skipping block device speed and capacity check on dry run")
+            return
+        self._run_block_device_check(ctx, block_device_name, collaborators)
+
+    def _run_block_device_check(self, ctx: Context, block_device_name: str, collaborators: CoreCollaborators):
+        device_path = block_device_name
+        if ctx.os_arch.is_darwin():
+            # Mounted disks cannot be opened for writing, the raw device bypasses the buffer cache
+            collaborators.process().run_fn(args=["diskutil", "unmountDisk", block_device_name])
+            if "/dev/" in block_device_name:
+                device_path = block_device_name.replace("/dev/", "/dev/r", 1)
+
+        result = (
+            collaborators.progress_indicator()
+            .get_status()
+            .long_running_process_fn(
+                call=lambda: self._check_block_device(device_path, collaborators),
+                desc_run=f"Checking write speed and capacity of {block_device_name}",
+                desc_end="Block device check finished.",
+            )
+        )
+        collaborators.printer().print_with_rich_table_fn(
+            generate_block_device_check_report(result, self.min_write_speed_mbps)
+        )
+        if result.is_capacity_verified() and not result.is_slower_than(self.min_write_speed_mbps):
+            return
+
+        Evaluator.eval_step_return_value_throw_on_failure(
+            call=lambda: collaborators.prompter().prompt_yes_no_fn(
+                f"Block device '{block_device_name}' failed the pre-burn check, burn it anyway",
+                level=PromptLevel.WARNING,
+                post_no_message="Aborted by user.",
+                post_yes_message="Block device was approved by user despite the failed check",
+            ),
+            ctx=ctx,
+            err_msg="Aborted upon user request",
+        )
+
+    def _check_block_device(self, device_path: str, collaborators: CoreCollaborators) -> BlockDeviceCheckResult:
+        if os.access(device_path, os.W_OK):
+            return BlockDeviceChecker(device_path).check()
+        # The checker module is standard library only, run its file as is with elevated permissions
+        output = collaborators.process().run_fn(
+            args=["sudo", sys.executable, block_device_check.__file__, device_path],
+            fail_msg=f"Failed to check block device {device_path}",
+        )
+        return BlockDeviceCheckResult.from_dict(json.loads(output.strip().splitlines()[-1]))
+
+    def _burn_image_by_os(
+        self,
+        ctx: Context,
+        block_device_name: str,
+        burn_image_file_path: str,
+        collaborators: CoreCollaborators,
+        args: ImageBurnerArgs,
+    ):
+        if self.skip_verify:
+            return super()._burn_image_by_os(ctx, block_device_name, burn_image_file_path, collaborators, args)
+
+        if ctx.os_arch.is_linux():
+            self._run_pre_burn_approval_flow(ctx, block_device_name, collaborators)
+            self._burn_and_verify_image_linux(ctx, block_device_name, burn_image_file_path, collaborators, args)
+
+        elif ctx.os_arch.is_darwin():
+            self._run_pre_burn_approval_flow(ctx, block_device_name, collaborators)
+            self._burn_and_verify_image_darwin(ctx, block_device_name, burn_image_file_path, collaborators, args)
+
+        elif ctx.os_arch.is_windows():
+            raise NotImplementedError("Windows is not supported")
+        else:
+            raise NotImplementedError("OS is not supported")
+
+    def _burn_and_verify_image_linux(
+        self,
+        ctx: Context,
+        block_device_name: str,
+        burn_image_file_path: str,
+        collaborators: CoreCollaborators,
+        args: ImageBurnerArgs,
+    ):
+        logger.debug(f"About to burn and verify image. device: {block_device_name}, image: {burn_image_file_path}")
+        extracted_file_path, temp_dir = self._extract_image_file(burn_image_file_path, collaborators)
+        try:
+            collaborators.printer().print_fn("Formatting block device, burning and verifying image...")
+            self._write_and_verify_image(
+                ctx, [], extracted_file_path, block_device_name, block_device_name, collaborators
+            )
+
+            collaborators.printer().print_fn("Flushing write-cache...")
+            collaborators.process().run_fn(args=["sync"])
+
+            self._configure_boot_partition_for_ssh(collaborators, args)
+            collaborators.printer().print_fn("It is now safe to remove the SD-Card !")
+        finally:
+            if extracted_file_path != burn_image_file_path and temp_dir and os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir)
+
+    def _burn_and_verify_image_darwin(
+        self,
+        ctx: Context,
+        block_device_name: str,
+        burn_image_file_path: str,
+        collaborators: CoreCollaborators,
+        args: ImageBurnerArgs,
+    ):
+        logger.debug(f"About to burn and verify image. device: {block_device_name}, image: {burn_image_file_path}")
+        # Raw disk (rdisk) bypasses the buffer cache of the disk (disk), faster writes and honest read backs
+        raw_block_device_name = block_device_name
+        if "/dev/" in block_device_name:
+            raw_block_device_name = block_device_name.replace("/dev/", "/dev/r", 1)
+
+        collaborators.printer().print_fn("Unmounting selected block device (SD-Card)...")
+        collaborators.process().run_fn(args=["diskutil", "unmountDisk", block_device_name])
+
+        extracted_file_path, temp_dir = self._extract_image_file(burn_image_file_path, collaborators)
+        try:
+            collaborators.printer().print_fn("Formatting block device, burning and verifying image...")
+            self._write_and_verify_image(
+                ctx, ["sudo"], extracted_file_path, raw_block_device_name, block_device_name, collaborators
+            )
+
+            collaborators.printer().print_fn("Flushing write-cache to block device...")
+            collaborators.process().run_fn(args=["sync"])
+
+            collaborators.printer().print_fn(f"Remounting block device {block_device_name}...")
+            collaborators.process().run_fn(args=["diskutil", "unmountDisk", block_device_name])
+            collaborators.process().run_fn(args=["diskutil", "mountDisk", block_device_name])
+
+            self._configure_boot_partition_for_ssh(collaborators, args)
+
+            collaborators.printer().print_fn(f"Ejecting block device {block_device_name}...")
+            collaborators.process().run_fn(args=["diskutil", "eject", block_device_name])
+            collaborators.printer().print_fn("It is now safe to remove the SD-Card !")
+        finally:
+            if extracted_file_path != burn_image_file_path and temp_dir and os.path.exists(temp_dir):
+                collaborators.io_utils().delete_directory_fn(temp_dir)
+
+    def _write_and_verify_image(
+        self,
+        ctx: Context,
+        command_prefix: List[str],
+        image_file_path: str,
+        device_path: str,
+        block_device_name: str,
+        collaborators: CoreCollaborators,
+    ) -> None:
+        # The writer module is standard library only, its file runs as is in place of dd
+        output = collaborators.process().run_fn(
+            args=command_prefix + [sys.executable, image_writer.__file__, "write", image_file_path, device_path],
+            fail_msg=f"Failed to burn image to block device {block_device_name}",
+        )
+        if ctx.is_dry_run():
+            return
+
+        result = ImageWriteResult.from_dict(json.loads(output.strip().splitlines()[-1]))
+        collaborators.printer().print_with_rich_table_fn(generate_image_verification_report(result))
+        if not result.is_verified():
+            raise CliApplicationException(
+                f"Image verification failed, {len(result.mismatched_offsets)} written ranges differ from the image. "
+                + f"The SD-Card might be faulty. device: {block_device_name}"
+            )
+
+
+def generate_image_verification_report(result: ImageWriteResult) -> str:
+    written_mb = int(result.bytes_written / MB)
+    if result.is_verified():
+        status = f"[green]verified[/green] ({len(result.digests)} ranges read back)"
+    else:
+        status = f"[red]{len(result.mismatched_offsets)}/{len(result.digests)} ranges differ from the image[/red]"
+    return f"""
+  Written: {written_mb} MB in {result.write_seconds:.1f}s
+  Verification: {status} in {result.verify_seconds:.1f}s
+"""
+
+
+def generate_block_device_check_report(result: BlockDeviceCheckResult, min_write_speed_mbps: float) -> str:
+    reported_size_mb = int(result.reported_size_bytes / MB)
+    speed_color = "red" if result.is_slower_than(min_write_speed_mbps) else "green"
+    speed_line = f"[{speed_color}]{result.write_speed_mbps} MB/s[/{speed_color}] (minimum {min_write_speed_mbps} MB/s)"
+    if result.is_capacity_verified():
+        capacity_line = f"[green]verified[/green] ({result.samples_total} sampled blocks read back)"
+    else:
+        capacity_line = (
+            f"[red]{len(result.samples_failed)}/{result.samples_total} sampled blocks failed to read back[/red], "
+            + f"data past {int(result.verified_size_bytes() / MB)} MB is not stored reliably, "
+            + "the device might be counterfeit"
+        )
+    return f"""
+  Block device: [yellow]{result.device_path}[/yellow]
+  Reported size: {reported_size_mb} MB
+  Sustained write speed: {speed_line}
+  Capacity: {capacity_line}
+"""
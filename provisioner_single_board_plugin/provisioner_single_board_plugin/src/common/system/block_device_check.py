@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Standard library only: when the device is not writable by the current user the module file is
+# executed as is with elevated permissions, see checked_image_burner.py.
+# The check is destructive, it runs only after the operator approved formatting the device.
+
+DEFAULT_MIN_WRITE_SPEED_MBPS = 10.0
+DEFAULT_SPEED_TEST_SIZE_MB = 64
+DEFAULT_CAPACITY_SAMPLES = 64
+
+MB = 1024 * 1024
+WRITE_BLOCK_SIZE = 4 * MB
+SAMPLE_BLOCK_SIZE = 64 * 1024
+SAMPLE_HEADER_MAGIC = b"PROVCHK1"
+SAMPLE_HEADER_FORMAT = "<8sQQ"
+
+# macOS does not report the size of a disk device through lseek
+DARWIN_DKIOCGETBLOCKSIZE = 0x40046418
+DARWIN_DKIOCGETBLOCKCOUNT = 0x40086419
+
+
+class BlockDeviceCheckResult:
+
+    device_path: str
+    reported_size_bytes: int
+    write_speed_mbps: float
+    samples_total: int
+    samples_failed: List[int]
+
+    def __init__(
+        self,
+        device_path: str,
+        reported_size_bytes: int,
+        write_speed_mbps: float,
+        samples_total: int,
+        samples_failed: List[int],
+    ) -> None:
+        self.device_path = device_path
+        self.reported_size_bytes = reported_size_bytes
+        self.write_speed_mbps = write_speed_mbps
+        self.samples_total = samples_total
+        self.samples_failed = samples_failed
+
+    def is_capacity_verified(self) -> bool:
+        return self.samples_total > 0 and not self.samples_failed
+
+    def verified_size_bytes(self) -> int:
+        """Lowest offset that failed to read back, data past it is not stored reliably"""
+        return min(self.samples_failed) if self.samples_failed else self.reported_size_bytes
+
+    def is_slower_than(self, min_write_speed_mbps: float) -> bool:
+        return self.write_speed_mbps < min_write_speed_mbps
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "device_path": self.device_path,
+            "reported_size_bytes": self.reported_size_bytes,
+            "write_speed_mbps": self.write_speed_mbps,
+            "samples_total": self.samples_total,
+            "samples_failed": self.samples_failed,
+        }
+
+    @staticmethod
+    def from_dict(values: Dict[str, Any]) -> "BlockDeviceCheckResult":
+        return BlockDeviceCheckResult(**values)
+
+
+class BlockDeviceChecker:
+    """
+    Measures the sustained sequential write speed at the start of the device, then writes a block
+    at sampled offsets across the whole reported size and reads all of them back.
+    Counterfeit cards report a larger size than they hold and wrap or drop writes past the real
+    capacity, the affected samples read back another block or garbage.
+    """
+
+    device_path: str
+    speed_test_size_mb: int
+    capacity_samples: int
+
+    def __init__(
+        self,
+        device_path: str,
+        speed_test_size_mb: Optional[int] = DEFAULT_SPEED_TEST_SIZE_MB,
+        capacity_samples: Optional[int] = DEFAULT_CAPACITY_SAMPLES,
+    ) -> None:
+        self.device_path = device_path
+        self.speed_test_size_mb = speed_test_size_mb
+        self.capacity_samples = capacity_samples
+
+    def check(self) -> BlockDeviceCheckResult:
+        fd = os.open(self.device_path, os.O_RDWR)
+        try:
+            reported_size_bytes = self._reported_size(fd)
+            write_speed_mbps = self._measure_write_speed(fd, reported_size_bytes)
+            offsets = self.sample_offsets(reported_size_bytes)
+            samples_failed = self._verify_samples(fd, offsets)
+        finally:
+            os.close(fd)
+        return BlockDeviceCheckResult(
+            device_path=self.device_path,
+            reported_size_bytes=reported_size_bytes,
+            write_speed_mbps=round(write_speed_mbps, 1),
+            samples_total=len(offsets),
+            samples_failed=samples_failed,
+        )
+
+    def sample_offsets(self, size_bytes: int) -> List[int]:
+        """
+        Block aligned offsets evenly spread over the device, always covering the first and the last block.
+        Power of two offsets are added as well, counterfeit capacities are mostly powers of two and a write
+        at exactly the real capacity wraps onto the first block.
+        """
+        blocks = size_bytes // SAMPLE_BLOCK_SIZE
+        if blocks <= 0:
+            return []
+        count = min(self.capacity_samples, blocks)
+        offsets = {0, (blocks - 1) * SAMPLE_BLOCK_SIZE}
+        if count > 1:
+            offsets.update((i * (blocks - 1) // (count - 1)) * SAMPLE_BLOCK_SIZE for i in range(count))
+        power = 1
+        while power < blocks:
+            offsets.add(power * SAMPLE_BLOCK_SIZE)
+            power *= 2
+        return sorted(offsets)
+
+    def _reported_size(self, fd: int) -> int:
+        size = os.lseek(fd, 0, os.SEEK_END)
+        if size == 0 and sys.platform == "darwin":
+            import fcntl
+
+            block_size = struct.unpack("<I", fcntl.ioctl(fd, DARWIN_DKIOCGETBLOCKSIZE, b"\x00" * 4))[0]
+            block_count = struct.unpack("<Q", fcntl.ioctl(fd, DARWIN_DKIOCGETBLOCKCOUNT, b"\x00" * 8))[0]
+            size = block_size * block_count
+        os.lseek(fd, 0, os.SEEK_SET)
+        return size
+
+    def _measure_write_speed(self, fd: int, reported_size_bytes: int) -> float:
+        size_bytes = min(self.speed_test_size_mb * MB, reported_size_bytes)
+        size_bytes -= size_bytes % WRITE_BLOCK_SIZE
+        if size_bytes <= 0:
+            return 0.0
+        block = os.urandom(WRITE_BLOCK_SIZE)
+        started = time.monotonic()
+        # Flushed as part of the measurement, otherwise only the page cache speed is measured
+        for offset in range(0, size_bytes, WRITE_BLOCK_SIZE):
+            self._write_at(fd, block, offset)
+        os.fsync(fd)
+        return size_bytes / MB / max(time.monotonic() - started, 1e-9)
+
+    def _verify_samples(self, fd: int, offsets: List[int]) -> List[int]:
+        failed = set()
+        # Highest first, a wrapped write then lands before the block it aliases is written and only the
+        # sample past the real capacity fails to read back
+        for offset in sorted(offsets, reverse=True):
+            try:
+                self._write_at(fd, self._sample_block(offset), offset)
+            except OSError:
+                failed.add(offset)
+        os.fsync(fd)
+        if hasattr(os, "posix_fadvise"):
+            # Read back from the device and not from the page cache
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+        for offset in offsets:
+            if offset in failed:
+                continue
+            try:
+                if self._read_at(fd, SAMPLE_BLOCK_SIZE, offset) != self._sample_block(offset):
+                    failed.add(offset)
+            except OSError:
+                failed.add(offset)
+        return sorted(failed)
+
+    def _sample_block(self, offset: int) -> bytes:
+        header = struct.pack(SAMPLE_HEADER_FORMAT, SAMPLE_HEADER_MAGIC, offset, SAMPLE_BLOCK_SIZE)
+        pattern = hashlib.sha256(header).digest()
+        return (header + pattern * (SAMPLE_BLOCK_SIZE // len(pattern) + 1))[:SAMPLE_BLOCK_SIZE]
+
+    def _write_at(self, fd: int, data: bytes, offset: int) -> None:
+        written = os.pwrite(fd, data, offset)
+        if written != len(data):
+            raise OSError(f"Short write at offset {offset}")
+
+    def _read_at(self, fd: int, size: int, offset: int) -> bytes:
+        return os.pread(fd, size, offset)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Block device speed and capacity check")
+    parser.add_argument("device_path")
+    parser.add_argument("--speed-test-size-mb", type=int, default=DEFAULT_SPEED_TEST_SIZE_MB)
+    parser.add_argument("--capacity-samples", type=int, default=DEFAULT_CAPACITY_SAMPLES)
+    args = parser.parse_args(argv)
+    checker = BlockDeviceChecker(args.device_path, args.speed_test_size_mb, args.capacity_samples)
+    print(json.dumps(checker.check().to_dict()))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from provisioner_single_board_plugin.src.common.system.block_device_check import (
+    MB,
+    SAMPLE_BLOCK_SIZE,
+    BlockDeviceChecker,
+    BlockDeviceCheckResult,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/system/block_device_check_test.py
+#
+
+TEST_IMAGE_SIZE_MB = 32
+TEST_REAL_CAPACITY_BYTES = 8 * MB
+
+
+class CounterfeitBlockDeviceChecker(BlockDeviceChecker):
+    """Mimics a counterfeit card controller, addresses past the real capacity wrap around to its start"""
+
+    def _write_at(self, fd: int, data: bytes, offset: int) -> None:
+        super()._write_at(fd, data, offset % TEST_REAL_CAPACITY_BYTES)
+
+    def _read_at(self, fd: int, size: int, offset: int) -> bytes:
+        return super()._read_at(fd, size, offset % TEST_REAL_CAPACITY_BYTES)
+
+
+class BlockDeviceCheckTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.image_dir = tempfile.mkdtemp(prefix="provisioner-block-device-check-test")
+        self.image_path = os.path.join(self.image_dir, "loopback.img")
+        with open(self.image_path, "wb") as f:
+            f.truncate(TEST_IMAGE_SIZE_MB * MB)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.image_dir)
+
+    def test_verify_genuine_image_capacity_and_speed(self) -> None:
+        result = BlockDeviceChecker(self.image_path, speed_test_size_mb=8, capacity_samples=16).check()
+
+        self.assertEqual(result.reported_size_bytes, TEST_IMAGE_SIZE_MB * MB)
+        self.assertGreater(result.write_speed_mbps, 0)
+        self.assertGreaterEqual(result.samples_total, 16)
+        self.assertTrue(result.is_capacity_verified())
+        self.assertEqual(result.verified_size_bytes(), TEST_IMAGE_SIZE_MB * MB)
+        self.assertEqual(os.path.getsize(self.image_path), TEST_IMAGE_SIZE_MB * MB)
+
+    def test_detect_counterfeit_capacity(self) -> None:
+        result = CounterfeitBlockDeviceChecker(self.image_path, speed_test_size_mb=4, capacity_samples=16).check()
+
+        self.assertFalse(result.is_capacity_verified())
+        self.assertEqual(result.verified_size_bytes(), TEST_REAL_CAPACITY_BYTES)
+
+    def test_spread_samples_over_the_whole_device(self) -> None:
+        offsets = BlockDeviceChecker(self.image_path, capacity_samples=5).sample_offsets(TEST_IMAGE_SIZE_MB * MB)
+
+        self.assertEqual(offsets[0], 0)
+        self.assertIn(TEST_REAL_CAPACITY_BYTES, offsets)
+        self.assertEqual(offsets[-1], TEST_IMAGE_SIZE_MB * MB - SAMPLE_BLOCK_SIZE)
+        self.assertTrue(all(offset % SAMPLE_BLOCK_SIZE == 0 for offset in offsets))
+        self.assertEqual(BlockDeviceChecker(self.image_path).sample_offsets(SAMPLE_BLOCK_SIZE - 1), [])
+
+    def test_flag_slow_devices(self) -> None:
+        result = BlockDeviceCheckResult.from_dict(
+            {
+                "device_path": "/dev/sdz",
+                "reported_size_bytes": 64 * MB,
+                "write_speed_mbps": 4.2,
+                "samples_total": 8,
+                "samples_failed": [],
+            }
+        )
+        self.assertTrue(result.is_slower_than(10))
+        self.assertFalse(result.is_slower_than(4))
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+
+import argparse
+import gzip
+import json
+import lzma
+import os
+import re
+import shutil
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional
+
+# Standard library only: the module file is pushed to the node and runs there as root, see remote_boot_migration.py.
+# Functions operating on devices take plain paths, image files stand in for block devices in tests.
+
+SECTOR_SIZE = 512
+MBR_DISK_ID_OFFSET = 440
+MBR_PARTITION_TABLE_OFFSET = 446
+MBR_PARTITION_ENTRY_FORMAT = "<B3sB3sII"
+MBR_PARTITION_ENTRY_SIZE = 16
+MBR_SIGNATURE_OFFSET = 510
+MBR_SIGNATURE = b"\x55\xaa"
+MBR_TYPE_EMPTY = 0x00
+MBR_TYPE_LINUX = 0x83
+MBR_TYPE_GPT_PROTECTIVE = 0xEE
+
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+PROGRESS_INTERVAL_SECONDS = 5
+
+XZ_MAGIC = b"\xfd7zXZ\x00"
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Boot modes are tried from the rightmost nibble: 1 SD card, 4 USB mass storage, 6 NVMe, f restart the sequence.
+# The SD card stays as a fallback so a node with a failed SSD still boots.
+BOOT_ORDER_USB_FIRST = "0xf14"
+BOOT_ORDER_NVME_FIRST = "0xf416"
+EEPROM_CONFIG_TOOL = "rpi-eeprom-config"
+
+PARTUUID_PATTERN = re.compile(r"PARTUUID=([0-9a-fA-F]{8})-(\d{2})")
+
+# linux/fs.h, freezing the root filesystem keeps the block level clone consistent
+FIFREEZE = 0xC0045877
+FITHAW = 0xC0045878
+# A frozen root filesystem blocks every writer on the node, it is thawed when the script is told to stop
+# (e.g. SIGHUP once the SSH session drops) and by a watchdog in case the copy never completes
+FREEZE_THAW_SIGNALS = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
+MAX_FREEZE_SECONDS = 30 * 60
+
+MIGRATION_SOURCE_CLONE = "clone"
+MIGRATION_SOURCE_IMAGE = "image"
+
+
+class MbrPartition:
+    __slots__ = ("number", "type", "start_sector", "sectors")
+
+    def __init__(self, number: int, type: int, start_sector: int, sectors: int) -> None:
+        self.number = number
+        self.type = type
+        self.start_sector = start_sector
+        self.sectors = sectors
+
+    def end_sector(self) -> int:
+        return self.start_sector + self.sectors
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+def read_mbr(device_path: str) -> bytes:
+    with open(device_path, "rb") as f:
+        mbr = f.read(SECTOR_SIZE)
+    if len(mbr) != SECTOR_SIZE or mbr[MBR_SIGNATURE_OFFSET:] != MBR_SIGNATURE:
+        raise ValueError(f"No MBR partition table found. device: {device_path}")
+    if any(partition.type == MBR_TYPE_GPT_PROTECTIVE for partition in _parse_partitions(mbr)):
+        raise ValueError(f"GPT partition tables are not supported, Raspberry Pi OS uses MBR. device: {device_path}")
+    return mbr
+
+
+def _parse_partitions(mbr: bytes) -> List[MbrPartition]:
+    partitions = []
+    for i in range(4):
+        offset = MBR_PARTITION_TABLE_OFFSET + i * MBR_PARTITION_ENTRY_SIZE
+        _, _, type, _, start_sector, sectors = struct.unpack(
+            MBR_PARTITION_ENTRY_FORMAT, mbr[offset : offset + MBR_PARTITION_ENTRY_SIZE]
+        )
+        if type != MBR_TYPE_EMPTY and sectors > 0:
+            partitions.append(MbrPartition(i + 1, type, start_sector, sectors))
+    return partitions
+
+
+def read_partitions(device_path: str) -> List[MbrPartition]:
+    return _parse_partitions(read_mbr(device_path))
+
+
+def read_disk_id(device_path: str) -> int:
+    return struct.unpack_from("<I", read_mbr(device_path), MBR_DISK_ID_OFFSET)[0]
+
+
+def write_disk_id(device_path: str, disk_id: int) -> None:
+    """The MBR disk identifier is the prefix of every PARTUUID of the disk"""
+    read_mbr(device_path)
+    with open(device_path, "r+b") as f:
+        f.seek(MBR_DISK_ID_OFFSET)
+        f.write(struct.pack("<I", disk_id))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def new_disk_id(*taken: int) -> int:
+    while True:
+        disk_id = struct.unpack("<I", os.urandom(4))[0]
+        if disk_id != 0 and disk_id not in taken:
+            return disk_id
+
+
+def format_disk_id(disk_id: int) -> str:
+    return f"{disk_id:08x}"
+
+
+def device_size(device_path: str) -> int:
+    fd = os.open(device_path, os.O_RDONLY)
+    try:
+        return os.lseek(fd, 0, os.SEEK_END)
+    finally:
+        os.close(fd)
+
+
+def partition_device_path(device_path: str, number: int) -> str:
+    """/dev/sda -> /dev/sda1, devices ending with a digit take a 'p' separator: /dev/nvme0n1 -> /dev/nvme0n1p1"""
+    separator = "p" if device_path[-1].isdigit() else ""
+    return f"{device_path}{separator}{number}"
+
+
+def boot_order_for(device_path: str) -> str:
+    return BOOT_ORDER_NVME_FIRST if os.path.basename(device_path).startswith("nvme") else BOOT_ORDER_USB_FIRST
+
+
+def _write_all(fd: int, data: bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _report_progress(progress: Optional[Callable[[int], None]], copied: int, last_report: List[float]) -> None:
+    if progress is not None and time.monotonic() - last_report[0] >= PROGRESS_INTERVAL_SECONDS:
+        last_report[0] = time.monotonic()
+        progress(copied)
+
+
+def copy_device(
+    source_path: str, target_path: str, length: int, progress: Optional[Callable[[int], None]] = None
+) -> int:
+    if device_size(target_path) < length:
+        raise ValueError(f"Target device is smaller than the data to copy. target: {target_path}, required: {length}")
+    copied = 0
+    last_report = [time.monotonic()]
+    source_fd = os.open(source_path, os.O_RDONLY)
+    target_fd = os.open(target_path, os.O_WRONLY)
+    try:
+        while copied < length:
+            chunk = os.pread(source_fd, min(COPY_BUFFER_SIZE, length - copied), copied)
+            if not chunk:
+                raise ValueError(f"Source device ended before the end of its last partition. source: {source_path}")
+            _write_all(target_fd, chunk, copied)
+            copied += len(chunk)
+            _report_progress(progress, copied, last_report)
+        os.fsync(target_fd)
+    finally:
+        os.close(source_fd)
+        os.close(target_fd)
+    return copied
+
+
+def _open_image_stream(stream: BinaryIO) -> BinaryIO:
+    """Raw, xz and gzip images are recognized by their magic bytes, compressed ones are inflated on the fly"""
+    magic = stream.peek(len(XZ_MAGIC))[: len(XZ_MAGIC)]
+    if magic.startswith(XZ_MAGIC):
+        return lzma.LZMAFile(stream)
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def write_image_stream(stream: BinaryIO, target_path: str, progress: Optional[Callable[[int], None]] = None) -> int:
+    image = _open_image_stream(stream)
+    written = 0
+    last_report = [time.monotonic()]
+    target_fd = os.open(target_path, os.O_WRONLY)
+    try:
+        while True:
+            chunk = image.read(COPY_BUFFER_SIZE)
+            if not chunk:
+                break
+            _write_all(target_fd, chunk, written)
+            written += len(chunk)
+            _report_progress(progress, written, last_report)
+        os.fsync(target_fd)
+    finally:
+        os.close(target_fd)
+    return written
+
+
+def expand_last_partition(device_path: str) -> Optional[MbrPartition]:
+    """
+    Grow the last partition to the end of the device when it is a Linux partition, the clone of a small SD card
+    would otherwise leave most of the SSD unused. The filesystem is resized separately.
+    """
+    mbr = bytearray(read_mbr(device_path))
+    partitions = _parse_partitions(bytes(mbr))
+    if not partitions:
+        return None
+    last = max(partitions, key=lambda partition: partition.end_sector())
+    device_sectors = device_size(device_path) // SECTOR_SIZE
+    if last.type != MBR_TYPE_LINUX or last.end_sector() >= device_sectors:
+        return None
+
+    # MBR sector counts are 32 bit, larger devices are capped at 2TiB
+    last.sectors = min(device_sectors - last.start_sector, 0xFFFFFFFF)
+    entry_offset = MBR_PARTITION_TABLE_OFFSET + (last.number - 1) * MBR_PARTITION_ENTRY_SIZE
+    struct.pack_into("<I", mbr, entry_offset + 12, last.sectors)
+    with open(device_path, "r+b") as f:
+        f.write(bytes(mbr))
+        f.flush()
+        os.fsync(f.fileno())
+    return last
+
+
+def replace_partuuid(text: str, new_disk_id: int, old_disk_id: Optional[int] = None) -> str:
+    """Point PARTUUID references of the old disk to the new one, any disk when the old one is not given"""
+    return PARTUUID_PATTERN.sub(
+        lambda match: (
+            f"PARTUUID={format_disk_id(new_disk_id)}-{match.group(2)}"
+            if old_disk_id is None or match.group(1).lower() == format_disk_id(old_disk_id)
+            else match.group(0)
+        ),
+        text,
+    )
+
+
+def rewrite_partuuid_file(path: str, new_disk_id: int, old_disk_id: Optional[int] = None) -> bool:
+    if not os.path.exists(path):
+        return False
+    with open(path, "r") as f:
+        content = f.read()
+    updated = replace_partuuid(content, new_disk_id, old_disk_id)
+    if updated == content:
+        return False
+    with open(path, "w") as f:
+        f.write(updated)
+    return True
+
+
+def set_boot_order(eeprom_config: str, boot_order: str) -> str:
+    lines = eeprom_config.rstrip("\n").splitlines()
+    for i, line in enumerate(lines):
+        if line.strip().startswith("BOOT_ORDER="):
+            lines[i] = f"BOOT_ORDER={boot_order}"
+            break
+    else:
+        lines.append(f"BOOT_ORDER={boot_order}")
+    return "\n".join(lines) + "\n"
+
+
+def _run(args: List[str]) -> str:
+    """Command output is captured, stdout of this script carries the JSON protocol only"""
+    return subprocess.run(args, check=True, capture_output=True, text=True).stdout
+
+
+def _read_text(path: str) -> str:
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+def root_partuuid() -> Optional[str]:
+    for option in _read_text("/proc/cmdline").split():
+        if option.startswith("root=PARTUUID="):
+            return option[len("root=PARTUUID=") :]
+    return None
+
+
+def root_disk() -> str:
+    """The whole disk holding the root filesystem, e.g. /dev/mmcblk0"""
+    partuuid = root_partuuid()
+    partition = os.path.realpath(f"/dev/disk/by-partuuid/{partuuid}") if partuuid else None
+    if not partition or not os.path.exists(partition):
+        partition = next(
+            (line.split()[0] for line in _read_text("/proc/self/mounts").splitlines() if line.split()[1:2] == ["/"]),
+            None,
+        )
+    if not partition or not partition.startswith("/dev/"):
+        raise ValueError("Cannot resolve the root filesystem device")
+    sys_path = os.path.realpath(f"/sys/class/block/{os.path.basename(partition)}")
+    return f"/dev/{os.path.basename(os.path.dirname(sys_path))}"
+
+
+def mounted_sources() -> List[str]:
+    return [line.split()[0] for line in _read_text("/proc/self/mounts").splitlines() if line]
+
+
+def _check_target(target_path: str) -> None:
+    if not os.path.exists(target_path):
+        raise ValueError(f"Target device does not exist. target: {target_path}")
+    if os.path.realpath(target_path) == os.path.realpath(root_disk()):
+        raise ValueError(f"Target device holds the running root filesystem. target: {target_path}")
+    mounted = [source for source in mounted_sources() if source.startswith(target_path)]
+    if mounted:
+        raise ValueError(f"Target device has mounted partitions, unmount them first. mounted: {mounted}")
+
+
+class _FrozenFilesystem:
+    """Thaw may be requested by the script, a signal handler and the watchdog, only the first one thaws"""
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+        self.thawed_by_watchdog = False
+        self._frozen = False
+        # Reentrant, a signal handler may interrupt a thaw in progress on the same thread
+        self._lock = threading.RLock()
+
+    def freeze(self) -> None:
+        import fcntl
+
+        fcntl.ioctl(self.fd, FIFREEZE, 0)
+        self._frozen = True
+
+    def thaw(self, by_watchdog: Optional[bool] = False) -> None:
+        import fcntl
+
+        with self._lock:
+            if not self._frozen:
+                return
+            self._frozen = False
+            self.thawed_by_watchdog = by_watchdog
+            fcntl.ioctl(self.fd, FITHAW, 0)
+
+
+@contextmanager
+def _frozen(
+    mount_point: str, enabled: bool, max_freeze_seconds: Optional[float] = MAX_FREEZE_SECONDS
+) -> Iterator[None]:
+    if not enabled:
+        yield
+        return
+
+    fd = os.open(mount_point, os.O_RDONLY)
+    filesystem = _FrozenFilesystem(fd)
+
+    def thaw_and_exit(signum: int, frame: Any) -> None:
+        filesystem.thaw()
+        raise SystemExit(128 + signum)
+
+    previous_handlers = {signum: signal.signal(signum, thaw_and_exit) for signum in FREEZE_THAW_SIGNALS}
+    watchdog = threading.Timer(max_freeze_seconds, filesystem.thaw, kwargs={"by_watchdog": True})
+    watchdog.daemon = True
+    try:
+        filesystem.freeze()
+        watchdog.start()
+        yield
+    finally:
+        watchdog.cancel()
+        filesystem.thaw()
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        os.close(fd)
+    if filesystem.thawed_by_watchdog:
+        raise ValueError(
+            f"Root filesystem was thawed after {max_freeze_seconds}s before the copy completed, the clone is unusable"
+        )
+
+
+@contextmanager
+def _mounted(partition_path: str) -> Iterator[str]:
+    mount_dir = tempfile.mkdtemp(prefix="provisioner-boot-migration")
+    _run(["mount", partition_path, mount_dir])
+    try:
+        yield mount_dir
+    finally:
+        _run(["umount", mount_dir])
+        os.rmdir(mount_dir)
+
+
+def _update_eeprom_boot_order(boot_order: str) -> bool:
+    """Raspberry Pi 4 / 5 only, older boards boot from USB through an OTP bit and are left untouched"""
+    if shutil.which(EEPROM_CONFIG_TOOL) is None:
+        return False
+    config = set_boot_order(_run([EEPROM_CONFIG_TOOL]), boot_order)
+    with tempfile.NamedTemporaryFile("w", suffix=".conf", delete=False) as f:
+        f.write(config)
+    try:
+        # Staged by the bootloader update service, applied on the next reboot
+        _run([EEPROM_CONFIG_TOOL, "--apply", f.name])
+    finally:
+        os.remove(f.name)
+    return True
+
+
+def _print_progress(copied: int) -> None:
+    # Keeps the SSH channel busy as well, the controller applies a per operation timeout
+    print(json.dumps({"progress_bytes": copied}), flush=True)
+
+
+def migrate(
+    source: str,
+    target_path: str,
+    image_stream: Optional[BinaryIO] = None,
+    boot_files_dir: Optional[str] = None,
+    freeze: Optional[bool] = True,
+    update_eeprom: Optional[bool] = True,
+) -> Dict[str, Any]:
+    _check_target(target_path)
+    if source == MIGRATION_SOURCE_CLONE:
+        source_disk = root_disk()
+        length = max(partition.end_sector() for partition in read_partitions(source_disk)) * SECTOR_SIZE
+        _run(["sync"])
+        with _frozen("/", freeze):
+            bytes_written = copy_device(source_disk, target_path, length, _print_progress)
+        old_disk_id = read_disk_id(source_disk)
+    else:
+        bytes_written = write_image_stream(image_stream, target_path, _print_progress)
+        old_disk_id = read_disk_id(target_path)
+
+    # A clone or a second copy of the same image shares the disk identifier of the SD card,
+    # root=PARTUUID would then be ambiguous while both devices are attached
+    disk_id = new_disk_id(old_disk_id, read_disk_id(root_disk()))
+    write_disk_id(target_path, disk_id)
+    expanded = expand_last_partition(target_path) if source == MIGRATION_SOURCE_CLONE else None
+    _run(["blockdev", "--rereadpt", target_path])
+    partitions = read_partitions(target_path)
+    boot_partition = partition_device_path(target_path, partitions[0].number)
+    root_partition = partition_device_path(target_path, partitions[-1].number)
+    if expanded is not None:
+        _run(["e2fsck", "-f", "-y", root_partition])
+        _run(["resize2fs", root_partition])
+
+    updated_files = []
+    with _mounted(boot_partition) as boot_dir:
+        if boot_files_dir:
+            for file_name in sorted(os.listdir(boot_files_dir)):
+                shutil.copyfile(os.path.join(boot_files_dir, file_name), os.path.join(boot_dir, file_name))
+        # The kernel command line of this boot partition can only refer to this disk, boot files copied over
+        # from the controller may carry the identifier of another image
+        if rewrite_partuuid_file(os.path.join(boot_dir, "cmdline.txt"), disk_id):
+            updated_files.append("cmdline.txt")
+    with _mounted(root_partition) as root_dir:
+        # Other disks might be mounted by PARTUUID as well, only references to the source disk are moved
+        if rewrite_partuuid_file(os.path.join(root_dir, "etc", "fstab"), disk_id, old_disk_id):
+            updated_files.append("/etc/fstab")
+
+    boot_order = boot_order_for(target_path)
+    eeprom_updated = _update_eeprom_boot_order(boot_order) if update_eeprom else False
+    return {
+        "source": source,
+        "target": target_path,
+        "bytes_written": bytes_written,
+        "disk_id": format_disk_id(disk_id),
+        "previous_disk_id": format_disk_id(old_disk_id),
+        "expanded_partition": expanded.to_dict() if expanded is not None else None,
+        "updated_files": updated_files,
+        "boot_order": boot_order if eeprom_updated else None,
+    }
+
+
+def boot_device() -> Dict[str, Any]:
+    return {"root_disk": root_disk(), "root_partuuid": root_partuuid()}
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Migrate the Raspberry Pi boot device to a USB SSD / NVMe drive")
+    parser.add_argument("action", choices=[MIGRATION_SOURCE_CLONE, MIGRATION_SOURCE_IMAGE, "boot-device"])
+    parser.add_argument("--target", default=None)
+    parser.add_argument("--boot-files-dir", default=None)
+    parser.add_argument("--no-freeze", action="store_true", default=False)
+    parser.add_argument("--no-eeprom", action="store_true", default=False)
+    args = parser.parse_args(argv)
+
+    if args.action == "boot-device":
+        result = boot_device()
+    else:
+        result = migrate(
+            source=args.action,
+            target_path=args.target,
+            image_stream=sys.stdin.buffer if args.action == MIGRATION_SOURCE_IMAGE else None,
+            boot_files_dir=args.boot_files_dir,
+            freeze=not args.no_freeze,
+            update_eeprom=not args.no_eeprom,
+        )
+    print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+import gzip
+import io
+import lzma
+import os
+import shutil
+import signal
+import struct
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from provisioner_single_board_plugin.src.common.system.boot_migration import (
+    BOOT_ORDER_NVME_FIRST,
+    BOOT_ORDER_USB_FIRST,
+    FIFREEZE,
+    FITHAW,
+    MBR_DISK_ID_OFFSET,
+    MBR_PARTITION_TABLE_OFFSET,
+    MBR_SIGNATURE,
+    MBR_SIGNATURE_OFFSET,
+    MBR_TYPE_GPT_PROTECTIVE,
+    MBR_TYPE_LINUX,
+    SECTOR_SIZE,
+    _frozen,
+    boot_order_for,
+    copy_device,
+    expand_last_partition,
+    new_disk_id,
+    partition_device_path,
+    read_disk_id,
+    read_partitions,
+    replace_partuuid,
+    rewrite_partuuid_file,
+    set_boot_order,
+    write_disk_id,
+    write_image_stream,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/system/boot_migration_test.py
+#
+
+MBR_TYPE_FAT32_LBA = 0x0C
+TEST_DISK_ID = 0x1A2B3C4D
+TEST_BOOT_PARTITION = (MBR_TYPE_FAT32_LBA, 16, 64)
+TEST_ROOT_PARTITION = (MBR_TYPE_LINUX, 80, 176)
+TEST_SOURCE_SECTORS = 256
+TEST_TARGET_SECTORS = 1024
+
+
+def create_disk_image(path: str, sectors: int, partitions, disk_id: int = TEST_DISK_ID) -> bytes:
+    mbr = bytearray(SECTOR_SIZE)
+    struct.pack_into("<I", mbr, MBR_DISK_ID_OFFSET, disk_id)
+    for i, (type, start_sector, length) in enumerate(partitions):
+        struct.pack_into("<B3sB3sII", mbr, MBR_PARTITION_TABLE_OFFSET + i * 16, 0, b"", type, b"", start_sector, length)
+    mbr[MBR_SIGNATURE_OFFSET:] = MBR_SIGNATURE
+    content = bytes(mbr) + os.urandom((sectors - 1) * SECTOR_SIZE)
+    with open(path, "wb") as f:
+        f.write(content)
+    return content
+
+
+class BootMigrationTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-boot-migration-test")
+        self.source_path = os.path.join(self.work_dir, "sd-card.img")
+        self.target_path = os.path.join(self.work_dir, "ssd.img")
+        self.source_content = create_disk_image(
+            self.source_path, TEST_SOURCE_SECTORS, [TEST_BOOT_PARTITION, TEST_ROOT_PARTITION]
+        )
+        with open(self.target_path, "wb") as f:
+            f.truncate(TEST_TARGET_SECTORS * SECTOR_SIZE)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def test_read_partitions(self) -> None:
+        partitions = read_partitions(self.source_path)
+        self.assertEqual([partition.number for partition in partitions], [1, 2])
+        self.assertEqual(partitions[1].type, MBR_TYPE_LINUX)
+        self.assertEqual(partitions[1].end_sector(), TEST_SOURCE_SECTORS)
+
+    def test_refuse_devices_without_mbr(self) -> None:
+        with self.assertRaises(ValueError):
+            read_partitions(self.target_path)
+
+    def test_refuse_gpt_partition_tables(self) -> None:
+        create_disk_image(self.source_path, TEST_SOURCE_SECTORS, [(MBR_TYPE_GPT_PROTECTIVE, 1, 255)])
+        with self.assertRaises(ValueError):
+            read_partitions(self.source_path)
+
+    def test_write_new_disk_id(self) -> None:
+        disk_id = new_disk_id(TEST_DISK_ID)
+        self.assertNotEqual(disk_id, TEST_DISK_ID)
+
+        write_disk_id(self.source_path, disk_id)
+        self.assertEqual(read_disk_id(self.source_path), disk_id)
+        self.assertEqual(len(read_partitions(self.source_path)), 2)
+
+    def test_clone_and_expand_the_last_partition(self) -> None:
+        length = read_partitions(self.source_path)[-1].end_sector() * SECTOR_SIZE
+        copied = copy_device(self.source_path, self.target_path, length)
+        self.assertEqual(copied, len(self.source_content))
+
+        expanded = expand_last_partition(self.target_path)
+        self.assertEqual(expanded.number, 2)
+        self.assertEqual(expanded.end_sector(), TEST_TARGET_SECTORS)
+        self.assertEqual(read_partitions(self.target_path)[1].sectors, TEST_TARGET_SECTORS - 80)
+        with open(self.target_path, "rb") as f:
+            f.seek(SECTOR_SIZE)
+            self.assertEqual(f.read(len(self.source_content) - SECTOR_SIZE), self.source_content[SECTOR_SIZE:])
+
+    def test_keep_partitions_already_spanning_the_device(self) -> None:
+        self.assertIsNone(expand_last_partition(self.source_path))
+
+    def test_refuse_targets_smaller_than_the_source(self) -> None:
+        with self.assertRaises(ValueError):
+            copy_device(self.target_path, self.source_path, TEST_TARGET_SECTORS * SECTOR_SIZE)
+
+    def test_write_raw_and_compressed_image_streams(self) -> None:
+        for compress in [lambda data: data, lzma.compress, gzip.compress]:
+            stream = io.BufferedReader(io.BytesIO(compress(self.source_content)))
+            self.assertEqual(write_image_stream(stream, self.target_path), len(self.source_content))
+            with open(self.target_path, "rb") as f:
+                self.assertEqual(f.read(len(self.source_content)), self.source_content)
+
+    def test_replace_partuuid_of_any_disk(self) -> None:
+        cmdline = "console=serial0,115200 root=PARTUUID=abcdef01-02 rootfstype=ext4 fsck.repair=yes rootwait"
+        self.assertEqual(
+            replace_partuuid(cmdline, TEST_DISK_ID),
+            "console=serial0,115200 root=PARTUUID=1a2b3c4d-02 rootfstype=ext4 fsck.repair=yes rootwait",
+        )
+
+    def test_replace_partuuid_of_the_old_disk_only(self) -> None:
+        fstab = "PARTUUID=ABCDEF01-01 /boot/firmware vfat defaults 0 2\nPARTUUID=99999999-01 /data ext4 defaults 0 2\n"
+        fstab_path = os.path.join(self.work_dir, "fstab")
+        with open(fstab_path, "w") as f:
+            f.write(fstab)
+
+        self.assertTrue(rewrite_partuuid_file(fstab_path, TEST_DISK_ID, old_disk_id=0xABCDEF01))
+        with open(fstab_path, "r") as f:
+            self.assertEqual(
+                f.read(),
+                "PARTUUID=1a2b3c4d-01 /boot/firmware vfat defaults 0 2\nPARTUUID=99999999-01 /data ext4 defaults 0 2\n",
+            )
+        self.assertFalse(rewrite_partuuid_file(fstab_path, TEST_DISK_ID, old_disk_id=0xABCDEF01))
+        self.assertFalse(rewrite_partuuid_file(os.path.join(self.work_dir, "missing"), TEST_DISK_ID))
+
+    def test_set_boot_order(self) -> None:
+        self.assertEqual(
+            set_boot_order("[all]\nBOOT_UART=0\nBOOT_ORDER=0xf41\n", BOOT_ORDER_USB_FIRST),
+            "[all]\nBOOT_UART=0\nBOOT_ORDER=0xf14\n",
+        )
+        self.assertEqual(
+            set_boot_order("[all]\nBOOT_UART=0", BOOT_ORDER_NVME_FIRST), "[all]\nBOOT_UART=0\nBOOT_ORDER=0xf416\n"
+        )
+
+    def test_resolve_device_naming(self) -> None:
+        self.assertEqual(partition_device_path("/dev/sda", 2), "/dev/sda2")
+        self.assertEqual(partition_device_path("/dev/nvme0n1", 2), "/dev/nvme0n1p2")
+        self.assertEqual(boot_order_for("/dev/sda"), BOOT_ORDER_USB_FIRST)
+        self.assertEqual(boot_order_for("/dev/nvme0n1"), BOOT_ORDER_NVME_FIRST)
+
+    @mock.patch("fcntl.ioctl")
+    def test_thaw_the_frozen_filesystem_when_told_to_stop(self, ioctl_call: mock.MagicMock) -> None:
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        with self.assertRaises(SystemExit):
+            with _frozen(self.work_dir, enabled=True):
+                os.kill(os.getpid(), signal.SIGTERM)
+        self.assertEqual([call.args[1] for call in ioctl_call.call_args_list], [FIFREEZE, FITHAW])
+        self.assertEqual(signal.getsignal(signal.SIGTERM), previous_handler)
+
+    @mock.patch("fcntl.ioctl")
+    def test_watchdog_thaws_a_copy_that_takes_too_long(self, ioctl_call: mock.MagicMock) -> None:
+        with self.assertRaisesRegex(ValueError, "thawed"):
+            with _frozen(self.work_dir, enabled=True, max_freeze_seconds=0.01):
+                while ioctl_call.call_count < 2:
+                    time.sleep(0.01)
+        self.assertEqual([call.args[1] for call in ioctl_call.call_args_list], [FIFREEZE, FITHAW])
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Standard library only: the module file is executed as is in place of dd, with elevated permissions
+# where the platform requires them, see checked_image_burner.py.
+
+DEFAULT_IO_BUFFER_SIZE = 4 * 1024 * 1024
+DEFAULT_DIGEST_RANGE_SIZE = 64 * 1024 * 1024
+# Direct I/O requires offsets and lengths aligned to the logical block size, a page covers every device
+DIRECT_IO_ALIGNMENT = 4096
+
+# macOS equivalent of O_DIRECT, set through fcntl on an open descriptor
+DARWIN_F_NOCACHE = 48
+
+
+class ImageRangeDigest:
+    __slots__ = ("offset", "length", "sha256")
+
+    def __init__(self, offset: int, length: int, sha256: str) -> None:
+        self.offset = offset
+        self.length = length
+        self.sha256 = sha256
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @staticmethod
+    def from_dict(values: Dict[str, Any]) -> "ImageRangeDigest":
+        return ImageRangeDigest(**values)
+
+
+class ImageWriteResult:
+
+    bytes_written: int
+    digests: List[ImageRangeDigest]
+    mismatched_offsets: Optional[List[int]]
+    write_seconds: float
+    verify_seconds: float
+
+    def __init__(
+        self,
+        bytes_written: int,
+        digests: List[ImageRangeDigest],
+        mismatched_offsets: Optional[List[int]] = None,
+        write_seconds: Optional[float] = 0,
+        verify_seconds: Optional[float] = 0,
+    ) -> None:
+        self.bytes_written = bytes_written
+        self.digests = digests
+        self.mismatched_offsets = mismatched_offsets
+        self.write_seconds = write_seconds
+        self.verify_seconds = verify_seconds
+
+    def is_verified(self) -> bool:
+        return self.mismatched_offsets is not None and not self.mismatched_offsets
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bytes_written": self.bytes_written,
+            "digests": [digest.to_dict() for digest in self.digests],
+            "mismatched_offsets": self.mismatched_offsets,
+            "write_seconds": round(self.write_seconds, 3),
+            "verify_seconds": round(self.verify_seconds, 3),
+        }
+
+    @staticmethod
+    def from_dict(values: Dict[str, Any]) -> "ImageWriteResult":
+        return ImageWriteResult(
+            bytes_written=values["bytes_written"],
+            digests=[ImageRangeDigest.from_dict(digest) for digest in values["digests"]],
+            mismatched_offsets=values.get("mismatched_offsets"),
+            write_seconds=values.get("write_seconds", 0),
+            verify_seconds=values.get("verify_seconds", 0),
+        )
+
+
+def _align_up(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
+def write_image(
+    image_path: str,
+    device_path: str,
+    buffer_size: Optional[int] = DEFAULT_IO_BUFFER_SIZE,
+    range_size: Optional[int] = DEFAULT_DIGEST_RANGE_SIZE,
+) -> List[ImageRangeDigest]:
+    """
+    Stream the image onto the device, the digest of every written range is computed from the
+    buffers already in memory so the image is read exactly once.
+    """
+    digests = []
+    offset = 0
+    range_offset = 0
+    hasher = hashlib.sha256()
+    with open(image_path, "rb", buffering=0) as image:
+        fd = os.open(device_path, os.O_WRONLY | getattr(os, "O_CLOEXEC", 0))
+        try:
+            while True:
+                chunk = image.read(min(buffer_size, range_size - (offset - range_offset)))
+                if not chunk:
+                    break
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.pwrite(fd, view, offset + len(chunk) - len(view)) :]
+                hasher.update(chunk)
+                offset += len(chunk)
+                if offset - range_offset == range_size:
+                    digests.append(ImageRangeDigest(range_offset, range_size, hasher.hexdigest()))
+                    range_offset = offset
+                    hasher = hashlib.sha256()
+            if offset > range_offset:
+                digests.append(ImageRangeDigest(range_offset, offset - range_offset, hasher.hexdigest()))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    return digests
+
+
+def _open_uncached(device_path: str) -> int:
+    """Bypass the page cache where possible, otherwise drop the cached pages of the written ranges"""
+    if hasattr(os, "O_DIRECT"):
+        try:
+            return os.open(device_path, os.O_RDONLY | os.O_DIRECT)
+        except OSError:
+            # Not every filesystem supports direct I/O, image files on tmpfs for example
+            pass
+    fd = os.open(device_path, os.O_RDONLY)
+    if sys.platform == "darwin":
+        import fcntl
+
+        fcntl.fcntl(fd, DARWIN_F_NOCACHE, 1)
+    elif hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    return fd
+
+
+def _read_into(fd: int, view: memoryview, offset: int) -> int:
+    if hasattr(os, "preadv"):
+        return os.preadv(fd, [view], offset)
+    data = os.pread(fd, len(view), offset)
+    view[: len(data)] = data
+    return len(data)
+
+
+def verify_ranges(
+    device_path: str,
+    digests: List[ImageRangeDigest],
+    buffer_size: Optional[int] = DEFAULT_IO_BUFFER_SIZE,
+) -> List[int]:
+    """Read back the written ranges only and return the offsets of the ranges that differ"""
+    buffer_size = _align_up(buffer_size, DIRECT_IO_ALIGNMENT)
+    # Anonymous mappings are page aligned, as direct I/O requires from the buffer address
+    buffer = mmap.mmap(-1, buffer_size)
+    view = memoryview(buffer)
+    mismatched = []
+    fd = _open_uncached(device_path)
+    try:
+        for digest in digests:
+            hasher = hashlib.sha256()
+            remaining = digest.length
+            offset = digest.offset
+            while remaining > 0:
+                # The tail of the last range is read up to the alignment and cut
+                read_size = min(buffer_size, _align_up(remaining, DIRECT_IO_ALIGNMENT))
+                read = _read_into(fd, view[:read_size], offset)
+                if read <= 0:
+                    break
+                used = min(read, remaining)
+                hasher.update(view[:used])
+                remaining -= used
+                offset += used
+            if remaining > 0 or hasher.hexdigest() != digest.sha256:
+                mismatched.append(digest.offset)
+    finally:
+        os.close(fd)
+        view.release()
+        buffer.close()
+    return mismatched
+
+
+def write_and_verify_image(image_path: str, device_path: str, verify: Optional[bool] = True) -> ImageWriteResult:
+    started = time.monotonic()
+    digests = write_image(image_path, device_path)
+    write_seconds = time.monotonic() - started
+
+    if not verify:
+        return ImageWriteResult(sum(digest.length for digest in digests), digests, write_seconds=write_seconds)
+
+    started = time.monotonic()
+    mismatched_offsets = verify_ranges(device_path, digests)
+    return ImageWriteResult(
+        bytes_written=sum(digest.length for digest in digests),
+        digests=digests,
+        mismatched_offsets=mismatched_offsets,
+        write_seconds=write_seconds,
+        verify_seconds=time.monotonic() - started,
+    )
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Write an image to a block device and verify the written ranges")
+    parser.add_argument("action", choices=["write"])
+    parser.add_argument("image_path")
+    parser.add_argument("device_path")
+    parser.add_argument("--no-verify", action="store_true", default=False)
+    args = parser.parse_args(argv)
+    result = write_and_verify_image(args.image_path, args.device_path, verify=not args.no_verify)
+    print(json.dumps(result.to_dict()))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
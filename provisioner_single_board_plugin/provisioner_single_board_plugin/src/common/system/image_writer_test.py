@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from provisioner_single_board_plugin.src.common.system.image_writer import (
+    ImageWriteResult,
+    verify_ranges,
+    write_and_verify_image,
+    write_image,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/system/image_writer_test.py
+#
+
+KB = 1024
+TEST_IMAGE_SIZE = 1000 * KB
+TEST_DEVICE_SIZE = 4096 * KB
+TEST_RANGE_SIZE = 256 * KB
+TEST_BUFFER_SIZE = 64 * KB
+
+
+class ImageWriterTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = tempfile.mkdtemp(prefix="provisioner-image-writer-test")
+        self.image_path = os.path.join(self.work_dir, "os.img")
+        self.device_path = os.path.join(self.work_dir, "loopback.img")
+        self.image_content = os.urandom(TEST_IMAGE_SIZE)
+        with open(self.image_path, "wb") as f:
+            f.write(self.image_content)
+        with open(self.device_path, "wb") as f:
+            f.truncate(TEST_DEVICE_SIZE)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.work_dir)
+
+    def write(self):
+        return write_image(self.image_path, self.device_path, buffer_size=TEST_BUFFER_SIZE, range_size=TEST_RANGE_SIZE)
+
+    def test_write_image_and_digest_every_range(self) -> None:
+        digests = self.write()
+
+        with open(self.device_path, "rb") as f:
+            self.assertEqual(f.read(TEST_IMAGE_SIZE), self.image_content)
+        self.assertEqual(os.path.getsize(self.device_path), TEST_DEVICE_SIZE)
+        self.assertEqual([digest.offset for digest in digests], [0, 256 * KB, 512 * KB, 768 * KB])
+        self.assertEqual(digests[-1].length, TEST_IMAGE_SIZE - 768 * KB)
+        self.assertEqual(digests[1].sha256, hashlib.sha256(self.image_content[256 * KB : 512 * KB]).hexdigest())
+
+    def test_verify_written_ranges(self) -> None:
+        digests = self.write()
+        self.assertEqual(verify_ranges(self.device_path, digests, buffer_size=TEST_BUFFER_SIZE), [])
+
+    def test_report_corrupted_ranges(self) -> None:
+        digests = self.write()
+        with open(self.device_path, "r+b") as f:
+            f.seek(600 * KB)
+            f.write(b"\x00" * 16)
+
+        self.assertEqual(verify_ranges(self.device_path, digests, buffer_size=TEST_BUFFER_SIZE), [512 * KB])
+
+    def test_report_ranges_past_the_device_end(self) -> None:
+        digests = self.write()
+        with open(self.device_path, "r+b") as f:
+            f.truncate(700 * KB)
+
+        self.assertEqual(verify_ranges(self.device_path, digests), [512 * KB, 768 * KB])
+
+    def test_write_and_verify_result_round_trip(self) -> None:
+        result = write_and_verify_image(self.image_path, self.device_path)
+        self.assertTrue(result.is_verified())
+        self.assertEqual(result.bytes_written, TEST_IMAGE_SIZE)
+
+        restored = ImageWriteResult.from_dict(result.to_dict())
+        self.assertTrue(restored.is_verified())
+        self.assertEqual([digest.sha256 for digest in restored.digests], [digest.sha256 for digest in result.digests])
+
+    def test_skip_verification(self) -> None:
+        result = write_and_verify_image(self.image_path, self.device_path, verify=False)
+        self.assertFalse(result.is_verified())
+        self.assertIsNone(result.mismatched_offsets)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+import os
+from typing import Any, Dict, List, Optional
+
+# Standard library only: the module source is also sent to remote nodes and executed there as is,
+# see remote_fleet_system_info.py.
+
+OS_RELEASE_PATH = "etc/os-release"
+HOSTNAME_PATH = "proc/sys/kernel/hostname"
+KERNEL_RELEASE_PATH = "proc/sys/kernel/osrelease"
+UPTIME_PATH = "proc/uptime"
+LOAD_AVERAGE_PATH = "proc/loadavg"
+CPU_INFO_PATH = "proc/cpuinfo"
+MEM_INFO_PATH = "proc/meminfo"
+DEVICE_TREE_MODEL_PATH = "proc/device-tree/model"
+NET_CLASS_PATH = "sys/class/net"
+THERMAL_ZONE_TEMP_PATH = "sys/class/thermal/thermal_zone0/temp"
+# Raspberry Pi firmware exposes the same bit field reported by 'vcgencmd get_throttled'
+THROTTLED_PATH = "sys/devices/platform/soc/soc:firmware/get_throttled"
+
+THROTTLED_FLAGS = {
+    0: "under-voltage",
+    1: "arm-frequency-capped",
+    2: "throttled",
+    3: "soft-temperature-limit",
+    16: "under-voltage-occurred",
+    17: "arm-frequency-capped-occurred",
+    18: "throttled-occurred",
+    19: "soft-temperature-limit-occurred",
+}
+
+
+class NetworkInterfaceInfo:
+    __slots__ = ("name", "mac_address", "operstate", "mtu", "speed_mbps", "rx_bytes", "tx_bytes")
+
+    def __init__(
+        self,
+        name: str,
+        mac_address: Optional[str] = None,
+        operstate: Optional[str] = None,
+        mtu: Optional[int] = None,
+        speed_mbps: Optional[int] = None,
+        rx_bytes: Optional[int] = None,
+        tx_bytes: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        self.mac_address = mac_address
+        self.operstate = operstate
+        self.mtu = mtu
+        self.speed_mbps = speed_mbps
+        self.rx_bytes = rx_bytes
+        self.tx_bytes = tx_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class SystemSnapshot:
+    """
+    Point in time system information read straight from procfs and sysfs.
+    Fields a platform does not expose (i.e. Pi firmware files on a generic Linux) are left as None.
+    """
+
+    __slots__ = (
+        "hostname",
+        "os_name",
+        "os_version",
+        "kernel_release",
+        "model",
+        "cpu_model",
+        "cpu_cores",
+        "cpu_revision",
+        "cpu_serial",
+        "mem_total_kb",
+        "mem_available_kb",
+        "swap_total_kb",
+        "swap_free_kb",
+        "uptime_seconds",
+        "load_average",
+        "cpu_temperature_celsius",
+        "throttled",
+        "network_interfaces",
+    )
+
+    def __init__(self) -> None:
+        for slot in self.__slots__:
+            setattr(self, slot, None)
+        self.network_interfaces = []
+
+    def throttled_flags(self) -> List[str]:
+        if self.throttled is None:
+            return []
+        return [flag for bit, flag in THROTTLED_FLAGS.items() if self.throttled & (1 << bit)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {slot: getattr(self, slot) for slot in self.__slots__}
+        result["network_interfaces"] = [interface.to_dict() for interface in self.network_interfaces]
+        return result
+
+
+class NativeSystemReader:
+    """
+    Collect a SystemSnapshot with plain file reads, no processes are spawned.
+    The root path is configurable so tests can point it to a fake filesystem tree.
+    """
+
+    root_path: str
+
+    def __init__(self, root_path: Optional[str] = "/") -> None:
+        self.root_path = root_path
+
+    def read(self) -> SystemSnapshot:
+        snapshot = SystemSnapshot()
+        snapshot.hostname = self._read_text(HOSTNAME_PATH)
+        snapshot.kernel_release = self._read_text(KERNEL_RELEASE_PATH)
+        self._read_os_release(snapshot)
+        self._read_cpu_info(snapshot)
+        self._read_mem_info(snapshot)
+        self._read_load(snapshot)
+        self._read_firmware(snapshot)
+        snapshot.network_interfaces = self._read_network_interfaces()
+        return snapshot
+
+    def _path(self, relative_path: str) -> str:
+        return os.path.join(self.root_path, relative_path)
+
+    def _read_text(self, relative_path: str) -> Optional[str]:
+        try:
+            with open(self._path(relative_path), "r", errors="replace") as f:
+                return f.read().strip().strip("\x00")
+        except OSError:
+            # Platform does not expose the file
+            return None
+
+    def _read_int(self, relative_path: str, base: Optional[int] = 10) -> Optional[int]:
+        value = self._read_text(relative_path)
+        try:
+            return int(value, base) if value else None
+        except ValueError:
+            return None
+
+    def _read_os_release(self, snapshot: SystemSnapshot) -> None:
+        values = _parse_key_values(self._read_text(OS_RELEASE_PATH), separator="=")
+        snapshot.os_name = values.get("PRETTY_NAME", values.get("NAME"))
+        snapshot.os_version = values.get("VERSION_ID")
+
+    def _read_cpu_info(self, snapshot: SystemSnapshot) -> None:
+        content = self._read_text(CPU_INFO_PATH)
+        if content is None:
+            return
+        values = _parse_key_values(content, separator=":")
+        snapshot.cpu_cores = sum(1 for line in content.splitlines() if line.startswith("processor"))
+        snapshot.cpu_model = values.get("model name", values.get("Hardware"))
+        snapshot.cpu_revision = values.get("Revision")
+        snapshot.cpu_serial = values.get("Serial")
+        device_tree_model = self._read_text(DEVICE_TREE_MODEL_PATH)
+        snapshot.model = device_tree_model if device_tree_model else values.get("Model")
+
+    def _read_mem_info(self, snapshot: SystemSnapshot) -> None:
+        values = _parse_key_values(self._read_text(MEM_INFO_PATH), separator=":")
+        snapshot.mem_total_kb = _parse_kb(values.get("MemTotal"))
+        snapshot.mem_available_kb = _parse_kb(values.get("MemAvailable"))
+        snapshot.swap_total_kb = _parse_kb(values.get("SwapTotal"))
+        snapshot.swap_free_kb = _parse_kb(values.get("SwapFree"))
+
+    def _read_load(self, snapshot: SystemSnapshot) -> None:
+        uptime = self._read_text(UPTIME_PATH)
+        if uptime:
+            snapshot.uptime_seconds = float(uptime.split()[0])
+        load_average = self._read_text(LOAD_AVERAGE_PATH)
+        if load_average:
+            snapshot.load_average = [float(value) for value in load_average.split()[:3]]
+
+    def _read_firmware(self, snapshot: SystemSnapshot) -> None:
+        millidegrees = self._read_int(THERMAL_ZONE_TEMP_PATH)
+        snapshot.cpu_temperature_celsius = millidegrees / 1000.0 if millidegrees is not None else None
+        snapshot.throttled = self._read_int(THROTTLED_PATH, base=16)
+
+    def _read_network_interfaces(self) -> List[NetworkInterfaceInfo]:
+        try:
+            names = sorted(os.listdir(self._path(NET_CLASS_PATH)))
+        except OSError:
+            return []
+
+        interfaces = []
+        for name in names:
+            if name == "lo":
+                continue
+            base = f"{NET_CLASS_PATH}/{name}"
+            speed = self._read_int(f"{base}/speed")
+            interfaces.append(
+                NetworkInterfaceInfo(
+                    name=name,
+                    mac_address=self._read_text(f"{base}/address"),
+                    operstate=self._read_text(f"{base}/operstate"),
+                    mtu=self._read_int(f"{base}/mtu"),
+                    # Disconnected or wireless interfaces report -1
+                    speed_mbps=speed if speed is not None and speed > 0 else None,
+                    rx_bytes=self._read_int(f"{base}/statistics/rx_bytes"),
+                    tx_bytes=self._read_int(f"{base}/statistics/tx_bytes"),
+                )
+            )
+        return interfaces
+
+
+def _parse_key_values(content: Optional[str], separator: str) -> Dict[str, str]:
+    """First occurrence wins, per core blocks of /proc/cpuinfo repeat the same keys"""
+    values = {}
+    if not content:
+        return values
+    for line in content.splitlines():
+        if separator not in line:
+            continue
+        key, value = line.split(separator, 1)
+        key = key.strip()
+        if key and key not in values:
+            values[key] = value.strip().strip('"')
+    return values
+
+
+def _parse_kb(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        return int(value.split()[0])
+    except ValueError:
+        return None
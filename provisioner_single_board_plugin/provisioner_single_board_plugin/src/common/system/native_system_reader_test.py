@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from provisioner_single_board_plugin.src.common.system.native_system_reader import NativeSystemReader
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/system/native_system_reader_test.py
+#
+
+FAKE_SYSTEM_FILES = {
+    "etc/os-release": 'PRETTY_NAME="Raspbian GNU/Linux 12 (bookworm)"\nNAME="Raspbian GNU/Linux"\nVERSION_ID="12"\n',
+    "proc/sys/kernel/hostname": "node1\n",
+    "proc/sys/kernel/osrelease": "6.6.31+rpt-rpi-v6\n",
+    "proc/uptime": "3600.25 1200.50\n",
+    "proc/loadavg": "0.52 0.40 0.33 1/123 4567\n",
+    "proc/cpuinfo": (
+        "processor\t: 0\nmodel name\t: ARMv6-compatible processor rev 7 (v6l)\n\n"
+        + "processor\t: 1\nmodel name\t: ignored duplicate\n\n"
+        + "Hardware\t: BCM2835\nRevision\t: 9000c1\nSerial\t\t: 00000000abcdef01\nModel\t\t: Raspberry Pi Zero W\n"
+    ),
+    "proc/meminfo": "MemTotal:         444176 kB\nMemFree:  100 kB\nMemAvailable:     301212 kB\n"
+    + "SwapTotal:        102396 kB\nSwapFree:         102396 kB\n",
+    "proc/device-tree/model": "Raspberry Pi Zero W Rev 1.1\x00",
+    "sys/class/thermal/thermal_zone0/temp": "41856\n",
+    "sys/devices/platform/soc/soc:firmware/get_throttled": "50005\n",
+    "sys/class/net/lo/address": "00:00:00:00:00:00\n",
+    "sys/class/net/wlan0/address": "b8:27:eb:00:00:01\n",
+    "sys/class/net/wlan0/operstate": "up\n",
+    "sys/class/net/wlan0/mtu": "1500\n",
+    "sys/class/net/wlan0/speed": "-1\n",
+    "sys/class/net/wlan0/statistics/rx_bytes": "1024\n",
+    "sys/class/net/wlan0/statistics/tx_bytes": "2048\n",
+    "sys/class/net/eth0/address": "b8:27:eb:00:00:02\n",
+    "sys/class/net/eth0/operstate": "down\n",
+    "sys/class/net/eth0/speed": "100\n",
+}
+
+
+class NativeSystemReaderTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.root_path = tempfile.mkdtemp(prefix="provisioner-sysfs-test")
+        for relative_path, content in FAKE_SYSTEM_FILES.items():
+            path = os.path.join(self.root_path, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root_path)
+
+    def test_read_system_snapshot_from_proc_and_sysfs(self) -> None:
+        snapshot = NativeSystemReader(self.root_path).read()
+        self.assertEqual(snapshot.hostname, "node1")
+        self.assertEqual(snapshot.os_name, "Raspbian GNU/Linux 12 (bookworm)")
+        self.assertEqual(snapshot.os_version, "12")
+        self.assertEqual(snapshot.kernel_release, "6.6.31+rpt-rpi-v6")
+        self.assertEqual(snapshot.model, "Raspberry Pi Zero W Rev 1.1")
+        self.assertEqual(snapshot.cpu_model, "ARMv6-compatible processor rev 7 (v6l)")
+        self.assertEqual(snapshot.cpu_cores, 2)
+        self.assertEqual(snapshot.cpu_revision, "9000c1")
+        self.assertEqual(snapshot.cpu_serial, "00000000abcdef01")
+        self.assertEqual(snapshot.mem_total_kb, 444176)
+        self.assertEqual(snapshot.mem_available_kb, 301212)
+        self.assertEqual(snapshot.swap_free_kb, 102396)
+        self.assertEqual(snapshot.uptime_seconds, 3600.25)
+        self.assertEqual(snapshot.load_average, [0.52, 0.40, 0.33])
+        self.assertEqual(snapshot.cpu_temperature_celsius, 41.856)
+
+    def test_decode_throttled_flags(self) -> None:
+        snapshot = NativeSystemReader(self.root_path).read()
+        self.assertEqual(snapshot.throttled, 0x50005)
+        self.assertEqual(
+            snapshot.throttled_flags(), ["under-voltage", "throttled", "under-voltage-occurred", "throttled-occurred"]
+        )
+
+    def test_read_network_interfaces_without_loopback(self) -> None:
+        interfaces = NativeSystemReader(self.root_path).read().network_interfaces
+        self.assertEqual([interface.name for interface in interfaces], ["eth0", "wlan0"])
+        self.assertEqual(interfaces[0].speed_mbps, 100)
+        self.assertIsNone(interfaces[0].mtu)
+        self.assertIsNone(interfaces[1].speed_mbps)
+        self.assertEqual(interfaces[1].to_dict()["rx_bytes"], 1024)
+
+    def test_missing_files_leave_fields_empty(self) -> None:
+        snapshot = NativeSystemReader(os.path.join(self.root_path, "missing")).read()
+        self.assertIsNone(snapshot.hostname)
+        self.assertIsNone(snapshot.throttled)
+        self.assertEqual(snapshot.throttled_flags(), [])
+        self.assertEqual(snapshot.network_interfaces, [])
+        self.assertEqual(snapshot.to_dict()["network_interfaces"], [])
+
+    def test_slots_prevent_unknown_fields(self) -> None:
+        snapshot = NativeSystemReader(self.root_path).read()
+        with self.assertRaises(AttributeError):
+            snapshot.unknown_field = "value"
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import socket
+import sys
+import time
+from typing import Any, Dict, List
+
+# Standard library only: the module source is piped to the node python3 interpreter, see remote_benchmark.py.
+# Workloads are deliberately plain Python so results are comparable between nodes and runs.
+
+DEFAULT_BENCHMARK_DIR = "~/.provisioner/benchmark"
+DEFAULT_BENCHMARK_DURATION_SECONDS = 5
+DEFAULT_BENCHMARK_DISK_SIZE_MB = 256
+DEFAULT_BENCHMARK_PORT = 5201
+
+BENCHMARK_FILE_NAME = "benchmark.dat"
+MB = 1024 * 1024
+SEQUENTIAL_BLOCK_SIZE = MB
+RANDOM_BLOCK_SIZE = 4096
+NETWORK_CHUNK_SIZE = 64 * 1024
+NETWORK_CONNECT_RETRY_SECONDS = 0.2
+
+
+def _elapsed(started: float) -> float:
+    return max(time.monotonic() - started, 1e-9)
+
+
+def _drop_file_cache(fd: int) -> None:
+    # Reads must hit the device and not the page cache, not available on every platform
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def cpu_benchmark(duration_seconds: float) -> Dict[str, float]:
+    buffer = os.urandom(MB)
+    started = time.monotonic()
+    hashed = 0
+    while time.monotonic() - started < duration_seconds / 2:
+        hashlib.sha256(buffer).digest()
+        hashed += 1
+    sha256_mbps = hashed / _elapsed(started)
+
+    started = time.monotonic()
+    operations = 0
+    while time.monotonic() - started < duration_seconds / 2:
+        value = 0
+        for i in range(10000):
+            value = (value * 31 + i) % 1000003
+        operations += 10000
+    return {
+        "cpu_sha256_mbps": round(sha256_mbps, 1),
+        "cpu_python_kops": round(operations / _elapsed(started) / 1000, 1),
+    }
+
+
+def disk_sequential_benchmark(path: str, size_mb: int) -> Dict[str, float]:
+    block = os.urandom(SEQUENTIAL_BLOCK_SIZE)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        started = time.monotonic()
+        for _ in range(size_mb):
+            os.write(fd, block)
+        os.fsync(fd)
+        write_mbps = size_mb / _elapsed(started)
+    finally:
+        os.close(fd)
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        _drop_file_cache(fd)
+        started = time.monotonic()
+        while os.read(fd, SEQUENTIAL_BLOCK_SIZE):
+            pass
+        read_mbps = size_mb / _elapsed(started)
+    finally:
+        os.close(fd)
+    return {"disk_seq_write_mbps": round(write_mbps, 1), "disk_seq_read_mbps": round(read_mbps, 1)}
+
+
+def disk_random_benchmark(path: str, duration_seconds: float) -> Dict[str, float]:
+    """Runs on the file left by the sequential benchmark, 4KB aligned blocks"""
+    blocks = os.path.getsize(path) // RANDOM_BLOCK_SIZE
+    rnd = random.Random(0)
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        _drop_file_cache(fd)
+        started = time.monotonic()
+        reads = 0
+        while time.monotonic() - started < duration_seconds / 2:
+            os.pread(fd, RANDOM_BLOCK_SIZE, rnd.randrange(blocks) * RANDOM_BLOCK_SIZE)
+            reads += 1
+        read_iops = reads / _elapsed(started)
+    finally:
+        os.close(fd)
+
+    # Synchronous writes, otherwise the page cache absorbs them and the device is never measured
+    block = os.urandom(RANDOM_BLOCK_SIZE)
+    fd = os.open(path, os.O_WRONLY | getattr(os, "O_DSYNC", 0))
+    try:
+        started = time.monotonic()
+        writes = 0
+        while time.monotonic() - started < duration_seconds / 2:
+            os.pwrite(fd, block, rnd.randrange(blocks) * RANDOM_BLOCK_SIZE)
+            writes += 1
+        write_iops = writes / _elapsed(started)
+    finally:
+        os.close(fd)
+    return {"disk_rand_read_iops": round(read_iops), "disk_rand_write_iops": round(write_iops)}
+
+
+def local_benchmark(benchmark_dir: str, size_mb: int, duration_seconds: float) -> Dict[str, Any]:
+    os.makedirs(benchmark_dir, exist_ok=True)
+    path = os.path.join(benchmark_dir, BENCHMARK_FILE_NAME)
+    result = {}
+    try:
+        result.update(cpu_benchmark(duration_seconds))
+        result.update(disk_sequential_benchmark(path, size_mb))
+        result.update(disk_random_benchmark(path, duration_seconds))
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+    return result
+
+
+def network_receive(port: int, timeout_seconds: float) -> Dict[str, Any]:
+    """Accept a single sender and measure the received throughput"""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.settimeout(timeout_seconds)
+    server.bind(("0.0.0.0", port))
+    server.listen(1)
+    try:
+        connection, address = server.accept()
+    finally:
+        server.close()
+
+    with connection:
+        connection.settimeout(timeout_seconds)
+        received = 0
+        started = time.monotonic()
+        while True:
+            chunk = connection.recv(NETWORK_CHUNK_SIZE)
+            if not chunk:
+                break
+            received += len(chunk)
+        elapsed = _elapsed(started)
+    return {
+        "peer": address[0],
+        "received_bytes": received,
+        "net_receive_mbps": round(received * 8 / elapsed / 1000000, 1),
+    }
+
+
+def network_send(host: str, port: int, duration_seconds: float, connect_timeout_seconds: float) -> Dict[str, Any]:
+    """Retries until the receiver listens, it is started concurrently on the other node"""
+    deadline = time.monotonic() + connect_timeout_seconds
+    while True:
+        try:
+            client = socket.create_connection((host, port), timeout=connect_timeout_seconds)
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(NETWORK_CONNECT_RETRY_SECONDS)
+
+    chunk = os.urandom(NETWORK_CHUNK_SIZE)
+    sent = 0
+    with client:
+        started = time.monotonic()
+        while time.monotonic() - started < duration_seconds:
+            client.sendall(chunk)
+            sent += len(chunk)
+    return {"sent_bytes": sent}
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Node benchmark")
+    parser.add_argument("action", choices=["local", "receive", "send"])
+    parser.add_argument("--dir", default=DEFAULT_BENCHMARK_DIR)
+    parser.add_argument("--size-mb", type=int, default=DEFAULT_BENCHMARK_DISK_SIZE_MB)
+    parser.add_argument("--duration", type=float, default=DEFAULT_BENCHMARK_DURATION_SECONDS)
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=DEFAULT_BENCHMARK_PORT)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args(argv)
+
+    if args.action == "local":
+        result = local_benchmark(os.path.expanduser(args.dir), args.size_mb, args.duration)
+    elif args.action == "receive":
+        result = network_receive(args.port, args.timeout)
+    else:
+        result = network_send(args.host, args.port, args.duration, args.timeout)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+from provisioner_single_board_plugin.src.common.system.node_benchmark import (
+    BENCHMARK_FILE_NAME,
+    local_benchmark,
+    network_receive,
+    network_send,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/system/node_benchmark_test.py
+#
+
+
+def get_free_port() -> int:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+class NodeBenchmarkTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.benchmark_dir = tempfile.mkdtemp(prefix="provisioner-benchmark-test")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.benchmark_dir)
+
+    def test_local_benchmark_reports_all_metrics_and_cleans_up(self) -> None:
+        result = local_benchmark(self.benchmark_dir, size_mb=2, duration_seconds=0.2)
+        for metric in [
+            "cpu_sha256_mbps",
+            "cpu_python_kops",
+            "disk_seq_write_mbps",
+            "disk_seq_read_mbps",
+            "disk_rand_read_iops",
+            "disk_rand_write_iops",
+        ]:
+            self.assertGreater(result[metric], 0, metric)
+        self.assertFalse(os.path.exists(os.path.join(self.benchmark_dir, BENCHMARK_FILE_NAME)))
+
+    def test_measure_tcp_throughput_between_receiver_and_sender(self) -> None:
+        port = get_free_port()
+        received = {}
+        receiver = threading.Thread(target=lambda: received.update(network_receive(port, timeout_seconds=5)))
+        receiver.start()
+        sent = network_send("127.0.0.1", port, duration_seconds=0.2, connect_timeout_seconds=5)
+        receiver.join(5)
+
+        self.assertGreater(sent["sent_bytes"], 0)
+        self.assertEqual(received["received_bytes"], sent["sent_bytes"])
+        self.assertGreater(received["net_receive_mbps"], 0)
+
+    def test_sender_fails_when_no_receiver_listens(self) -> None:
+        with self.assertRaises(OSError):
+            network_send("127.0.0.1", get_free_port(), duration_seconds=0.1, connect_timeout_seconds=0.3)
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Standard library only: the module file is pushed to the node and runs there as root, see remote_tuning.py.
+# It is also installed on the node, a boot time unit re-applies the runtime settings of the selected profile.
+# Functions editing files take the filesystem root as a parameter, tests point it to a temporary directory.
+
+BOOT_FIRMWARE_DIRS = ["/boot/firmware", "/boot"]
+CONFIG_TXT_FILE_NAME = "config.txt"
+CMDLINE_TXT_FILE_NAME = "cmdline.txt"
+CONFIG_TXT_ALL_SECTION = "[all]"
+
+TUNING_STATE_PATH = "/etc/provisioner/tuning.json"
+TUNING_SCRIPT_INSTALL_PATH = "/usr/local/lib/provisioner/node_tuning.py"
+TUNING_SERVICE_NAME = "provisioner-tuning.service"
+TUNING_SERVICE_PATH = f"/etc/systemd/system/{TUNING_SERVICE_NAME}"
+JOURNALD_DROPIN_PATH = "/etc/systemd/journald.conf.d/90-provisioner-tuning.conf"
+SYSCTL_DROPIN_PATH = "/etc/sysctl.d/90-provisioner-tuning.conf"
+
+# Swap file service of Raspberry Pi OS, replaced by zram so swapping does not wear the SD card
+DPHYS_SWAPFILE_SERVICE = "dphys-swapfile.service"
+ZRAM_DEVICE = "zram0"
+ZRAM_SWAP_PRIORITY = 100
+VOLATILE_JOURNAL_MAX_USE = "32M"
+
+CGROUP_CMDLINE_FLAGS = ["cgroup_memory=1", "cgroup_enable=memory"]
+
+CPUFREQ_POLICIES_DIR = "/sys/devices/system/cpu/cpufreq"
+DEFAULT_WRITE_RATE_WINDOW_SECONDS = 10
+DISKSTATS_SECTOR_SIZE = 512
+
+TUNING_SERVICE_UNIT = f"""[Unit]
+Description=Apply provisioner tuning profile runtime settings
+After=local-fs.target systemd-modules-load.service
+
+[Service]
+Type=oneshot
+RemainAfterExit=yes
+ExecStart=/usr/bin/python3 {TUNING_SCRIPT_INSTALL_PATH} boot
+
+[Install]
+WantedBy=multi-user.target
+"""
+
+
+class TuningProfile:
+    __slots__ = (
+        "name",
+        "description",
+        "zram_percent",
+        "zram_algorithm",
+        "cpu_governor",
+        "volatile_logs",
+        "gpu_mem_mb",
+        "cgroups",
+        "sysctl",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        zram_percent: int,
+        zram_algorithm: str,
+        cpu_governor: str,
+        volatile_logs: bool,
+        gpu_mem_mb: int,
+        cgroups: bool,
+        sysctl: Dict[str, str],
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.zram_percent = zram_percent
+        self.zram_algorithm = zram_algorithm
+        self.cpu_governor = cpu_governor
+        self.volatile_logs = volatile_logs
+        self.gpu_mem_mb = gpu_mem_mb
+        self.cgroups = cgroups
+        self.sysctl = sysctl
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+PROFILES: Dict[str, TuningProfile] = {
+    profile.name: profile
+    for profile in [
+        TuningProfile(
+            name="k3s-worker",
+            description="Kubernetes worker: memory cgroups, steady clocks, compressed swap, logs kept in RAM",
+            zram_percent=25,
+            zram_algorithm="zstd",
+            cpu_governor="performance",
+            volatile_logs=True,
+            gpu_mem_mb=16,
+            cgroups=True,
+            sysctl={"vm.swappiness": "100", "vm.page-cluster": "0"},
+        ),
+        TuningProfile(
+            name="low-memory",
+            description="Nodes with 1GB or less: large compressed swap, aggressive swapping, logs kept in RAM",
+            zram_percent=50,
+            zram_algorithm="zstd",
+            cpu_governor="ondemand",
+            volatile_logs=True,
+            gpu_mem_mb=16,
+            cgroups=False,
+            sysctl={"vm.swappiness": "180", "vm.page-cluster": "0", "vm.vfs_cache_pressure": "200"},
+        ),
+        TuningProfile(
+            name="storage",
+            description="Storage nodes on SSD: persistent logs, smaller and earlier write back bursts",
+            zram_percent=25,
+            zram_algorithm="lz4",
+            cpu_governor="ondemand",
+            volatile_logs=False,
+            gpu_mem_mb=16,
+            cgroups=True,
+            sysctl={"vm.swappiness": "60", "vm.dirty_background_ratio": "5", "vm.dirty_ratio": "10"},
+        ),
+    ]
+}
+
+
+def _path(root: str, path: str) -> str:
+    return os.path.join(root, path.lstrip("/"))
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_if_changed(path: str, content: str) -> bool:
+    if _read_text(path) == content:
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    return True
+
+
+def _remove_if_exists(path: str) -> bool:
+    if not os.path.exists(path):
+        return False
+    os.remove(path)
+    return True
+
+
+def boot_firmware_dir(root: str) -> str:
+    """Bookworm mounts the boot partition on /boot/firmware, older releases on /boot"""
+    for boot_dir in BOOT_FIRMWARE_DIRS:
+        if os.path.exists(_path(root, os.path.join(boot_dir, CONFIG_TXT_FILE_NAME))):
+            return boot_dir
+    return BOOT_FIRMWARE_DIRS[0]
+
+
+def set_config_txt_option(text: str, key: str, value: str) -> str:
+    """
+    Set an option for every board, either where it is already set outside of a conditional section
+    or appended under an [all] section at the end of the file
+    """
+    lines = text.rstrip("\n").splitlines()
+    section = None
+    last_section = None
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            section = stripped.lower()
+            last_section = section
+        elif stripped.split("=", 1)[0].strip() == key and section in (None, CONFIG_TXT_ALL_SECTION):
+            lines[i] = f"{key}={value}"
+            return "\n".join(lines) + "\n"
+    if last_section not in (None, CONFIG_TXT_ALL_SECTION):
+        lines.append(CONFIG_TXT_ALL_SECTION)
+    lines.append(f"{key}={value}")
+    return "\n".join(lines) + "\n"
+
+
+def add_cmdline_flags(text: str, flags: List[str]) -> str:
+    """The kernel command line is a single line, flags already present are kept as is"""
+    tokens = text.split()
+    return " ".join(tokens + [flag for flag in flags if flag not in tokens]) + "\n"
+
+
+def format_sysctl(settings: Dict[str, str]) -> str:
+    return "".join(f"{key} = {value}\n" for key, value in sorted(settings.items()))
+
+
+def format_journald_dropin() -> str:
+    return f"[Journal]\nStorage=volatile\nRuntimeMaxUse={VOLATILE_JOURNAL_MAX_USE}\n"
+
+
+def apply_persistent(profile: TuningProfile, root: Optional[str] = "/") -> Dict[str, List[str]]:
+    """
+    Write the persistent part of the profile, returns the changed files.
+    Boot partition files are only read by the firmware and the kernel on boot, changing them requires a reboot.
+    """
+    changed: List[str] = []
+    reboot_required: List[str] = []
+    boot_dir = boot_firmware_dir(root)
+
+    config_txt_path = os.path.join(boot_dir, CONFIG_TXT_FILE_NAME)
+    config_txt = _read_text(_path(root, config_txt_path))
+    if config_txt is not None:
+        updated = set_config_txt_option(config_txt, "gpu_mem", str(profile.gpu_mem_mb))
+        if _write_if_changed(_path(root, config_txt_path), updated):
+            reboot_required.append(config_txt_path)
+
+    cmdline_txt_path = os.path.join(boot_dir, CMDLINE_TXT_FILE_NAME)
+    cmdline_txt = _read_text(_path(root, cmdline_txt_path))
+    if cmdline_txt is not None and profile.cgroups:
+        if _write_if_changed(_path(root, cmdline_txt_path), add_cmdline_flags(cmdline_txt, CGROUP_CMDLINE_FLAGS)):
+            reboot_required.append(cmdline_txt_path)
+
+    if profile.volatile_logs:
+        if _write_if_changed(_path(root, JOURNALD_DROPIN_PATH), format_journald_dropin()):
+            changed.append(JOURNALD_DROPIN_PATH)
+    elif _remove_if_exists(_path(root, JOURNALD_DROPIN_PATH)):
+        changed.append(JOURNALD_DROPIN_PATH)
+
+    if _write_if_changed(_path(root, SYSCTL_DROPIN_PATH), format_sysctl(profile.sysctl)):
+        changed.append(SYSCTL_DROPIN_PATH)
+    if _write_if_changed(_path(root, TUNING_STATE_PATH), json.dumps(profile.to_dict(), indent=2) + "\n"):
+        changed.append(TUNING_STATE_PATH)
+    if _write_if_changed(_path(root, TUNING_SERVICE_PATH), TUNING_SERVICE_UNIT):
+        changed.append(TUNING_SERVICE_PATH)
+
+    return {"changed": changed + reboot_required, "reboot_required": reboot_required}
+
+
+def read_installed_profile(root: Optional[str] = "/") -> Optional[TuningProfile]:
+    content = _read_text(_path(root, TUNING_STATE_PATH))
+    if content is None:
+        return None
+    return TuningProfile(**json.loads(content))
+
+
+def _run(args: List[str], errors: List[str]) -> bool:
+    """Runtime settings are best effort, a missing kernel module or tool must not fail the other settings"""
+    try:
+        subprocess.run(args, check=True, capture_output=True, text=True)
+        return True
+    except (OSError, subprocess.CalledProcessError) as ex:
+        errors.append(f"{' '.join(args)}: {getattr(ex, 'stderr', None) or ex}".strip())
+        return False
+
+
+def _write_sys(path: str, value: str, errors: List[str]) -> None:
+    try:
+        with open(path, "w") as f:
+            f.write(value)
+    except OSError as ex:
+        errors.append(f"{path}: {ex}")
+
+
+def read_meminfo(root: Optional[str] = "/") -> Dict[str, int]:
+    """Values in kB"""
+    meminfo = {}
+    for line in (_read_text(_path(root, "/proc/meminfo")) or "").splitlines():
+        name, _, value = line.partition(":")
+        if value.split():
+            meminfo[name] = int(value.split()[0])
+    return meminfo
+
+
+def set_cpu_governor(governor: str, errors: List[str], root: Optional[str] = "/") -> None:
+    policies_dir = _path(root, CPUFREQ_POLICIES_DIR)
+    if not os.path.isdir(policies_dir):
+        errors.append("cpufreq is not available, CPU governor unchanged")
+        return
+    for policy in sorted(os.listdir(policies_dir)):
+        available = (_read_text(os.path.join(policies_dir, policy, "scaling_available_governors")) or "").split()
+        if governor not in available:
+            errors.append(f"CPU governor {governor} is not available on {policy}, available: {' '.join(available)}")
+            continue
+        _write_sys(os.path.join(policies_dir, policy, "scaling_governor"), governor, errors)
+
+
+def setup_zram_swap(profile: TuningProfile, errors: List[str]) -> None:
+    zram_path = f"/dev/{ZRAM_DEVICE}"
+    sys_path = f"/sys/block/{ZRAM_DEVICE}"
+    if not os.path.exists(sys_path) and not _run(["modprobe", "zram"], errors):
+        return
+    if ZRAM_DEVICE in (_read_text("/proc/swaps") or ""):
+        _run(["swapoff", zram_path], errors)
+    _write_sys(os.path.join(sys_path, "reset"), "1", errors)
+    if profile.zram_percent <= 0:
+        return
+    _write_sys(os.path.join(sys_path, "comp_algorithm"), profile.zram_algorithm, errors)
+    disk_size = read_meminfo().get("MemTotal", 0) * 1024 * profile.zram_percent // 100
+    _write_sys(os.path.join(sys_path, "disksize"), str(disk_size), errors)
+    if _run(["mkswap", zram_path], errors):
+        _run(["swapon", "-p", str(ZRAM_SWAP_PRIORITY), zram_path], errors)
+
+
+def apply_runtime(profile: TuningProfile) -> List[str]:
+    errors: List[str] = []
+    set_cpu_governor(profile.cpu_governor, errors)
+    setup_zram_swap(profile, errors)
+    if os.path.exists(SYSCTL_DROPIN_PATH):
+        _run(["sysctl", "-p", SYSCTL_DROPIN_PATH], errors)
+    return errors
+
+
+def apply_profile(profile: TuningProfile) -> Dict[str, Any]:
+    result = apply_persistent(profile)
+    errors: List[str] = []
+    os.makedirs(os.path.dirname(TUNING_SCRIPT_INSTALL_PATH), exist_ok=True)
+    shutil.copyfile(os.path.abspath(__file__), TUNING_SCRIPT_INSTALL_PATH)
+    _run(["systemctl", "daemon-reload"], errors)
+    _run(["systemctl", "enable", TUNING_SERVICE_NAME], errors)
+    if profile.zram_percent > 0 and os.path.exists(f"/lib/systemd/system/{DPHYS_SWAPFILE_SERVICE}"):
+        _run(["systemctl", "disable", "--now", DPHYS_SWAPFILE_SERVICE], errors)
+    if JOURNALD_DROPIN_PATH in result["changed"]:
+        _run(["systemctl", "restart", "systemd-journald"], errors)
+    errors += apply_runtime(profile)
+    result.update({"profile": profile.name, "errors": errors})
+    return result
+
+
+def _root_device_numbers() -> List[int]:
+    st_dev = os.stat("/").st_dev
+    return [os.major(st_dev), os.minor(st_dev)]
+
+
+def read_sectors_written(device_numbers: List[int], root: Optional[str] = "/") -> Optional[int]:
+    """/proc/diskstats columns: major, minor, name, then the I/O counters, sectors written is the 7th one"""
+    for line in (_read_text(_path(root, "/proc/diskstats")) or "").splitlines():
+        fields = line.split()
+        if len(fields) > 9 and [int(fields[0]), int(fields[1])] == device_numbers:
+            return int(fields[9])
+    return None
+
+
+def measure_write_rate(window_seconds: float) -> Optional[float]:
+    """Background write rate of the root filesystem device, logs and swap of an idle node show up here"""
+    device_numbers = _root_device_numbers()
+    before = read_sectors_written(device_numbers)
+    if before is None:
+        return None
+    time.sleep(window_seconds)
+    after = read_sectors_written(device_numbers)
+    return round((after - before) * DISKSTATS_SECTOR_SIZE / 1024 / window_seconds, 1)
+
+
+def status(write_rate_window_seconds: Optional[float] = DEFAULT_WRITE_RATE_WINDOW_SECONDS) -> Dict[str, Any]:
+    meminfo = read_meminfo()
+    zram_kb = sum(
+        int(line.split()[2]) for line in (_read_text("/proc/swaps") or "").splitlines()[1:] if ZRAM_DEVICE in line
+    )
+    cmdline = (_read_text("/proc/cmdline") or "").split()
+    installed = read_installed_profile()
+    result = {
+        "profile": installed.name if installed else None,
+        "mem_available_mb": int(meminfo.get("MemAvailable", 0) / 1024),
+        "swap_total_mb": int(meminfo.get("SwapTotal", 0) / 1024),
+        "zram_swap_mb": int(zram_kb / 1024),
+        "cpu_governor": (_read_text(os.path.join(CPUFREQ_POLICIES_DIR, "policy0", "scaling_governor")) or "").strip(),
+        "memory_cgroups": all(flag in cmdline for flag in CGROUP_CMDLINE_FLAGS),
+        "volatile_logs": not os.path.isdir("/var/log/journal") or os.path.exists(JOURNALD_DROPIN_PATH),
+    }
+    if write_rate_window_seconds > 0:
+        result["root_write_kbps"] = measure_write_rate(write_rate_window_seconds)
+    return result
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Raspberry Pi node tuning profiles")
+    parser.add_argument("action", choices=["apply", "boot", "status"])
+    parser.add_argument("--profile", choices=sorted(PROFILES.keys()))
+    parser.add_argument("--write-rate-window", type=float, default=DEFAULT_WRITE_RATE_WINDOW_SECONDS)
+    args = parser.parse_args(argv)
+
+    if args.action == "apply":
+        if not args.profile:
+            parser.error("--profile is required to apply a profile")
+        result = apply_profile(PROFILES[args.profile])
+    elif args.action == "boot":
+        installed = read_installed_profile()
+        result = {"profile": installed.name, "errors": apply_runtime(installed)} if installed else {"profile": None}
+    else:
+        result = status(args.write_rate_window)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
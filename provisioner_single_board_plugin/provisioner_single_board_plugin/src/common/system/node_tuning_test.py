@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from provisioner_single_board_plugin.src.common.system.node_tuning import (
+    CGROUP_CMDLINE_FLAGS,
+    JOURNALD_DROPIN_PATH,
+    PROFILES,
+    SYSCTL_DROPIN_PATH,
+    TUNING_SERVICE_PATH,
+    TUNING_STATE_PATH,
+    add_cmdline_flags,
+    apply_persistent,
+    read_installed_profile,
+    read_meminfo,
+    read_sectors_written,
+    set_config_txt_option,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/system/node_tuning_test.py
+#
+
+TEST_CMDLINE = "console=serial0,115200 console=tty1 root=PARTUUID=8a438930-02 rootfstype=ext4 rootwait\n"
+TEST_CONFIG_TXT = "dtparam=audio=on\narm_64bit=1\n\n[cm4]\notg_mode=1\n\n[all]\n"
+TEST_DISKSTATS = """ 179       0 mmcblk0 5000 100 400000 2000 3000 200 96000 9000 0 8000 11000 0 0 0 0
+ 179       2 mmcblk0p2 4000 90 380000 1800 2900 190 95000 8800 0 7800 10600 0 0 0 0
+"""
+
+
+class NodeTuningTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp(prefix="provisioner-node-tuning-test")
+        os.makedirs(os.path.join(self.root, "boot/firmware"))
+        self.write("boot/firmware/cmdline.txt", TEST_CMDLINE)
+        self.write("boot/firmware/config.txt", TEST_CONFIG_TXT)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root)
+
+    def write(self, path: str, content: str) -> None:
+        os.makedirs(os.path.dirname(os.path.join(self.root, path)), exist_ok=True)
+        with open(os.path.join(self.root, path), "w") as f:
+            f.write(content)
+
+    def read(self, path: str) -> str:
+        with open(os.path.join(self.root, path.lstrip("/")), "r") as f:
+            return f.read()
+
+    def test_set_config_txt_option_for_all_boards(self) -> None:
+        self.assertEqual(
+            set_config_txt_option(TEST_CONFIG_TXT, "gpu_mem", "16"),
+            "dtparam=audio=on\narm_64bit=1\n\n[cm4]\notg_mode=1\n\n[all]\ngpu_mem=16\n",
+        )
+        self.assertEqual(
+            set_config_txt_option("gpu_mem=128\n[pi4]\ngpu_mem=256\n", "gpu_mem", "16"),
+            "gpu_mem=16\n[pi4]\ngpu_mem=256\n",
+        )
+        self.assertEqual(
+            set_config_txt_option("[pi4]\narm_boost=1\n", "gpu_mem", "16"), "[pi4]\narm_boost=1\n[all]\ngpu_mem=16\n"
+        )
+
+    def test_add_cmdline_flags_once(self) -> None:
+        updated = add_cmdline_flags(TEST_CMDLINE, CGROUP_CMDLINE_FLAGS)
+        self.assertTrue(updated.rstrip("\n").endswith("rootwait cgroup_memory=1 cgroup_enable=memory"))
+        self.assertEqual(add_cmdline_flags(updated, CGROUP_CMDLINE_FLAGS), updated)
+
+    def test_apply_persistent_profile_settings(self) -> None:
+        result = apply_persistent(PROFILES["k3s-worker"], root=self.root)
+
+        self.assertEqual(result["reboot_required"], ["/boot/firmware/config.txt", "/boot/firmware/cmdline.txt"])
+        self.assertIn("gpu_mem=16", self.read("/boot/firmware/config.txt"))
+        self.assertIn("cgroup_enable=memory", self.read("/boot/firmware/cmdline.txt"))
+        self.assertIn("Storage=volatile", self.read(JOURNALD_DROPIN_PATH))
+        self.assertEqual(self.read(SYSCTL_DROPIN_PATH), "vm.page-cluster = 0\nvm.swappiness = 100\n")
+        self.assertIn("boot", self.read(TUNING_SERVICE_PATH))
+        self.assertEqual(json.loads(self.read(TUNING_STATE_PATH))["name"], "k3s-worker")
+        self.assertEqual(read_installed_profile(root=self.root).cpu_governor, "performance")
+
+    def test_reapply_same_profile_without_changes(self) -> None:
+        apply_persistent(PROFILES["k3s-worker"], root=self.root)
+        self.assertEqual(
+            apply_persistent(PROFILES["k3s-worker"], root=self.root), {"changed": [], "reboot_required": []}
+        )
+
+    def test_switch_profile_restores_persistent_logs(self) -> None:
+        apply_persistent(PROFILES["k3s-worker"], root=self.root)
+        result = apply_persistent(PROFILES["storage"], root=self.root)
+
+        self.assertIn(JOURNALD_DROPIN_PATH, result["changed"])
+        self.assertFalse(os.path.exists(os.path.join(self.root, JOURNALD_DROPIN_PATH.lstrip("/"))))
+        self.assertEqual(result["reboot_required"], [])
+
+    def test_skip_missing_boot_files(self) -> None:
+        shutil.rmtree(os.path.join(self.root, "boot"))
+        self.assertEqual(apply_persistent(PROFILES["low-memory"], root=self.root)["reboot_required"], [])
+
+    def test_read_node_counters(self) -> None:
+        self.write(
+            "proc/meminfo", "MemTotal:        3884096 kB\nMemAvailable:    3212548 kB\nHugePages_Total:       0\n"
+        )
+        self.write("proc/diskstats", TEST_DISKSTATS)
+
+        self.assertEqual(read_meminfo(root=self.root)["MemAvailable"], 3212548)
+        self.assertEqual(read_meminfo(root=self.root)["HugePages_Total"], 0)
+        self.assertEqual(read_sectors_written([179, 2], root=self.root), 95000)
+        self.assertIsNone(read_sectors_written([8, 0], root=self.root))
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import re
+import signal
+import struct
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Standard library only: the module source is copied to remote nodes and runs there detached,
+# see remote_telemetry.py. It also serves as the command line of the on-node sampler.
+
+DEFAULT_TELEMETRY_DIR = "~/.provisioner/telemetry"
+DEFAULT_TELEMETRY_INTERVAL_SECONDS = 10
+# One day of samples at the default interval, ~5MB would be needed for a full week at 1 second
+DEFAULT_TELEMETRY_CAPACITY = 8640
+
+RING_BUFFER_FILE_NAME = "ring.bin"
+PID_FILE_NAME = "sampler.pid"
+
+CPU_FREQ_PATH = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq"
+THERMAL_ZONE_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
+THROTTLED_PATH = "/sys/devices/platform/soc/soc:firmware/get_throttled"
+LOAD_AVERAGE_PATH = "/proc/loadavg"
+MEM_INFO_PATH = "/proc/meminfo"
+DISK_STATS_PATH = "/proc/diskstats"
+
+# Whole disks only, partitions would count the same I/O twice
+DISK_DEVICE_PATTERN = re.compile(r"^(mmcblk\d+|sd[a-z]+|vd[a-z]+|nvme\d+n\d+)$")
+DISK_SECTOR_BYTES = 512
+
+RING_HEADER_MAGIC = b"PTEL"
+RING_HEADER_VERSION = 1
+RING_HEADER_FORMAT = "<4sHIQ"
+# timestamp, cpu_freq_khz, temperature, throttled, load1, mem_available_kb, sectors read/written, io busy ms
+RING_RECORD_FORMAT = "<dififqqqq"
+RING_HEADER_SIZE = struct.calcsize(RING_HEADER_FORMAT)
+RING_RECORD_SIZE = struct.calcsize(RING_RECORD_FORMAT)
+MISSING_VALUE = -1
+
+
+class TelemetrySample:
+    __slots__ = (
+        "timestamp",
+        "cpu_freq_khz",
+        "temperature_celsius",
+        "throttled",
+        "load1",
+        "mem_available_kb",
+        "disk_sectors_read",
+        "disk_sectors_written",
+        "disk_io_ms",
+    )
+
+    def __init__(self, timestamp: float, **values) -> None:
+        self.timestamp = timestamp
+        for slot in self.__slots__[1:]:
+            setattr(self, slot, values.get(slot))
+
+    def pack(self) -> bytes:
+        values = [MISSING_VALUE if getattr(self, slot) is None else getattr(self, slot) for slot in self.__slots__]
+        return struct.pack(RING_RECORD_FORMAT, *values)
+
+    @staticmethod
+    def unpack(record: bytes) -> "TelemetrySample":
+        values = struct.unpack(RING_RECORD_FORMAT, record)
+        sample = TelemetrySample(values[0])
+        for slot, value in zip(TelemetrySample.__slots__[1:], values[1:]):
+            setattr(sample, slot, None if value == MISSING_VALUE else value)
+        # Stored as single precision floats
+        if sample.temperature_celsius is not None:
+            sample.temperature_celsius = round(sample.temperature_celsius, 3)
+        if sample.load1 is not None:
+            sample.load1 = round(sample.load1, 2)
+        return sample
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @staticmethod
+    def from_dict(values: Dict[str, Any]) -> "TelemetrySample":
+        return TelemetrySample(**values)
+
+
+class TelemetryRingBuffer:
+    """
+    Fixed size file of fixed size records, the oldest sample is overwritten once the capacity is reached.
+    Appending costs a single record write plus a header update, the file never grows past its capacity.
+    """
+
+    path: str
+    capacity: int
+
+    def __init__(self, path: str, capacity: Optional[int] = DEFAULT_TELEMETRY_CAPACITY) -> None:
+        self.path = path
+        self.capacity = capacity
+
+    def _read_header(self, f) -> Optional[Tuple[int, int]]:
+        """Returns the capacity and the total number of samples ever appended"""
+        f.seek(0)
+        header = f.read(RING_HEADER_SIZE)
+        if len(header) != RING_HEADER_SIZE:
+            return None
+        magic, version, capacity, count = struct.unpack(RING_HEADER_FORMAT, header)
+        if magic != RING_HEADER_MAGIC or version != RING_HEADER_VERSION or capacity <= 0:
+            return None
+        return (capacity, count)
+
+    def _write_header(self, f, count: int) -> None:
+        f.seek(0)
+        f.write(struct.pack(RING_HEADER_FORMAT, RING_HEADER_MAGIC, RING_HEADER_VERSION, self.capacity, count))
+
+    def append(self, sample: TelemetrySample) -> None:
+        mode = "r+b" if os.path.exists(self.path) else "w+b"
+        with open(self.path, mode) as f:
+            header = self._read_header(f)
+            if header is None or header[0] != self.capacity:
+                # New file or a different layout, start over rather than mixing records
+                f.truncate(0)
+                header = (self.capacity, 0)
+            count = header[1]
+            f.seek(RING_HEADER_SIZE + (count % self.capacity) * RING_RECORD_SIZE)
+            f.write(sample.pack())
+            self._write_header(f, count + 1)
+
+    def read_all(self) -> List[TelemetrySample]:
+        """Samples from oldest to newest, the capacity is taken from the file as written by the sampler"""
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "rb") as f:
+            header = self._read_header(f)
+            if not header:
+                return []
+            capacity, count = header
+            first = count % capacity if count > capacity else 0
+            samples = []
+            for i in range(min(count, capacity)):
+                f.seek(RING_HEADER_SIZE + ((first + i) % capacity) * RING_RECORD_SIZE)
+                samples.append(TelemetrySample.unpack(f.read(RING_RECORD_SIZE)))
+            return samples
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip().strip("\x00")
+    except OSError:
+        return None
+
+
+def _read_int(path: str, base: Optional[int] = 10) -> Optional[int]:
+    value = _read_text(path)
+    try:
+        return int(value, base) if value else None
+    except ValueError:
+        return None
+
+
+def take_sample() -> TelemetrySample:
+    temperature = _read_int(THERMAL_ZONE_TEMP_PATH)
+    load_average = _read_text(LOAD_AVERAGE_PATH)
+    mem_available_kb = None
+    for line in (_read_text(MEM_INFO_PATH) or "").splitlines():
+        if line.startswith("MemAvailable:"):
+            mem_available_kb = int(line.split()[1])
+            break
+
+    sectors_read, sectors_written, io_ms = None, None, None
+    for line in (_read_text(DISK_STATS_PATH) or "").splitlines():
+        fields = line.split()
+        if len(fields) < 13 or not DISK_DEVICE_PATTERN.match(fields[2]):
+            continue
+        sectors_read = (sectors_read or 0) + int(fields[5])
+        sectors_written = (sectors_written or 0) + int(fields[9])
+        io_ms = (io_ms or 0) + int(fields[12])
+
+    return TelemetrySample(
+        time.time(),
+        cpu_freq_khz=_read_int(CPU_FREQ_PATH),
+        temperature_celsius=temperature / 1000.0 if temperature is not None else None,
+        throttled=_read_int(THROTTLED_PATH, base=16),
+        load1=float(load_average.split()[0]) if load_average else None,
+        mem_available_kb=mem_available_kb,
+        disk_sectors_read=sectors_read,
+        disk_sectors_written=sectors_written,
+        disk_io_ms=io_ms,
+    )
+
+
+def _is_running(pid_file_path: str) -> Optional[int]:
+    pid = _read_int(pid_file_path)
+    if not pid:
+        return None
+    try:
+        os.kill(pid, 0)
+        return pid
+    except OSError:
+        return None
+
+
+def run_sampler(telemetry_dir: str, interval_seconds: float, capacity: int) -> None:
+    pid_file_path = os.path.join(telemetry_dir, PID_FILE_NAME)
+    if _is_running(pid_file_path):
+        return
+    with open(pid_file_path, "w") as f:
+        f.write(str(os.getpid()))
+
+    ring_buffer = TelemetryRingBuffer(os.path.join(telemetry_dir, RING_BUFFER_FILE_NAME), capacity)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        while True:
+            started = time.monotonic()
+            ring_buffer.append(take_sample())
+            time.sleep(max(0, interval_seconds - (time.monotonic() - started)))
+    finally:
+        os.remove(pid_file_path)
+
+
+def stop_sampler(telemetry_dir: str) -> bool:
+    pid = _is_running(os.path.join(telemetry_dir, PID_FILE_NAME))
+    if not pid:
+        return False
+    os.kill(pid, signal.SIGTERM)
+    return True
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Node telemetry sampler")
+    parser.add_argument("action", choices=["sample", "stop", "dump"])
+    parser.add_argument("--dir", default=DEFAULT_TELEMETRY_DIR)
+    parser.add_argument("--interval", type=float, default=DEFAULT_TELEMETRY_INTERVAL_SECONDS)
+    parser.add_argument("--capacity", type=int, default=DEFAULT_TELEMETRY_CAPACITY)
+    args = parser.parse_args(argv)
+    telemetry_dir = os.path.expanduser(args.dir)
+    os.makedirs(telemetry_dir, exist_ok=True)
+
+    if args.action == "sample":
+        run_sampler(telemetry_dir, args.interval, args.capacity)
+    elif args.action == "stop":
+        print(json.dumps({"stopped": stop_sampler(telemetry_dir)}))
+    else:
+        ring_buffer = TelemetryRingBuffer(os.path.join(telemetry_dir, RING_BUFFER_FILE_NAME))
+        running = _is_running(os.path.join(telemetry_dir, PID_FILE_NAME)) is not None
+        samples = [sample.to_dict() for sample in ring_buffer.read_all()]
+        print(json.dumps({"running": running, "samples": samples}))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
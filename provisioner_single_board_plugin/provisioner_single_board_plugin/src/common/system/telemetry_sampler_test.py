@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from provisioner_single_board_plugin.src.common.system.telemetry_sampler import (
+    RING_HEADER_SIZE,
+    RING_RECORD_SIZE,
+    TelemetryRingBuffer,
+    TelemetrySample,
+    take_sample,
+)
+
+# To run as a single test target:
+#  ./run_tests.py plugins/provisioner_single_board_plugin/provisioner_single_board_plugin/src/common/system/telemetry_sampler_test.py
+#
+
+
+def create_sample(timestamp: float) -> TelemetrySample:
+    return TelemetrySample(timestamp, temperature_celsius=45.5, load1=0.25, mem_available_kb=1024, disk_io_ms=10)
+
+
+class TelemetryRingBufferTestShould(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.telemetry_dir = tempfile.mkdtemp(prefix="provisioner-telemetry-test")
+        self.path = os.path.join(self.telemetry_dir, "ring.bin")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.telemetry_dir)
+
+    def test_round_trip_samples_with_missing_values(self) -> None:
+        ring_buffer = TelemetryRingBuffer(self.path, capacity=4)
+        ring_buffer.append(create_sample(1.0))
+        samples = ring_buffer.read_all()
+        self.assertEqual(len(samples), 1)
+        self.assertEqual(samples[0].temperature_celsius, 45.5)
+        self.assertEqual(samples[0].load1, 0.25)
+        self.assertEqual(samples[0].mem_available_kb, 1024)
+        self.assertIsNone(samples[0].cpu_freq_khz)
+        self.assertIsNone(samples[0].throttled)
+
+    def test_overwrite_oldest_samples_with_fixed_file_size(self) -> None:
+        ring_buffer = TelemetryRingBuffer(self.path, capacity=3)
+        for timestamp in range(1, 8):
+            ring_buffer.append(create_sample(float(timestamp)))
+
+        self.assertEqual([sample.timestamp for sample in ring_buffer.read_all()], [5.0, 6.0, 7.0])
+        self.assertEqual(os.path.getsize(self.path), RING_HEADER_SIZE + 3 * RING_RECORD_SIZE)
+
+    def test_read_capacity_from_file(self) -> None:
+        TelemetryRingBuffer(self.path, capacity=2).append(create_sample(1.0))
+        self.assertEqual(len(TelemetryRingBuffer(self.path).read_all()), 1)
+
+    def test_start_over_when_capacity_changes(self) -> None:
+        TelemetryRingBuffer(self.path, capacity=2).append(create_sample(1.0))
+        ring_buffer = TelemetryRingBuffer(self.path, capacity=5)
+        ring_buffer.append(create_sample(2.0))
+        self.assertEqual([sample.timestamp for sample in ring_buffer.read_all()], [2.0])
+
+    def test_missing_or_corrupted_file_has_no_samples(self) -> None:
+        self.assertEqual(TelemetryRingBuffer(self.path).read_all(), [])
+        with open(self.path, "wb") as f:
+            f.write(b"garbage")
+        self.assertEqual(TelemetryRingBuffer(self.path).read_all(), [])
+
+    def test_take_sample_from_local_system(self) -> None:
+        sample = take_sample()
+        self.assertGreater(sample.timestamp, 0)
+        self.assertIsNotNone(sample.mem_available_kb)
+        self.assertEqual(TelemetrySample.from_dict(sample.to_dict()).to_dict(), sample.to_dict())
@@ -14,6 +14,7 @@ os:
     raspbian:
     download_path: $HOME/temp/rpi_raspios_image
     active_system: 64bit
+    min_write_speed_mbps: 10
     download_url:
         64bit: https://downloads.raspberrypi.org/raspios_lite_arm64/images/raspios_lite_arm64-2022-01-28/2022-01-28-raspios-bullseye-arm64-lite.zip
         32bit: https://downloads.raspberrypi.org/raspios_lite_armhf/images/raspios_lite_armhf-2022-01-28/2022-01-28-raspios-bullseye-armhf-lite.zi
@@ -22,6 +23,12 @@ network:
     gw_ip_address: 192.168.1.1
     dns_ip_address: 192.168.1.1
 
+lan_inventory:
+    ttl_seconds: 600
+    concurrency: 128
+    probe_timeout_seconds: 1.0
+    ssh_port: 22
+
 remote: {}
 vcs: {}
 """
@@ -51,6 +58,7 @@ class DownloadUrl(SerializationBase):
 class SingleBoardOsRaspbianConfig(SerializationBase):
     download_path: str = ""
     active_system: str = ""
+    min_write_speed_mbps: float = None
     download_url: DownloadUrl = DownloadUrl({})
 
     def __init__(self, dict_obj: dict) -> None:
@@ -61,6 +69,8 @@ class SingleBoardOsRaspbianConfig(SerializationBase):
             self.download_path = other.download_path
         if hasattr(other, "active_system") and len(other.active_system) > 0:
             self.active_system = other.active_system
+        if hasattr(other, "min_write_speed_mbps") and other.min_write_speed_mbps is not None:
+            self.min_write_speed_mbps = other.min_write_speed_mbps
         if hasattr(other, "download_url"):
             self.download_url = self.download_url if self.download_url is not None else DownloadUrl()
             self.download_url.merge(other.download_url)
@@ -70,6 +80,8 @@ class SingleBoardOsRaspbianConfig(SerializationBase):
             self.download_path = dict_obj["download_path"]
         if "active_system" in dict_obj:
             self.active_system = dict_obj["active_system"]
+        if "min_write_speed_mbps" in dict_obj:
+            self.min_write_speed_mbps = float(dict_obj["min_write_speed_mbps"])
         if "download_url" in dict_obj:
             self.download_url = DownloadUrl(dict_obj["download_url"])
 
@@ -110,9 +122,41 @@ class SingleBoardNetworkConfig(SerializationBase):
             self.dns_ip_address = dict_obj["dns_ip_address"]
 
 
+class SingleBoardLanInventoryConfig(SerializationBase):
+    ttl_seconds: int = None
+    concurrency: int = None
+    probe_timeout_seconds: float = None
+    ssh_port: int = None
+
+    def __init__(self, dict_obj: dict) -> None:
+        super().__init__(dict_obj)
+
+    def merge(self, other: "SingleBoardLanInventoryConfig") -> SerializationBase:
+        if hasattr(other, "ttl_seconds") and other.ttl_seconds is not None:
+            self.ttl_seconds = other.ttl_seconds
+        if hasattr(other, "concurrency") and other.concurrency is not None:
+            self.concurrency = other.concurrency
+        if hasattr(other, "probe_timeout_seconds") and other.probe_timeout_seconds is not None:
+            self.probe_timeout_seconds = other.probe_timeout_seconds
+        if hasattr(other, "ssh_port") and other.ssh_port is not None:
+            self.ssh_port = other.ssh_port
+        return self
+
+    def _try_parse_config(self, dict_obj: dict):
+        if "ttl_seconds" in dict_obj:
+            self.ttl_seconds = int(dict_obj["ttl_seconds"])
+        if "concurrency" in dict_obj:
+            self.concurrency = int(dict_obj["concurrency"])
+        if "probe_timeout_seconds" in dict_obj:
+            self.probe_timeout_seconds = float(dict_obj["probe_timeout_seconds"])
+        if "ssh_port" in dict_obj:
+            self.ssh_port = int(dict_obj["ssh_port"])
+
+
 class SingleBoardConfig(SerializationBase):
     os: SingleBoardOsConfig = SingleBoardOsConfig({})
     network: SingleBoardNetworkConfig = SingleBoardNetworkConfig({})
+    lan_inventory: SingleBoardLanInventoryConfig = SingleBoardLanInventoryConfig({})
     remote: RemoteConfig = RemoteConfig({})
     vcs: VersionControlConfig = VersionControlConfig({})
 
@@ -130,6 +174,11 @@ class SingleBoardConfig(SerializationBase):
         if hasattr(other, "network"):
             self.network = self.network if self.network is not None else SingleBoardNetworkConfig()
             self.network.merge(other.network)
+        if hasattr(other, "lan_inventory"):
+            self.lan_inventory = (
+                self.lan_inventory if self.lan_inventory is not None else SingleBoardLanInventoryConfig({})
+            )
+            self.lan_inventory.merge(other.lan_inventory)
 
         return self
 
@@ -142,6 +191,8 @@ class SingleBoardConfig(SerializationBase):
             self.os = SingleBoardOsConfig(dict_obj["os"])
         if "network" in dict_obj:
             self.network = SingleBoardNetworkConfig(dict_obj["network"])
+        if "lan_inventory" in dict_obj:
+            self.lan_inventory = SingleBoardLanInventoryConfig(dict_obj["lan_inventory"])
 
     def get_os_raspbian_download_url(self):
         if self.os is None or self.os.raspbian is None or self.os.raspbian.active_system is None:
@@ -87,6 +87,7 @@ os:
   raspbian:
     active_system: 64bit
     download_path: $HOME/temp/rpi_raspios_image
+    min_write_speed_mbps: 10
     download_url:
       url_64bit: http://download-url-64-bit.com
       url_32bit: http://download-url-32-bit.com
@@ -104,6 +105,7 @@ os:
   raspbian:
     active_system: 32bit
     download_path: $HOME/temp/rpi_raspios_image_user
+    min_write_speed_mbps: 20.5
     download_url:
       url_64bit: http://download-url-64-bit-user.com
       url_32bit: http://download-url-32-bit-user.com
@@ -121,10 +123,38 @@ network:
         )
         self.assertEqual(merged_config_obj.os.raspbian.download_url.url_32bit, "http://download-url-32-bit-user.com")
         self.assertEqual(merged_config_obj.os.raspbian.download_url.url_64bit, "http://download-url-64-bit-user.com")
+        self.assertEqual(merged_config_obj.os.raspbian.min_write_speed_mbps, 20.5)
 
         self.assertEqual(merged_config_obj.network.gw_ip_address, "1.1.1.1")
         self.assertEqual(merged_config_obj.network.dns_ip_address, "2.2.2.2")
 
+    def test_config_lan_inventory_partial_merge_with_user_config(self):
+        ctx = Context.create()
+        yaml_util = YamlUtil.create(ctx=ctx, io_utils=IOUtils.create(ctx))
+        internal_yaml_str = """
+lan_inventory:
+  ttl_seconds: 600
+  concurrency: 128
+  probe_timeout_seconds: 1.0
+  ssh_port: 22
+"""
+        internal_config_obj: SingleBoardConfig = yaml_util.read_string_fn(
+            yaml_str=internal_yaml_str, cls=SingleBoardConfig
+        )
+
+        user_yaml_str = """
+lan_inventory:
+  ttl_seconds: 60
+  concurrency: 32
+"""
+        user_config_obj: SingleBoardConfig = yaml_util.read_string_fn(yaml_str=user_yaml_str, cls=SingleBoardConfig)
+        merged_config_obj: SingleBoardConfig = internal_config_obj.merge(user_config_obj)
+
+        self.assertEqual(merged_config_obj.lan_inventory.ttl_seconds, 60)
+        self.assertEqual(merged_config_obj.lan_inventory.concurrency, 32)
+        self.assertEqual(merged_config_obj.lan_inventory.probe_timeout_seconds, 1.0)
+        self.assertEqual(merged_config_obj.lan_inventory.ssh_port, 22)
+
     def test_read_os_raspi_download_url(self):
         ctx = Context.create()
         ctx._verbose = True
@@ -8,6 +8,7 @@ from provisioner_single_board_plugin.src.config.domain.config import (
     SingleBoardConfig,
 )
 from provisioner_single_board_plugin.src.info.system.cli import register_system_info_commands
+from provisioner_single_board_plugin.src.info.telemetry.cli import register_telemetry_commands
 
 from provisioner_shared.components.remote.cli_remote_opts import cli_remote_opts
 from provisioner_shared.components.remote.domain.config import RemoteConfig
@@ -27,3 +28,4 @@ def register_remote_info_commands(cli_group: click.Group, single_board_cfg: Opti
             click.echo(ctx.get_help())
 
     register_system_info_commands(cli_group=info, single_board_cfg=single_board_cfg)
+    register_telemetry_commands(cli_group=info, single_board_cfg=single_board_cfg)
@@ -3,6 +3,13 @@
 from typing import Optional
 
 import click
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    DEFAULT_COLLECT_MAX_WORKERS,
+    DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+    OUTPUT_FORMAT_TABLE,
+    OUTPUT_FORMATS,
+)
 from provisioner_single_board_plugin.src.config.domain.config import SingleBoardConfig
 from provisioner_single_board_plugin.src.info.system.system_info_cmd import SystemInfoCmd, SystemInfoCmdArgs
 
@@ -16,17 +23,79 @@ from provisioner_shared.components.runtime.infra.evaluator import Evaluator
 def register_system_info_commands(cli_group: click.Group, single_board_cfg: Optional[SingleBoardConfig] = None):
 
     @cli_group.command()
+    @click.option(
+        "--fleet",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Collect from all remote hosts in user configuration concurrently",
+        envvar="PROV_RPI_FLEET",
+    )
+    @click.option(
+        "--fleet-hosts",
+        type=str,
+        help="Comma separated host names from user configuration to narrow the fleet [example: node1,node2]",
+        envvar="PROV_RPI_FLEET_HOSTS",
+    )
+    @click.option(
+        "--forks",
+        type=int,
+        default=DEFAULT_COLLECT_MAX_WORKERS,
+        show_default=True,
+        help="Number of hosts collected in parallel in fleet mode",
+        envvar="PROV_RPI_FLEET_FORKS",
+    )
+    @click.option(
+        "--host-timeout",
+        type=int,
+        default=DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+        show_default=True,
+        help="Seconds after which an unresponsive host is reported as failed",
+        envvar="PROV_SYSTEM_INFO_HOST_TIMEOUT",
+    )
+    @click.option(
+        "--output-format",
+        type=click.Choice(OUTPUT_FORMATS, case_sensitive=False),
+        default=OUTPUT_FORMAT_TABLE,
+        show_default=True,
+        help="Report format of remote hosts system information",
+        envvar="PROV_SYSTEM_INFO_OUTPUT_FORMAT",
+    )
+    @click.option(
+        "--output-file",
+        type=str,
+        help="Write the report to a file instead of stdout (table format exports JSON)",
+        envvar="PROV_SYSTEM_INFO_OUTPUT_FILE",
+    )
     @cli_modifiers
     @click.pass_context
-    def collect(ctx: click.Context) -> None:
+    def collect(
+        ctx: click.Context,
+        fleet: bool,
+        fleet_hosts: Optional[str],
+        forks: int,
+        host_timeout: int,
+        output_format: str,
+        output_file: Optional[str],
+    ) -> None:
         """
         Collect system information from a remote host
         """
         cli_ctx = CliContextManager.create(modifiers=CliModifiers.from_click_ctx(ctx))
         remote_opts = RemoteOpts.from_click_ctx(ctx)
+        fleet_opts = FleetOpts(forks=forks, host_names=FleetOpts.parse_host_names(fleet_hosts)) if fleet else None
         Evaluator.eval_cli_entrypoint_step(
             name="System Info Collect",
-            call=lambda: SystemInfoCmd().run(ctx=cli_ctx, args=SystemInfoCmdArgs(remote_opts=remote_opts)),
+            call=lambda: SystemInfoCmd().run(
+                ctx=cli_ctx,
+                args=SystemInfoCmdArgs(
+                    remote_opts=remote_opts,
+                    fleet_opts=fleet_opts,
+                    output_format=output_format.lower(),
+                    output_file=output_file,
+                    host_timeout_seconds=host_timeout,
+                ),
+            ),
             error_message="Failed to collect system information",
             verbose=cli_ctx.is_verbose(),
         )
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
+from typing import Optional
 
 from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+    OUTPUT_FORMAT_TABLE,
+)
 from provisioner_single_board_plugin.src.common.remote.remote_system_info_collector import (
     RemoteMachineSystemInfoCollectArgs,
     RemoteMachineSystemInfoCollectRunner,
@@ -16,14 +22,36 @@ class SystemInfoCmdArgs:
     """Arguments for the SystemInfoCmd"""
 
     remote_opts: RemoteOpts
+    fleet_opts: FleetOpts
+    output_format: str
+    output_file: str
+    host_timeout_seconds: int
 
-    def __init__(self, remote_opts: RemoteOpts = None) -> None:
+    def __init__(
+        self,
+        remote_opts: RemoteOpts = None,
+        fleet_opts: Optional[FleetOpts] = None,
+        output_format: Optional[str] = OUTPUT_FORMAT_TABLE,
+        output_file: Optional[str] = None,
+        host_timeout_seconds: Optional[int] = DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+    ) -> None:
         self.remote_opts = remote_opts
+        self.fleet_opts = fleet_opts
+        self.output_format = output_format
+        self.output_file = output_file
+        self.host_timeout_seconds = host_timeout_seconds
 
     def print(self) -> None:
         if self.remote_opts:
             self.remote_opts.print()
-        logger.debug("SystemInfoCmdArgs: \n")
+        if self.fleet_opts:
+            self.fleet_opts.print()
+        logger.debug(
+            "SystemInfoCmdArgs: \n"
+            + f"  output_format: {self.output_format}\n"
+            + f"  output_file: {self.output_file}\n"
+            + f"  host_timeout_seconds: {self.host_timeout_seconds}\n"
+        )
 
 
 class SystemInfoCmd:
@@ -35,6 +63,10 @@ class SystemInfoCmd:
             ctx=ctx,
             args=RemoteMachineSystemInfoCollectArgs(
                 remote_opts=args.remote_opts,
+                fleet_opts=args.fleet_opts,
+                output_format=args.output_format,
+                output_file=args.output_file,
+                host_timeout_seconds=args.host_timeout_seconds,
             ),
             collaborators=CoreCollaborators(ctx),
         )
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+from functools import wraps
+from typing import Any, Callable, Optional
+
+import click
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    DEFAULT_COLLECT_MAX_WORKERS,
+    DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+    OUTPUT_FORMAT_JSON,
+    OUTPUT_FORMAT_TABLE,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_telemetry import (
+    TELEMETRY_ACTION_START,
+    TELEMETRY_ACTION_STOP,
+    TELEMETRY_ACTION_SUMMARY,
+)
+from provisioner_single_board_plugin.src.common.system.telemetry_sampler import (
+    DEFAULT_TELEMETRY_CAPACITY,
+    DEFAULT_TELEMETRY_INTERVAL_SECONDS,
+)
+from provisioner_single_board_plugin.src.config.domain.config import SingleBoardConfig
+from provisioner_single_board_plugin.src.info.telemetry.telemetry_cmd import TelemetryCmd, TelemetryCmdArgs
+
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.cli.cli_modifiers import cli_modifiers
+from provisioner_shared.components.runtime.cli.menu_format import CustomGroup
+from provisioner_shared.components.runtime.cli.modifiers import CliModifiers
+from provisioner_shared.components.runtime.infra.context import CliContextManager
+from provisioner_shared.components.runtime.infra.evaluator import Evaluator
+
+
+def cli_telemetry_target_opts(func: Callable) -> Callable:
+    @click.option(
+        "--fleet",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Target all remote hosts from user configuration",
+        envvar="PROV_RPI_FLEET",
+    )
+    @click.option(
+        "--fleet-hosts",
+        type=str,
+        help="Comma separated host names from user configuration to narrow the fleet [example: node1,node2]",
+        envvar="PROV_RPI_FLEET_HOSTS",
+    )
+    @click.option(
+        "--forks",
+        type=int,
+        default=DEFAULT_COLLECT_MAX_WORKERS,
+        show_default=True,
+        help="Number of hosts handled in parallel in fleet mode",
+        envvar="PROV_RPI_FLEET_FORKS",
+    )
+    @click.option(
+        "--host-timeout",
+        type=int,
+        default=DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+        show_default=True,
+        help="Seconds after which an unresponsive host is reported as failed",
+        envvar="PROV_TELEMETRY_HOST_TIMEOUT",
+    )
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _run_telemetry(ctx: click.Context, action: str, fleet: bool, fleet_hosts: Optional[str], forks: int, **kwargs):
+    cli_ctx = CliContextManager.create(modifiers=CliModifiers.from_click_ctx(ctx))
+    remote_opts = RemoteOpts.from_click_ctx(ctx)
+    fleet_opts = FleetOpts(forks=forks, host_names=FleetOpts.parse_host_names(fleet_hosts)) if fleet else None
+    Evaluator.eval_cli_entrypoint_step(
+        name=f"Telemetry {action}",
+        call=lambda: TelemetryCmd().run(
+            ctx=cli_ctx,
+            args=TelemetryCmdArgs(action=action, remote_opts=remote_opts, fleet_opts=fleet_opts, **kwargs),
+        ),
+        error_message=f"Failed to run telemetry {action}",
+        verbose=cli_ctx.is_verbose(),
+    )
+
+
+def register_telemetry_commands(cli_group: click.Group, single_board_cfg: Optional[SingleBoardConfig] = None):
+
+    @cli_group.group(invoke_without_command=True, no_args_is_help=True, cls=CustomGroup)
+    @click.pass_context
+    def telemetry(ctx: click.Context):
+        """Sample node telemetry into an on-node ring buffer and summarize it"""
+        if ctx.invoked_subcommand is None:
+            click.echo(ctx.get_help())
+
+    @telemetry.command()
+    @click.option(
+        "--interval",
+        type=float,
+        default=DEFAULT_TELEMETRY_INTERVAL_SECONDS,
+        show_default=True,
+        help="Seconds between samples",
+        envvar="PROV_TELEMETRY_INTERVAL",
+    )
+    @click.option(
+        "--capacity",
+        type=int,
+        default=DEFAULT_TELEMETRY_CAPACITY,
+        show_default=True,
+        help="Number of samples kept on the node, older samples are overwritten",
+        envvar="PROV_TELEMETRY_CAPACITY",
+    )
+    @cli_telemetry_target_opts
+    @cli_modifiers
+    @click.pass_context
+    def start(
+        ctx: click.Context,
+        interval: float,
+        capacity: int,
+        fleet: bool,
+        fleet_hosts: Optional[str],
+        forks: int,
+        host_timeout: int,
+    ) -> None:
+        """
+        Start the telemetry sampler on remote hosts
+        """
+        _run_telemetry(
+            ctx,
+            TELEMETRY_ACTION_START,
+            fleet,
+            fleet_hosts,
+            forks,
+            interval_seconds=interval,
+            capacity=capacity,
+            host_timeout_seconds=host_timeout,
+        )
+
+    @telemetry.command()
+    @cli_telemetry_target_opts
+    @cli_modifiers
+    @click.pass_context
+    def stop(ctx: click.Context, fleet: bool, fleet_hosts: Optional[str], forks: int, host_timeout: int) -> None:
+        """
+        Stop the telemetry sampler on remote hosts, collected samples are kept
+        """
+        _run_telemetry(ctx, TELEMETRY_ACTION_STOP, fleet, fleet_hosts, forks, host_timeout_seconds=host_timeout)
+
+    @telemetry.command()
+    @click.option(
+        "--output-format",
+        type=click.Choice([OUTPUT_FORMAT_TABLE, OUTPUT_FORMAT_JSON], case_sensitive=False),
+        default=OUTPUT_FORMAT_TABLE,
+        show_default=True,
+        help="Report format of the telemetry summary",
+        envvar="PROV_TELEMETRY_OUTPUT_FORMAT",
+    )
+    @cli_telemetry_target_opts
+    @cli_modifiers
+    @click.pass_context
+    def summary(
+        ctx: click.Context,
+        output_format: str,
+        fleet: bool,
+        fleet_hosts: Optional[str],
+        forks: int,
+        host_timeout: int,
+    ) -> None:
+        """
+        Pull the sample buffers from remote hosts and summarize them
+        """
+        _run_telemetry(
+            ctx,
+            TELEMETRY_ACTION_SUMMARY,
+            fleet,
+            fleet_hosts,
+            forks,
+            host_timeout_seconds=host_timeout,
+            output_format=output_format.lower(),
+        )
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+from typing import Optional
+
+from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+    OUTPUT_FORMAT_TABLE,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_telemetry import (
+    RemoteTelemetryArgs,
+    RemoteTelemetryRunner,
+)
+from provisioner_single_board_plugin.src.common.system.telemetry_sampler import (
+    DEFAULT_TELEMETRY_CAPACITY,
+    DEFAULT_TELEMETRY_INTERVAL_SECONDS,
+)
+
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+
+class TelemetryCmdArgs:
+    """Arguments for the TelemetryCmd"""
+
+    remote_opts: RemoteOpts
+    action: str
+    fleet_opts: FleetOpts
+    interval_seconds: float
+    capacity: int
+    host_timeout_seconds: int
+    output_format: str
+
+    def __init__(
+        self,
+        action: str,
+        remote_opts: RemoteOpts = None,
+        fleet_opts: Optional[FleetOpts] = None,
+        interval_seconds: Optional[float] = DEFAULT_TELEMETRY_INTERVAL_SECONDS,
+        capacity: Optional[int] = DEFAULT_TELEMETRY_CAPACITY,
+        host_timeout_seconds: Optional[int] = DEFAULT_HOST_COLLECT_TIMEOUT_SECONDS,
+        output_format: Optional[str] = OUTPUT_FORMAT_TABLE,
+    ) -> None:
+        self.action = action
+        self.remote_opts = remote_opts
+        self.fleet_opts = fleet_opts
+        self.interval_seconds = interval_seconds
+        self.capacity = capacity
+        self.host_timeout_seconds = host_timeout_seconds
+        self.output_format = output_format
+
+    def print(self) -> None:
+        if self.remote_opts:
+            self.remote_opts.print()
+        if self.fleet_opts:
+            self.fleet_opts.print()
+        logger.debug(
+            "TelemetryCmdArgs: \n"
+            + f"  action: {self.action}\n"
+            + f"  interval_seconds: {self.interval_seconds}\n"
+            + f"  capacity: {self.capacity}\n"
+            + f"  host_timeout_seconds: {self.host_timeout_seconds}\n"
+            + f"  output_format: {self.output_format}\n"
+        )
+
+
+class TelemetryCmd:
+    def run(self, ctx: Context, args: TelemetryCmdArgs) -> None:
+        logger.debug("Inside TelemetryCmd run()")
+        args.print()
+
+        RemoteTelemetryRunner().run(
+            ctx=ctx,
+            args=RemoteTelemetryArgs(
+                remote_opts=args.remote_opts,
+                action=args.action,
+                fleet_opts=args.fleet_opts,
+                interval_seconds=args.interval_seconds,
+                capacity=args.capacity,
+                host_timeout_seconds=args.host_timeout_seconds,
+                output_format=args.output_format,
+            ),
+            collaborators=CoreCollaborators(ctx),
+        )
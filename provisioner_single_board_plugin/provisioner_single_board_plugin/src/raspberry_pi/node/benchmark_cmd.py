@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+
+from typing import Optional
+
+from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.remote_benchmark import (
+    RemoteBenchmarkArgs,
+    RemoteBenchmarkRunner,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import OUTPUT_FORMAT_TABLE
+from provisioner_single_board_plugin.src.common.system.node_benchmark import (
+    DEFAULT_BENCHMARK_DIR,
+    DEFAULT_BENCHMARK_DISK_SIZE_MB,
+    DEFAULT_BENCHMARK_DURATION_SECONDS,
+)
+
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+
+class RPiBenchmarkCmdArgs:
+
+    remote_opts: RemoteOpts
+    fleet_opts: FleetOpts
+    benchmark_dir: str
+    disk_size_mb: int
+    duration_seconds: float
+    network: bool
+    output_format: str
+
+    def __init__(
+        self,
+        remote_opts: RemoteOpts = None,
+        fleet_opts: Optional[FleetOpts] = None,
+        benchmark_dir: Optional[str] = DEFAULT_BENCHMARK_DIR,
+        disk_size_mb: Optional[int] = DEFAULT_BENCHMARK_DISK_SIZE_MB,
+        duration_seconds: Optional[float] = DEFAULT_BENCHMARK_DURATION_SECONDS,
+        network: Optional[bool] = True,
+        output_format: Optional[str] = OUTPUT_FORMAT_TABLE,
+    ) -> None:
+        self.remote_opts = remote_opts
+        self.fleet_opts = fleet_opts
+        self.benchmark_dir = benchmark_dir
+        self.disk_size_mb = disk_size_mb
+        self.duration_seconds = duration_seconds
+        self.network = network
+        self.output_format = output_format
+
+    def print(self) -> None:
+        if self.remote_opts:
+            self.remote_opts.print()
+        if self.fleet_opts:
+            self.fleet_opts.print()
+        logger.debug(
+            "RPiBenchmarkCmdArgs: \n"
+            + f"  benchmark_dir: {self.benchmark_dir}\n"
+            + f"  disk_size_mb: {self.disk_size_mb}\n"
+            + f"  duration_seconds: {self.duration_seconds}\n"
+            + f"  network: {self.network}\n"
+            + f"  output_format: {self.output_format}\n"
+        )
+
+
+class RPiBenchmarkCmd:
+    def run(self, ctx: Context, args: RPiBenchmarkCmdArgs) -> None:
+        logger.debug("Inside RPiBenchmarkCmd run()")
+        args.print()
+
+        RemoteBenchmarkRunner().run(
+            ctx=ctx,
+            args=RemoteBenchmarkArgs(
+                remote_opts=args.remote_opts,
+                fleet_opts=args.fleet_opts,
+                benchmark_dir=args.benchmark_dir,
+                disk_size_mb=args.disk_size_mb,
+                duration_seconds=args.duration_seconds,
+                network=args.network,
+                output_format=args.output_format,
+            ),
+            collaborators=CoreCollaborators(ctx),
+        )
@@ -3,12 +3,39 @@
 from typing import Optional
 
 import click
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import (
+    DEFAULT_FLEET_FORKS,
+    DEFAULT_FLEET_REBOOT_STAGGER_SECONDS,
+    DEFAULT_FLEET_SSH_WAIT_TIMEOUT_SECONDS,
+    FleetOpts,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_fleet_system_info import (
+    OUTPUT_FORMAT_JSON,
+    OUTPUT_FORMAT_TABLE,
+)
+from provisioner_single_board_plugin.src.common.remote.remote_tuning import DEFAULT_TUNING_BENCHMARK_DURATION_SECONDS
+from provisioner_single_board_plugin.src.common.system.boot_migration import (
+    MIGRATION_SOURCE_CLONE,
+    MIGRATION_SOURCE_IMAGE,
+)
+from provisioner_single_board_plugin.src.common.system.node_benchmark import (
+    DEFAULT_BENCHMARK_DIR,
+    DEFAULT_BENCHMARK_DISK_SIZE_MB,
+    DEFAULT_BENCHMARK_DURATION_SECONDS,
+)
+from provisioner_single_board_plugin.src.common.system.node_tuning import PROFILES
 from provisioner_single_board_plugin.src.config.domain.config import SingleBoardConfig
+from provisioner_single_board_plugin.src.raspberry_pi.node.benchmark_cmd import RPiBenchmarkCmd, RPiBenchmarkCmdArgs
 from provisioner_single_board_plugin.src.raspberry_pi.node.configure_cmd import RPiOsConfigureCmd, RPiOsConfigureCmdArgs
+from provisioner_single_board_plugin.src.raspberry_pi.node.migrate_boot_cmd import (
+    RPiMigrateBootCmd,
+    RPiMigrateBootCmdArgs,
+)
 from provisioner_single_board_plugin.src.raspberry_pi.node.network_cmd import (
     RPiNetworkConfigureCmd,
     RPiNetworkConfigureCmdArgs,
 )
+from provisioner_single_board_plugin.src.raspberry_pi.node.tune_cmd import RPiTuneCmd, RPiTuneCmdArgs
 
 from provisioner_shared.components.remote.remote_opts import RemoteOpts
 from provisioner_shared.components.runtime.cli.cli_modifiers import cli_modifiers
@@ -19,19 +46,96 @@ from provisioner_shared.components.runtime.infra.evaluator import Evaluator
 
 def register_node_commands(cli_group: click.Group, single_board_cfg: Optional[SingleBoardConfig] = None):
 
+    lan_inventory_cfg = single_board_cfg.lan_inventory if single_board_cfg is not None else None
+    maybe_image_download_url = (
+        single_board_cfg.maybe_get("os.raspbian.download_url.url_64bit") if single_board_cfg is not None else None
+    )
+    maybe_image_download_path = (
+        single_board_cfg.maybe_get("os.raspbian.download_path") if single_board_cfg is not None else None
+    )
+
     @cli_group.command()
+    @click.option(
+        "--fleet",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Configure all remote hosts from user configuration in a single non-interactive run",
+        envvar="PROV_RPI_FLEET",
+    )
+    @click.option(
+        "--fleet-hosts",
+        type=str,
+        help="Comma separated host names from user configuration to narrow the fleet [example: node1,node2]",
+        envvar="PROV_RPI_FLEET_HOSTS",
+    )
+    @click.option(
+        "--forks",
+        type=int,
+        default=DEFAULT_FLEET_FORKS,
+        show_default=True,
+        help="Number of hosts Ansible configures in parallel in fleet mode",
+        envvar="PROV_RPI_FLEET_FORKS",
+    )
+    @click.option(
+        "--reboot-stagger-seconds",
+        type=int,
+        default=DEFAULT_FLEET_REBOOT_STAGGER_SECONDS,
+        show_default=True,
+        help="Delay between consecutive node reboots in fleet mode",
+        envvar="PROV_RPI_FLEET_REBOOT_STAGGER_SECONDS",
+    )
+    @click.option(
+        "--ssh-wait-timeout",
+        type=int,
+        default=DEFAULT_FLEET_SSH_WAIT_TIMEOUT_SECONDS,
+        show_default=True,
+        help="Seconds to wait for each node SSH to come back after reboot in fleet mode",
+        envvar="PROV_RPI_FLEET_SSH_WAIT_TIMEOUT",
+    )
+    @click.option(
+        "--force",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Run even when the node already matches the desired state fingerprint",
+        envvar="PROV_RPI_FORCE",
+    )
     @cli_modifiers
     @click.pass_context
-    def configure(ctx: click.Context) -> None:
+    def configure(
+        ctx: click.Context,
+        fleet: bool,
+        fleet_hosts: Optional[str],
+        forks: int,
+        reboot_stagger_seconds: int,
+        ssh_wait_timeout: int,
+        force: bool,
+    ) -> None:
         """
         Select a remote Raspberry Pi node to configure Raspbian OS software and hardware settings.
         Configuration is aimed for an optimal headless Raspberry Pi used as a Kubernetes cluster node.
         """
         cli_ctx = CliContextManager.create(modifiers=CliModifiers.from_click_ctx(ctx))
         remote_opts = RemoteOpts.from_click_ctx(ctx)
+        fleet_opts = (
+            FleetOpts(
+                forks=forks,
+                reboot_stagger_seconds=reboot_stagger_seconds,
+                ssh_wait_timeout_seconds=ssh_wait_timeout,
+                host_names=FleetOpts.parse_host_names(fleet_hosts),
+            )
+            if fleet
+            else None
+        )
         Evaluator.eval_cli_entrypoint_step(
             name="Raspbian OS Configure",
-            call=lambda: RPiOsConfigureCmd().run(ctx=cli_ctx, args=RPiOsConfigureCmdArgs(remote_opts=remote_opts)),
+            call=lambda: RPiOsConfigureCmd().run(
+                ctx=cli_ctx,
+                args=RPiOsConfigureCmdArgs(
+                    remote_opts=remote_opts, lan_inventory_cfg=lan_inventory_cfg, fleet_opts=fleet_opts, force=force
+                ),
+            ),
             error_message="Failed to configure Raspbian OS",
             verbose=cli_ctx.is_verbose(),
         )
@@ -71,6 +175,51 @@ def register_node_commands(cli_group: click.Group, single_board_cfg: Optional[Si
         show_default=True,
         help="Update /etc/hosts file with the node's hostname and IP address",
     )
+    @click.option(
+        "--ip-pool",
+        type=str,
+        help="Batch mode, assign static IPs to all remote hosts from user configuration out of this pool "
+        + "(CIDR, range or comma separated list) [example: 192.168.1.200/29, 192.168.1.200-192.168.1.210]",
+        envvar="PROV_RPI_STATIC_IP_POOL",
+    )
+    @click.option(
+        "--fleet-hosts",
+        type=str,
+        help="Comma separated host names from user configuration to narrow the batch [example: node1,node2]",
+        envvar="PROV_RPI_FLEET_HOSTS",
+    )
+    @click.option(
+        "--forks",
+        type=int,
+        default=DEFAULT_FLEET_FORKS,
+        show_default=True,
+        help="Number of hosts Ansible configures in parallel in batch mode",
+        envvar="PROV_RPI_FLEET_FORKS",
+    )
+    @click.option(
+        "--reboot-stagger-seconds",
+        type=int,
+        default=DEFAULT_FLEET_REBOOT_STAGGER_SECONDS,
+        show_default=True,
+        help="Delay between consecutive node reboots in batch mode",
+        envvar="PROV_RPI_FLEET_REBOOT_STAGGER_SECONDS",
+    )
+    @click.option(
+        "--ssh-wait-timeout",
+        type=int,
+        default=DEFAULT_FLEET_SSH_WAIT_TIMEOUT_SECONDS,
+        show_default=True,
+        help="Seconds to wait for each node SSH to come back after reboot in batch mode",
+        envvar="PROV_RPI_FLEET_SSH_WAIT_TIMEOUT",
+    )
+    @click.option(
+        "--force",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Run even when the node already matches the desired state fingerprint",
+        envvar="PROV_RPI_FORCE",
+    )
     @cli_modifiers
     @click.pass_context
     def network(
@@ -79,11 +228,28 @@ def register_node_commands(cli_group: click.Group, single_board_cfg: Optional[Si
         gw_ip_address: Optional[str],
         dns_ip_address: Optional[str],
         update_hosts_file: bool,
+        ip_pool: Optional[str],
+        fleet_hosts: Optional[str],
+        forks: int,
+        reboot_stagger_seconds: int,
+        ssh_wait_timeout: int,
+        force: bool,
     ) -> None:
         """
         Select a remote Raspberry Pi node on the ethernet network to configure a static IP address.
+        With --ip-pool, all remote hosts from user configuration are addressed in a single run.
         """
         cli_ctx = CliContextManager.create(modifiers=CliModifiers.from_click_ctx(ctx))
+        fleet_opts = (
+            FleetOpts(
+                forks=forks,
+                reboot_stagger_seconds=reboot_stagger_seconds,
+                ssh_wait_timeout_seconds=ssh_wait_timeout,
+                host_names=FleetOpts.parse_host_names(fleet_hosts),
+            )
+            if ip_pool
+            else None
+        )
         Evaluator.eval_cli_entrypoint_step(
             name="Raspbian Network Configure",
             call=lambda: RPiNetworkConfigureCmd().run(
@@ -94,8 +260,261 @@ def register_node_commands(cli_group: click.Group, single_board_cfg: Optional[Si
                     static_ip_address=static_ip_address,
                     remote_opts=RemoteOpts.from_click_ctx(ctx),
                     update_hosts_file=update_hosts_file,
+                    lan_inventory_cfg=lan_inventory_cfg,
+                    force=force,
+                    ip_pool=ip_pool,
+                    fleet_opts=fleet_opts,
                 ),
             ),
             error_message="Failed to configure RPi network",
             verbose=cli_ctx.is_verbose(),
         )
+
+    @cli_group.command()
+    @click.option(
+        "--fleet",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Benchmark all remote hosts from user configuration concurrently",
+        envvar="PROV_RPI_FLEET",
+    )
+    @click.option(
+        "--fleet-hosts",
+        type=str,
+        help="Comma separated host names from user configuration to narrow the fleet [example: node1,node2]",
+        envvar="PROV_RPI_FLEET_HOSTS",
+    )
+    @click.option(
+        "--forks",
+        type=int,
+        default=DEFAULT_FLEET_FORKS,
+        show_default=True,
+        help="Number of hosts running local benchmarks in parallel in fleet mode",
+        envvar="PROV_RPI_FLEET_FORKS",
+    )
+    @click.option(
+        "--disk-path",
+        type=str,
+        default=DEFAULT_BENCHMARK_DIR,
+        show_default=True,
+        help="Directory on the node to benchmark, point it to a USB SSD mount to test that device",
+        envvar="PROV_RPI_BENCHMARK_DISK_PATH",
+    )
+    @click.option(
+        "--disk-size-mb",
+        type=int,
+        default=DEFAULT_BENCHMARK_DISK_SIZE_MB,
+        show_default=True,
+        help="Size of the sequential I/O test file",
+        envvar="PROV_RPI_BENCHMARK_DISK_SIZE_MB",
+    )
+    @click.option(
+        "--duration",
+        type=float,
+        default=DEFAULT_BENCHMARK_DURATION_SECONDS,
+        show_default=True,
+        help="Seconds per CPU, random I/O and network workload",
+        envvar="PROV_RPI_BENCHMARK_DURATION",
+    )
+    @click.option(
+        "--skip-network",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Skip the node to node TCP throughput tests",
+        envvar="PROV_RPI_BENCHMARK_SKIP_NETWORK",
+    )
+    @click.option(
+        "--output-format",
+        type=click.Choice([OUTPUT_FORMAT_TABLE, OUTPUT_FORMAT_JSON], case_sensitive=False),
+        default=OUTPUT_FORMAT_TABLE,
+        show_default=True,
+        help="Report format of the benchmark results",
+        envvar="PROV_RPI_BENCHMARK_OUTPUT_FORMAT",
+    )
+    @cli_modifiers
+    @click.pass_context
+    def benchmark(
+        ctx: click.Context,
+        fleet: bool,
+        fleet_hosts: Optional[str],
+        forks: int,
+        disk_path: str,
+        disk_size_mb: int,
+        duration: float,
+        skip_network: bool,
+        output_format: str,
+    ) -> None:
+        """
+        Benchmark CPU, SD card / USB SSD I/O and node to node LAN throughput of remote Raspberry Pi nodes.
+        Results are kept in a local history and compared with the previous run.
+        """
+        cli_ctx = CliContextManager.create(modifiers=CliModifiers.from_click_ctx(ctx))
+        fleet_opts = FleetOpts(forks=forks, host_names=FleetOpts.parse_host_names(fleet_hosts)) if fleet else None
+        Evaluator.eval_cli_entrypoint_step(
+            name="Raspberry Pi Benchmark",
+            call=lambda: RPiBenchmarkCmd().run(
+                ctx=cli_ctx,
+                args=RPiBenchmarkCmdArgs(
+                    remote_opts=RemoteOpts.from_click_ctx(ctx),
+                    fleet_opts=fleet_opts,
+                    benchmark_dir=disk_path,
+                    disk_size_mb=disk_size_mb,
+                    duration_seconds=duration,
+                    network=not skip_network,
+                    output_format=output_format.lower(),
+                ),
+            ),
+            error_message="Failed to benchmark Raspberry Pi nodes",
+            verbose=cli_ctx.is_verbose(),
+        )
+
+    @cli_group.command(name="migrate-boot")
+    @click.option(
+        "--target-device",
+        type=str,
+        required=True,
+        help="Block device on the node to boot from, a USB or NVMe SSD [example: /dev/sda, /dev/nvme0n1]",
+        envvar="PROV_RPI_MIGRATE_BOOT_TARGET_DEVICE",
+    )
+    @click.option(
+        "--source",
+        type=click.Choice([MIGRATION_SOURCE_CLONE, MIGRATION_SOURCE_IMAGE], case_sensitive=False),
+        default=MIGRATION_SOURCE_CLONE,
+        show_default=True,
+        help="Clone the running SD card or write a fresh OS image onto the target device",
+        envvar="PROV_RPI_MIGRATE_BOOT_SOURCE",
+    )
+    @click.option(
+        "--image-download-url",
+        type=str,
+        help="OS image file download URL, used with --source image",
+        show_default=True,
+        default=maybe_image_download_url if maybe_image_download_url else "",
+        envvar="PROV_SINGLE_BOARD_IMAGE_DOWNLOAD_URL",
+    )
+    @click.option(
+        "--image-download-path",
+        type=str,
+        help="OS image file download path, used with --source image",
+        show_default=True,
+        default=maybe_image_download_path if maybe_image_download_path else "",
+        envvar="PROV_SINGLE_BOARD_IMAGE_DOWNLOAD_PATH",
+    )
+    @click.option(
+        "--no-freeze",
+        is_flag=True,
+        default=False,
+        help="Clone the root filesystem without freezing it, only for nodes that cannot freeze their root",
+        envvar="PROV_RPI_MIGRATE_BOOT_NO_FREEZE",
+    )
+    @click.option(
+        "--skip-eeprom",
+        is_flag=True,
+        default=False,
+        help="Keep the bootloader EEPROM boot order as is",
+        envvar="PROV_RPI_MIGRATE_BOOT_SKIP_EEPROM",
+    )
+    @click.option(
+        "--no-reboot",
+        is_flag=True,
+        default=False,
+        help="Skip rebooting the node and verifying it booted from the target device",
+        envvar="PROV_RPI_MIGRATE_BOOT_NO_REBOOT",
+    )
+    @cli_modifiers
+    @click.pass_context
+    def migrate_boot(
+        ctx: click.Context,
+        target_device: str,
+        source: str,
+        image_download_url: str,
+        image_download_path: str,
+        no_freeze: bool,
+        skip_eeprom: bool,
+        no_reboot: bool,
+    ) -> None:
+        """
+        Migrate the boot device of a remote Raspberry Pi node from its SD card to a USB / NVMe SSD.
+        The node is rebooted and verified to run from the target device.
+        """
+        cli_ctx = CliContextManager.create(modifiers=CliModifiers.from_click_ctx(ctx))
+        Evaluator.eval_cli_entrypoint_step(
+            name="Raspberry Pi Boot Migration",
+            call=lambda: RPiMigrateBootCmd().run(
+                ctx=cli_ctx,
+                args=RPiMigrateBootCmdArgs(
+                    target_device=target_device,
+                    remote_opts=RemoteOpts.from_click_ctx(ctx),
+                    source=source.lower(),
+                    image_download_url=image_download_url,
+                    image_download_path=image_download_path,
+                    freeze=not no_freeze,
+                    update_eeprom=not skip_eeprom,
+                    reboot=not no_reboot,
+                ),
+            ),
+            error_message="Failed to migrate Raspberry Pi boot device",
+            verbose=cli_ctx.is_verbose(),
+        )
+
+    @cli_group.command()
+    @click.option(
+        "--profile",
+        type=click.Choice(sorted(PROFILES.keys()), case_sensitive=False),
+        required=True,
+        help="Tuning profile to apply: zram swap, CPU governor, logs in RAM, GPU memory split and cgroup flags",
+        envvar="PROV_RPI_TUNING_PROFILE",
+    )
+    @click.option(
+        "--skip-metrics",
+        is_flag=True,
+        default=False,
+        help="Apply the profile without measuring the node before and after",
+        envvar="PROV_RPI_TUNING_SKIP_METRICS",
+    )
+    @click.option(
+        "--benchmark-duration",
+        type=float,
+        default=DEFAULT_TUNING_BENCHMARK_DURATION_SECONDS,
+        show_default=True,
+        help="Seconds per CPU and random I/O workload of the before/after benchmark, 0 measures the node status only",
+        envvar="PROV_RPI_TUNING_BENCHMARK_DURATION",
+    )
+    @click.option(
+        "--no-reboot",
+        is_flag=True,
+        default=False,
+        help="Leave boot settings (GPU memory, cgroup flags) pending until the next reboot",
+        envvar="PROV_RPI_TUNING_NO_REBOOT",
+    )
+    @cli_modifiers
+    @click.pass_context
+    def tune(
+        ctx: click.Context,
+        profile: str,
+        skip_metrics: bool,
+        benchmark_duration: float,
+        no_reboot: bool,
+    ) -> None:
+        """
+        Apply a performance tuning profile on a remote Raspberry Pi node.
+        The node is measured before and after so the effect of the profile can be compared.
+        """
+        cli_ctx = CliContextManager.create(modifiers=CliModifiers.from_click_ctx(ctx))
+        Evaluator.eval_cli_entrypoint_step(
+            name="Raspberry Pi Tuning",
+            call=lambda: RPiTuneCmd().run(
+                ctx=cli_ctx,
+                args=RPiTuneCmdArgs(
+                    profile=profile.lower(),
+                    remote_opts=RemoteOpts.from_click_ctx(ctx),
+                    measure=not skip_metrics,
+                    benchmark_duration_seconds=benchmark_duration,
+                    reboot=not no_reboot,
+                ),
+            ),
+            error_message="Failed to tune Raspberry Pi node",
+            verbose=cli_ctx.is_verbose(),
+        )
@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 
 
+from typing import Optional
+
 from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts
 from provisioner_single_board_plugin.src.common.remote.remote_os_configure import (
     RemoteMachineOsConfigureArgs,
     RemoteMachineOsConfigureRunner,
 )
+from provisioner_single_board_plugin.src.common.remote.remote_os_fleet_configure import (
+    RemoteMachineOsFleetConfigureArgs,
+    RemoteMachineOsFleetConfigureRunner,
+)
+from provisioner_single_board_plugin.src.config.domain.config import SingleBoardLanInventoryConfig
 
 from provisioner_shared.components.remote.remote_opts import RemoteOpts
 from provisioner_shared.components.runtime.infra.context import Context
@@ -15,14 +23,30 @@ from provisioner_shared.components.runtime.shared.collaborators import CoreColla
 class RPiOsConfigureCmdArgs:
 
     remote_opts: RemoteOpts
+    lan_inventory_cfg: SingleBoardLanInventoryConfig
+    fleet_opts: FleetOpts
+    force: bool
 
-    def __init__(self, remote_opts: RemoteOpts = None) -> None:
+    def __init__(
+        self,
+        remote_opts: RemoteOpts = None,
+        lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None,
+        fleet_opts: Optional[FleetOpts] = None,
+        force: bool = False,
+    ) -> None:
         self.remote_opts = remote_opts
+        self.lan_inventory_cfg = lan_inventory_cfg
+        self.fleet_opts = fleet_opts
+        self.force = force
 
     def print(self) -> None:
         if self.remote_opts:
             self.remote_opts.print()
-        logger.debug("RPiOsConfigureCmdArgs: \n")
+        if self.fleet_opts:
+            self.fleet_opts.print()
+        logger.debug(
+            "RPiOsConfigureCmdArgs: \n" + f"  fleet: {self.fleet_opts is not None}\n" + f"  force: {self.force}\n"
+        )
 
 
 class RPiOsConfigureCmd:
@@ -30,10 +54,24 @@ class RPiOsConfigureCmd:
         logger.debug("Inside RPiOsConfigureCmd run()")
         args.print()
 
+        if args.fleet_opts:
+            RemoteMachineOsFleetConfigureRunner().run(
+                ctx=ctx,
+                args=RemoteMachineOsFleetConfigureArgs(
+                    remote_opts=args.remote_opts,
+                    fleet_opts=args.fleet_opts,
+                    force=args.force,
+                ),
+                collaborators=CoreCollaborators(ctx),
+            )
+            return
+
         RemoteMachineOsConfigureRunner().run(
             ctx=ctx,
             args=RemoteMachineOsConfigureArgs(
                 remote_opts=args.remote_opts,
+                lan_inventory_cfg=args.lan_inventory_cfg,
+                force=args.force,
             ),
             collaborators=CoreCollaborators(ctx),
         )
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+
+from typing import Optional
+
+from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.remote_boot_migration import (
+    RemoteBootMigrationArgs,
+    RemoteBootMigrationRunner,
+)
+from provisioner_single_board_plugin.src.common.system.boot_migration import MIGRATION_SOURCE_CLONE
+from provisioner_single_board_plugin.src.raspberry_pi.os.burn_image_cmd import RPI_IMAGE_BURN_RESOURCES_PATH
+
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+
+class RPiMigrateBootCmdArgs:
+
+    remote_opts: RemoteOpts
+    target_device: str
+    source: str
+    image_download_url: str
+    image_download_path: str
+    freeze: bool
+    update_eeprom: bool
+    reboot: bool
+
+    def __init__(
+        self,
+        target_device: str,
+        remote_opts: RemoteOpts = None,
+        source: Optional[str] = MIGRATION_SOURCE_CLONE,
+        image_download_url: Optional[str] = None,
+        image_download_path: Optional[str] = None,
+        freeze: Optional[bool] = True,
+        update_eeprom: Optional[bool] = True,
+        reboot: Optional[bool] = True,
+    ) -> None:
+        self.remote_opts = remote_opts
+        self.target_device = target_device
+        self.source = source
+        self.image_download_url = image_download_url
+        self.image_download_path = image_download_path
+        self.freeze = freeze
+        self.update_eeprom = update_eeprom
+        self.reboot = reboot
+
+    def print(self) -> None:
+        if self.remote_opts:
+            self.remote_opts.print()
+        logger.debug(
+            "RPiMigrateBootCmdArgs: \n"
+            + f"  target_device: {self.target_device}\n"
+            + f"  source: {self.source}\n"
+            + f"  image_download_url: {self.image_download_url}\n"
+            + f"  image_download_path: {self.image_download_path}\n"
+            + f"  freeze: {self.freeze}\n"
+            + f"  update_eeprom: {self.update_eeprom}\n"
+            + f"  reboot: {self.reboot}\n"
+        )
+
+
+class RPiMigrateBootCmd:
+    def run(self, ctx: Context, args: RPiMigrateBootCmdArgs) -> None:
+        logger.debug("Inside RPiMigrateBootCmd run()")
+        args.print()
+
+        RemoteBootMigrationRunner().run(
+            ctx=ctx,
+            args=RemoteBootMigrationArgs(
+                remote_opts=args.remote_opts,
+                target_device=args.target_device,
+                source=args.source,
+                image_download_url=args.image_download_url,
+                image_download_path=args.image_download_path,
+                # Same boot partition files the burn image command drops onto a freshly burned SD card
+                boot_files_path=RPI_IMAGE_BURN_RESOURCES_PATH,
+                freeze=args.freeze,
+                update_eeprom=args.update_eeprom,
+                reboot=args.reboot,
+            ),
+            collaborators=CoreCollaborators(ctx),
+        )
@@ -3,10 +3,16 @@
 from typing import Optional
 
 from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.remote_fleet import FleetOpts
+from provisioner_single_board_plugin.src.common.remote.remote_network_batch_configure import (
+    RemoteMachineNetworkBatchConfigureArgs,
+    RemoteMachineNetworkBatchConfigureRunner,
+)
 from provisioner_single_board_plugin.src.common.remote.remote_network_configure import (
     RemoteMachineNetworkConfigureArgs,
     RemoteMachineNetworkConfigureRunner,
 )
+from provisioner_single_board_plugin.src.config.domain.config import SingleBoardLanInventoryConfig
 
 from provisioner_shared.components.remote.remote_opts import RemoteOpts
 from provisioner_shared.components.runtime.infra.context import Context
@@ -20,6 +26,10 @@ class RPiNetworkConfigureCmdArgs:
     static_ip_address: str
     remote_opts: RemoteOpts
     update_hosts_file: bool
+    lan_inventory_cfg: SingleBoardLanInventoryConfig
+    force: bool
+    ip_pool: str
+    fleet_opts: FleetOpts
 
     def __init__(
         self,
@@ -28,22 +38,34 @@ class RPiNetworkConfigureCmdArgs:
         static_ip_address: Optional[str] = None,
         remote_opts: RemoteOpts = None,
         update_hosts_file: bool = False,
+        lan_inventory_cfg: Optional[SingleBoardLanInventoryConfig] = None,
+        force: bool = False,
+        ip_pool: Optional[str] = None,
+        fleet_opts: Optional[FleetOpts] = None,
     ) -> None:
         self.gw_ip_address = gw_ip_address
         self.dns_ip_address = dns_ip_address
         self.static_ip_address = static_ip_address
         self.remote_opts = remote_opts
         self.update_hosts_file = update_hosts_file
+        self.lan_inventory_cfg = lan_inventory_cfg
+        self.force = force
+        self.ip_pool = ip_pool
+        self.fleet_opts = fleet_opts
 
     def print(self) -> None:
         if self.remote_opts:
             self.remote_opts.print()
+        if self.fleet_opts:
+            self.fleet_opts.print()
         logger.debug(
             "RPiNetworkConfigureCmdArgs: \n"
             + f"  gw_ip_address: {self.gw_ip_address}\n"
             + f"  dns_ip_address: {self.dns_ip_address}\n"
             + f"  static_ip_address: {self.static_ip_address}\n"
             + f"  update_hosts_file: {self.update_hosts_file}\n"
+            + f"  force: {self.force}\n"
+            + f"  ip_pool: {self.ip_pool}\n"
         )
 
 
@@ -52,6 +74,22 @@ class RPiNetworkConfigureCmd:
         logger.debug("Inside RPiNetworkConfigureCmd run()")
         args.print()
 
+        if args.ip_pool:
+            RemoteMachineNetworkBatchConfigureRunner().run(
+                ctx=ctx,
+                args=RemoteMachineNetworkBatchConfigureArgs(
+                    remote_opts=args.remote_opts,
+                    fleet_opts=args.fleet_opts if args.fleet_opts else FleetOpts(),
+                    ip_pool=args.ip_pool,
+                    gw_ip_address=args.gw_ip_address,
+                    dns_ip_address=args.dns_ip_address,
+                    update_hosts_file=args.update_hosts_file,
+                    lan_inventory_cfg=args.lan_inventory_cfg,
+                ),
+                collaborators=CoreCollaborators(ctx),
+            )
+            return
+
         RemoteMachineNetworkConfigureRunner().run(
             ctx=ctx,
             args=RemoteMachineNetworkConfigureArgs(
@@ -60,6 +98,8 @@ class RPiNetworkConfigureCmd:
                 dns_ip_address=args.dns_ip_address,
                 static_ip_address=args.static_ip_address,
                 update_hosts_file=args.update_hosts_file,
+                lan_inventory_cfg=args.lan_inventory_cfg,
+                force=args.force,
             ),
             collaborators=CoreCollaborators(ctx),
         )
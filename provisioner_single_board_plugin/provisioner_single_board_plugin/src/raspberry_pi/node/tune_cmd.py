@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+
+from typing import Optional
+
+from loguru import logger
+from provisioner_single_board_plugin.src.common.remote.remote_tuning import (
+    DEFAULT_TUNING_BENCHMARK_DURATION_SECONDS,
+    RemoteTuningArgs,
+    RemoteTuningRunner,
+)
+
+from provisioner_shared.components.remote.remote_opts import RemoteOpts
+from provisioner_shared.components.runtime.infra.context import Context
+from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
+
+
+class RPiTuneCmdArgs:
+
+    remote_opts: RemoteOpts
+    profile: str
+    measure: bool
+    benchmark_duration_seconds: float
+    reboot: bool
+
+    def __init__(
+        self,
+        profile: str,
+        remote_opts: RemoteOpts = None,
+        measure: Optional[bool] = True,
+        benchmark_duration_seconds: Optional[float] = DEFAULT_TUNING_BENCHMARK_DURATION_SECONDS,
+        reboot: Optional[bool] = True,
+    ) -> None:
+        self.remote_opts = remote_opts
+        self.profile = profile
+        self.measure = measure
+        self.benchmark_duration_seconds = benchmark_duration_seconds
+        self.reboot = reboot
+
+    def print(self) -> None:
+        if self.remote_opts:
+            self.remote_opts.print()
+        logger.debug(
+            "RPiTuneCmdArgs: \n"
+            + f"  profile: {self.profile}\n"
+            + f"  measure: {self.measure}\n"
+            + f"  benchmark_duration_seconds: {self.benchmark_duration_seconds}\n"
+            + f"  reboot: {self.reboot}\n"
+        )
+
+
+class RPiTuneCmd:
+    def run(self, ctx: Context, args: RPiTuneCmdArgs) -> None:
+        logger.debug("Inside RPiTuneCmd run()")
+        args.print()
+
+        RemoteTuningRunner().run(
+            ctx=ctx,
+            args=RemoteTuningArgs(
+                remote_opts=args.remote_opts,
+                profile=args.profile,
+                measure=args.measure,
+                benchmark_duration_seconds=args.benchmark_duration_seconds,
+                reboot=args.reboot,
+            ),
+            collaborators=CoreCollaborators(ctx),
+        )
@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
 
 import pathlib
+from typing import Optional
 
 from loguru import logger
+from provisioner_single_board_plugin.src.common.sd_card.checked_image_burner import CheckedImageBurnerCmdRunner
+from provisioner_single_board_plugin.src.common.system.block_device_check import DEFAULT_MIN_WRITE_SPEED_MBPS
 
 from provisioner_shared.components.runtime.infra.context import Context
 from provisioner_shared.components.runtime.shared.collaborators import CoreCollaborators
-from provisioner_shared.components.sd_card.image_burner import (
-    ImageBurnerArgs,
-    ImageBurnerCmdRunner,
-)
+from provisioner_shared.components.sd_card.image_burner import ImageBurnerArgs
 
 PROJECT_ROOT_FOLDER = str(pathlib.Path(__file__).parent.parent.parent.parent)
 RPI_IMAGE_BURN_RESOURCES_PATH = f"{PROJECT_ROOT_FOLDER}/resources/raspberrypi"
@@ -19,16 +19,32 @@ class RPiOsBurnImageCmdArgs:
 
     image_download_url: str
     image_download_path: str
+    min_write_speed_mbps: float
+    skip_device_check: bool
+    skip_verify: bool
 
-    def __init__(self, image_download_url: str, image_download_path: str) -> None:
+    def __init__(
+        self,
+        image_download_url: str,
+        image_download_path: str,
+        min_write_speed_mbps: Optional[float] = DEFAULT_MIN_WRITE_SPEED_MBPS,
+        skip_device_check: Optional[bool] = False,
+        skip_verify: Optional[bool] = False,
+    ) -> None:
         self.image_download_url = image_download_url
         self.image_download_path = image_download_path
+        self.min_write_speed_mbps = min_write_speed_mbps
+        self.skip_device_check = skip_device_check
+        self.skip_verify = skip_verify
 
     def print(self) -> None:
         logger.debug(
             "RPiOsBurnImageCmdArgs: \n"
             + f"  image_download_url: {self.image_download_url}\n"
             + f"  image_download_path: {self.image_download_path}\n"
+            + f"  min_write_speed_mbps: {self.min_write_speed_mbps}\n"
+            + f"  skip_device_check: {self.skip_device_check}\n"
+            + f"  skip_verify: {self.skip_verify}\n"
         )
 
 
@@ -37,7 +53,11 @@ class RPiOsBurnImageCmd:
         logger.debug("Inside RPiOsBurnImageCmd run()")
         args.print()
 
-        ImageBurnerCmdRunner().run(
+        CheckedImageBurnerCmdRunner(
+            min_write_speed_mbps=args.min_write_speed_mbps,
+            skip_device_check=args.skip_device_check,
+            skip_verify=args.skip_verify,
+        ).run(
             ctx=ctx,
             args=ImageBurnerArgs(
                 image_download_url=args.image_download_url,
@@ -3,6 +3,7 @@
 from typing import Optional
 
 import click
+from provisioner_single_board_plugin.src.common.system.block_device_check import DEFAULT_MIN_WRITE_SPEED_MBPS
 from provisioner_single_board_plugin.src.config.domain.config import (
     SingleBoardConfig,
 )
@@ -18,6 +19,7 @@ def register_os_commands(cli_group: click.Group, single_board_cfg: Optional[Sing
 
     maybe_image_download_url = single_board_cfg.maybe_get("os.raspbian.download_url.url_64bit")
     maybe_image_download_path = single_board_cfg.maybe_get("os.raspbian.download_path")
+    maybe_min_write_speed_mbps = single_board_cfg.maybe_get("os.raspbian.min_write_speed_mbps")
 
     @cli_group.command()
     @click.option(
@@ -36,9 +38,38 @@ def register_os_commands(cli_group: click.Group, single_board_cfg: Optional[Sing
         default=maybe_image_download_path if maybe_image_download_path else "",
         envvar="PROV_SINGLE_BOARD_IMAGE_DOWNLOAD_PATH",
     )
+    @click.option(
+        "--min-write-speed-mbps",
+        type=float,
+        help="Warn before burning block devices with a slower sustained write speed (MB/s)",
+        show_default=True,
+        default=maybe_min_write_speed_mbps if maybe_min_write_speed_mbps else DEFAULT_MIN_WRITE_SPEED_MBPS,
+        envvar="PROV_SINGLE_BOARD_MIN_WRITE_SPEED_MBPS",
+    )
+    @click.option(
+        "--skip-device-check",
+        is_flag=True,
+        default=False,
+        help="Skip the block device write speed and capacity check before burning",
+        envvar="PROV_SINGLE_BOARD_SKIP_DEVICE_CHECK",
+    )
+    @click.option(
+        "--skip-verify",
+        is_flag=True,
+        default=False,
+        help="Burn the image with dd and skip reading back the written ranges",
+        envvar="PROV_SINGLE_BOARD_SKIP_VERIFY",
+    )
     @cli_modifiers
     @click.pass_context
-    def burn_image(ctx: click.Context, image_download_url: str, image_download_path: str) -> None:
+    def burn_image(
+        ctx: click.Context,
+        image_download_url: str,
+        image_download_path: str,
+        min_write_speed_mbps: float,
+        skip_device_check: bool,
+        skip_verify: bool,
+    ) -> None:
         """
         Select an available block device to burn a Raspbian OS image (SD-Card / HDD)
         """
@@ -50,6 +81,9 @@ def register_os_commands(cli_group: click.Group, single_board_cfg: Optional[Sing
                 args=RPiOsBurnImageCmdArgs(
                     image_download_url=image_download_url,
                     image_download_path=image_download_path,
+                    min_write_speed_mbps=min_write_speed_mbps,
+                    skip_device_check=skip_device_check,
+                    skip_verify=skip_verify,
                 ),
             ),
             error_message="Failed to burn Raspbian OS",
@@ -126,7 +126,7 @@ class RaspberryPiOsCliTestShould(unittest.TestCase):
             expected=[
                 "diskutil list",
                 f"diskutil unmountDisk {AUTO_PROMPT_RESPONSE}",
-                f"sudo dd if=DRY_RUN_DOWNLOAD_FILE_PATH of={AUTO_PROMPT_RESPONSE} bs=1m conv=sync status=progress",
+                f"image_writer.py write DRY_RUN_DOWNLOAD_FILE_PATH {AUTO_PROMPT_RESPONSE}",
                 "sync",
                 f"diskutil unmountDisk {AUTO_PROMPT_RESPONSE}",
                 f"diskutil mountDisk {AUTO_PROMPT_RESPONSE}",
@@ -152,7 +152,7 @@ class RaspberryPiOsCliTestShould(unittest.TestCase):
             self,
             expected=[
                 "lsblk -p",
-                f"dd if=DRY_RUN_DOWNLOAD_FILE_PATH of={AUTO_PROMPT_RESPONSE} bs=4M conv=fsync status=progress",
+                f"image_writer.py write DRY_RUN_DOWNLOAD_FILE_PATH {AUTO_PROMPT_RESPONSE}",
                 "sync",
             ],
             method_to_run=lambda: self.create_os_burn_image_runner_linux(),